@@ -1,3 +1,4 @@
 from .drafting_graph import drafting_graph, get_drafting_graph, legal_drafting_graph
+from .batch import DraftingRequest, run_drafting_batch
 
-__all__ = ["get_drafting_graph", "drafting_graph", "legal_drafting_graph"]
+__all__ = ["get_drafting_graph", "drafting_graph", "legal_drafting_graph", "DraftingRequest", "run_drafting_batch"]
@@ -0,0 +1,306 @@
+"""
+Batch drafting runner.
+
+Runs many drafting requests through one compiled drafting graph inside one
+process, so the LKB registry, keyword automata, LLM clients and response
+cache are loaded once and shared by every request:
+
+    async for record in run_drafting_batch(requests, concurrency=4,
+                                           results_path="batch.jsonl"):
+        print(record["id"], record["status"], record["wall_ms"])
+
+At most ``concurrency`` graphs run at a time (LLM calls are additionally
+bounded per model by ``ainvoke_llm``); records are yielded as requests
+finish, not in input order. Each record holds:
+
+    - ``node_ms`` / ``path``: wall time per graph node and the visit order
+    - ``llm``: LLM calls and input/output tokens, in total and per node
+    - ``gates``: issue and blocking counts of every validation gate that ran,
+      plus the review verdict
+    - ``draft``: source block, length and sha256 of the final draft text
+
+With ``results_path`` every record is also written as one sorted-key JSON
+line, so two runs of the same request file can be diffed line by line
+(see scripts/run_drafting_batch.py).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Optional, Union
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.outputs import LLMResult
+
+from ...config import logger, settings
+from .drafting_graph import drafting_graph
+from .nodes._utils import _as_dict
+
+
+# DraftingState issue lists reported under ``gates``, in pipeline order
+_GATE_FIELDS = (
+    "domain_gate_issues",
+    "civil_gate_issues",
+    "evidence_anchoring_issues",
+    "accuracy_gate_issues",
+    "structural_issues",
+    "postprocess_issues",
+    "citation_issues",
+)
+
+# Lazy models used by the drafting nodes; resolved once per process by warm-up
+_DRAFTING_MODELS = ("intake_ollama_model", "glm_model", "draft_ollama_model", "review_ollama_model")
+
+
+@dataclass(frozen=True)
+class DraftingRequest:
+    """One batch item. ``state`` holds extra initial DraftingState keys."""
+
+    id: str
+    user_request: str
+    state: Dict[str, Any] = field(default_factory=dict)
+
+
+RequestLike = Union[str, Mapping[str, Any], DraftingRequest]
+
+
+def _coerce_requests(requests: Iterable[RequestLike]) -> List[DraftingRequest]:
+    items: List[DraftingRequest] = []
+    for index, request in enumerate(requests, start=1):
+        if isinstance(request, DraftingRequest):
+            items.append(request)
+        elif isinstance(request, str):
+            items.append(DraftingRequest(id=str(index), user_request=request))
+        else:
+            extra = {k: v for k, v in request.items() if k not in ("id", "user_request")}
+            items.append(DraftingRequest(
+                id=str(request.get("id") or index),
+                user_request=request["user_request"],
+                state=extra,
+            ))
+    ids = [item.id for item in items]
+    if len(set(ids)) != len(ids):
+        raise ValueError("Batch request ids must be unique")
+    return items
+
+
+class _RunRecorder(BaseCallbackHandler):
+    """Per-node wall time and LLM call/token counts for one graph run."""
+
+    run_inline = True
+
+    def __init__(self):
+        self._node_started: Dict[Any, tuple] = {}
+        self._llm_node: Dict[Any, str] = {}
+        self.path: List[str] = []
+        self.node_ms: Dict[str, float] = defaultdict(float)
+        self.llm_by_node: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"calls": 0, "input_tokens": 0, "output_tokens": 0}
+        )
+
+    # Graph nodes run as chains named after their node
+    def on_chain_start(self, serialized, inputs, *, run_id, metadata=None, **kwargs):
+        node = (metadata or {}).get("langgraph_node")
+        if node and kwargs.get("name") == node:
+            self._node_started[run_id] = (node, time.perf_counter())
+            self.path.append(node)
+
+    def _finish_node(self, run_id) -> None:
+        started = self._node_started.pop(run_id, None)
+        if started:
+            node, t0 = started
+            self.node_ms[node] += (time.perf_counter() - t0) * 1000
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._finish_node(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._finish_node(run_id)
+
+    def _start_llm(self, run_id, metadata) -> None:
+        self._llm_node[run_id] = (metadata or {}).get("langgraph_node") or ""
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, metadata=None, **kwargs):
+        self._start_llm(run_id, metadata)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, metadata=None, **kwargs):
+        self._start_llm(run_id, metadata)
+
+    def on_llm_end(self, response: LLMResult, *, run_id, **kwargs):
+        counts = self.llm_by_node[self._llm_node.pop(run_id, "")]
+        counts["calls"] += 1
+        input_tokens, output_tokens = _token_usage(response)
+        counts["input_tokens"] += input_tokens
+        counts["output_tokens"] += output_tokens
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._llm_node.pop(run_id, None)
+
+    def llm_summary(self) -> Dict[str, Any]:
+        by_node = {node or "<none>": dict(counts) for node, counts in sorted(self.llm_by_node.items())}
+        totals = {
+            key: sum(counts[key] for counts in by_node.values())
+            for key in ("calls", "input_tokens", "output_tokens")
+        }
+        totals["total_tokens"] = totals["input_tokens"] + totals["output_tokens"]
+        return {**totals, "by_node": by_node}
+
+
+def _token_usage(response: LLMResult) -> tuple:
+    """(input_tokens, output_tokens) from message usage metadata or provider llm_output."""
+    input_tokens = output_tokens = 0
+    for generations in response.generations:
+        for generation in generations:
+            usage = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+            input_tokens += usage.get("input_tokens", 0) or 0
+            output_tokens += usage.get("output_tokens", 0) or 0
+    if not input_tokens and not output_tokens:
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        input_tokens = usage.get("prompt_tokens", 0) or 0
+        output_tokens = usage.get("completion_tokens", 0) or 0
+    return input_tokens, output_tokens
+
+
+def _gate_outcomes(state: Dict[str, Any]) -> Dict[str, Any]:
+    gates: Dict[str, Any] = {}
+    for name in _GATE_FIELDS:
+        issues = state.get(name)
+        if issues is None:
+            continue
+        gates[name] = {
+            "issues": len(issues),
+            "blocking": sum(
+                1 for issue in issues
+                if isinstance(issue, dict) and issue.get("severity") == "blocking"
+            ),
+        }
+    review = _as_dict(_as_dict(state.get("review")).get("review"))
+    if review:
+        gates["review"] = {
+            "pass": review.get("review_pass"),
+            "blocking": len(review.get("blocking_issues") or []),
+        }
+    return gates
+
+
+def _draft_summary(state: Dict[str, Any]) -> Dict[str, Any]:
+    for source in ("final_draft", "draft"):
+        artifacts = _as_dict(state.get(source)).get("draft_artifacts") or []
+        if artifacts:
+            text = (_as_dict(artifacts[0]).get("text") or "").strip()
+            return {
+                "source": source,
+                "chars": len(text),
+                "sha256": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+            }
+    return {"source": "none", "chars": 0, "sha256": ""}
+
+
+def warm_drafting_state() -> None:
+    """Resolve the drafting LLM clients (and the response cache they attach) up front.
+
+    The graph import already loads the LKB and its keyword automata; this
+    covers the lazily built models so the first batch requests do not race
+    to construct them.
+    """
+    from ...services import llm_service
+
+    for name in _DRAFTING_MODELS:
+        model = getattr(llm_service, name, None)
+        if model is not None and model.resolve_model() is None:
+            logger.warning(f"[BATCH] drafting model {name} is unavailable")
+
+
+async def _run_one(graph: Any, request: DraftingRequest, semaphore: asyncio.Semaphore) -> Dict[str, Any]:
+    async with semaphore:
+        recorder = _RunRecorder()
+        config = {
+            "callbacks": [recorder],
+            "tags": ["drafting_batch"],
+            "run_name": f"drafting_batch:{request.id}",
+            # Unique per run so a checkpointed graph never resumes an earlier batch
+            "configurable": {"thread_id": f"batch-{request.id}-{uuid.uuid4().hex[:8]}"},
+        }
+        state: Dict[str, Any] = {}
+        error = None
+        started = time.perf_counter()
+        try:
+            state = _as_dict(await graph.ainvoke({**request.state, "user_request": request.user_request}, config))
+        except Exception as exc:
+            error = f"{type(exc).__name__}: {exc}"
+            logger.exception(f"[BATCH] request {request.id} failed")
+        wall_ms = (time.perf_counter() - started) * 1000
+
+    return {
+        "id": request.id,
+        "status": "error" if error else "ok",
+        "error": error,
+        "wall_ms": round(wall_ms, 1),
+        "path": recorder.path,
+        "node_ms": {node: round(ms, 1) for node, ms in recorder.node_ms.items()},
+        "llm": recorder.llm_summary(),
+        "gates": _gate_outcomes(state),
+        "draft": _draft_summary(state),
+        "errors": list(state.get("errors") or []),
+    }
+
+
+async def run_drafting_batch(
+    requests: Iterable[RequestLike],
+    *,
+    concurrency: Optional[int] = None,
+    results_path: Optional[Union[str, Path]] = None,
+    graph: Any = None,
+    warm: bool = True,
+) -> AsyncIterator[Dict[str, Any]]:
+    """Run drafting requests concurrently and yield one record per request as it finishes.
+
+    Args:
+        requests: Request strings (ids become their 1-based position), mappings
+            with ``user_request`` and optional ``id`` plus extra initial state
+            keys, or ``DraftingRequest`` objects. Ids must be unique.
+        concurrency: Graph runs in flight at once
+            (defaults to ``DRAFTING_BATCH_CONCURRENCY``)
+        results_path: JSONL file (overwritten) receiving one record per line
+        graph: Compiled drafting graph (defaults to the shared ``drafting_graph``)
+        warm: Resolve the drafting models before the first request starts
+
+    A failing request yields a record with ``status="error"``; the rest of the
+    batch keeps running.
+    """
+    items = _coerce_requests(requests)
+    graph = graph if graph is not None else drafting_graph
+    limit = max(1, concurrency or settings.DRAFTING_BATCH_CONCURRENCY)
+    if warm:
+        await asyncio.to_thread(warm_drafting_state)
+
+    semaphore = asyncio.Semaphore(limit)
+    tasks = [asyncio.create_task(_run_one(graph, item, semaphore)) for item in items]
+    out = None
+    if results_path is not None:
+        path = Path(results_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        out = path.open("w", encoding="utf-8")
+    logger.info(f"[BATCH] running {len(items)} drafting requests, concurrency={limit}")
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            record = await next_done
+            if out is not None:
+                out.write(json.dumps(record, sort_keys=True, ensure_ascii=False, default=str) + "\n")
+                out.flush()
+            yield record
+    finally:
+        for task in tasks:
+            task.cancel()
+        if out is not None:
+            out.close()
+
+
+__all__ = ["DraftingRequest", "run_drafting_batch", "warm_drafting_state"]
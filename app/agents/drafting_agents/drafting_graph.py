@@ -6,15 +6,16 @@ Drafting graph wiring.
 Routing: all node-to-node transitions are handled by Command(goto=...) inside each node.
 Only the START -> intake edge is declared here.
 
-Checkpointer: opt-in via `get_drafting_graph(use_checkpointer=True)`.
+Checkpointer: opt-in via `get_drafting_graph(use_checkpointer=True)`; the
+backend (in-process or Postgres) comes from CHECKPOINT_BACKEND.
 Without a checkpointer the graph works as a stateless one-shot pipeline
 and does NOT require a thread_id in the invocation config.
 """
 
-from langgraph.checkpoint.memory import MemorySaver
 from langgraph.graph import START, StateGraph
 from langgraph.types import RetryPolicy
 
+from ...database.postgresql.checkpointer import get_checkpointer
 from .nodes import (
     civil_ambiguity_gate_node,
     civil_case_resolver_node,
@@ -69,8 +70,10 @@ def get_drafting_graph(use_checkpointer: bool = False):
     Set DRAFTING_SKIP_REVIEW=false in .env to re-enable review.
 
     Args:
-        use_checkpointer: When True, compiles with MemorySaver for thread-level
-            state persistence. Callers must then pass
+        use_checkpointer: When True, compiles with ``get_checkpointer()`` for
+            thread-level state persistence: MemorySaver, or the durable
+            Postgres checkpointer with CHECKPOINT_BACKEND=postgres (async
+            invocation only). Callers must then pass
             config={"configurable": {"thread_id": "..."}} on every invoke.
             Defaults to False (stateless one-shot mode).
     """
@@ -117,7 +120,7 @@ def get_drafting_graph(use_checkpointer: bool = False):
     # Entry: merged intake+classify -> domain routing
     graph.add_edge(START, "intake_classify")
 
-    checkpointer = MemorySaver() if use_checkpointer else None
+    checkpointer = get_checkpointer() if use_checkpointer else None
     return graph.compile(checkpointer=checkpointer)
 
 
@@ -11,9 +11,10 @@ Usage:
 """
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 from ....config import logger
+from .keyword_matcher import KeywordHits, KeywordMatcher
 from .limitation import (
     build_limitation_verified_provision,
     get_limitation_reference_details,
@@ -70,6 +71,9 @@ RESIDUARY_ARTICLES = {"113"}  # Limitation Act 1963 — catch-all
 # ---------------------------------------------------------------------------
 
 _REGISTRY: Dict[str, Dict[str, dict]] = {}
+# domain → compiled keyword automaton (doc_type_keywords + registered extras)
+_KEYWORD_MATCHERS: Dict[str, KeywordMatcher] = {}
+_EXTRA_KEYWORDS: Dict[str, set] = {}
 _SUPPORTED_LKB_DOMAINS = ("Civil", "Criminal", "Family", "Corporate", "IP", "Other")
 
 # ---------------------------------------------------------------------------
@@ -119,9 +123,34 @@ _CAUSE_TYPE_ALIASES: Dict[str, str] = {
 def register_domain(domain: str, entries: Dict[str, dict]) -> None:
     """Register all cause type entries for a legal domain."""
     _REGISTRY[domain.lower()] = entries
+    _compile_keywords(domain.lower())
     logger.info("[LKB] registered %d entries for domain=%s", len(entries), domain)
 
 
+def register_keywords(domain: str, keywords: Iterable[str]) -> None:
+    """Add extra keywords (e.g. consistency-gate vocabulary) to a domain's automaton."""
+    key = domain.lower()
+    _EXTRA_KEYWORDS.setdefault(key, set()).update(kw.lower() for kw in keywords)
+    _compile_keywords(key)
+
+
+def _compile_keywords(domain_key: str) -> None:
+    patterns = set(_EXTRA_KEYWORDS.get(domain_key, ()))
+    if domain_key == "civil":
+        patterns.update(_INFERENCE_CUES)
+    for entry in _REGISTRY.get(domain_key, {}).values():
+        patterns.update(kw.lower() for kw in entry.get("doc_type_keywords", []))
+    _KEYWORD_MATCHERS[domain_key] = KeywordMatcher(patterns)
+
+
+def keyword_hits(text: str, domain: str = "Civil") -> KeywordHits:
+    """Scan lower-cased ``text`` once for every keyword registered for ``domain``."""
+    matcher = _KEYWORD_MATCHERS.get(domain.lower())
+    if matcher is None:
+        return KeywordHits(text, frozenset(), frozenset())
+    return matcher.hits(text)
+
+
 def _lookup_in_entries(domain_entries: Dict[str, dict], cause_type: str) -> Optional[dict]:
     entry = domain_entries.get(cause_type)
     if entry:
@@ -259,30 +288,38 @@ def apply_specificity_rule(limitation_article: Optional[str], lkb_article: Optio
 # Keyword-based cause type inference (fallback when LLM doesn't classify)
 # ---------------------------------------------------------------------------
 
-def _score_keywords(text, keywords):
-    return sum(1.0 for kw in keywords if kw.lower() in text)
+# Non-keyword cues read by the score adjustments in infer_cause_type
+_INFERENCE_CUES = (
+    "advance", "fail", "refund", "possession", "vacate", "declaration", "title",
+    "order 37", "agreement to sell", "unauthorized occupation", "encroach", "damages",
+)
+
+
+def _score_keywords(hits, keywords):
+    return sum(1.0 for kw in keywords if kw.lower() in hits)
 
 
 def infer_cause_type(doc_type, user_request, topics=None):
     """Infer cause_type from keywords when LLM classification is missing."""
     text = f"{doc_type} {user_request} {' '.join(topics or [])}".lower()
+    hits = keyword_hits(text, "Civil")
     domain_entries = _REGISTRY.get("civil", {})
     best, best_score = "", 0.0
     for code, entry in domain_entries.items():
-        score = _score_keywords(text, entry.get("doc_type_keywords", []))
-        if code == "money_recovery_loan" and ("advance" in text and ("fail" in text or "refund" in text)):
+        score = _score_keywords(hits, entry.get("doc_type_keywords", []))
+        if code == "money_recovery_loan" and ("advance" in hits and ("fail" in hits or "refund" in hits)):
             score -= 0.5
-        if code == "declaration_title" and ("possession" in text or "vacate" in text):
+        if code == "declaration_title" and ("possession" in hits or "vacate" in hits):
             score -= 0.5
-        if code == "permanent_injunction" and ("declaration" in text or "title" in text):
+        if code == "permanent_injunction" and ("declaration" in hits or "title" in hits):
             score -= 0.25
-        if code == "summary_suit_instrument" and "order 37" in text:
+        if code == "summary_suit_instrument" and "order 37" in hits:
             score += 0.75
-        if code == "specific_performance" and "agreement to sell" in text:
+        if code == "specific_performance" and "agreement to sell" in hits:
             score += 0.5
-        if code.startswith("recovery_of_possession") and ("unauthorized occupation" in text or "vacate" in text):
+        if code.startswith("recovery_of_possession") and ("unauthorized occupation" in hits or "vacate" in hits):
             score += 0.5
-        if code.startswith("recovery_of_possession") and ("encroach" in text and "damages" in text and "possession" not in text):
+        if code.startswith("recovery_of_possession") and ("encroach" in hits and "damages" in hits and "possession" not in hits):
             score -= 0.25
         if score > best_score:
             best, best_score = code, score
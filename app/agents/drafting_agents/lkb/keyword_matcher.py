@@ -0,0 +1,98 @@
+"""Precompiled multi-pattern keyword matcher (Aho-Corasick).
+
+Cause-type inference and the civil consistency gates test dozens of literal
+keywords against the same text. ``KeywordMatcher`` compiles every keyword into
+one automaton, and ``find`` reports all of them in a single pass over the text,
+with the same substring semantics as ``keyword in text``.
+
+Usage:
+    matcher = KeywordMatcher(["order xx rule 12", "mesne profits"])
+    hits = matcher.hits(draft_text.lower())
+    if "order xx rule 12" not in hits:
+        ...
+"""
+from __future__ import annotations
+
+from collections import deque
+from typing import AbstractSet, Dict, FrozenSet, Iterable, List, Tuple
+
+
+class KeywordMatcher:
+    """Aho-Corasick automaton over a fixed keyword set (matched case-sensitively)."""
+
+    __slots__ = ("patterns", "_delta", "_out")
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: FrozenSet[str] = frozenset(p for p in patterns if p)
+        goto: List[Dict[str, int]] = [{}]
+        out: List[Tuple[str, ...]] = [()]
+
+        for pattern in sorted(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = (pattern,)
+
+        # Fold failure links into a full transition table (BFS order guarantees
+        # a state's failure target is complete before the state itself), so
+        # scanning is one dict lookup per character.
+        fail = [0] * len(goto)
+        delta: List[Dict[str, int]] = [dict(goto[0])] + [{} for _ in goto[1:]]
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            delta[state] = {**delta[fail[state]], **goto[state]}
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                fail[nxt] = delta[fail[state]].get(ch, 0)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._delta = delta
+        self._out = out
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """All registered patterns that occur in ``text``."""
+        delta, out = self._delta, self._out
+        matched = set()
+        state = 0
+        for ch in text:
+            state = delta[state].get(ch, 0)
+            if out[state]:
+                matched.add(state)
+        return frozenset(pattern for s in matched for pattern in out[s])
+
+    def hits(self, text: str) -> "KeywordHits":
+        return KeywordHits(text, self.find(text), self.patterns)
+
+
+class KeywordHits:
+    """Hit map for one text; ``keyword in hits`` behaves like ``keyword in text``.
+
+    Keywords the automaton was not built with fall back to a substring scan, so
+    a missing registration costs speed, never correctness.
+    """
+
+    __slots__ = ("text", "found", "_patterns")
+
+    def __init__(self, text: str, found: AbstractSet[str], patterns: AbstractSet[str]):
+        self.text = text
+        self.found = found
+        self._patterns = patterns
+
+    def __contains__(self, keyword: str) -> bool:
+        if keyword in self._patterns:
+            return keyword in self.found
+        return keyword in self.text
+
+    def any(self, keywords: Iterable[str]) -> bool:
+        return any(kw in self for kw in keywords)
+
+    def matching(self, keywords: Iterable[str]) -> List[str]:
+        """Keywords (in the given order) that occur in the text."""
+        return [kw for kw in keywords if kw in self]
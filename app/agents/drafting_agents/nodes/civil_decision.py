@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 from langgraph.graph import END
 from langgraph.types import Command
 
 from ....config import logger, settings
-from ..lkb import lookup
+from ..lkb import keyword_hits, lookup, register_keywords
+from ..lkb.keyword_matcher import KeywordHits
 from ..lkb.causes import CAUSE_GROUPS
 from ..lkb.causes._family_defaults import get_family
 from ..states import CivilDecision, DraftingState
@@ -174,7 +176,7 @@ def _text_blob(user_request: str, classify: Dict[str, Any], intake: Dict[str, An
 
 
 def _find_hits(text: str, tokens: Tuple[str, ...]) -> List[str]:
-    return [token for token in tokens if token in text]
+    return keyword_hits(text).matching(tokens)
 
 
 def _resolve_possession_track(text: str, doc_type: str) -> Tuple[Optional[str], List[str], str]:
@@ -1291,6 +1293,32 @@ def _forbidden_content_violations(text: str, decision: Dict[str, Any]) -> List[s
     return violations
 
 
+# Relief → prayer keywords — covers both _decree and non-_decree variants
+_RELIEF_KEYWORDS = {
+    "possession_decree": ["possession", "vacate", "hand over"],
+    "mesne_profits_inquiry_order_xx_r12": ["mesne profits", "order xx rule 12", "inquiry"],
+    "costs": ["costs of the suit", "cost of this suit", "costs"],
+    "preliminary_decree_shares": ["preliminary decree", "shares"],
+    "partition_by_metes_and_bounds": ["metes and bounds", "partition"],
+    "appointment_of_commissioner": ["commissioner"],
+    "separate_possession": ["separate possession"],
+    "final_decree": ["final decree"],
+    "declaration_decree": ["declaration", "declared", "declaring", "declare"],
+    "consequential_relief": ["consequential relief"],
+    "permanent_injunction": ["injunction", "restrained"],
+    "permanent_injunction_decree": ["injunction", "restrained"],
+    "mandatory_injunction": ["mandatory injunction", "directed to"],
+    "mandatory_injunction_decree": ["mandatory injunction", "directed to"],
+    "mesne_profits_decree": ["mesne profits"],
+    "inquiry_under_order_xx_rule_12": ["order xx rule 12", "inquiry"],
+    "interest_pendente_lite_future": ["interest", "pendente lite", "future interest"],
+    "damages": ["damages", "compensation"],
+    "specific_performance": ["specific performance"],
+    "rendition_of_accounts": ["render true and faithful accounts", "render accounts", "taking of accounts", "preliminary decree"],
+    "money_found_due_after_accounts": ["amount found due", "found due", "upon rendition of accounts", "upon taking accounts", "final decree"],
+}
+
+
 def _prayer_completeness_issues(text: str, decision: Dict[str, Any], plan: Dict[str, Any] | None = None) -> List[str]:
     """Check required_reliefs from decision_ir/plan_ir appear in the prayer section.
 
@@ -1310,37 +1338,13 @@ def _prayer_completeness_issues(text: str, decision: Dict[str, Any], plan: Dict[
     if not required_reliefs:
         return []
 
-    lower = text.lower()
+    hits = _draft_hits(text)
     issues: List[str] = []
 
-    # Keyword map — covers both _decree and non-_decree variants
-    relief_checks = {
-        "possession_decree": ["possession", "vacate", "hand over"],
-        "mesne_profits_inquiry_order_xx_r12": ["mesne profits", "order xx rule 12", "inquiry"],
-        "costs": ["costs of the suit", "cost of this suit", "costs"],
-        "preliminary_decree_shares": ["preliminary decree", "shares"],
-        "partition_by_metes_and_bounds": ["metes and bounds", "partition"],
-        "appointment_of_commissioner": ["commissioner"],
-        "separate_possession": ["separate possession"],
-        "final_decree": ["final decree"],
-        "declaration_decree": ["declaration", "declared", "declaring", "declare"],
-        "consequential_relief": ["consequential relief"],
-        "permanent_injunction": ["injunction", "restrained"],
-        "permanent_injunction_decree": ["injunction", "restrained"],
-        "mandatory_injunction": ["mandatory injunction", "directed to"],
-        "mandatory_injunction_decree": ["mandatory injunction", "directed to"],
-        "mesne_profits_decree": ["mesne profits"],
-        "inquiry_under_order_xx_rule_12": ["order xx rule 12", "inquiry"],
-        "interest_pendente_lite_future": ["interest", "pendente lite", "future interest"],
-        "damages": ["damages", "compensation"],
-        "specific_performance": ["specific performance"],
-        "rendition_of_accounts": ["render true and faithful accounts", "render accounts", "taking of accounts", "preliminary decree"],
-        "money_found_due_after_accounts": ["amount found due", "found due", "upon rendition of accounts", "upon taking accounts", "final decree"],
-    }
 
     for relief in required_reliefs:
-        keywords = relief_checks.get(relief, [relief.replace("_decree", "").replace("_", " ")])
-        if not any(kw in lower for kw in keywords):
+        keywords = _RELIEF_KEYWORDS.get(relief, [relief.replace("_decree", "").replace("_", " ")])
+        if not hits.any(keywords):
             issues.append(f"Required relief '{relief.replace('_', ' ')}' missing from prayer.")
 
     return issues
@@ -1351,15 +1355,16 @@ def _possession_consistency_issues(text: str, cause_type: str) -> List[str]:
         return []
 
     lower = text.lower()
+    hits = _draft_hits(text)
     issues: List[str] = []
     has_section_16 = bool(re.search(r"\bsection\s+16\b", text, re.IGNORECASE))
     has_situs_jurisdiction = bool(
         re.search(r"(immovable property|suit property)[^.\n]{0,140}\b(situated|situate)\b", lower, re.IGNORECASE)
     )
 
-    if "with interest and costs" in lower:
+    if "with interest and costs" in hits:
         issues.append("Possession draft title still uses the generic 'WITH INTEREST AND COSTS' damages template.")
-    if "carries on business / resides" in lower or re.search(r"territorial jurisdiction[^.\n]{0,180}defendant[^.\n]{0,80}resides", lower):
+    if "carries on business / resides" in hits or re.search(r"territorial jurisdiction[^.\n]{0,180}defendant[^.\n]{0,80}resides", lower):
         issues.append("Possession draft pleads Section 20-style residence/cause-of-action jurisdiction instead of immovable-property situs jurisdiction.")
     if not has_section_16 and not has_situs_jurisdiction:
         issues.append("Possession draft does not clearly plead property-situs jurisdiction under Section 16 CPC.")
@@ -1367,14 +1372,14 @@ def _possession_consistency_issues(text: str, cause_type: str) -> List[str]:
     if cause_type == "recovery_of_possession_tenant":
         if re.search(r"\bArticle\s+65\b", text, re.IGNORECASE):
             issues.append("Tenant possession draft cites Article 65 instead of the tenant track limitation.")
-        if "easements act" in lower or re.search(r"\bSection\s+52\b|\bSection\s+62\b", text, re.IGNORECASE):
+        if "easements act" in hits or re.search(r"\bSection\s+52\b|\bSection\s+62\b", text, re.IGNORECASE):
             issues.append("Tenant possession draft mixes licence/Easements Act language.")
     elif cause_type == "recovery_of_possession_licensee":
         if re.search(r"\bArticle\s+67\b", text, re.IGNORECASE):
             issues.append("Licensee possession draft cites Article 67 instead of the title-based licence track.")
-        if "transfer of property act" in lower or re.search(r"\bSection\s+106\b|\bSection\s+111\b", text, re.IGNORECASE):
+        if "transfer of property act" in hits or re.search(r"\bSection\s+106\b|\bSection\s+111\b", text, re.IGNORECASE):
             issues.append("Licensee possession draft mixes tenancy/Transfer of Property Act language.")
-        if "easements act" not in lower and not re.search(r"\bSection\s+52\b|\bSection\s+60\b|\bSection\s+61\b|\bSection\s+62\b|\bSection\s+63\b", text, re.IGNORECASE):
+        if "easements act" not in hits and not re.search(r"\bSection\s+52\b|\bSection\s+60\b|\bSection\s+61\b|\bSection\s+62\b|\bSection\s+63\b", text, re.IGNORECASE):
             issues.append("Licensee possession draft omits the Indian Easements Act footing for the licence track.")
     elif cause_type == "recovery_of_possession_trespasser":
         if re.search(r"\bArticle\s+67\b", text, re.IGNORECASE):
@@ -1386,47 +1391,48 @@ def _possession_consistency_issues(text: str, cause_type: str) -> List[str]:
         issues.append("Possession prayer still begins with a generic money-damages decree instead of a possession decree.")
     if re.search(r"mesne profits[^.\n]{0,120}rate of[^.\n]{0,40}%\s+per\s+annum", lower, re.IGNORECASE):
         issues.append("Mesne profits are pleaded as an interest-rate-only claim instead of a profits/use-and-occupation claim.")
-    if "order xx rule 12" not in lower:
+    if "order xx rule 12" not in hits:
         issues.append("Possession draft omits the Order XX Rule 12 CPC inquiry footing for mesne profits.")
-    if "past mesne profits" not in lower or (
-        "future mesne profits" not in lower and "inquiry under order xx rule 12" not in lower
+    if "past mesne profits" not in hits or (
+        "future mesne profits" not in hits and "inquiry under order xx rule 12" not in hits
     ):
         issues.append("Possession draft does not clearly separate past mesne profits from future inquiry relief.")
     if re.search(r"cause of action[^.\n]{0,180}first arose[^.\n]{0,100}notice", lower, re.IGNORECASE):
         issues.append("Possession draft incorrectly anchors the first accrual of cause of action to the legal notice date.")
-    if "person in possession" in lower and "recovery of possession" in lower:
+    if "person in possession" in hits and "recovery of possession" in hits:
         issues.append("Possession draft says the plaintiff is already in possession while also seeking recovery of possession.")
 
     return issues
 
 
+_PROPERTY_HINTS = (
+    "agricultural land",
+    "survey no",
+    "survey number",
+    "suit property",
+    "immovable property",
+    "revenue record",
+    "mutation",
+    "pahani",
+    "rtc",
+    "adangal",
+)
+
+
 def _injunction_consistency_issues(text: str, cause_type: str) -> List[str]:
     if not text or get_family(cause_type) != "injunction":
         return []
 
     lower = text.lower()
+    hits = _draft_hits(text)
     issues: List[str] = []
-    property_based = any(
-        token in lower
-        for token in (
-            "agricultural land",
-            "survey no",
-            "survey number",
-            "suit property",
-            "immovable property",
-            "revenue record",
-            "mutation",
-            "pahani",
-            "rtc",
-            "adangal",
-        )
-    )
+    property_based = hits.any(_PROPERTY_HINTS)
     has_section_16 = bool(re.search(r"\bsection\s+16\b", text, re.IGNORECASE))
     has_situs_jurisdiction = bool(
         re.search(r"(property|land|suit property|agricultural land)[^.\n]{0,140}\b(situated|situate)\b", lower, re.IGNORECASE)
     )
 
-    if "with interest and costs" in lower:
+    if "with interest and costs" in hits:
         issues.append("Injunction draft title still uses the generic 'WITH INTEREST AND COSTS' damages template.")
     if re.search(r"(?m)^INTEREST\b", text):
         issues.append("Bare injunction draft still contains a standalone INTEREST section.")
@@ -1439,7 +1445,7 @@ def _injunction_consistency_issues(text: str, cause_type: str) -> List[str]:
     if re.search(r"pass a decree[^.\n]{0,200}(sum of rs|towards damages)", lower, re.IGNORECASE):
         issues.append("Bare injunction prayer still contains a generic money-damages decree.")
     if property_based and (
-        "carries on business / resides" in lower
+        "carries on business / resides" in hits
         or re.search(r"territorial jurisdiction[^.\n]{0,180}defendant[^.\n]{0,80}resides", lower)
     ):
         issues.append("Property injunction draft pleads Section 20-style residence/cause-of-action jurisdiction instead of immovable-property situs jurisdiction.")
@@ -1459,25 +1465,26 @@ def _easement_consistency_issues(text: str, cause_type: str) -> List[str]:
         return []
 
     lower = text.lower()
+    hits = _draft_hits(text)
     issues: List[str] = []
     has_section_16 = bool(re.search(r"\bsection\s+16\b", text, re.IGNORECASE))
     has_situs_jurisdiction = bool(
         re.search(r"(property|pathway|passage|land|servient|dominant)[^.\n]{0,140}\b(situated|situate)\b", lower)
     )
 
-    if "suit for suit for" in lower:
+    if "suit for suit for" in hits:
         issues.append("Easement draft title still duplicates the 'SUIT FOR' prefix.")
     if re.search(r"(?m)^INTEREST\b", text):
         issues.append("Easement draft still contains a standalone INTEREST section.")
     if re.search(r"pass a decree[^.\n]{0,220}(sum of rs|towards damages)", lower, re.IGNORECASE):
         issues.append("Easement prayer still falls back to a generic money-damages decree.")
-    if "easements act" not in lower or not re.search(r"\bsection\s+15\b", text, re.IGNORECASE):
+    if "easements act" not in hits or not re.search(r"\bsection\s+15\b", text, re.IGNORECASE):
         issues.append("Easement draft omits the Indian Easements Act / Section 15 prescriptive footing.")
     has_section_34 = bool(re.search(r"\bsection(?:s)?\s+34\b", text, re.IGNORECASE))
-    has_perm_injunction_track = "permanent injunction" in lower or bool(
+    has_perm_injunction_track = "permanent injunction" in hits or bool(
         re.search(r"\bsection(?:s)?\s+38\b", text, re.IGNORECASE)
     )
-    has_mand_injunction_track = "mandatory injunction" in lower or bool(
+    has_mand_injunction_track = "mandatory injunction" in hits or bool(
         re.search(r"\bsection(?:s)?\s+39\b", text, re.IGNORECASE)
     )
 
@@ -1487,9 +1494,9 @@ def _easement_consistency_issues(text: str, cause_type: str) -> List[str]:
         issues.append("Easement draft omits the Sections 38 and 39 Specific Relief Act injunction footing.")
     if not has_section_16 and not has_situs_jurisdiction:
         issues.append("Easement draft does not clearly plead property-situs jurisdiction under Section 16 CPC.")
-    if "dominant heritage" not in lower and "schedule a" not in lower:
+    if "dominant heritage" not in hits and "schedule a" not in hits:
         issues.append("Easement draft does not distinctly identify the dominant heritage.")
-    if "servient" not in lower and "pathway" not in lower and "passage" not in lower and "schedule b" not in lower:
+    if "servient" not in hits and "pathway" not in hits and "passage" not in hits and "schedule b" not in hits:
         issues.append("Easement draft does not distinctly identify the servient pathway / passage.")
 
     return issues
@@ -1500,11 +1507,12 @@ def _easement_blocking_violations(text: str, cause_type: str) -> List[str]:
         return []
 
     lower = text.lower()
+    hits = _draft_hits(text)
     violations: List[str] = []
     prayer_start = lower.rfind("prayer")
     prayer_text = lower[prayer_start:] if prayer_start >= 0 else lower
 
-    if "suit for suit for" in lower:
+    if "suit for suit for" in hits:
         violations.append("EASEMENT_TEMPLATE_DRIFT: Draft title still duplicates the 'SUIT FOR' prefix.")
     if re.search(r"pass a decree[^.\n]{0,220}(sum of rs|towards damages)", prayer_text, re.IGNORECASE):
         violations.append("EASEMENT_TEMPLATE_DRIFT: Easement draft prayer fell back to a money-damages decree.")
@@ -1541,6 +1549,7 @@ def _contract_consistency_issues(text: str, cause_type: str) -> List[str]:
         return []
 
     lower = text.lower()
+    hits = _draft_hits(text)
     issues: List[str] = []
 
     # S.73 vs S.74 mixing — mutually exclusive damage tracks
@@ -1560,7 +1569,7 @@ def _contract_consistency_issues(text: str, cause_type: str) -> List[str]:
         )
 
     # S.12A CCRA 2018 — pre-institution mediation mandatory for commercial disputes
-    if "commercial dispute" in lower or "commercial court" in lower:
+    if "commercial dispute" in hits or "commercial court" in hits:
         if not re.search(r"\bsection\s+12a\b", lower) and not re.search(r"\bpre.?institution\s+mediation\b", lower):
             issues.append(
                 "Commercial dispute draft omits mandatory pre-institution mediation "
@@ -1911,6 +1920,7 @@ def _tenancy_consistency_issues(text: str, cause_type: str) -> List[str]:
         return []
 
     lower = text.lower()
+    hits = _draft_hits(text)
     issues: List[str] = []
 
     # Rent Act protection — if tenant is protected under state rent act, civil suit may be barred
@@ -1949,7 +1959,7 @@ def _tenancy_consistency_issues(text: str, cause_type: str) -> List[str]:
 
     # Mesne profits post-tenancy — needs Order XX Rule 12 footing
     if cause_type == "mesne_profits_post_tenancy":
-        if "order xx rule 12" not in lower:
+        if "order xx rule 12" not in hits:
             issues.append(
                 "Mesne profits post-tenancy draft omits Order XX Rule 12 CPC "
                 "inquiry footing."
@@ -2069,6 +2079,47 @@ def _tort_consistency_issues(text: str, cause_type: str) -> List[str]:
     return issues
 
 
+# Literal phrases the consistency gates test against the draft. Registered with
+# the Civil LKB automaton so each draft is scanned once for all of them.
+_GATE_KEYWORDS = (
+    "carries on business / resides",
+    "commercial court",
+    "commercial dispute",
+    "dominant heritage",
+    "easements act",
+    "future mesne profits",
+    "inquiry under order xx rule 12",
+    "mandatory injunction",
+    "order xx rule 12",
+    "passage",
+    "past mesne profits",
+    "pathway",
+    "permanent injunction",
+    "person in possession",
+    "recovery of possession",
+    "schedule a",
+    "schedule b",
+    "servient",
+    "suit for suit for",
+    "transfer of property act",
+    "with interest and costs",
+)
+
+register_keywords(
+    "Civil",
+    _GATE_KEYWORDS
+    + _PROPERTY_HINTS
+    + tuple(kw for keywords in _RELIEF_KEYWORDS.values() for kw in keywords)
+    + _TENANT_HINTS + _LICENSE_HINTS + _CO_OWNER_HINTS + _TRESPASS_HINTS + _EVICTION_HINTS,
+)
+
+
+@lru_cache(maxsize=16)
+def _draft_hits(text: str) -> KeywordHits:
+    """Keyword hit map of a draft; the gates share one scan per draft text."""
+    return keyword_hits(text.lower())
+
+
 def civil_consistency_gate_node(state: DraftingState) -> Command:
     """Semantic consistency gate — flags issues for review, does NOT block.
 
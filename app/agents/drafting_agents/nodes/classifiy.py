@@ -7,14 +7,14 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.types import Command
 
 from ....config import logger
-from ....services import glm_model as ollma_model
+from ....services import ainvoke_llm, glm_model as ollma_model
 from ....utils.draftingAgent import CIVIL_PROFILE, get_active_qdrant_profile
 from ..prompts import CLASSIFY_USER_PROMPT, build_classify_system_prompt
 from ..states import ClassifyNode, DraftingState
 from ._utils import _as_dict, _as_json
 
 
-def classifier_node(state: DraftingState) -> Dict[str, Any]:
+async def classifier_node(state: DraftingState) -> Dict[str, Any]:
     """Classify legal domain/doc type and prepare retrieval plan."""
     logger.info("[CLASSIFY] ▶ start")
     t0 = time.perf_counter()
@@ -42,7 +42,7 @@ def classifier_node(state: DraftingState) -> Dict[str, Any]:
 
     try:
         messages = [SystemMessage(content=build_classify_system_prompt()), human_message]
-        response = structured_llm.invoke(messages)
+        response = await ainvoke_llm(structured_llm, messages)
         result = _as_dict(response)
         logger.info(
             "[CLASSIFY] ✓ done (%.1fs) | domain=%s | doc_type=%s | collection=%s",
@@ -58,7 +58,7 @@ def classifier_node(state: DraftingState) -> Dict[str, Any]:
     try:
         retry_system = build_classify_system_prompt(retry=True)
         retry_messages = [SystemMessage(content=retry_system), human_message]
-        response = structured_llm.invoke(retry_messages)
+        response = await ainvoke_llm(structured_llm, retry_messages)
         result = _as_dict(response)
         logger.info(
             "[CLASSIFY] ✓ done on retry (%.1fs) | domain=%s | doc_type=%s",
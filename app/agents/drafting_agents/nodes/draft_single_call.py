@@ -15,7 +15,7 @@ from langgraph.graph import END
 from langgraph.types import Command
 
 from ....config import logger, settings
-from ....services import draft_ollama_model as draft_openai_model
+from ....services import ainvoke_llm, draft_ollama_model as draft_openai_model
 from ..lkb.limitation import get_limitation_reference_details, normalize_coa_type
 from ..prompts.draft_prompt import (
     build_draft_system_prompt,
@@ -469,7 +469,7 @@ async def draft_single_call_node(state: DraftingState) -> Command:
 
     for attempt in range(1, 3):
         try:
-            response = model.invoke(messages)
+            response = await ainvoke_llm(model, messages, cache=attempt == 1)
             raw_text = getattr(response, "content", "") or ""
             logger.info(
                 "[DRAFT] attempt %d raw response length: %d",
@@ -660,7 +660,7 @@ async def draft_freetext_node(state: DraftingState) -> Command:
     draft_text = ""
     for attempt in range(1, 3):
         try:
-            response = model.invoke(messages)
+            response = await ainvoke_llm(model, messages, cache=attempt == 1)
             raw_text = getattr(response, "content", "") or ""
             logger.info(
                 "[DRAFT_FREETEXT] attempt %d raw response length: %d",
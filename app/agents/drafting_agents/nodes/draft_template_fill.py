@@ -20,7 +20,7 @@ from langgraph.graph import END
 from langgraph.types import Command
 
 from ....config import logger, settings
-from ....services import draft_ollama_model as draft_openai_model
+from ....services import ainvoke_llm, draft_ollama_model as draft_openai_model
 from ..prompts.gap_fill_prompt import (
     build_gap_fill_system_prompt,
     build_gap_fill_user_prompt,
@@ -510,7 +510,7 @@ async def draft_template_fill_node(state: DraftingState) -> Command:
     llm_response = ""
     for attempt in range(1, 3):
         try:
-            response = model.invoke(messages)
+            response = await ainvoke_llm(model, messages, cache=attempt == 1)
             raw_text = getattr(response, "content", "") or ""
             logger.info(
                 "[DRAFT_TEMPLATE_FILL] Phase 2 attempt %d | raw_len=%d",
@@ -20,7 +20,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.types import Command
 
 from ....config import logger, settings
-from ....services import glm_model
+from ....services import ainvoke_llm, glm_model
 from ..tools import CourtFeeWebSearchTool, LegalResearchWebSearchTool
 from ..lkb import (
     filter_superseded_provisions,
@@ -231,7 +231,7 @@ async def _websearch_limitation_retry(
     logger.info("[ENRICHMENT] limitation retry websearch: %r", query)
 
     try:
-        items = _fetch_one(api_key, query)
+        items = await _fetch_one(api_key, query)
     except Exception as exc:
         logger.warning("[ENRICHMENT] limitation retry websearch failed: %s", exc)
         return []
@@ -548,7 +548,7 @@ async def _websearch_limitation_candidates(
     logger.info("[ENRICHMENT] limitation websearch: %r", query)
 
     try:
-        items = _fetch_one(api_key, query)
+        items = await _fetch_one(api_key, query)
     except Exception as exc:
         logger.warning("[ENRICHMENT] limitation websearch failed: %s", exc)
         return []
@@ -619,7 +619,7 @@ async def _llm_select_limitation(
             logger.warning("[ENRICHMENT] glm_model unavailable — falling back to first candidate")
             return candidates[0] if candidates else None
 
-        response = model.invoke([
+        response = await ainvoke_llm(model, [
             SystemMessage(content=_LIM_SELECTOR_SYSTEM),
             HumanMessage(content=user_prompt),
         ])
@@ -709,7 +709,7 @@ async def _websearch_provision(
     query = f"{section_key} {act_name} India text provision".strip()
     logger.info("[ENRICHMENT] provision websearch: %r", query)
     try:
-        items = _fetch_one(api_key, query)
+        items = await _fetch_one(api_key, query)
     except Exception as exc:
         logger.warning("[ENRICHMENT] provision websearch failed: %s", exc)
         return None
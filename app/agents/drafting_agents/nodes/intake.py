@@ -7,13 +7,13 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.types import Command
 
 from ....config import logger
-from ....services import glm_model as ollma_model
+from ....services import ainvoke_llm, glm_model as ollma_model
 from ..prompts import INTAKE_USER_PROMPT, build_intake_system_prompt
 from ..states import DraftingState, IntakeNode
 from ._utils import _as_dict
 
 
-def intake_node(state: DraftingState) -> Dict[str, Any]:
+async def intake_node(state: DraftingState) -> Dict[str, Any]:
     """Extract structured intake details from the raw user request."""
     logger.info("[INTAKE] ▶ start")
     t0 = time.perf_counter()
@@ -33,7 +33,7 @@ def intake_node(state: DraftingState) -> Dict[str, Any]:
     ]
 
     try:
-        response = structured_llm.invoke(messages)
+        response = await ainvoke_llm(structured_llm, messages)
         result = _as_dict(response)
         facts_summary = (result.get("facts") or {}).get("summary", "")[:80]
         jurisdiction = (result.get("jurisdiction") or {})
@@ -58,7 +58,7 @@ def intake_node(state: DraftingState) -> Dict[str, Any]:
             ),
             HumanMessage(content=INTAKE_USER_PROMPT.format(user_text=user_text)),
         ]
-        response = structured_llm.invoke(retry_messages)
+        response = await ainvoke_llm(structured_llm, retry_messages)
         result = _as_dict(response)
         logger.info("[INTAKE] ✓ done on retry (%.1fs)", time.perf_counter() - t0)
         return Command(update={"intake": result}, goto="classify")
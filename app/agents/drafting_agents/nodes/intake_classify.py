@@ -15,7 +15,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.types import Command
 
 from ....config import logger
-from ....services import glm_model as ollma_model
+from ....services import ainvoke_llm, glm_model as ollma_model
 from ....utils.draftingAgent import CIVIL_PROFILE, get_active_qdrant_profile
 from ..prompts.intake_classify import (
     INTAKE_CLASSIFY_USER_PROMPT,
@@ -50,7 +50,7 @@ def _next_node() -> str:
     return "domain_router"
 
 
-def intake_classify_node(state: DraftingState) -> Dict[str, Any]:
+async def intake_classify_node(state: DraftingState) -> Dict[str, Any]:
     """Extract intake + classify in ONE LLM call."""
     logger.info("[INTAKE+CLASSIFY] ▶ start")
     t0 = time.perf_counter()
@@ -83,7 +83,7 @@ def intake_classify_node(state: DraftingState) -> Dict[str, Any]:
             SystemMessage(content=build_intake_classify_system_prompt()),
             HumanMessage(content=user_prompt),
         ]
-        response = structured_llm.invoke(messages)
+        response = await ainvoke_llm(structured_llm, messages)
         result = _as_dict(response)
         intake, classify = _split_result(result)
 
@@ -105,7 +105,7 @@ def intake_classify_node(state: DraftingState) -> Dict[str, Any]:
             SystemMessage(content=build_intake_classify_system_prompt(retry=True)),
             HumanMessage(content=user_prompt),
         ]
-        response = structured_llm.invoke(retry_messages)
+        response = await ainvoke_llm(structured_llm, retry_messages)
         result = _as_dict(response)
         intake, classify = _split_result(result)
 
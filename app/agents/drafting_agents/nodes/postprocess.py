@@ -9,14 +9,21 @@ Safe auto-fixes ONLY:
 NEVER auto-fixes substance (limitation reasoning, legal arguments, interest rates).
 
 Pipeline position: evidence_anchoring → **postprocess** → citation_validator
+
+The fixes are declared once in ``_RULES`` with precompiled patterns and run by
+``_apply_rules``. Rules whose matches cannot interact share one pass (one
+alternation, or one walk over the lines); each rule's wall time is recorded
+and available from ``get_postprocess_rule_stats()``.
 """
 from __future__ import annotations
 
 import json
 import re
+import threading
 import time
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from langgraph.types import Command
 
@@ -39,20 +46,31 @@ except (FileNotFoundError, json.JSONDecodeError):
     pass
 
 
+_PLACEHOLDER_TOKEN_RE = re.compile(r"\{\{([^{}]*)\}\}")
+
+
 def _normalize_placeholders(text: str) -> Tuple[str, int]:
     """Replace alias placeholders with canonical names. Returns (text, count)."""
+    present = set(_PLACEHOLDER_TOKEN_RE.findall(text)) if "{{" in text else set()
     count = 0
     for alias, canonical in _ALIAS_MAP.items():
-        pattern = "{{" + alias + "}}"
-        if pattern in text:
-            text = text.replace(pattern, "{{" + canonical + "}}")
+        if alias in present:
+            text = text.replace("{{" + alias + "}}", "{{" + canonical + "}}")
+            present.add(canonical)
             count += 1
     return text, count
 
 
+_ESCAPED_PLACEHOLDER_RE = re.compile(r"\{\{\{\{([A-Z0-9_]+)\}\}\}\}")
+# Both mid-word cases in one pass: word char before "{{" and "}}" before a word char
+_MID_WORD_PLACEHOLDER_RE = re.compile(r"(?<=\w)\{\{|\}\}(?=\w)")
+
+
 def _fix_escaped_placeholders(text: str) -> Tuple[str, int]:
     """Collapse accidentally escaped placeholder braces back to canonical form."""
-    fixed = re.sub(r"\{\{\{\{([A-Z0-9_]+)\}\}\}\}", r"{{\1}}", text)
+    if "{{{{" not in text:
+        return text, 0
+    fixed = _ESCAPED_PLACEHOLDER_RE.sub(r"{{\1}}", text)
     return fixed, 1 if fixed != text else 0
 
 
@@ -63,15 +81,14 @@ def _fix_mid_word_placeholders(text: str) -> Tuple[str, int]:
     when they confuse placeholder syntax with natural text. This inserts
     a space between the word character and the placeholder braces.
     """
-    count = 0
-    # word char immediately before {{ → insert space
-    fixed = re.sub(r"(\w)(\{\{)", r"\1 \2", text)
-    count += (len(fixed) - len(text))  # rough count
-    # }} immediately before word char → insert space
-    text = fixed
-    fixed = re.sub(r"(\}\})(\w)", r"\1 \2", text)
-    count += (len(fixed) - len(text))
-    return fixed, max(count, 0)
+    if "{{" not in text and "}}" not in text:
+        return text, 0
+    return _MID_WORD_PLACEHOLDER_RE.subn(lambda m: " {{" if m.group() == "{{" else "}} ", text)
+
+
+_TRUNCATED_ENDING_RE = re.compile(
+    r"\b(under|under\s+Section|of|the|in|at|by|for|and|or|to|from|with|that|which|Section)\s*$"
+)
 
 
 def _flag_incomplete_sentences(text: str) -> List[Dict[str, Any]]:
@@ -92,10 +109,7 @@ def _flag_incomplete_sentences(text: str) -> List[Dict[str, Any]]:
             continue
         # Check if line ends with a truncation indicator
         # (preposition, article, conjunction, or "Section"/"under" without completion)
-        trunc = re.search(
-            r"\b(under|under\s+Section|of|the|in|at|by|for|and|or|to|from|with|that|which|Section)\s*$",
-            stripped,
-        )
+        trunc = _TRUNCATED_ENDING_RE.search(stripped)
         if trunc:
             issues.append({
                 "type": "incomplete_sentence",
@@ -106,51 +120,69 @@ def _flag_incomplete_sentences(text: str) -> List[Dict[str, Any]]:
     return issues
 
 
+_PARAGRAPH_BREAK_RE = re.compile(r"(?<!\n)(\s)(\d+\.\s)")
+_PARAGRAPH_NUMBER_SPACING_RE = re.compile(r"(?m)^(\s*\d+)\.(\S)")
+_CPC_YEAR_SPLIT_RE = re.compile(r"(Code of Civil Procedure,)\s*\n+\s*(1908\.)")
+_ACT_YEAR_SPLIT_RE = re.compile(r"([A-Za-z][A-Za-z\s]+Act,)\s*\n+\s*((?:18|19|20)\d{2}\.)")
+# Literal tail of _ACT_YEAR_SPLIT_RE; its backtracking head only runs when this is present
+_ACT_YEAR_SPLIT_HINT_RE = re.compile(r"Act,\s*\n\s*(?:18|19|20)\d{2}\.")
+_BREACH_HEADING_HINT_RE = re.compile(r"breach\s+particula", re.IGNORECASE)
+_BREACH_HEADING_RE = re.compile(
+    r"^(BREACH\s+PARTICULA\w*)(?:\s+\{\{[A-Z0-9_]+\}\}\.)?\s*(.+)$",
+    re.IGNORECASE,
+)
+_NUMBERED_LINE_RE = re.compile(r"^(\s*)(\d+)\.\s")
+# Prayer sub-items after ";" or "." and annexure items after ";" — the three
+# never share characters, so one scan splits them all.
+_LIST_BREAK_RE = re.compile(r";\s*(?:\(([a-z])\)|((?i:Annexure)\s))|\.\s+\(([b-z])\)")
+_BLANK_RUN_RE = re.compile(r"\n{3,}")
+_AND_OR_RE = re.compile(r"\band/or\b", re.IGNORECASE)
+
+
 def _fix_paragraph_breaks(text: str) -> Tuple[str, int]:
     """Split run-together numbered paragraphs into separate lines.
 
     LLMs often output "4. First para. 5. Second para." as one continuous
     string. This inserts newlines before each numbered paragraph start.
     """
-    original = text
-    # Insert \n\n before numbered paragraph starts that are NOT at line start
-    text = re.sub(r"(?<!\n)(\s)(\d+\.\s)", r"\n\n\2", text)
-    fixes = 1 if text != original else 0
-    return text, fixes
+    fixed = _PARAGRAPH_BREAK_RE.sub(r"\n\n\2", text)
+    return fixed, 1 if fixed != text else 0
 
 
 def _fix_paragraph_number_spacing(text: str) -> Tuple[str, int]:
     """Normalize numbered paragraphs from `1.Text` to `1. Text`."""
-    fixed = re.sub(r"(?m)^(\s*\d+)\.(\S)", r"\1. \2", text)
+    fixed = _PARAGRAPH_NUMBER_SPACING_RE.sub(r"\1. \2", text)
     return fixed, 1 if fixed != text else 0
 
 
 def _fix_split_act_years(text: str) -> Tuple[str, int]:
     """Join stray act-year lines like `Code of Civil Procedure,` + `1908.`."""
-    fixed = re.sub(r"(Code of Civil Procedure,)\s*\n+\s*(1908\.)", r"\1 \2", text)
-    fixed = re.sub(r"([A-Za-z][A-Za-z\s]+Act,)\s*\n+\s*((?:18|19|20)\d{2}\.)", r"\1 \2", fixed)
+    fixed = text
+    if "Code of Civil Procedure," in fixed:
+        fixed = _CPC_YEAR_SPLIT_RE.sub(r"\1 \2", fixed)
+    if _ACT_YEAR_SPLIT_HINT_RE.search(fixed):
+        fixed = _ACT_YEAR_SPLIT_RE.sub(r"\1 \2", fixed)
     return fixed, 1 if fixed != text else 0
 
 
 def _repair_breach_heading_runon(text: str) -> Tuple[str, int]:
     """Repair common run-together breach heading corruption before numbering."""
+    if not _BREACH_HEADING_HINT_RE.search(text):
+        return text, 0
+
     lines = text.split("\n")
     fixed: List[str] = []
     fixes = 0
 
     for line in lines:
         stripped = line.strip()
-        match = re.match(
-            r"^(BREACH\s+PARTICULA\w*)(?:\s+\{\{[A-Z0-9_]+\}\}\.)?\s*(.+)$",
-            stripped,
-            flags=re.IGNORECASE,
-        )
+        match = _BREACH_HEADING_RE.match(stripped)
         if match and match.group(2):
             prev_num = 0
             for prior in reversed(fixed):
-                num_match = re.match(r"^\s*(\d+)\.\s", prior)
+                num_match = _NUMBERED_LINE_RE.match(prior)
                 if num_match:
-                    prev_num = int(num_match.group(1))
+                    prev_num = int(num_match.group(2))
                     break
             next_num = prev_num + 1 if prev_num else 1
             fixed.append("BREACH PARTICULARS")
@@ -163,63 +195,73 @@ def _repair_breach_heading_runon(text: str) -> Tuple[str, int]:
     return "\n".join(fixed), fixes
 
 
-def _fix_prayer_items(text: str) -> Tuple[str, int]:
-    """Ensure prayer sub-items (a), (b), (c) are on separate lines."""
-    original = text
-    # Split run-together prayer items: "...relief; (b) Award..." → newline before (b)
-    text = re.sub(r";\s*\(([a-z])\)", r";\n(\1)", text)
-    # Also handle period before prayer item: "...suit. (b) Award..."
-    text = re.sub(r"\.\s+\(([b-z])\)", r".\n(\1)", text)
-    fixes = 1 if text != original else 0
-    return text, fixes
+def _fix_list_breaks(text: str) -> Tuple[str, int, int]:
+    """Put prayer sub-items (a), (b), (c) and semicolon-separated annexures on their own lines.
+
+    "...relief; (b) Award..." and "...suit. (b) Award..." get a newline before
+    the item; "...; Annexure P-2" gets a blank line before the annexure.
+    Returns (text, prayer_fixes, annexure_fixes), each 1 if anything changed.
+    """
+    changed = [False, False]
 
+    def _split(match: "re.Match[str]") -> str:
+        if match.group(1) is not None:
+            replacement, kind = f";\n({match.group(1)})", 0
+        elif match.group(2) is not None:
+            replacement, kind = f";\n\n{match.group(2)}", 1
+        else:
+            replacement, kind = f".\n({match.group(3)})", 0
+        if replacement != match.group(0):
+            changed[kind] = True
+        return replacement
 
-def _fix_annexure_list_breaks(text: str) -> Tuple[str, int]:
-    """Split semicolon-separated annexure items into separate lines."""
-    original = text
-    text = re.sub(r";\s*(Annexure\s)", r";\n\n\1", text, flags=re.IGNORECASE)
-    fixes = 1 if text != original else 0
-    return text, fixes
+    fixed = _LIST_BREAK_RE.sub(_split, text)
+    return fixed, int(changed[0]), int(changed[1])
 
 
 def _collapse_blank_lines(text: str) -> Tuple[str, int]:
     """Collapse 3+ consecutive blank lines to 2."""
-    original = text
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    fixes = 1 if text != original else 0
-    return text, fixes
+    if "\n\n\n" not in text:
+        return text, 0
+    fixed = _BLANK_RUN_RE.sub("\n\n", text)
+    return fixed, 1 if fixed != text else 0
 
 
-def _strip_trailing_whitespace(text: str) -> Tuple[str, int]:
-    """Strip trailing whitespace from each line."""
-    lines = text.split("\n")
-    fixed = [line.rstrip() for line in lines]
-    fixes = sum(1 for a, b in zip(lines, fixed) if a != b)
-    return "\n".join(fixed), fixes
+def _is_heading_line(stripped: str) -> bool:
+    return (
+        bool(stripped)
+        and stripped == stripped.upper()
+        and len(stripped) < 80
+        and "{{" not in stripped
+    )
 
 
-def _fix_numbering(text: str) -> Tuple[str, int]:
-    """Fix paragraph numbering continuity — CONTINUOUS across entire document.
+def _strip_and_renumber(text: str) -> Tuple[str, int, int]:
+    """Strip trailing whitespace, then fix paragraph numbering, in one walk over the lines.
 
-    Does NOT reset numbering on section headings. Paragraphs are numbered
-    1, 2, 3... through the whole plaint as required by court filing standards.
-    Skips renumbering inside PRAYER sections (which use (a), (b), (c)).
+    Numbering is CONTINUOUS across the entire document: it does NOT reset on
+    section headings. Paragraphs are numbered 1, 2, 3... through the whole
+    plaint as required by court filing standards. Skips renumbering inside
+    PRAYER sections (which use (a), (b), (c)).
+
+    Returns (text, trailing_whitespace_fixes, numbering_fixes).
     """
-    lines = text.split("\n")
     fixed_lines: List[str] = []
     expected = 1
     fixes = 0
+    ws_fixes = 0
     in_prayer = False
 
-    for line in lines:
+    for line in text.split("\n"):
+        stripped_line = line.rstrip()
+        if stripped_line != line:
+            ws_fixes += 1
+            line = stripped_line
         stripped = line.strip()
 
         # Detect ALL-CAPS heading (do NOT reset numbering — keep continuous)
         if (
-            stripped
-            and stripped == stripped.upper()
-            and len(stripped) < 80
-            and "{{" not in stripped
+            _is_heading_line(stripped)
             and not stripped.startswith(("(", "•", "-"))
             and len(stripped) > 3
         ):
@@ -233,7 +275,7 @@ def _fix_numbering(text: str) -> Tuple[str, int]:
             continue
 
         # Match numbered paragraph starts: "1.", "2.", etc.
-        m = re.match(r"^(\s*)(\d+)\.\s", line)
+        m = _NUMBERED_LINE_RE.match(line)
         if m:
             indent = m.group(1)
             actual = int(m.group(2))
@@ -243,15 +285,7 @@ def _fix_numbering(text: str) -> Tuple[str, int]:
             expected += 1
         fixed_lines.append(line)
 
-    return "\n".join(fixed_lines), fixes
-
-
-def _fix_annexure_labels(text: str) -> Tuple[str, int]:
-    """Ensure annexure references in body match the document list section."""
-    # Find all annexure references
-    body_refs = set(re.findall(r"Annexure[\s-]+([A-Z](?:\d+)?)", text, re.IGNORECASE))
-    # No auto-fix logic needed for first pass — just count for reporting
-    return text, 0
+    return "\n".join(fixed_lines), ws_fixes, fixes
 
 
 def _fix_and_or(text: str) -> Tuple[str, int]:
@@ -261,16 +295,11 @@ def _fix_and_or(text: str) -> Tuple[str, int]:
     with 'and'. Only exception: if preceded by a clear disjunctive context.
     We default to 'and' since it's the safer legal choice.
     """
-    count = 0
     # "failed and/or neglected" → "failed and neglected"
     # "refused and/or failed"  → "refused and failed"
-    result = text
-    and_or_pattern = re.compile(r"\band/or\b", re.IGNORECASE)
-    matches = list(and_or_pattern.finditer(result))
-    count = len(matches)
-    if count:
-        result = and_or_pattern.sub("and", result)
-    return result, count
+    if "/" not in text:
+        return text, 0
+    return _AND_OR_RE.subn("and", text)
 
 
 # Anti-patterns: drafting-notes language that must NEVER appear in a filed document
@@ -288,6 +317,12 @@ _DRAFTING_NOTES_PATTERNS = [
         r"\bneed(?:s|ed)?\s+to\s+(?:be\s+)?(?:confirm|verif|check)\b",
     ]
 ]
+# Any-of prefilter: clean drafts (the common case) are scanned once, not per pattern
+_DRAFTING_NOTES_ANY_RE = re.compile(
+    "|".join(f"(?:{p.pattern})" for p in _DRAFTING_NOTES_PATTERNS), re.IGNORECASE,
+)
+_CALC_LEGAL_BEFORE = frozenset({"interest", "amount", "sum", "rate", "damages", "compensation", "costs"})
+_CALC_LEGAL_AFTER = frozenset({"from", "until", "at", "on", "per", "and", "as", "till", "upto"})
 
 
 def _flag_drafting_notes(text: str) -> Tuple[str, List[Dict[str, Any]]]:
@@ -297,11 +332,11 @@ def _flag_drafting_notes(text: str) -> Tuple[str, List[Dict[str, Any]]]:
     Context-aware: legal phrases like "interest to be calculated from..." are NOT flagged.
     Returns (text_unchanged, issues_found).
     """
-    # Words before/after "to be calculated" that indicate legal context (not a drafting note)
-    _CALC_LEGAL_BEFORE = {"interest", "amount", "sum", "rate", "damages", "compensation", "costs"}
-    _CALC_LEGAL_AFTER = {"from", "until", "at", "on", "per", "and", "as", "till", "upto"}
-
+    # _CALC_LEGAL_BEFORE/_AFTER: words around "to be calculated" that indicate
+    # legal context (not a drafting note)
     issues: List[Dict[str, Any]] = []
+    if not _DRAFTING_NOTES_ANY_RE.search(text):
+        return text, issues
     for pattern in _DRAFTING_NOTES_PATTERNS:
         for m in pattern.finditer(text):
             matched = m.group().lower()
@@ -327,6 +362,14 @@ def _flag_drafting_notes(text: str) -> Tuple[str, List[Dict[str, Any]]]:
     return text, issues
 
 
+_EXPECTED_TRIGRAMS = frozenset({
+    "of the court", "the code of", "code of civil",
+    "of civil procedure", "the said amount",
+    "per cent per", "cent per annum",
+    "the plaintiff and", "and against the",
+})
+
+
 def _detect_repetition(text: str) -> List[Dict[str, Any]]:
     """Detect phrases repeated more than 3 times in the document.
 
@@ -343,13 +386,9 @@ def _detect_repetition(text: str) -> List[Dict[str, Any]]:
 
     # Count 3-gram frequencies
     trigram_counts: Dict[str, int] = {}
-    for i in range(len(words) - 2):
-        trigram = " ".join(words[i:i+3])
+    for trigram in map(" ".join, zip(words, words[1:], words[2:])):
         # Skip very common legal phrases that are expected to repeat
-        if trigram in ("of the court", "the code of", "code of civil",
-                       "of civil procedure", "the said amount",
-                       "per cent per", "cent per annum",
-                       "the plaintiff and", "and against the"):
+        if trigram in _EXPECTED_TRIGRAMS:
             continue
         trigram_counts[trigram] = trigram_counts.get(trigram, 0) + 1
 
@@ -364,63 +403,62 @@ def _detect_repetition(text: str) -> List[Dict[str, Any]]:
     return issues
 
 
+_PROTOCOL_MARKERS = ("---SECTION_TEXT---", "---CLAIM_LEDGER---")
+
+
 def _strip_protocol_markers(text: str) -> Tuple[str, int]:
     """Remove LLM protocol markers that should never appear in output."""
-    markers = ["---SECTION_TEXT---", "---CLAIM_LEDGER---"]
+    if "---" not in text:
+        return text, 0
     count = 0
-    for marker in markers:
+    for marker in _PROTOCOL_MARKERS:
         occurrences = text.count(marker)
         if occurrences:
             text = text.replace(marker, "")
             count += occurrences
     if count:
         # Clean up double blank lines left by marker removal
-        text = re.sub(r"\n{3,}", "\n\n", text)
+        text = _BLANK_RUN_RE.sub("\n\n", text)
     return text, count
 
 
-def _fix_spaced_out_titles(text: str) -> Tuple[str, int]:
-    """Collapse spaced-out ALL-CAPS titles like 'S U I T  F O R  D A M A G E S'.
+def _collapse_spaced_out_line(line: str) -> str:
+    """Collapse a spaced-out ALL-CAPS title like 'S U I T  F O R  D A M A G E S'.
 
-    LLMs sometimes produce decorative spacing in title lines. This collapses
-    single-char-spaced words back to normal: 'S U I T  F O R' → 'SUIT FOR'.
     Handles mixed content (letters, digits, punctuation) as long as the line
-    is predominantly single-spaced uppercase characters.
+    is predominantly single-spaced uppercase characters; other lines are
+    returned unchanged.
     """
-    fixes = 0
-    lines = text.split("\n")
-    fixed: List[str] = []
-    for line in lines:
-        stripped = line.strip()
-        # Detect: predominantly single uppercase letters separated by spaces
-        # Must be at least 20 chars (avoids false positives on short lines)
-        # Allow digits, commas, periods mixed in
-        if len(stripped) >= 20:
-            # Count single-char tokens separated by single spaces
-            tokens = stripped.split(" ")
-            single_char_count = sum(1 for t in tokens if len(t) == 1 and t.isupper())
-            # If >60% of tokens are single uppercase letters, it's spaced-out
-            if len(tokens) > 5 and single_char_count / len(tokens) > 0.6:
-                # Rebuild: collapse runs of single-char tokens into words
-                # Non-single-char tokens (like "39", "1872,") stay as-is
-                result_parts: List[str] = []
-                current_word: List[str] = []
-                for t in tokens:
-                    if len(t) == 1 and (t.isupper() or t == ","):
-                        current_word.append(t)
-                    else:
-                        if current_word:
-                            result_parts.append("".join(current_word))
-                            current_word = []
-                        result_parts.append(t)
-                if current_word:
-                    result_parts.append("".join(current_word))
-                collapsed = " ".join(result_parts)
-                if collapsed != stripped:
-                    line = line.replace(stripped, collapsed)
-                    fixes += 1
-        fixed.append(line)
-    return "\n".join(fixed), fixes
+    stripped = line.strip()
+    # Detect: predominantly single uppercase letters separated by spaces
+    # Must be at least 20 chars (avoids false positives on short lines)
+    # Allow digits, commas, periods mixed in
+    if len(stripped) < 20:
+        return line
+    # Count single-char tokens separated by single spaces
+    tokens = stripped.split(" ")
+    single_char_count = sum(1 for t in tokens if len(t) == 1 and t.isupper())
+    # If >60% of tokens are single uppercase letters, it's spaced-out
+    if len(tokens) <= 5 or single_char_count / len(tokens) <= 0.6:
+        return line
+    # Rebuild: collapse runs of single-char tokens into words
+    # Non-single-char tokens (like "39", "1872,") stay as-is
+    result_parts: List[str] = []
+    current_word: List[str] = []
+    for t in tokens:
+        if len(t) == 1 and (t.isupper() or t == ","):
+            current_word.append(t)
+        else:
+            if current_word:
+                result_parts.append("".join(current_word))
+                current_word = []
+            result_parts.append(t)
+    if current_word:
+        result_parts.append("".join(current_word))
+    collapsed = " ".join(result_parts)
+    if collapsed != stripped:
+        return line.replace(stripped, collapsed)
+    return line
 
 
 def _fix_heading_spacing(text: str) -> Tuple[str, int]:
@@ -430,16 +468,12 @@ def _fix_heading_spacing(text: str) -> Tuple[str, int]:
     lines = text.split("\n")
     fixed: List[str] = []
     for i, line in enumerate(lines):
-        stripped = line.strip()
         # Detect heading: ALL CAPS, short, not a placeholder
         if (
-            stripped
-            and stripped == stripped.upper()
-            and len(stripped) < 80
-            and "{{" not in stripped
-            and i > 0
+            i > 0
             and fixed
             and fixed[-1].strip()
+            and _is_heading_line(line.strip())
         ):
             fixed.append("")
             fixes += 1
@@ -447,27 +481,47 @@ def _fix_heading_spacing(text: str) -> Tuple[str, int]:
     return "\n".join(fixed), fixes
 
 
-def _strip_leaked_instructions(text: str) -> Tuple[str, int]:
-    """Remove drafting instruction text that the LLM copied verbatim from the prompt.
+_INSTRUCTION_LINE_RE = re.compile(
+    r"^\s*(?:PLACEMENT:\s|WHAT TO WRITE:\s|INSTRUCTION:\s|"
+    r"Note:\s+(?:All|The|This|These)\s)", re.IGNORECASE
+)
 
-    Patterns like 'PLACEMENT: after PRAYER', 'WHAT TO WRITE:', 'INSTRUCTION:' are
-    prompt directives — not legal content. Remove lines that match these patterns.
-    Also removes meta-notes like 'Note: All factual assertions herein...' which are
-    LLM self-commentary, not court-filing content.
+
+def _fix_title_and_instruction_lines(text: str) -> Tuple[str, int, int]:
+    """Collapse spaced-out titles and drop leaked prompt instructions in one walk over the lines.
+
+    Titles: LLMs sometimes produce decorative spacing in title lines,
+    'S U I T  F O R' → 'SUIT FOR'.
+    Instructions: lines like 'PLACEMENT: after PRAYER', 'WHAT TO WRITE:',
+    'INSTRUCTION:' are prompt directives, and 'Note: All factual assertions
+    herein...' is LLM self-commentary — neither is court-filing content.
+
+    Returns (text, title_fixes, instruction_fixes).
     """
-    fixes = 0
-    lines = text.split("\n")
+    title_fixes = 0
+    instruction_fixes = 0
     fixed: List[str] = []
-    _instruction_patterns = re.compile(
-        r"^\s*(?:PLACEMENT:\s|WHAT TO WRITE:\s|INSTRUCTION:\s|"
-        r"Note:\s+(?:All|The|This|These)\s)", re.IGNORECASE
-    )
-    for line in lines:
-        if _instruction_patterns.match(line):
-            fixes += 1
+    for line in text.split("\n"):
+        collapsed = _collapse_spaced_out_line(line)
+        if collapsed != line:
+            title_fixes += 1
+            line = collapsed
+        if _INSTRUCTION_LINE_RE.match(line):
+            instruction_fixes += 1
             continue  # skip the line entirely
         fixed.append(line)
-    return "\n".join(fixed), fixes
+    return "\n".join(fixed), title_fixes, instruction_fixes
+
+
+_ADVOCATE_BLOCK_RE = re.compile(
+    r"(?:ADVOCATE\s+(?:BLOCK|FOR\s+THE\s+PLAINTIFF)\s*\n+)?"
+    r"(?:Through:\s*\n)?"
+    r"\{\{ADVOCATE_NAME\}\}\s*\n"
+    r"(?:Advocate\s*\n)?"
+    r"Enrollment\s+No\.\s*\{\{ADVOCATE_ENROLLMENT\}\}",
+    re.IGNORECASE,
+)
+_ADVOCATE_ADDRESS_RE = re.compile(r"\s*\n\{\{ADVOCATE_ADDRESS\}\}")
 
 
 def _strip_duplicate_advocate_block(text: str) -> Tuple[str, int]:
@@ -477,16 +531,12 @@ def _strip_duplicate_advocate_block(text: str) -> Tuple[str, int]:
     (correct) and once at the very end under 'ADVOCATE BLOCK' or
     'ADVOCATE FOR THE PLAINTIFF' heading. Remove the second occurrence.
     """
+    # Every block contains the name placeholder — fewer than two means nothing to remove
+    if text.lower().count("{{advocate_name}}") < 2:
+        return text, 0
+
     # Find all advocate block occurrences (Through: + name + Advocate + Enrollment)
-    pattern = re.compile(
-        r"(?:ADVOCATE\s+(?:BLOCK|FOR\s+THE\s+PLAINTIFF)\s*\n+)?"
-        r"(?:Through:\s*\n)?"
-        r"\{\{ADVOCATE_NAME\}\}\s*\n"
-        r"(?:Advocate\s*\n)?"
-        r"Enrollment\s+No\.\s*\{\{ADVOCATE_ENROLLMENT\}\}",
-        re.IGNORECASE,
-    )
-    matches = list(pattern.finditer(text))
+    matches = list(_ADVOCATE_BLOCK_RE.finditer(text))
     if len(matches) <= 1:
         return text, 0
 
@@ -505,7 +555,7 @@ def _strip_duplicate_advocate_block(text: str) -> Tuple[str, int]:
                 break
         # Look forward for address placeholder
         after_text = text[end:]
-        addr_match = re.match(r"\s*\n\{\{ADVOCATE_ADDRESS\}\}", after_text)
+        addr_match = _ADVOCATE_ADDRESS_RE.match(after_text)
         if addr_match:
             end += addr_match.end()
         text = text[:start].rstrip() + text[end:]
@@ -513,6 +563,144 @@ def _strip_duplicate_advocate_block(text: str) -> Tuple[str, int]:
     return text, len(matches) - 1
 
 
+_PARA_NUMBER_RE = re.compile(r"^\s*(\d+)\.\s", re.MULTILINE)
+_STALE_PARA_RANGE_RE = re.compile(r"paragraphs\s+1\s+to\s+(\d+)")
+_LAST_PARA_VARIANTS = ("{{LAST_PARA}}", "{{LAST_PARA_NUMBER}}", "{{LAST_PARAGRAPH}}")
+
+
+def _resolve_paragraph_references(text: str) -> Tuple[str, int, int]:
+    """Point verification/SOT paragraph references at the last numbered paragraph.
+
+    Resolves {{LAST_PARA}} / {{LAST_PARA_NUMBER}} / {{LAST_PARAGRAPH}} and fixes a
+    stale "paragraphs 1 to N" where N doesn't match the actual count.
+    Returns (text, last_para_fixes, stale_range_fixes).
+    """
+    para_nums = [int(m.group(1)) for m in _PARA_NUMBER_RE.finditer(text)]
+    last_para = max(para_nums) if para_nums else 0
+
+    last_para_fixes = 0
+    if last_para > 0 and any(v in text for v in _LAST_PARA_VARIANTS):
+        for v in _LAST_PARA_VARIANTS:
+            text = text.replace(v, str(last_para))
+        last_para_fixes = 1
+
+    stale_fixes = 0
+    stale = _STALE_PARA_RANGE_RE.search(text)
+    if stale and last_para > 0:
+        stated = int(stale.group(1))
+        if stated != last_para:
+            text = text.replace(f"paragraphs 1 to {stated}", f"paragraphs 1 to {last_para}")
+            stale_fixes = 1
+
+    return text, last_para_fixes, stale_fixes
+
+
+# ---------------------------------------------------------------------------
+# Rule engine
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class _Rule:
+    """One postprocess fix. ``apply`` returns the new text plus one count per issue type.
+
+    An issue type of ``None`` counts toward the fix total without being reported.
+    """
+    name: str
+    apply: Callable[[str], Tuple[Any, ...]]
+    issue_types: Tuple[Optional[str], ...]
+    light: bool = False  # also applied in light mode
+
+
+# Order matters: later rules see earlier rules' output.
+_RULES: Tuple[_Rule, ...] = (
+    _Rule("protocol_markers", _strip_protocol_markers, ("protocol_markers_stripped",), light=True),
+    _Rule("escaped_placeholders", _fix_escaped_placeholders, ("escaped_placeholders_fixed",), light=True),
+    _Rule("mid_word_placeholders", _fix_mid_word_placeholders, ("mid_word_placeholder_fixed",), light=True),
+    _Rule("placeholder_aliases", _normalize_placeholders, ("placeholder_normalized",), light=True),
+    _Rule("and_or", _fix_and_or, ("and_or_fixed",), light=True),
+    _Rule(
+        "titles_and_instructions", _fix_title_and_instruction_lines,
+        ("spaced_out_title_fixed", "leaked_instructions_stripped"),
+    ),
+    _Rule("duplicate_advocate_block", _strip_duplicate_advocate_block, ("duplicate_advocate_block_removed",)),
+    _Rule("paragraph_breaks", _fix_paragraph_breaks, ("paragraph_breaks_fixed",)),
+    _Rule("paragraph_number_spacing", _fix_paragraph_number_spacing, ("paragraph_number_spacing_fixed",)),
+    _Rule("breach_heading_runon", _repair_breach_heading_runon, ("breach_heading_runon_fixed",)),
+    _Rule("split_act_years", _fix_split_act_years, ("split_act_years_fixed",)),
+    _Rule("list_breaks", _fix_list_breaks, ("prayer_items_fixed", "annexure_list_fixed")),
+    _Rule("blank_lines", _collapse_blank_lines, ("blank_lines_collapsed",)),
+    _Rule(
+        "whitespace_and_numbering", _strip_and_renumber,
+        ("trailing_whitespace_stripped", "numbering_fixed"),
+    ),
+    _Rule("paragraph_references", _resolve_paragraph_references, ("verification_para_count_fixed", None)),
+    _Rule("heading_spacing", _fix_heading_spacing, ("heading_spacing_fixed",)),
+)
+
+# Flag-only checks (NOT auto-fixed), run after the rules in full mode
+_CHECKS: Tuple[Tuple[str, Callable[[str], List[Dict[str, Any]]]], ...] = (
+    ("drafting_notes", lambda text: _flag_drafting_notes(text)[1]),
+    ("repetition", _detect_repetition),
+    ("incomplete_sentences", _flag_incomplete_sentences),
+)
+
+_RULE_STATS: Dict[str, Dict[str, float]] = {}
+_RULE_STATS_LOCK = threading.Lock()
+
+
+def _apply_rules(
+    text: str,
+    light_mode: bool,
+    timings: Dict[str, float],
+) -> Tuple[str, List[Dict[str, Any]], int]:
+    """Run the rules (and, in full mode, the checks) over one artifact.
+
+    Adds each rule's wall time in seconds to ``timings``.
+    Returns (text, issues, total_fixes).
+    """
+    issues: List[Dict[str, Any]] = []
+    total_fixes = 0
+    elapsed_by_rule: Dict[str, float] = {}
+    fixes_by_rule: Dict[str, int] = {}
+
+    for rule in _RULES:
+        if light_mode and not rule.light:
+            continue
+        started = time.perf_counter()
+        text, *counts = rule.apply(text)
+        elapsed_by_rule[rule.name] = time.perf_counter() - started
+        fixes = 0
+        for issue_type, count in zip(rule.issue_types, counts):
+            if count:
+                fixes += count
+                if issue_type:
+                    issues.append({"type": issue_type, "count": count})
+        fixes_by_rule[rule.name] = fixes
+        total_fixes += fixes
+
+    if not light_mode:
+        for name, check in _CHECKS:
+            started = time.perf_counter()
+            issues.extend(check(text))
+            elapsed_by_rule[name] = time.perf_counter() - started
+
+    with _RULE_STATS_LOCK:
+        for name, elapsed in elapsed_by_rule.items():
+            stats = _RULE_STATS.setdefault(name, {"calls": 0, "fixes": 0, "total_ms": 0.0})
+            stats["calls"] += 1
+            stats["fixes"] += fixes_by_rule.get(name, 0)
+            stats["total_ms"] += elapsed * 1000
+    for name, elapsed in elapsed_by_rule.items():
+        timings[name] = timings.get(name, 0.0) + elapsed
+    return text, issues, total_fixes
+
+
+def get_postprocess_rule_stats() -> Dict[str, Dict[str, float]]:
+    """Cumulative per-rule counters since start-up: calls, fixes and total_ms."""
+    with _RULE_STATS_LOCK:
+        return {name: dict(stats) for name, stats in _RULE_STATS.items()}
+
+
 def postprocess_node(state: DraftingState) -> Command:
     """Apply safe deterministic fixes to the assembled draft."""
     logger.info("[POSTPROCESS] ▶ start")
@@ -535,157 +723,14 @@ def postprocess_node(state: DraftingState) -> Command:
             processed_artifacts.append(artifact)
             continue
 
-        text = artifact.get("text", "")
-
-        # 0. Strip LLM protocol markers (safe, always applied)
-        text, marker_fixes = _strip_protocol_markers(text)
-        if marker_fixes:
-            issues.append({"type": "protocol_markers_stripped", "count": marker_fixes})
-            total_fixes += marker_fixes
-
-        # 0.5. Fix mid-word placeholders (safe — adds space only, always applied)
-        text, escaped_placeholder_fixes = _fix_escaped_placeholders(text)
-        if escaped_placeholder_fixes:
-            issues.append({"type": "escaped_placeholders_fixed", "count": escaped_placeholder_fixes})
-            total_fixes += escaped_placeholder_fixes
-
-        text, midword_fixes = _fix_mid_word_placeholders(text)
-        if midword_fixes:
-            issues.append({"type": "mid_word_placeholder_fixed", "count": midword_fixes})
-            total_fixes += midword_fixes
-
-        # 1. Placeholder normalization
-        text, placeholder_fixes = _normalize_placeholders(text)
-        if placeholder_fixes:
-            issues.append({"type": "placeholder_normalized", "count": placeholder_fixes})
-            total_fixes += placeholder_fixes
-
-        # 2. Clean "and/or" → "and" (safe deterministic fix, always applied)
-        text, and_or_fixes = _fix_and_or(text)
-        if and_or_fixes:
-            issues.append({"type": "and_or_fixed", "count": and_or_fixes})
-            total_fixes += and_or_fixes
-
-        if not light_mode:
-            # 2.5. Fix spaced-out titles (S U I T → SUIT)
-            text, spaced_fixes = _fix_spaced_out_titles(text)
-            if spaced_fixes:
-                issues.append({"type": "spaced_out_title_fixed", "count": spaced_fixes})
-                total_fixes += spaced_fixes
-
-            # 2.6. Strip leaked instruction text (PLACEMENT:, Note:, etc.)
-            text, instruction_fixes = _strip_leaked_instructions(text)
-            if instruction_fixes:
-                issues.append({"type": "leaked_instructions_stripped", "count": instruction_fixes})
-                total_fixes += instruction_fixes
-
-            # 2.7. Remove duplicate advocate blocks
-            text, advocate_fixes = _strip_duplicate_advocate_block(text)
-            if advocate_fixes:
-                issues.append({"type": "duplicate_advocate_block_removed", "count": advocate_fixes})
-                total_fixes += advocate_fixes
-
-            # 2.8. Split run-together numbered paragraphs
-            text, para_fixes = _fix_paragraph_breaks(text)
-            if para_fixes:
-                issues.append({"type": "paragraph_breaks_fixed", "count": para_fixes})
-                total_fixes += para_fixes
-
-            text, para_space_fixes = _fix_paragraph_number_spacing(text)
-            if para_space_fixes:
-                issues.append({"type": "paragraph_number_spacing_fixed", "count": para_space_fixes})
-                total_fixes += para_space_fixes
-
-            text, breach_heading_fixes = _repair_breach_heading_runon(text)
-            if breach_heading_fixes:
-                issues.append({"type": "breach_heading_runon_fixed", "count": breach_heading_fixes})
-                total_fixes += breach_heading_fixes
-
-            text, split_year_fixes = _fix_split_act_years(text)
-            if split_year_fixes:
-                issues.append({"type": "split_act_years_fixed", "count": split_year_fixes})
-                total_fixes += split_year_fixes
-
-            # 2.9. Split run-together prayer sub-items
-            text, prayer_fixes = _fix_prayer_items(text)
-            if prayer_fixes:
-                issues.append({"type": "prayer_items_fixed", "count": prayer_fixes})
-                total_fixes += prayer_fixes
-
-            # 2.10. Split semicolon-separated annexure items
-            text, annex_fixes = _fix_annexure_list_breaks(text)
-            if annex_fixes:
-                issues.append({"type": "annexure_list_fixed", "count": annex_fixes})
-                total_fixes += annex_fixes
-
-            # 2.11. Collapse 3+ blank lines to 2
-            text, blank_fixes = _collapse_blank_lines(text)
-            if blank_fixes:
-                issues.append({"type": "blank_lines_collapsed", "count": blank_fixes})
-                total_fixes += blank_fixes
-
-            # 2.12. Strip trailing whitespace
-            text, ws_fixes = _strip_trailing_whitespace(text)
-            if ws_fixes:
-                issues.append({"type": "trailing_whitespace_stripped", "count": ws_fixes})
-                total_fixes += ws_fixes
-
-            # 3. Numbering continuity (section-aware)
-            text, numbering_fixes = _fix_numbering(text)
-            if numbering_fixes:
-                issues.append({"type": "numbering_fixed", "count": numbering_fixes})
-                total_fixes += numbering_fixes
-
-            # 3.5. Resolve {{LAST_PARA}} / {{LAST_PARA_NUMBER}} in verification/SOT
-            para_nums = [int(m.group(1)) for m in re.finditer(r"^\s*(\d+)\.\s", text, re.MULTILINE)]
-            _last_para_variants = ("{{LAST_PARA}}", "{{LAST_PARA_NUMBER}}", "{{LAST_PARAGRAPH}}")
-            if any(v in text for v in _last_para_variants):
-                last_para = max(para_nums) if para_nums else 0
-                if last_para > 0:
-                    for v in _last_para_variants:
-                        if v in text:
-                            text = text.replace(v, str(last_para))
-                    total_fixes += 1
-                    issues.append({"type": "verification_para_count_fixed", "count": 1})
-
-            # 3.6. Fix stale "paragraphs 1 to N" where N doesn't match actual count
-            _stale_m = re.search(r"paragraphs\s+1\s+to\s+(\d+)", text)
-            if _stale_m and para_nums:
-                _stated = int(_stale_m.group(1))
-                _actual = max(para_nums) if para_nums else _stated
-                if _stated != _actual and _actual > 0:
-                    text = text.replace(
-                        f"paragraphs 1 to {_stated}",
-                        f"paragraphs 1 to {_actual}",
-                    )
-                    total_fixes += 1
-
-            # 4. Heading spacing
-            text, spacing_fixes = _fix_heading_spacing(text)
-            if spacing_fixes:
-                issues.append({"type": "heading_spacing_fixed", "count": spacing_fixes})
-                total_fixes += spacing_fixes
-
-            # 5. Annexure label check
-            text, annexure_fixes = _fix_annexure_labels(text)
-            if annexure_fixes:
-                issues.append({"type": "annexure_fixed", "count": annexure_fixes})
-                total_fixes += annexure_fixes
-
-            # 6. Flag drafting-notes language (NOT auto-fixed — flagged for review)
-            text, notes_issues = _flag_drafting_notes(text)
-            if notes_issues:
-                issues.extend(notes_issues)
-
-            # 7. Detect excessive repetition (NOT auto-fixed — informational)
-            rep_issues = _detect_repetition(text)
-            if rep_issues:
-                issues.extend(rep_issues)
-
-            # 8. Detect incomplete/truncated sentences (NOT auto-fixed — flagged)
-            trunc_issues = _flag_incomplete_sentences(text)
-            if trunc_issues:
-                issues.extend(trunc_issues)
+        timings: Dict[str, float] = {}
+        text, artifact_issues, artifact_fixes = _apply_rules(artifact.get("text", ""), light_mode, timings)
+        issues.extend(artifact_issues)
+        total_fixes += artifact_fixes
+        logger.debug(
+            "[POSTPROCESS] rule timings (ms): %s",
+            ", ".join(f"{name}={elapsed * 1000:.2f}" for name, elapsed in timings.items()),
+        )
 
         processed = {**artifact, "text": text}
         processed_artifacts.append(processed)
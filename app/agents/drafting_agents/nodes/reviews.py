@@ -9,7 +9,7 @@ from langgraph.graph import END
 from langgraph.types import Command
 
 from ....config import logger, settings
-from ....services import review_ollama_model
+from ....services import ainvoke_llm, review_ollama_model
 from ..prompts import build_review_system_prompt
 from ..states import DraftingState, ReviewNode
 from ._utils import (
@@ -288,7 +288,7 @@ def _route_after_review(
     )
 
 
-def review_node(state: DraftingState) -> Dict[str, Any]:
+async def review_node(state: DraftingState) -> Dict[str, Any]:
     """Review current draft, optionally generate inline corrected draft.
 
     Single-call approach: Phase 1 checks + Phase 2 inline fix in one LLM call.
@@ -352,7 +352,7 @@ def review_node(state: DraftingState) -> Dict[str, Any]:
             SystemMessage(content=_sys_text),
             human_message,
         ]
-        response = structured_llm.invoke(messages)
+        response = await ainvoke_llm(structured_llm, messages)
         # Log token usage from response metadata if available
         _meta = getattr(response, "response_metadata", None) or {}
         _usage = _meta.get("token_usage") or _meta.get("usage") or {}
@@ -374,7 +374,7 @@ def review_node(state: DraftingState) -> Dict[str, Any]:
             SystemMessage(content=build_review_system_prompt(retry=True, inline_fix=inline_fix_enabled)),
             human_message,
         ]
-        response = structured_llm.invoke(retry_messages)
+        response = await ainvoke_llm(structured_llm, retry_messages)
         result = _as_dict(response)
         return _route_after_review(result=result, elapsed=time.perf_counter() - t0, **route_kwargs)
     except Exception as second_exc:
@@ -389,7 +389,7 @@ def review_node(state: DraftingState) -> Dict[str, Any]:
             SystemMessage(content=build_review_system_prompt(retry=True, inline_fix=inline_fix_enabled)),
             human_message,
         ]
-        raw_response = review_ollama_model.invoke(raw_messages)
+        raw_response = await ainvoke_llm(review_ollama_model, raw_messages)
         # Log token usage from raw response
         _raw_meta = getattr(raw_response, "response_metadata", None) or {}
         _raw_usage = _raw_meta.get("token_usage") or _raw_meta.get("usage") or {}
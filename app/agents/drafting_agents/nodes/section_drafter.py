@@ -22,7 +22,7 @@ from langchain_core.messages import HumanMessage, SystemMessage
 from langgraph.types import Command
 
 from ....config import logger, settings
-from ....services import draft_ollama_model as draft_openai_model
+from ....services import ainvoke_llm, draft_ollama_model as draft_openai_model
 from ..prompts.section_drafter import build_section_system_prompt, build_section_user_prompt
 from ..schema_contracts import evaluate_section_condition
 from ..states import DraftingState
@@ -258,7 +258,7 @@ async def _draft_single_section(
                 SystemMessage(content=system_prompt),
                 HumanMessage(content=user_prompt),
             ]
-            response = await draft_openai_model.ainvoke(messages)
+            response = await ainvoke_llm(draft_openai_model, messages, cache=attempt == 0)
             raw_text = getattr(response, "content", "") or ""
             elapsed = time.perf_counter() - t0
 
@@ -16,7 +16,7 @@ from langgraph.graph import END
 from langgraph.types import Command
 
 from ....config import logger, settings
-from ....services import draft_ollama_model as draft_openai_model
+from ....services import ainvoke_llm, draft_ollama_model as draft_openai_model
 from ..prompts.section_fixer import build_fixer_system_prompt, build_fixer_user_prompt
 from ..states import DraftingState
 from ._utils import _as_dict, build_mandatory_provisions_context
@@ -75,7 +75,7 @@ def _build_fix_context(
     return "\n".join(parts) if parts else "(No additional context available)"
 
 
-def section_fixer_node(state: DraftingState) -> Command:
+async def section_fixer_node(state: DraftingState) -> Command:
     """Fix sections flagged with blocking issues by review."""
     logger.info("[SECTION_FIXER] ▶ start")
     t0 = time.perf_counter()
@@ -141,7 +141,7 @@ def section_fixer_node(state: DraftingState) -> Command:
                         SystemMessage(content=system_prompt),
                         HumanMessage(content=user_prompt),
                     ]
-                    response = draft_openai_model.invoke(messages)
+                    response = await ainvoke_llm(draft_openai_model, messages, cache=attempt == 0)
                     fixed_text = (getattr(response, "content", "") or "").strip()
 
                     if fixed_text and len(fixed_text) > 50:
@@ -1,4 +1,4 @@
 from .qudrant import DraftingRAGTool
-from .websearch import CourtFeeWebSearchTool, LegalResearchWebSearchTool, ProceduralWebSearchTool
+from .websearch import CourtFeeWebSearchTool, LegalResearchWebSearchTool, ProceduralWebSearchTool, get_websearch_cache_stats
 
-__all__ = ["DraftingRAGTool", "CourtFeeWebSearchTool", "LegalResearchWebSearchTool", "ProceduralWebSearchTool"]
\ No newline at end of file
+__all__ = ["DraftingRAGTool", "CourtFeeWebSearchTool", "LegalResearchWebSearchTool", "ProceduralWebSearchTool", "get_websearch_cache_stats"]
\ No newline at end of file
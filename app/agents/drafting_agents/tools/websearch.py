@@ -3,14 +3,23 @@ Court Fee Web Search Tool — fetches current court fee rates using Brave Search
 
 Court fees are jurisdiction-specific and change with government orders/amendments.
 This tool fetches fresh information at draft time rather than relying on static RAG.
+
+All searches go through ``_fetch_one``:
+    - one pooled ``httpx.AsyncClient`` per event loop (no blocking requests.get)
+    - results cached per normalized query for DRAFTING_WEBSEARCH_CACHE_TTL_SECONDS
+    - concurrent searches for the same normalized query share one HTTP call
 """
 from __future__ import annotations
 
+import asyncio
 import re
+import time
+import weakref
+from collections import OrderedDict
 from html.parser import HTMLParser
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
-import requests
+import httpx
 
 try:
     from ....config import logger, settings
@@ -18,7 +27,6 @@ except ImportError:  # pragma: no cover - direct execution
     from app.config import logger, settings
 
 
-_BRAVE_SEARCH_URL = "https://api.search.brave.com/res/v1/web/search"
 _REQUEST_TIMEOUT = 12
 _RESULT_COUNT = 5
 
@@ -101,22 +109,126 @@ def _is_fee_relevant(snippet: str) -> bool:
     return any(signal in low for signal in _FEE_SIGNAL_WORDS)
 
 
-def _fetch_one(api_key: str, query: str) -> List[Dict[str, Any]]:
-    """Run a single Brave search and return raw result items."""
-    response = requests.get(
-        _BRAVE_SEARCH_URL,
-        headers={
-            "Accept": "application/json",
-            "Accept-Encoding": "gzip",
-            "x-subscription-token": api_key,
-        },
+def _normalize_query(query: str) -> str:
+    """Cache key for a query: case- and whitespace-insensitive."""
+    return re.sub(r"\s+", " ", query).strip().lower()
+
+
+class _SearchCache:
+    """TTL + LRU cache of search results keyed on the normalized query."""
+
+    def __init__(self, clock=time.monotonic):
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[float, List[Dict[str, Any]]]]" = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0, "coalesced": 0, "requests": 0, "errors": 0}
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, results = entry
+        if self._clock() - stored_at > settings.DRAFTING_WEBSEARCH_CACHE_TTL_SECONDS:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return results
+
+    def put(self, key: str, results: List[Dict[str, Any]]) -> None:
+        self._entries[key] = (self._clock(), results)
+        self._entries.move_to_end(key)
+        while len(self._entries) > settings.DRAFTING_WEBSEARCH_CACHE_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        for counter in self.stats:
+            self.stats[counter] = 0
+
+
+_search_cache = _SearchCache()
+
+# httpx clients and in-flight search tasks are bound to the loop that created them
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+_in_flight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = weakref.WeakKeyDictionary()
+
+
+def _get_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=_REQUEST_TIMEOUT,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+            headers={"Accept": "application/json", "Accept-Encoding": "gzip"},
+        )
+        _clients[loop] = client
+    return client
+
+
+async def _request(api_key: str, query: str) -> List[Dict[str, Any]]:
+    _search_cache.stats["requests"] += 1
+    response = await _get_client().get(
+        settings.BRAVE_SEARCH_URL,
+        headers={"x-subscription-token": api_key},
         params={"q": query, "count": _RESULT_COUNT},
-        timeout=_REQUEST_TIMEOUT,
     )
     response.raise_for_status()
     return response.json().get("web", {}).get("results", [])
 
 
+async def _fetch_one(api_key: str, query: str) -> List[Dict[str, Any]]:
+    """Run a single Brave search and return raw result items.
+
+    Served from the query cache when fresh; joins an identical in-flight
+    search instead of issuing a second request. Failures are not cached.
+    The request runs as its own task, so a cancelled caller does not cancel
+    the search for the others waiting on it.
+    """
+    key = _normalize_query(query)
+    cached = _search_cache.get(key)
+    if cached is not None:
+        _search_cache.stats["hits"] += 1
+        return cached
+
+    pending = _in_flight.setdefault(asyncio.get_running_loop(), {})
+    task = pending.get(key)
+    if task is not None:
+        _search_cache.stats["coalesced"] += 1
+    else:
+        _search_cache.stats["misses"] += 1
+        task = asyncio.ensure_future(_request(api_key, query))
+        pending[key] = task
+
+        def _done(t: asyncio.Future) -> None:
+            pending.pop(key, None)
+            if t.cancelled():
+                return
+            if t.exception() is not None:
+                _search_cache.stats["errors"] += 1
+            else:
+                _search_cache.put(key, t.result())
+
+        task.add_done_callback(_done)
+    return await asyncio.shield(task)
+
+
+async def _fetch_all(api_key: str, queries: List[str]) -> List[Any]:
+    """Run queries concurrently; each item is a result list or the raised exception."""
+    return await asyncio.gather(*(_fetch_one(api_key, q) for q in queries), return_exceptions=True)
+
+
+def get_websearch_cache_stats() -> Dict[str, int]:
+    """Counters: hits, misses, coalesced (joined an in-flight search), requests, errors."""
+    return {**_search_cache.stats, "entries": len(_search_cache._entries)}
+
+
+async def close_websearch_client() -> None:
+    """Close the current loop's pooled HTTP client (e.g. on application shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
 async def CourtFeeWebSearchTool(
     *,
     state: str,
@@ -151,14 +263,13 @@ async def CourtFeeWebSearchTool(
     primary_query = queries[0]
     logger.info("[CourtFee] queries: %s", queries)
 
-    # Run both queries; second is best-effort (failure is non-fatal).
+    # Run both queries concurrently; second is best-effort (failure is non-fatal).
     seen_urls: set[str] = set()
     results: List[Dict[str, Any]] = []
 
-    for i, query in enumerate(queries, start=1):
-        try:
-            raw = _fetch_one(api_key, query)
-        except Exception as exc:
+    for i, raw in enumerate(await _fetch_all(api_key, queries), start=1):
+        if isinstance(raw, Exception):
+            exc = raw
             logger.warning("[CourtFee] query %d/%d failed: %s", i, len(queries), exc)
             if i == 1:
                 # Primary query failed — return error immediately.
@@ -328,11 +439,9 @@ async def ProceduralWebSearchTool(
     seen_urls: set[str] = set()
     results: List[Dict[str, Any]] = []
 
-    for i, query in enumerate(queries, start=1):
-        try:
-            raw = _fetch_one(api_key, query)
-        except Exception as exc:
-            logger.warning("[Procedural] query %d/%d failed: %s", i, len(queries), exc)
+    for i, raw in enumerate(await _fetch_all(api_key, queries), start=1):
+        if isinstance(raw, Exception):
+            logger.warning("[Procedural] query %d/%d failed: %s", i, len(queries), raw)
             continue  # Both queries are best-effort.
 
         for item in raw:
@@ -400,11 +509,9 @@ async def LegalResearchWebSearchTool(
     seen_urls: set[str] = set()
     results: List[Dict[str, Any]] = []
 
-    for i, query in enumerate(queries, start=1):
-        try:
-            raw = _fetch_one(api_key, query)
-        except Exception as exc:
-            logger.warning("[LegalResearch] query %d/%d failed: %s", i, len(queries), exc)
+    for i, raw in enumerate(await _fetch_all(api_key, queries), start=1):
+        if isinstance(raw, Exception):
+            logger.warning("[LegalResearch] query %d/%d failed: %s", i, len(queries), raw)
             continue  # Both queries are best-effort.
 
         for item in raw:
@@ -28,6 +28,7 @@ def create_graph(
     tools,
     route_after_tool_func=None,
     sub_agents: dict = None,
+    checkpointer=None,
 ):
     """
     Create the broadcasting supervisor workflow graph.
@@ -44,6 +45,8 @@ def create_graph(
                                (determines if we go to call_model or a sub-agent)
         sub_agents: Dict of {node_name: compiled_graph} for sub-agent nodes
                     e.g., {"data_processing": data_processing_graph}
+        checkpointer: Optional LangGraph checkpointer; sub-agent graphs
+                      (compiled without one) persist through it as well
 
     Returns:
         Compiled graph instance
@@ -82,7 +85,7 @@ def create_graph(
         workflow.add_edge("tool_node", "call_model")
 
     # Compile
-    graph = workflow.compile()
+    graph = workflow.compile(checkpointer=checkpointer)
 
     logger.info("Broadcasting supervisor graph created successfully")
     return graph
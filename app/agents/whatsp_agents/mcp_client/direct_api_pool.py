@@ -0,0 +1,342 @@
+"""
+Process-wide MCP session pool for the Direct API MCP server (port 9002).
+
+Every whatsp_agents tool module used to build a new MultiServerMCPClient,
+a new event loop, a streamable-http session and a fresh ``load_mcp_tools``
+call for each tool invocation. This pool keeps a small set of sessions open
+on one dedicated background event loop and shares them across threads:
+
+- Loop-safe: sessions live on the pool's own loop thread; sync callers block
+  on ``run_coroutine_threadsafe``, async callers on any loop await a wrapped
+  future, so a session is never touched from a foreign loop
+- Cached tool catalog: ``list_tools`` runs once per process; reconnects
+  rebuild the LangChain tools from the cached catalog
+- Health checks: idle sessions are pinged periodically and dropped on failure
+- Reconnect-on-failure: a session whose call fails at the transport level is
+  closed and reopened on next use. The failed call itself is not replayed,
+  so a send_message that may have reached the server is never sent twice.
+
+Usage:
+    from app.agents.whatsp_agents.mcp_client.direct_api_pool import call_direct_api_mcp
+
+    result = call_direct_api_mcp("get_templates", {"user_id": "u1"})          # sync
+    result = await acall_direct_api_mcp("send_message", {...})                 # async
+"""
+
+import asyncio
+import atexit
+import concurrent.futures
+import threading
+import time
+from typing import Any, Dict, List, Optional
+
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import convert_mcp_tool_to_langchain_tool
+
+from ....config import logger, settings
+from ....utils.whsp_onboarding_agent import parse_mcp_result
+from .supervisor_broadcasting import DIRECT_API_MCP_URL, DIRECT_API_MCP_NAME
+
+
+# ============================================
+# POOLED SESSION
+# ============================================
+
+class _PooledSession:
+    """
+    One MCP session owned by a long-lived task on the pool loop.
+
+    The streamable-http transport uses anyio cancel scopes, which must be
+    exited by the task that entered them, so the session context is held
+    open by ``_run`` until ``close()`` signals it.
+    """
+
+    def __init__(self, pool: "DirectApiMCPPool", slot_id: int):
+        self.pool = pool
+        self.slot_id = slot_id
+        self.session = None
+        self.tools: Optional[Dict[str, Any]] = None
+        self.last_used: float = 0.0
+        self.lock: Optional[asyncio.Lock] = None
+        self._owner: Optional[asyncio.Task] = None
+        self._stop: Optional[asyncio.Event] = None
+
+    @property
+    def is_open(self) -> bool:
+        return self.session is not None and self._owner is not None and not self._owner.done()
+
+    async def open(self) -> None:
+        ready = asyncio.get_running_loop().create_future()
+        self._stop = asyncio.Event()
+        self._owner = asyncio.create_task(self._run(ready))
+        await ready
+
+    async def _run(self, ready: asyncio.Future) -> None:
+        try:
+            async with self.pool.client.session(DIRECT_API_MCP_NAME) as session:
+                catalog = await self.pool._get_catalog(session)
+                self.tools = {
+                    t.name: convert_mcp_tool_to_langchain_tool(session, t) for t in catalog
+                }
+                self.session = session
+                self.last_used = time.monotonic()
+                logger.info("[MCP_POOL] Session %d connected (%d tools)", self.slot_id, len(self.tools))
+                ready.set_result(None)
+                await self._stop.wait()
+        except Exception as e:
+            if not ready.done():
+                ready.set_exception(e)
+            else:
+                logger.warning("[MCP_POOL] Session %d dropped: %s", self.slot_id, e)
+        finally:
+            self.session = None
+            self.tools = None
+
+    async def ping(self) -> bool:
+        try:
+            await asyncio.wait_for(self.session.send_ping(), timeout=self.pool.ping_timeout)
+            return True
+        except Exception as e:
+            logger.warning("[MCP_POOL] Session %d failed health check: %s", self.slot_id, e)
+            return False
+
+    async def close(self) -> None:
+        if self._owner is None:
+            return
+        self._stop.set()
+        try:
+            await asyncio.wait_for(self._owner, timeout=5)
+        except Exception as e:
+            logger.debug("[MCP_POOL] Session %d close error: %s", self.slot_id, e)
+            self._owner.cancel()
+        self._owner = None
+        self.session = None
+        self.tools = None
+
+
+# ============================================
+# POOL
+# ============================================
+
+class DirectApiMCPPool:
+    """
+    Fixed-size pool of Direct API MCP sessions on a background event loop.
+
+    Sessions are opened lazily and handed out round-robin. An MCP session
+    multiplexes concurrent requests, so callers share sessions rather than
+    checking them out exclusively; ``size`` spreads load over several HTTP
+    streams and limits the blast radius of one dropped connection.
+    """
+
+    def __init__(
+        self,
+        url: str = DIRECT_API_MCP_URL,
+        size: int = 4,
+        health_interval: float = 30.0,
+        ping_timeout: float = 5.0,
+    ):
+        self.url = url
+        self.size = max(1, size)
+        self.health_interval = health_interval
+        self.ping_timeout = ping_timeout
+        self.client = MultiServerMCPClient({
+            DIRECT_API_MCP_NAME: {"url": url, "transport": "streamable-http"}
+        })
+        self._catalog: Optional[List[Any]] = None
+        self._catalog_lock: Optional[asyncio.Lock] = None
+        self._slots = [_PooledSession(self, i) for i in range(self.size)]
+        self._next_slot = 0
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._health_task: Optional[asyncio.Task] = None
+        self.stats = {"calls": 0, "errors": 0, "reconnects": 0, "health_failures": 0}
+
+    # ---------- loop management ----------
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None or not self._thread.is_alive():
+                ready = threading.Event()
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=self._run_loop, args=(ready,), name="direct-api-mcp-pool", daemon=True,
+                )
+                self._thread.start()
+                ready.wait()
+        return self._loop
+
+    def _run_loop(self, ready: threading.Event) -> None:
+        asyncio.set_event_loop(self._loop)
+
+        async def _setup():
+            for slot in self._slots:
+                slot.lock = asyncio.Lock()
+            self._catalog_lock = asyncio.Lock()
+            self._health_task = asyncio.create_task(self._health_loop())
+
+        self._loop.run_until_complete(_setup())
+        ready.set()
+        self._loop.run_forever()
+
+    # ---------- catalog ----------
+
+    async def _get_catalog(self, session) -> List[Any]:
+        """Fetch the tool list once per process (handles pagination)."""
+        async with self._catalog_lock:
+            if self._catalog is None:
+                tools, cursor = [], None
+                while True:
+                    page = await session.list_tools(cursor=cursor)
+                    tools.extend(page.tools)
+                    cursor = page.nextCursor
+                    if not cursor:
+                        break
+                self._catalog = tools
+                logger.info("[MCP_POOL] Cached Direct API tool catalog (%d tools)", len(tools))
+            return self._catalog
+
+    def catalog(self) -> List[str]:
+        """Names of the cached MCP tools (empty until the first connection)."""
+        return [t.name for t in self._catalog or []]
+
+    # ---------- calls ----------
+
+    async def _checkout(self) -> _PooledSession:
+        """Next session round-robin, (re)connecting it if needed."""
+        slot = self._slots[self._next_slot % self.size]
+        self._next_slot += 1
+        if not slot.is_open:
+            async with slot.lock:
+                if not slot.is_open:
+                    if slot.last_used:
+                        self.stats["reconnects"] += 1
+                    await slot.close()
+                    await slot.open()
+        return slot
+
+    async def _call(self, tool_name: str, params: dict) -> dict:
+        slot = await self._checkout()
+        tool = slot.tools.get(tool_name)
+        if tool is None:
+            return {"status": "failed", "error": f"MCP tool '{tool_name}' not found"}
+
+        self.stats["calls"] += 1
+        try:
+            result = await tool.ainvoke(params)
+        except Exception:
+            # Transport-level failure (tool errors come back as content):
+            # drop the session so the next call reconnects
+            self.stats["errors"] += 1
+            async with slot.lock:
+                await slot.close()
+            raise
+        slot.last_used = time.monotonic()
+        return parse_mcp_result(result)
+
+    def call(self, tool_name: str, params: dict, timeout: Optional[float] = None) -> dict:
+        """
+        Call an MCP tool from synchronous code (any thread).
+
+        On ``timeout`` the call is cancelled on the pool loop before the
+        TimeoutError propagates, so it stops waiting for the server; the
+        server may still finish whatever it had started.
+        """
+        loop = self._ensure_started()
+        future = asyncio.run_coroutine_threadsafe(self._call(tool_name, params), loop)
+        try:
+            return future.result(timeout=timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    async def acall(self, tool_name: str, params: dict) -> dict:
+        """Call an MCP tool from async code running on any event loop."""
+        loop = self._ensure_started()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            return await self._call(tool_name, params)
+        future = asyncio.run_coroutine_threadsafe(self._call(tool_name, params), loop)
+        return await asyncio.wrap_future(future)
+
+    # ---------- health ----------
+
+    async def _health_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.health_interval)
+            for slot in self._slots:
+                idle_for = time.monotonic() - slot.last_used
+                if not slot.is_open or idle_for < self.health_interval:
+                    continue
+                if not await slot.ping():
+                    self.stats["health_failures"] += 1
+                    async with slot.lock:
+                        await slot.close()
+
+    def status(self) -> dict:
+        """Pool state for logging and admin endpoints."""
+        return {
+            "url": self.url,
+            "size": self.size,
+            "open_sessions": sum(1 for s in self._slots if s.is_open),
+            "catalog_size": len(self._catalog or []),
+            **self.stats,
+        }
+
+    # ---------- shutdown ----------
+
+    def shutdown(self) -> None:
+        """Close all sessions and stop the pool loop."""
+        with self._start_lock:
+            if self._loop is None or not self._thread.is_alive():
+                return
+            loop = self._loop
+
+            async def _close_all():
+                if self._health_task:
+                    self._health_task.cancel()
+                for slot in self._slots:
+                    await slot.close()
+
+            try:
+                asyncio.run_coroutine_threadsafe(_close_all(), loop).result(timeout=10)
+            except Exception as e:
+                logger.error("[MCP_POOL] Error closing sessions: %s", e)
+            loop.call_soon_threadsafe(loop.stop)
+            self._thread.join(timeout=5)
+            self._loop = None
+            logger.info("[MCP_POOL] Direct API MCP pool shut down")
+
+
+# ============================================
+# PROCESS-WIDE INSTANCE
+# ============================================
+
+_pool: Optional[DirectApiMCPPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_direct_api_pool() -> DirectApiMCPPool:
+    """Return the shared pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = DirectApiMCPPool(
+                size=settings.DIRECT_API_MCP_POOL_SIZE,
+                health_interval=settings.DIRECT_API_MCP_HEALTHCHECK_SECONDS,
+            )
+            atexit.register(_pool.shutdown)
+    return _pool
+
+
+def call_direct_api_mcp(tool_name: str, params: dict, timeout: Optional[float] = None) -> dict:
+    """Call a Direct API MCP tool synchronously through the shared pool."""
+    return get_direct_api_pool().call(tool_name, params, timeout=timeout)
+
+
+async def acall_direct_api_mcp(tool_name: str, params: dict) -> dict:
+    """Call a Direct API MCP tool from any event loop through the shared pool."""
+    return await get_direct_api_pool().acall(tool_name, params)
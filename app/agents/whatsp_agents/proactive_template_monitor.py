@@ -1,19 +1,33 @@
 """
 Proactive Template Approval Monitor.
 
-A background agent that monitors WhatsApp template approval status using
-APScheduler. Once started for a given template, it polls the WhatsApp API
-via the Direct API MCP server every 15 seconds and updates the local
-database when the status changes. Polling stops automatically when the
+A single background watcher tracks the approval status of every pending
+WhatsApp template. One APScheduler job ticks every ``TICK_SECONDS``; on each
+tick, every user with a template due for a check gets ONE ``get_templates``
+read via the Direct API MCP server (following the paging cursor until all of
+that user's tracked templates have been seen), and all of that user's
+pending templates are updated from the response.
+
+Templates that stay PENDING back off adaptively: after
+``BACKOFF_AFTER_SECONDS`` their check interval doubles on every poll, up to
+``MAX_POLL_INTERVAL_SECONDS``. Monitoring stops automatically when the
 template reaches a final status (APPROVED, REJECTED, PAUSED, DISABLED).
 
+Status changes are written to the local database and published on an
+in-process ``TemplateStatusChannel``, so waiting tools wait on the channel
+instead of polling -- async callers await it without holding a thread. Status events can also be pushed in directly (e.g. from a
+Meta ``message_template_status_update`` webhook) with
+``handle_template_status_event`` / ``handle_template_status_webhook``.
+
 Usage:
     from app.agents.whatsp_agents.proactive_template_monitor import (
         start_template_monitoring,
         stop_template_monitoring,
+        wait_for_template_status,
+        await_for_template_status,
     )
 
-    # Fire-and-forget: starts background polling
+    # Fire-and-forget: starts background tracking
     start_template_monitoring(user_id="u123", template_id="t456")
 
     # With optional callback
@@ -23,6 +37,12 @@ Usage:
         callback=my_async_or_sync_callback,
     )
 
+    # Block (in a worker thread) until a final status or timeout
+    result = wait_for_template_status("t456", timeout=300)
+
+    # Or await it from async code
+    result = await await_for_template_status("t456", timeout=300)
+
     # Manual stop (e.g., user cancels)
     stop_template_monitoring(template_id="t456")
 """
@@ -30,38 +50,38 @@ Usage:
 from __future__ import annotations
 
 import asyncio
-import json
 import threading
-import concurrent.futures
+import time
+from collections import OrderedDict
 from datetime import datetime
-from typing import Callable, Dict, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
-import nest_asyncio
 from pydantic import BaseModel, Field
-from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 
 from app.config import logger
 
-# Allow nested event-loop usage (required when called from sync contexts)
-nest_asyncio.apply()
-
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-POLL_INTERVAL_SECONDS: int = 15
+TICK_SECONDS: int = 15
+POLL_INTERVAL_SECONDS: int = 15          # Initial per-template check interval
+BACKOFF_AFTER_SECONDS: int = 300         # Start backing off after 5 min PENDING
+MAX_POLL_INTERVAL_SECONDS: int = 900     # Never check less often than every 15 min
 MAX_CONSECUTIVE_ERRORS: int = 10
+MAX_TEMPLATE_PAGES: int = 20             # get_templates pages followed per user check
 FINAL_STATUSES = frozenset({"APPROVED", "REJECTED", "PAUSED", "DISABLED"})
 _LOG_PREFIX = "[TemplateMonitor]"
 
 # ---------------------------------------------------------------------------
-# Pydantic schema -- structured result for each poll cycle
+# Pydantic schema -- structured result for each status update
 # ---------------------------------------------------------------------------
 
 
 class TemplateStatusResult(BaseModel):
-    """Structured output representing a single poll result."""
+    """Structured output representing a single status update."""
 
     template_id: str = Field(..., description="WhatsApp template ID being monitored")
     status: str = Field(..., description="Current approval status from WhatsApp API")
@@ -69,109 +89,127 @@ class TemplateStatusResult(BaseModel):
         default=False,
         description="True when status is a terminal state (APPROVED/REJECTED/PAUSED/DISABLED)",
     )
+    rejected_reason: Optional[str] = Field(
+        default=None,
+        description="Rejection reason reported by WhatsApp, if any",
+    )
+    source: str = Field(
+        default="poll",
+        description="Where the update came from: 'poll' or 'webhook'",
+    )
     message: str = Field(
         default="",
         description="Human-readable summary of the status check",
     )
 
 
+def _build_result(
+    template_id: str,
+    status: str,
+    rejected_reason: Optional[str] = None,
+    source: str = "poll",
+) -> TemplateStatusResult:
+    """Build a ``TemplateStatusResult`` with the human-readable message."""
+    is_final = status in FINAL_STATUSES
+    msg = f"Template {template_id}: status is {status}."
+    if rejected_reason and status == "REJECTED":
+        msg += f" Rejection reason: {rejected_reason}"
+    if is_final:
+        msg += " (final -- monitoring will stop)"
+    return TemplateStatusResult(
+        template_id=template_id,
+        status=status,
+        is_final=is_final,
+        rejected_reason=rejected_reason,
+        source=source,
+        message=msg,
+    )
+
+
 # ---------------------------------------------------------------------------
-# MCP helper -- mirrors the pattern in tools/content_creation.py
+# MCP helper -- shared Direct API session pool (same as tools/content_creation.py)
 # ---------------------------------------------------------------------------
 
-_executor = concurrent.futures.ThreadPoolExecutor(max_workers=3)
-
 
 def _call_direct_api_mcp(tool_name: str, params: dict) -> dict:
-    """Call a Direct API MCP tool (port 9002) synchronously."""
-    from langchain_mcp_adapters.client import MultiServerMCPClient
-    from langchain_mcp_adapters.tools import load_mcp_tools
-    from app.utils.whsp_onboarding_agent import (
-        parse_mcp_result_with_debug as parse_mcp_result,
-    )
-
-    async def _call():
-        client = MultiServerMCPClient(
-            {
-                "DirectApiMCP": {
-                    "url": "http://127.0.0.1:9002/mcp",
-                    "transport": "streamable-http",
-                }
-            }
-        )
-        async with client.session("DirectApiMCP") as session:
-            mcp_tools_list = await load_mcp_tools(session)
-            mcp_tools = {t.name: t for t in mcp_tools_list}
-            if tool_name not in mcp_tools:
-                return {"status": "failed", "error": f"MCP tool '{tool_name}' not found"}
-            result = await mcp_tools[tool_name].ainvoke(params)
-            return parse_mcp_result(result)
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(_call())
-    finally:
-        loop.close()
+    """Call a Direct API MCP tool (port 9002) synchronously via the shared session pool."""
+    from app.agents.whatsp_agents.mcp_client.direct_api_pool import call_direct_api_mcp
 
+    return call_direct_api_mcp(tool_name, params)
 
-# ---------------------------------------------------------------------------
-# Core polling logic
-# ---------------------------------------------------------------------------
 
-
-def _poll_template_status(user_id: str, template_id: str) -> TemplateStatusResult:
+def _extract_templates(mcp_result: Any) -> Optional[List[dict]]:
     """
-    Fetch template status from the WhatsApp API via MCP and return a
-    structured ``TemplateStatusResult``.
+    Pull the template list out of a ``get_templates`` response.
 
-    This function is intentionally synchronous so it can be dispatched
-    easily inside an APScheduler job running on the default executor.
+    Accepts a bare list or the Graph-style ``{"data": [...]}`` envelope.
+    Returns None when the call failed.
     """
-    try:
-        mcp_result = _call_direct_api_mcp(
-            "get_template_by_id",
-            {"user_id": user_id, "template_id": template_id},
-        )
-    except Exception as exc:
-        logger.error(
-            "%s MCP call failed for template %s: %s",
-            _LOG_PREFIX, template_id, exc, exc_info=True,
-        )
-        return TemplateStatusResult(
-            template_id=template_id,
-            status="ERROR",
-            is_final=False,
-            message=f"MCP call failed: {exc}",
-        )
+    if not isinstance(mcp_result, dict) or not mcp_result.get("success"):
+        return None
+    data = mcp_result.get("data")
+    if isinstance(data, dict):
+        data = data.get("data", data.get("templates"))
+    if not isinstance(data, list):
+        return None
+    return [t for t in data if isinstance(t, dict)]
+
+
+def _next_cursor(mcp_result: dict) -> Optional[str]:
+    """``after`` cursor of the next ``get_templates`` page, or None on the last page."""
+    data = mcp_result.get("data")
+    paging = data.get("paging") if isinstance(data, dict) else None
+    if not isinstance(paging, dict) or not paging.get("next"):
+        return None
+    cursor = (paging.get("cursors") or {}).get("after")
+    return str(cursor) if cursor else None
+
+
+def _rejected_reason(template: dict) -> Optional[str]:
+    """Rejection reason from a template payload (``NONE`` means no reason)."""
+    reason = template.get("rejected_reason")
+    if reason is None and isinstance(template.get("quality_score"), dict):
+        reason = template["quality_score"].get("reasons")
+    if reason in (None, "", "NONE"):
+        return None
+    return str(reason)
+
+
+def _fetch_user_templates(user_id: str, template_ids: Iterable[str] = ()) -> Optional[Dict[str, dict]]:
+    """
+    Fetch a user's templates with ``get_templates``, following the paging cursor.
 
-    api_status = "UNKNOWN"
-    rejected_reason: Optional[str] = None
+    Pages are requested until every ID in ``template_ids`` has been seen or
+    the last page is reached (at most ``MAX_TEMPLATE_PAGES`` pages).
 
-    if isinstance(mcp_result, dict) and mcp_result.get("success"):
-        api_data = mcp_result.get("data", {})
-        if isinstance(api_data, dict):
-            api_status = api_data.get("status", "UNKNOWN").upper()
-            rejected_reason = api_data.get(
-                "rejected_reason",
-                api_data.get("quality_score", {}).get("reasons") if isinstance(api_data.get("quality_score"), dict) else None,
+    Returns:
+        Dict mapping template ID to its payload, or None on failure.
+    """
+    wanted = set(template_ids)
+    found: Dict[str, dict] = {}
+    params = {"user_id": user_id}
+    for _ in range(MAX_TEMPLATE_PAGES):
+        try:
+            mcp_result = _call_direct_api_mcp("get_templates", params)
+        except Exception as exc:
+            logger.error(
+                "%s get_templates failed for user %s: %s",
+                _LOG_PREFIX, user_id, exc, exc_info=True,
             )
+            return None
 
-    is_final = api_status in FINAL_STATUSES
-
-    # Build human-readable message
-    msg = f"Template {template_id}: status is {api_status}."
-    if rejected_reason and api_status == "REJECTED":
-        msg += f" Rejection reason: {rejected_reason}"
-    if is_final:
-        msg += " (final -- monitoring will stop)"
+        templates = _extract_templates(mcp_result)
+        if templates is None:
+            error = mcp_result.get("error") if isinstance(mcp_result, dict) else mcp_result
+            logger.warning("%s get_templates returned no data for user %s: %s", _LOG_PREFIX, user_id, error)
+            return None
+        found.update({str(t["id"]): t for t in templates if t.get("id") is not None})
 
-    return TemplateStatusResult(
-        template_id=template_id,
-        status=api_status,
-        is_final=is_final,
-        message=msg,
-    )
+        cursor = _next_cursor(mcp_result)
+        if cursor is None or wanted.issubset(found):
+            break
+        params = {"user_id": user_id, "after": cursor}
+    return found
 
 
 def _sync_status_to_db(
@@ -217,7 +255,86 @@ def _sync_status_to_db(
 
 
 # ---------------------------------------------------------------------------
-# Monitor registry -- tracks active scheduler jobs
+# Notification channel -- in-process status fan-out to waiting tools
+# ---------------------------------------------------------------------------
+
+
+class TemplateStatusChannel:
+    """
+    Thread-safe latest-status board for templates.
+
+    ``publish`` stores the newest result per template and wakes every waiter;
+    ``wait_for_final`` blocks the calling thread until the template reaches a
+    final status or the timeout expires, and ``await_for_final`` does the
+    same on an ``asyncio.Event`` set from the publishing thread. Only the
+    most recent ``max_entries`` templates are remembered.
+    """
+
+    def __init__(self, max_entries: int = 1000):
+        self._cond = threading.Condition()
+        self._latest: "OrderedDict[str, TemplateStatusResult]" = OrderedDict()
+        self._max_entries = max_entries
+        self._async_waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+    def publish(self, result: TemplateStatusResult) -> None:
+        with self._cond:
+            self._latest[result.template_id] = result
+            self._latest.move_to_end(result.template_id)
+            while len(self._latest) > self._max_entries:
+                self._latest.popitem(last=False)
+            self._cond.notify_all()
+            waiters = self._async_waiters.pop(result.template_id, []) if result.is_final else []
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's loop is already closed
+                pass
+
+    def latest(self, template_id: str) -> Optional[TemplateStatusResult]:
+        with self._cond:
+            return self._latest.get(template_id)
+
+    def forget(self, template_id: str) -> None:
+        """Drop a stale status (e.g. before a resubmitted template is tracked again)."""
+        with self._cond:
+            self._latest.pop(template_id, None)
+
+    def wait_for_final(self, template_id: str, timeout: float) -> Optional[TemplateStatusResult]:
+        """Block until ``template_id`` has a final status; return the latest result seen."""
+        with self._cond:
+            self._cond.wait_for(
+                lambda: (
+                    template_id in self._latest and self._latest[template_id].is_final
+                ),
+                timeout=timeout,
+            )
+            return self._latest.get(template_id)
+
+    async def await_for_final(self, template_id: str, timeout: float) -> Optional[TemplateStatusResult]:
+        """Await a final status for ``template_id`` without blocking a thread; return the latest result seen."""
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._cond:
+            current = self._latest.get(template_id)
+            if current is not None and current.is_final:
+                return current
+            self._async_waiters.setdefault(template_id, []).append(waiter)
+        try:
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+        except asyncio.TimeoutError:
+            pass
+        finally:
+            with self._cond:
+                waiters = self._async_waiters.get(template_id)
+                if waiters and waiter in waiters:
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del self._async_waiters[template_id]
+        return self.latest(template_id)
+
+
+# ---------------------------------------------------------------------------
+# Watcher -- one scheduler job polling all pending templates
 # ---------------------------------------------------------------------------
 
 
@@ -231,6 +348,10 @@ class _MonitorEntry:
         "consecutive_errors",
         "last_known_status",
         "started_at",
+        "first_seen",
+        "interval",
+        "next_poll_at",
+        "polls",
     )
 
     def __init__(
@@ -238,6 +359,8 @@ class _MonitorEntry:
         user_id: str,
         template_id: str,
         callback: Optional[Callable] = None,
+        interval: float = POLL_INTERVAL_SECONDS,
+        now: float = 0.0,
     ):
         self.user_id = user_id
         self.template_id = template_id
@@ -245,159 +368,278 @@ class _MonitorEntry:
         self.consecutive_errors: int = 0
         self.last_known_status: Optional[str] = None
         self.started_at: datetime = datetime.utcnow()
+        self.first_seen: float = now
+        self.interval: float = interval
+        self.next_poll_at: float = now
+        self.polls: int = 0
 
 
-# Module-level state -- one scheduler shared across all monitors
-_scheduler: Optional[AsyncIOScheduler] = None
-_scheduler_lock = threading.Lock()
-_active_monitors: Dict[str, _MonitorEntry] = {}
-
+class TemplateApprovalWatcher:
+    """
+    Consolidated approval tracker for all monitored templates.
 
-def _get_scheduler() -> AsyncIOScheduler:
-    """Lazily create and start the shared AsyncIOScheduler."""
-    global _scheduler
-    with _scheduler_lock:
-        if _scheduler is None or not _scheduler.running:
-            _scheduler = AsyncIOScheduler()
-            _scheduler.start()
-            logger.info("%s Shared APScheduler started", _LOG_PREFIX)
-    return _scheduler
+    ``tick()`` is the scheduler job: it groups due templates by user and
+    issues one paged ``get_templates`` read per user. ``apply_status()`` is the
+    single path every update goes through -- poll or webhook -- and handles
+    the DB sync, channel publish, callback and final-status cleanup.
+    """
 
+    def __init__(
+        self,
+        channel: Optional[TemplateStatusChannel] = None,
+        tick_seconds: float = TICK_SECONDS,
+        poll_interval: float = POLL_INTERVAL_SECONDS,
+        backoff_after: float = BACKOFF_AFTER_SECONDS,
+        max_interval: float = MAX_POLL_INTERVAL_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.channel = channel or TemplateStatusChannel()
+        self.tick_seconds = tick_seconds
+        self.poll_interval = poll_interval
+        self.backoff_after = backoff_after
+        self.max_interval = max_interval
+        self._clock = clock
+        self._lock = threading.RLock()
+        self._entries: Dict[str, _MonitorEntry] = {}
+        self._scheduler: Optional[BackgroundScheduler] = None
+
+    # -- registry ----------------------------------------------------------
+
+    def add(
+        self,
+        user_id: str,
+        template_id: str,
+        callback: Optional[Callable] = None,
+        poll_interval: Optional[float] = None,
+    ) -> bool:
+        """Start tracking a template. Returns False if it is already tracked."""
+        with self._lock:
+            if template_id in self._entries:
+                return False
+            self.channel.forget(template_id)
+            self._entries[template_id] = _MonitorEntry(
+                user_id=user_id,
+                template_id=template_id,
+                callback=callback,
+                interval=poll_interval or self.poll_interval,
+                now=self._clock(),
+            )
+        return True
 
-def _job_id_for(template_id: str) -> str:
-    """Deterministic APScheduler job ID for a given template."""
-    return f"template_monitor_{template_id}"
+    def stop(self, template_id: str) -> bool:
+        """Stop tracking a template. Returns False if it was not tracked."""
+        with self._lock:
+            entry = self._entries.pop(template_id, None)
 
+        if entry is None:
+            logger.debug(
+                "%s No active monitor for template %s -- nothing to stop",
+                _LOG_PREFIX, template_id,
+            )
+            return False
 
-# ---------------------------------------------------------------------------
-# Scheduled job -- executed by APScheduler on each tick
-# ---------------------------------------------------------------------------
+        elapsed = (datetime.utcnow() - entry.started_at).total_seconds()
+        logger.info(
+            "%s Stopped monitoring template %s (ran for %.1fs, polls=%d, last_status=%s)",
+            _LOG_PREFIX, template_id, elapsed, entry.polls, entry.last_known_status,
+        )
+        return True
+
+    def is_tracking(self, template_id: str) -> bool:
+        with self._lock:
+            return template_id in self._entries
+
+    def snapshot(self) -> Dict[str, dict]:
+        now = self._clock()
+        with self._lock:
+            return {
+                tid: {
+                    "user_id": entry.user_id,
+                    "last_known_status": entry.last_known_status,
+                    "consecutive_errors": entry.consecutive_errors,
+                    "started_at": entry.started_at.isoformat(),
+                    "polls": entry.polls,
+                    "poll_interval": entry.interval,
+                    "next_poll_in": max(0.0, entry.next_poll_at - now),
+                }
+                for tid, entry in self._entries.items()
+            }
 
+    # -- polling -----------------------------------------------------------
+
+    def tick(self) -> int:
+        """
+        Poll every user that has at least one template due.
+
+        Returns:
+            Number of users polled.
+        """
+        now = self._clock()
+        with self._lock:
+            # Registration order, one entry per user
+            due_users = list(dict.fromkeys(
+                e.user_id for e in self._entries.values() if e.next_poll_at <= now
+            ))
+        for user_id in due_users:
+            self.poll_user(user_id)
+        return len(due_users)
+
+    def poll_user(self, user_id: str) -> bool:
+        """
+        Refresh all of a user's tracked templates with one paged ``get_templates`` read.
+
+        Returns:
+            True if the read succeeded.
+        """
+        with self._lock:
+            entries = [e for e in self._entries.values() if e.user_id == user_id]
+        if not entries:
+            return True
+
+        templates = _fetch_user_templates(user_id, [e.template_id for e in entries])
+        now = self._clock()
+
+        if templates is None:
+            for entry in entries:
+                entry.consecutive_errors += 1
+                entry.next_poll_at = now + entry.interval
+                if entry.consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                    logger.error(
+                        "%s Max consecutive errors (%d) reached for template %s -- stopping monitor",
+                        _LOG_PREFIX, MAX_CONSECUTIVE_ERRORS, entry.template_id,
+                    )
+                    self.stop(entry.template_id)
+            return False
+
+        for entry in entries:
+            template = templates.get(entry.template_id)
+            entry.polls += 1
+            if template is None:
+                entry.consecutive_errors += 1
+                logger.warning(
+                    "%s Template %s not in get_templates response (%d/%d)",
+                    _LOG_PREFIX, entry.template_id, entry.consecutive_errors, MAX_CONSECUTIVE_ERRORS,
+                )
+                if entry.consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+                    self.stop(entry.template_id)
+                    continue
+            else:
+                entry.consecutive_errors = 0
+                self.apply_status(
+                    entry.template_id,
+                    str(template.get("status", "UNKNOWN")).upper(),
+                    _rejected_reason(template),
+                )
 
-async def _monitor_tick(template_id: str) -> None:
-    """
-    Single polling tick executed by APScheduler.
+            if entry.next_poll_at <= now:
+                if now - entry.first_seen >= self.backoff_after:
+                    entry.interval = min(entry.interval * 2, self.max_interval)
+                entry.next_poll_at = now + entry.interval
+        return True
 
-    Runs the poll in a thread executor (MCP call is sync), then processes
-    the result on the async side.
-    """
-    entry = _active_monitors.get(template_id)
-    if entry is None:
-        # Entry removed while job was still scheduled; clean up silently.
-        logger.debug("%s Tick for unknown template %s -- skipping", _LOG_PREFIX, template_id)
-        return
+    # -- status updates ----------------------------------------------------
 
-    logger.info(
-        "%s Polling template %s (user=%s, errors=%d, last=%s)",
-        _LOG_PREFIX,
-        template_id,
-        entry.user_id,
-        entry.consecutive_errors,
-        entry.last_known_status,
-    )
+    def apply_status(
+        self,
+        template_id: str,
+        status: str,
+        rejected_reason: Optional[str] = None,
+        source: str = "poll",
+    ) -> TemplateStatusResult:
+        """
+        Record a template status from a poll or a pushed event.
+
+        Changed statuses are synced to the DB, published on the channel and
+        handed to the monitor's callback; a final status stops monitoring.
+        """
+        status = status.upper()
+        result = _build_result(template_id, status, rejected_reason, source)
+
+        with self._lock:
+            entry = self._entries.get(template_id)
+            previous = entry.last_known_status if entry else None
+            changed = entry is None or status != previous
+            if entry is not None:
+                entry.last_known_status = status
+
+        if changed:
+            logger.info(
+                "%s Status change for template %s via %s: %s -> %s",
+                _LOG_PREFIX, template_id, source, previous or "N/A", status,
+            )
+            _sync_status_to_db(template_id, status, rejected_reason)
+            self.channel.publish(result)
+            if entry is not None and entry.callback is not None:
+                self._run_callback(entry, result)
+        else:
+            logger.debug("%s No change for template %s (still %s)", _LOG_PREFIX, template_id, status)
 
-    # Run the synchronous MCP poll in the thread-pool executor
-    loop = asyncio.get_event_loop()
-    try:
-        result: TemplateStatusResult = await loop.run_in_executor(
-            _executor,
-            _poll_template_status,
-            entry.user_id,
-            template_id,
-        )
-    except Exception as exc:
-        logger.error(
-            "%s Executor error for template %s: %s",
-            _LOG_PREFIX, template_id, exc, exc_info=True,
-        )
-        entry.consecutive_errors += 1
-        if entry.consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
+        if result.is_final and entry is not None:
+            logger.info(
+                "%s Final status %s reached for template %s -- stopping monitor",
+                _LOG_PREFIX, status, template_id,
+            )
+            self.stop(template_id)
+        return result
+
+    @staticmethod
+    def _run_callback(entry: _MonitorEntry, result: TemplateStatusResult) -> None:
+        try:
+            cb_result = entry.callback(result)
+            # Support async callbacks transparently
+            if asyncio.iscoroutine(cb_result):
+                asyncio.run(cb_result)
+        except Exception as cb_exc:
             logger.error(
-                "%s Max consecutive errors (%d) reached for template %s -- stopping monitor",
-                _LOG_PREFIX, MAX_CONSECUTIVE_ERRORS, template_id,
+                "%s Callback error for template %s: %s",
+                _LOG_PREFIX, entry.template_id, cb_exc, exc_info=True,
             )
-            stop_template_monitoring(template_id)
-        return
 
-    # Handle transient MCP errors
-    if result.status == "ERROR":
-        entry.consecutive_errors += 1
-        logger.warning(
-            "%s Poll error (%d/%d) for template %s: %s",
-            _LOG_PREFIX,
-            entry.consecutive_errors,
-            MAX_CONSECUTIVE_ERRORS,
-            template_id,
-            result.message,
-        )
-        if entry.consecutive_errors >= MAX_CONSECUTIVE_ERRORS:
-            logger.error(
-                "%s Max consecutive errors (%d) reached for template %s -- stopping monitor",
-                _LOG_PREFIX, MAX_CONSECUTIVE_ERRORS, template_id,
+    # -- scheduler ---------------------------------------------------------
+
+    def ensure_running(self) -> None:
+        """Lazily start the shared background scheduler with the single tick job."""
+        with self._lock:
+            if self._scheduler is not None and self._scheduler.running:
+                return
+            self._scheduler = BackgroundScheduler()
+            self._scheduler.add_job(
+                self._safe_tick,
+                trigger=IntervalTrigger(seconds=self.tick_seconds),
+                id="template_watcher",
+                name="Template approval watcher",
+                replace_existing=True,
+                max_instances=1,
+                coalesce=True,
             )
-            stop_template_monitoring(template_id)
-        return
+            self._scheduler.start()
+            logger.info("%s Watcher started (tick=%ss)", _LOG_PREFIX, self.tick_seconds)
 
-    # Reset error counter on successful poll
-    entry.consecutive_errors = 0
+    def shutdown(self) -> None:
+        with self._lock:
+            if self._scheduler is not None and self._scheduler.running:
+                self._scheduler.shutdown(wait=False)
+                logger.info("%s Watcher shut down", _LOG_PREFIX)
+            self._scheduler = None
 
-    # Detect status change
-    status_changed = result.status != entry.last_known_status
-    if status_changed:
-        logger.info(
-            "%s Status change detected for template %s: %s -> %s",
-            _LOG_PREFIX,
-            template_id,
-            entry.last_known_status or "N/A",
-            result.status,
-        )
-        entry.last_known_status = result.status
-
-        # Persist to database
-        await loop.run_in_executor(
-            _executor,
-            _sync_status_to_db,
-            template_id,
-            result.status,
-            None,  # rejected_reason extracted inside _poll but we re-derive below
-        )
+    def _safe_tick(self) -> None:
+        try:
+            self.tick()
+        except Exception as exc:
+            logger.error("%s Watcher tick failed: %s", _LOG_PREFIX, exc, exc_info=True)
 
-        # If REJECTED, do a targeted DB update with the reason from the message
-        if result.status == "REJECTED" and "Rejection reason:" in result.message:
-            reason = result.message.split("Rejection reason:")[-1].strip()
-            await loop.run_in_executor(
-                _executor,
-                _sync_status_to_db,
-                template_id,
-                result.status,
-                reason,
-            )
 
-        # Fire user callback if provided
-        if entry.callback is not None:
-            try:
-                cb_result = entry.callback(result)
-                # Support async callbacks transparently
-                if asyncio.iscoroutine(cb_result):
-                    await cb_result
-            except Exception as cb_exc:
-                logger.error(
-                    "%s Callback error for template %s: %s",
-                    _LOG_PREFIX, template_id, cb_exc, exc_info=True,
-                )
-    else:
-        logger.debug(
-            "%s No change for template %s (still %s)",
-            _LOG_PREFIX, template_id, result.status,
-        )
+_watcher: Optional[TemplateApprovalWatcher] = None
+_watcher_lock = threading.Lock()
 
-    # Stop monitoring if we reached a terminal status
-    if result.is_final:
-        logger.info(
-            "%s Final status %s reached for template %s -- stopping monitor",
-            _LOG_PREFIX, result.status, template_id,
-        )
-        stop_template_monitoring(template_id)
+
+def get_template_watcher() -> TemplateApprovalWatcher:
+    """Return the process-wide watcher, creating it on first use."""
+    global _watcher
+    with _watcher_lock:
+        if _watcher is None:
+            _watcher = TemplateApprovalWatcher()
+    return _watcher
 
 
 # ---------------------------------------------------------------------------
@@ -414,55 +656,36 @@ def start_template_monitoring(
     """
     Start background monitoring for a WhatsApp template.
 
-    Registers an APScheduler job that polls ``get_template_by_id`` via MCP
-    at the specified interval (default 15 s). When the status changes the
-    local DB is updated and the optional *callback* is invoked with a
+    Adds the template to the shared watcher, which checks it with the
+    user's other pending templates (one ``get_templates`` call per user)
+    starting every ``poll_interval`` seconds and backing off while it stays
+    PENDING. When the status changes the local DB is updated, the status is
+    published on the channel and the optional *callback* is invoked with a
     ``TemplateStatusResult``.
 
     Monitoring stops automatically when a final status is reached or after
-    ``MAX_CONSECUTIVE_ERRORS`` consecutive MCP failures.
+    ``MAX_CONSECUTIVE_ERRORS`` consecutive failed checks.
 
     Args:
         user_id:       User ID that owns the template.
         template_id:   WhatsApp template ID to monitor.
         callback:      Optional callable(TemplateStatusResult) -- may be
                        sync or async.
-        poll_interval: Seconds between polls (default 15).
+        poll_interval: Initial seconds between checks (default 15).
 
     Returns:
         True if monitoring was started, False if already active for this
         template.
     """
-    job_id = _job_id_for(template_id)
-
-    if template_id in _active_monitors:
+    watcher = get_template_watcher()
+    if not watcher.add(user_id, template_id, callback=callback, poll_interval=poll_interval):
         logger.warning(
             "%s Monitoring already active for template %s -- ignoring duplicate start",
             _LOG_PREFIX, template_id,
         )
         return False
 
-    # Register the monitor entry
-    entry = _MonitorEntry(
-        user_id=user_id,
-        template_id=template_id,
-        callback=callback,
-    )
-    _active_monitors[template_id] = entry
-
-    # Schedule the recurring job
-    scheduler = _get_scheduler()
-    scheduler.add_job(
-        _monitor_tick,
-        trigger=IntervalTrigger(seconds=poll_interval),
-        args=[template_id],
-        id=job_id,
-        name=f"Monitor template {template_id}",
-        replace_existing=True,
-        max_instances=1,
-        misfire_grace_time=poll_interval * 2,
-    )
-
+    watcher.ensure_running()
     logger.info(
         "%s Started monitoring template %s for user %s (interval=%ds)",
         _LOG_PREFIX, template_id, user_id, poll_interval,
@@ -474,38 +697,80 @@ def stop_template_monitoring(template_id: str) -> bool:
     """
     Stop background monitoring for a WhatsApp template.
 
-    Removes the APScheduler job and cleans up internal state.
-
     Args:
         template_id: WhatsApp template ID to stop monitoring.
 
     Returns:
         True if monitoring was stopped, False if no active monitor found.
     """
-    job_id = _job_id_for(template_id)
-    entry = _active_monitors.pop(template_id, None)
+    return get_template_watcher().stop(template_id)
 
-    if entry is None:
-        logger.debug(
-            "%s No active monitor for template %s -- nothing to stop",
-            _LOG_PREFIX, template_id,
-        )
-        return False
 
-    # Remove the APScheduler job (safe even if already removed)
-    scheduler = _get_scheduler()
-    try:
-        scheduler.remove_job(job_id)
-    except Exception:
-        # Job may have already been removed by a concurrent stop
-        pass
+def wait_for_template_status(template_id: str, timeout: float) -> Optional[TemplateStatusResult]:
+    """
+    Block the calling thread until the template reaches a final status.
 
-    elapsed = (datetime.utcnow() - entry.started_at).total_seconds()
-    logger.info(
-        "%s Stopped monitoring template %s (ran for %.1fs, last_status=%s)",
-        _LOG_PREFIX, template_id, elapsed, entry.last_known_status,
+    Returns:
+        The final ``TemplateStatusResult``, or the latest known (non-final)
+        result / None if the timeout expired first.
+    """
+    return get_template_watcher().channel.wait_for_final(template_id, timeout)
+
+
+async def await_for_template_status(template_id: str, timeout: float) -> Optional[TemplateStatusResult]:
+    """
+    Await a final status for the template without parking a thread.
+
+    Returns:
+        Same as ``wait_for_template_status``.
+    """
+    return await get_template_watcher().channel.await_for_final(template_id, timeout)
+
+
+def handle_template_status_event(
+    template_id: str,
+    status: str,
+    rejected_reason: Optional[str] = None,
+) -> TemplateStatusResult:
+    """
+    Webhook-style entry point: apply a pushed template status update.
+
+    Works whether or not the template is being monitored; the DB is synced
+    and waiters are notified either way.
+    """
+    if rejected_reason in ("", "NONE"):
+        rejected_reason = None
+    return get_template_watcher().apply_status(
+        str(template_id), status, rejected_reason, source="webhook",
     )
-    return True
+
+
+def handle_template_status_webhook(payload: dict) -> List[TemplateStatusResult]:
+    """
+    Apply a Meta ``message_template_status_update`` webhook payload.
+
+    Expected shape::
+
+        {"entry": [{"changes": [{"field": "message_template_status_update",
+                                 "value": {"event": "APPROVED",
+                                           "message_template_id": 123,
+                                           "reason": "NONE"}}]}]}
+
+    Returns:
+        One ``TemplateStatusResult`` per status change in the payload.
+    """
+    results = []
+    for entry in payload.get("entry") or []:
+        for change in entry.get("changes") or []:
+            if change.get("field") != "message_template_status_update":
+                continue
+            value = change.get("value") or {}
+            if value.get("message_template_id") is None or not value.get("event"):
+                continue
+            results.append(handle_template_status_event(
+                value["message_template_id"], value["event"], value.get("reason"),
+            ))
+    return results
 
 
 def get_monitored_templates() -> Dict[str, dict]:
@@ -517,15 +782,7 @@ def get_monitored_templates() -> Dict[str, dict]:
     Returns:
         Dict mapping template_id to a summary dict.
     """
-    return {
-        tid: {
-            "user_id": entry.user_id,
-            "last_known_status": entry.last_known_status,
-            "consecutive_errors": entry.consecutive_errors,
-            "started_at": entry.started_at.isoformat(),
-        }
-        for tid, entry in _active_monitors.items()
-    }
+    return get_template_watcher().snapshot()
 
 
 def stop_all_monitors() -> int:
@@ -537,19 +794,12 @@ def stop_all_monitors() -> int:
     Returns:
         Number of monitors stopped.
     """
-    template_ids = list(_active_monitors.keys())
+    watcher = get_template_watcher()
     count = 0
-    for tid in template_ids:
-        if stop_template_monitoring(tid):
+    for tid in list(watcher.snapshot()):
+        if watcher.stop(tid):
             count += 1
 
-    # Shut down the scheduler itself if nothing is left
-    global _scheduler
-    with _scheduler_lock:
-        if _scheduler is not None and _scheduler.running:
-            _scheduler.shutdown(wait=False)
-            logger.info("%s Shared APScheduler shut down", _LOG_PREFIX)
-            _scheduler = None
-
+    watcher.shutdown()
     logger.info("%s All monitors stopped (count=%d)", _LOG_PREFIX, count)
     return count
@@ -118,9 +118,9 @@ After submitting a new template, you MUST follow this exact sequence:
 2. Call display_pending_approval (frontend tool) with template_id and template_name
    → This shows the animated "Waiting for Meta Approval..." screen to the user
 3. Call start_background_monitoring with user_id and template_id
-   → This starts a background APScheduler job that polls every 15 seconds and syncs DB
+   → This adds the template to the background approval watcher, which checks every 15 seconds (backing off while pending) and syncs DB
 4. Call wait_for_template_approval with user_id and template_id
-   → This is the synchronous poll (every 10 seconds, up to 5 minutes)
+   → This blocks until the watcher reports a final status (up to 5 minutes)
    → Returns when template reaches a final status: APPROVED, REJECTED, PAUSED, DISABLED
 5. When wait_for_template_approval returns:
    - Call update_template_status (frontend tool) with template_id and the final status
@@ -18,7 +18,7 @@ STEP 1: PREPARE DELIVERY QUEUE
 ═══════════════════════════════════════════════════════════
 
 - Call prepare_delivery_queue with user_id and broadcast_job_id
-- This builds a multi-priority queue:
+- This plans the multi-priority queue the send tools fill:
 
 | Priority | Type                    | Dispatch Order           |
 |----------|------------------------|--------------------------|
@@ -44,11 +44,10 @@ STEP 2: SEND VIA MARKETING LITE (FIRST ATTEMPT - Business Policy)
 ═══════════════════════════════════════════════════════════
 
 - Call send_lite_broadcast with user_id and broadcast_job_id
-- Uses send_marketing_lite_message MCP tool (cheaper, optimized for promotional)
-- Sends to ALL contacts in the queue
-- For each contact: sends the template body text as a lite message
-- Tracks: sent, failed, errors per contact
-- Reports progress after completion
+- Queues ALL contacts for send_marketing_lite_message (cheaper, optimized for promotional)
+- Broadcast workers send the template body text as a lite message, lane by lane
+- The tool returns as soon as the contacts are queued; it does NOT wait for sending
+- Calling it again never sends twice: already-queued contacts are skipped
 
 If lite sending is not applicable (e.g., template has media, buttons, variables):
 - Skip lite and proceed to Step 3 (template sending)
@@ -58,17 +57,23 @@ STEP 3: SEND VIA TEMPLATE MESSAGE (FALLBACK)
 ═══════════════════════════════════════════════════════════
 
 - Call send_template_broadcast with user_id and broadcast_job_id
-- Uses send_message MCP tool with message_type="template"
-- Sends template messages with full components (header, body, footer, buttons)
+- Queues ALL contacts for send_message with message_type="template"
+- Contacts whose lite message was dead-lettered are queued again as templates
+  (not those with 131026 / 131031); call it while the job is still SENDING -
+  a COMPLETED job never sends again
+- Broadcast workers send template messages with full components (header, body, footer, buttons)
 - Supports: text, image, video, document templates
-- Tracks: sent, failed, errors per contact
+- Returns once queued; follow progress with get_delivery_queue_status
 
 ═══════════════════════════════════════════════════════════
 STEP 4: RETRY FAILED MESSAGES
 ═══════════════════════════════════════════════════════════
 
-- Call retry_failed_messages with user_id and broadcast_job_id
-- Exponential backoff retry logic:
+- Broadcast workers retry queued failures automatically - do NOT loop or wait in the conversation
+- Call retry_failed_messages with user_id and broadcast_job_id to report scheduled
+  retries and dead letters (it also queues ledger failures that bypassed the queue)
+- Call get_delivery_queue_status to see per-lane progress; 'complete' is true when nothing is pending
+- Exponential backoff retry logic (applied by the workers):
 
 | Attempt | Delay       | Retry Condition              | Final Action       |
 |---------|-------------|------------------------------|--------------------|
@@ -76,9 +81,9 @@ STEP 4: RETRY FAILED MESSAGES
 | 2nd     | 30 seconds  | Temporary failure            | Queue for retry    |
 | 3rd     | 2 minutes   | Service unavailable          | Queue for retry    |
 | 4th     | 10 minutes  | Any retryable error          | Queue for retry    |
-| 5th     | 1 hour      | Any retryable error          | Mark as failed     |
+| 5th     | 1 hour      | Any retryable error          | Dead-letter        |
 
-Non-retryable errors (mark permanent fail immediately):
+Non-retryable errors (dead-lettered immediately):
 | Error Code | Description              | Resolution                |
 |------------|--------------------------|---------------------------|
 | 131026     | Message undeliverable    | Number not on WhatsApp    |
@@ -143,8 +143,8 @@ STEP 5 - CONTENT CREATION (Handled by Content Creation Agent):
   3. If NEW template: Ask for all details step-by-step (purpose, name, body text, etc.)
      - Show complete preview and get user confirmation BEFORE submitting
      - Call submit_template ONLY after user confirms
-  4. After submission: Call wait_for_template_approval to poll status via MCP get_template_by_id
-     - The proactive template monitor checks status every 15 seconds
+  4. After submission: Call wait_for_template_approval to wait for the approval status
+     - The proactive template monitor checks status via MCP get_templates every 15 seconds, backing off while pending
      - Frontend shows polling animation with "Waiting for Meta Approval..."
      - Do NOT proceed until template is actually APPROVED by Meta
   5. If REJECTED: Analyze reason, suggest fixes, let user edit and resubmit
@@ -194,8 +194,11 @@ STEP 8 - SENDING (Handled by Delivery Agent):
   7. Returns delivery summary with sent/delivered/failed/pending counts
 
 After Delivery Agent completes:
-- If all messages processed: Call update_broadcast_phase to COMPLETED, then call display_analytics_view
-- If user requests pause: Call update_broadcast_phase to PAUSED
+- The Delivery Agent only QUEUES messages; background broadcast workers send them and
+  move the job to COMPLETED by themselves once nothing is left to send
+- To report progress: Call get_broadcast_status (progress counters + queue state)
+- If the job is COMPLETED: call display_analytics_view
+- If user requests pause: Call update_broadcast_phase to PAUSED (workers stop sending this job)
 - If delivery failed: Call update_broadcast_phase to FAILED
 
 STEP 9 - SCHEDULED (STOP POINT - campaign fully prepared, waiting for send window):
@@ -212,7 +215,7 @@ STEP 9 - SCHEDULED (STOP POINT - campaign fully prepared, waiting for send windo
 STEP 10 - PAUSED:
 - Broadcast is temporarily halted during sending
 - Ask user: "Resume sending" or "Cancel broadcast"
-- If resume: Call update_broadcast_phase to SENDING, then call send_broadcast_messages
+- If resume: Call update_broadcast_phase to SENDING (workers continue with the queued messages)
 - If cancel: Call update_broadcast_phase to CANCELLED
 
 STEP 11 - COMPLETED (Handled by Analytics & Optimization Agent):
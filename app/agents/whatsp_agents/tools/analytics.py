@@ -11,7 +11,6 @@ and AI optimization recommendations.
 NOTE: Cost tracking excluded (future enhancement).
 """
 
-import asyncio
 import json
 import time
 import concurrent.futures
@@ -30,32 +29,9 @@ _executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
 # ============================================
 
 def _call_direct_api_mcp(tool_name: str, params: dict) -> dict:
-    """Call a Direct API MCP tool (port 9002) synchronously."""
-    from langchain_mcp_adapters.client import MultiServerMCPClient
-    from langchain_mcp_adapters.tools import load_mcp_tools
-    from app.utils.whsp_onboarding_agent import parse_mcp_result_with_debug as parse_mcp_result
-
-    async def _call():
-        client = MultiServerMCPClient({
-            "DirectApiMCP": {
-                "url": "http://127.0.0.1:9002/mcp",
-                "transport": "streamable-http"
-            }
-        })
-        async with client.session("DirectApiMCP") as session:
-            mcp_tools_list = await load_mcp_tools(session)
-            mcp_tools = {t.name: t for t in mcp_tools_list}
-            if tool_name not in mcp_tools:
-                return {"status": "failed", "error": f"MCP tool '{tool_name}' not found"}
-            result = await mcp_tools[tool_name].ainvoke(params)
-            return parse_mcp_result(result)
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(_call())
-    finally:
-        loop.close()
+    """Call a Direct API MCP tool (port 9002) synchronously via the shared session pool."""
+    from ..mcp_client.direct_api_pool import call_direct_api_mcp
+    return call_direct_api_mcp(tool_name, params)
 
 
 # ============================================
@@ -66,22 +42,36 @@ def _run_delivery_report_sync(user_id: str, broadcast_job_id: str):
     """Pull delivery metrics for a broadcast job from DB."""
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
+    from app.database.postgresql.postgresql_repositories.broadcast_message_repo import BroadcastMessageRepository
 
     with get_session() as session:
         repo = BroadcastJobRepository(session=session)
         job = repo.get_by_id(broadcast_job_id)
+        if job:
+            ledger = BroadcastMessageRepository(session=session)
+            ledger_counts = ledger.get_delivery_counts(broadcast_job_id)
+            failures_by_code = ledger.count_failures_by_code(broadcast_job_id) if ledger_counts else {}
 
     if not job:
         return {"status": "failed", "message": "Broadcast job not found"}
 
     total = job.get("valid_contacts", 0)
-    sent = job.get("sent_count", 0)
-    delivered = job.get("delivered_count", 0)
-    failed = job.get("failed_count", 0)
-    pending = job.get("pending_count", 0)
+    if ledger_counts:
+        # Per-message ledger; jobs sent before it existed fall back to the job counters
+        sent = ledger_counts["sent"]
+        delivered = ledger_counts["delivered"]
+        read = ledger_counts["read"]
+        failed = ledger_counts["failed"]
+        pending = max(0, total - sent - failed)
+    else:
+        sent = job.get("sent_count", 0)
+        delivered = job.get("delivered_count", 0)
+        read = delivered
+        failed = job.get("failed_count", 0)
+        pending = job.get("pending_count", 0)
 
     delivery_rate = round((sent / total * 100), 1) if total > 0 else 0
-    read_rate = round((delivered / sent * 100), 1) if sent > 0 else 0
+    read_rate = round((read / sent * 100), 1) if sent > 0 else 0
 
     # Calculate duration
     started = job.get("started_sending_at")
@@ -105,10 +95,12 @@ def _run_delivery_report_sync(user_id: str, broadcast_job_id: str):
         "total_contacts": total,
         "sent": sent,
         "delivered": delivered,
+        "read": read,
         "failed": failed,
         "pending": pending,
         "delivery_rate": delivery_rate,
         "read_rate": read_rate,
+        "failures_by_code": failures_by_code,
         "template_name": job.get("template_name"),
         "template_category": job.get("template_category"),
         "started_at": started,
@@ -7,7 +7,6 @@ time window restrictions, and account health checks.
 Per doc section 3.3: TRAI, GDPR, WhatsApp Business Policy compliance.
 """
 
-import asyncio
 import json
 import concurrent.futures
 import nest_asyncio
@@ -34,38 +33,18 @@ TIME_WINDOWS = {
 # Default window for unknown regions
 DEFAULT_WINDOW = {"start": 8, "end": 21, "tz_offset": 0, "name": "Default"}
 
+# Phones returned as a sample by the opt-in and suppression checks
+COMPLIANCE_SAMPLE_SIZE = 10
+
 
 # ============================================
 # DIRECT API MCP HELPER
 # ============================================
 
 def _call_direct_api_mcp(tool_name: str, params: dict) -> dict:
-    """Call a Direct API MCP tool (port 9002) synchronously."""
-    from langchain_mcp_adapters.client import MultiServerMCPClient
-    from langchain_mcp_adapters.tools import load_mcp_tools
-    from app.utils.whsp_onboarding_agent import parse_mcp_result_with_debug as parse_mcp_result
-
-    async def _call():
-        client = MultiServerMCPClient({
-            "DirectApiMCP": {
-                "url": "http://127.0.0.1:9002/mcp",
-                "transport": "streamable-http"
-            }
-        })
-        async with client.session("DirectApiMCP") as session:
-            mcp_tools_list = await load_mcp_tools(session)
-            mcp_tools = {t.name: t for t in mcp_tools_list}
-            if tool_name not in mcp_tools:
-                return {"status": "failed", "error": f"MCP tool '{tool_name}' not found"}
-            result = await mcp_tools[tool_name].ainvoke(params)
-            return parse_mcp_result(result)
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(_call())
-    finally:
-        loop.close()
+    """Call a Direct API MCP tool (port 9002) synchronously via the shared session pool."""
+    from ..mcp_client.direct_api_pool import call_direct_api_mcp
+    return call_direct_api_mcp(tool_name, params)
 
 
 # ============================================
@@ -73,49 +52,36 @@ def _call_direct_api_mcp(tool_name: str, params: dict) -> dict:
 # ============================================
 
 def _run_check_opt_in_sync(user_id: str, broadcast_job_id: str):
-    """Verify opt-in consent for all contacts in a broadcast job."""
+    """
+    Verify opt-in consent for all contacts in a broadcast job.
+
+    Runs as a set-based anti-join in SQL; exclusions are audit-logged with a
+    single bulk insert and only counts plus a sample come back.
+    """
     from app.database.postgresql.postgresql_connection import get_session
-    from app.database.postgresql.postgresql_repositories.processed_contact_repo import ProcessedContactRepository
-    from app.database.postgresql.postgresql_repositories.consent_log_repo import ConsentLogRepository
+    from app.database.postgresql.postgresql_repositories.compliance_repo import ComplianceRepository
 
     with get_session() as session:
-        contact_repo = ProcessedContactRepository(session=session)
-        consent_repo = ConsentLogRepository(session=session)
-
-        valid_phones = contact_repo.get_valid_phones_by_job(broadcast_job_id)
-        opted_out_phones = consent_repo.get_opted_out_phones(user_id)
-
-        opted_in = []
-        no_consent = []
-
-        for phone in valid_phones:
-            if phone in opted_out_phones:
-                no_consent.append(phone)
-            else:
-                opted_in.append(phone)
+        result = ComplianceRepository(session=session).check_opt_in(
+            user_id, broadcast_job_id, sample_size=COMPLIANCE_SAMPLE_SIZE
+        )
 
-        # Log exclusions
-        for phone in no_consent:
-            consent_repo.log_consent(
-                user_id=user_id,
-                phone_e164=phone,
-                action="EXCLUDED",
-                source="compliance_check",
-                broadcast_job_id=broadcast_job_id,
-            )
+    total = result["total"]
+    no_consent = result["excluded_count"]
+    opted_in = total - no_consent
 
     return {
         "status": "success",
-        "total_checked": len(valid_phones),
-        "opted_in_count": len(opted_in),
-        "no_consent_count": len(no_consent),
-        "excluded_phones": no_consent[:10],
-        "passed": len(no_consent) == 0,
+        "total_checked": total,
+        "opted_in_count": opted_in,
+        "no_consent_count": no_consent,
+        "excluded_phones": result["excluded_sample"],
+        "passed": no_consent == 0,
         "message": (
-            f"Opt-in check: {len(opted_in)} contacts have consent, "
-            f"{len(no_consent)} excluded (no opt-in)."
+            f"Opt-in check: {opted_in} contacts have consent, "
+            f"{no_consent} excluded (no opt-in)."
             if no_consent else
-            f"Opt-in check passed: All {len(opted_in)} contacts have valid consent."
+            f"Opt-in check passed: All {opted_in} contacts have valid consent."
         ),
     }
 
@@ -150,45 +116,33 @@ def check_opt_in_status(user_id: str, broadcast_job_id: str) -> str:
 # ============================================
 
 def _run_filter_suppression_sync(user_id: str, broadcast_job_id: str):
-    """Filter contacts against all suppression lists."""
+    """Filter contacts against all suppression lists (set-based, in SQL)."""
     from app.database.postgresql.postgresql_connection import get_session
-    from app.database.postgresql.postgresql_repositories.processed_contact_repo import ProcessedContactRepository
-    from app.database.postgresql.postgresql_repositories.suppression_list_repo import SuppressionListRepository
+    from app.database.postgresql.postgresql_repositories.compliance_repo import ComplianceRepository
 
     with get_session() as session:
-        contact_repo = ProcessedContactRepository(session=session)
-        suppression_repo = SuppressionListRepository(session=session)
-
-        valid_phones = contact_repo.get_valid_phones_by_job(broadcast_job_id)
-        suppressed_phones = suppression_repo.get_suppressed_phones(user_id)
-
-        passed = []
-        filtered = []
-        filtered_by_type = {}
-
-        for phone in valid_phones:
-            if phone in suppressed_phones:
-                filtered.append(phone)
-            else:
-                passed.append(phone)
+        result = ComplianceRepository(session=session).filter_suppressed(
+            user_id, broadcast_job_id, sample_size=COMPLIANCE_SAMPLE_SIZE
+        )
 
-        # Get breakdown by type for filtered phones
-        if filtered:
-            summary = suppression_repo.get_suppression_summary(user_id)
-            filtered_by_type = summary.get("by_type", {})
+    total = result["total"]
+    filtered = result["filtered_count"]
+    filtered_by_type = result["filtered_by_type"]
+    passed = total - filtered
 
     return {
         "status": "success",
-        "total_checked": len(valid_phones),
-        "passed_count": len(passed),
-        "filtered_count": len(filtered),
+        "total_checked": total,
+        "passed_count": passed,
+        "filtered_count": filtered,
         "filtered_by_type": filtered_by_type,
-        "passed": len(filtered) == 0,
+        "filtered_phones": result["filtered_sample"],
+        "passed": filtered == 0,
         "message": (
-            f"Suppression filter: {len(filtered)} contacts removed "
-            f"({filtered_by_type}). {len(passed)} contacts remain."
+            f"Suppression filter: {filtered} contacts removed "
+            f"({filtered_by_type}). {passed} contacts remain."
             if filtered else
-            f"Suppression filter passed: All {len(passed)} contacts are clear."
+            f"Suppression filter passed: All {passed} contacts are clear."
         ),
     }
 
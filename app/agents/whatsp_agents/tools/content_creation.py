@@ -20,6 +20,7 @@ Uses MCP tools from direct_api_mcp (port 9002):
 
 import asyncio
 import json
+import time
 import concurrent.futures
 import nest_asyncio
 from langchain.tools import tool
@@ -35,32 +36,9 @@ _executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
 # ============================================
 
 def _call_direct_api_mcp(tool_name: str, params: dict) -> dict:
-    """Call a Direct API MCP tool (port 9002) synchronously."""
-    from langchain_mcp_adapters.client import MultiServerMCPClient
-    from langchain_mcp_adapters.tools import load_mcp_tools
-    from app.utils.whsp_onboarding_agent import parse_mcp_result_with_debug as parse_mcp_result
-
-    async def _call():
-        client = MultiServerMCPClient({
-            "DirectApiMCP": {
-                "url": "http://127.0.0.1:9002/mcp",
-                "transport": "streamable-http"
-            }
-        })
-        async with client.session("DirectApiMCP") as session:
-            mcp_tools_list = await load_mcp_tools(session)
-            mcp_tools = {t.name: t for t in mcp_tools_list}
-            if tool_name not in mcp_tools:
-                return {"status": "failed", "error": f"MCP tool '{tool_name}' not found"}
-            result = await mcp_tools[tool_name].ainvoke(params)
-            return parse_mcp_result(result)
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(_call())
-    finally:
-        loop.close()
+    """Call a Direct API MCP tool (port 9002) synchronously via the shared session pool."""
+    from ..mcp_client.direct_api_pool import call_direct_api_mcp
+    return call_direct_api_mcp(tool_name, params)
 
 
 # ============================================
@@ -394,114 +372,96 @@ def check_template_status(user_id: str, template_id: str) -> str:
 # TOOL 4b: WAIT FOR TEMPLATE APPROVAL (POLL)
 # ============================================
 
-def _run_wait_for_template_approval_sync(
-    user_id: str, template_id: str, max_polls: int = 30, poll_interval: int = 10
-):
-    """Poll template status via MCP until APPROVED, REJECTED, or timeout."""
-    import time
-
-    from app.database.postgresql.postgresql_connection import get_session
-    from app.database.postgresql.postgresql_repositories.template_creation_repo import TemplateCreationRepository
-
-    final_statuses = {"APPROVED", "REJECTED", "PAUSED", "DISABLED"}
-
-    for attempt in range(1, max_polls + 1):
-        # Check status via MCP
-        mcp_result = _call_direct_api_mcp("get_template_by_id", {
-            "user_id": user_id, "template_id": template_id
-        })
+def _run_start_template_wait_sync(user_id: str, template_id: str, poll_interval: int = 10):
+    """Register the template with the shared approval watcher and check it once up front."""
+    from ..proactive_template_monitor import get_template_watcher, start_template_monitoring
 
-        api_status = "UNKNOWN"
-        rejected_reason = None
+    start_template_monitoring(user_id, template_id, poll_interval=poll_interval)
+    get_template_watcher().poll_user(user_id)
 
-        if isinstance(mcp_result, dict) and mcp_result.get("success"):
-            api_data = mcp_result.get("data", {})
-            if isinstance(api_data, dict):
-                api_status = api_data.get("status", "UNKNOWN").upper()
-                rejected_reason = api_data.get("rejected_reason")
-
-        # Sync to local DB
-        with get_session() as session:
-            repo = TemplateCreationRepository(session=session)
-            repo.update_status(
-                template_id, api_status,
-                rejected_reason=str(rejected_reason) if rejected_reason else None
-            )
-
-        logger.info(
-            "[CONTENT] wait_for_template_approval: poll %d/%d - template %s status: %s",
-            attempt, max_polls, template_id, api_status
-        )
 
-        if api_status in final_statuses:
-            return {
-                "status": "success",
-                "template_id": template_id,
-                "template_status": api_status,
-                "rejected_reason": rejected_reason,
-                "polls": attempt,
-                "message": (
-                    f"Template {template_id} is now {api_status} after {attempt} poll(s)."
-                    + (f" Rejection reason: {rejected_reason}" if rejected_reason and api_status == "REJECTED" else "")
-                ),
-            }
+def _template_wait_result(template_id: str, result, waited: float, timeout: int) -> dict:
+    """Tool response for a finished wait; ``result`` is the latest TemplateStatusResult or None."""
+    api_status = result.status if result else "UNKNOWN"
+    rejected_reason = result.rejected_reason if result else None
+    logger.info(
+        "[CONTENT] wait_for_template_approval: template %s status %s after %.1fs",
+        template_id, api_status, waited
+    )
 
-        # Wait before next poll
-        time.sleep(poll_interval)
+    if result and result.is_final:
+        return {
+            "status": "success",
+            "template_id": template_id,
+            "template_status": api_status,
+            "rejected_reason": rejected_reason,
+            "waited_seconds": waited,
+            "message": (
+                f"Template {template_id} is now {api_status} after {waited:.0f}s."
+                + (f" Rejection reason: {rejected_reason}" if rejected_reason and api_status == "REJECTED" else "")
+            ),
+        }
 
-    # Timeout
+    # Timeout -- the watcher keeps tracking the template in the background
     return {
         "status": "timeout",
         "template_id": template_id,
         "template_status": api_status,
-        "polls": max_polls,
+        "waited_seconds": waited,
         "message": (
-            f"Template {template_id} still {api_status} after {max_polls} polls "
-            f"({max_polls * poll_interval}s). Template approval can take up to 24-48 hours. "
+            f"Template {template_id} still {api_status} after {timeout}s. "
+            f"Template approval can take up to 24-48 hours. "
             f"Use check_template_status later to re-check."
         ),
     }
 
 
 @tool
-def wait_for_template_approval(
+async def wait_for_template_approval(
     user_id: str,
     template_id: str,
     max_polls: int = 30,
     poll_interval: int = 10,
 ) -> str:
     """
-    Wait for a WhatsApp template to be approved by polling its status.
+    Wait for a WhatsApp template to be approved.
 
-    Polls get_template_by_id MCP tool repeatedly until the template reaches
-    a final status (APPROVED, REJECTED, PAUSED, DISABLED) or times out.
-    Syncs status to local DB after each poll.
+    Hands the template to the background approval watcher (one get_templates
+    call per user per check, plus webhook status events) and returns as soon
+    as it reaches a final status (APPROVED, REJECTED, PAUSED, DISABLED) or
+    after max_polls * poll_interval seconds. Status changes are synced to
+    the local DB by the watcher.
 
-    Default: polls every 10 seconds for up to 30 attempts (5 minutes).
+    Default: waits up to 30 x 10 seconds (5 minutes).
     WhatsApp typically approves MARKETING templates within a few minutes,
     but it can take up to 24-48 hours.
 
     Args:
         user_id: User's unique identifier
         template_id: WhatsApp template ID to monitor
-        max_polls: Maximum number of poll attempts (default: 30)
-        poll_interval: Seconds between polls (default: 10)
+        max_polls: Maximum number of poll intervals to wait (default: 30)
+        poll_interval: Seconds between status checks (default: 10)
 
     Returns:
-        JSON string with final template status and poll count
+        JSON string with final template status and seconds waited
     """
+    from ..proactive_template_monitor import await_for_template_status
+
     logger.info(
         "[CONTENT] wait_for_template_approval: template=%s, max_polls=%d, interval=%ds",
         template_id, max_polls, poll_interval
     )
     try:
-        future = _executor.submit(
-            _run_wait_for_template_approval_sync,
-            user_id, template_id, max_polls, poll_interval
+        timeout = max_polls * poll_interval
+        started = time.monotonic()
+        # Only the registration and first check use an executor thread; the
+        # wait itself is an asyncio.Event set by the watcher's channel
+        await asyncio.get_running_loop().run_in_executor(
+            _executor, _run_start_template_wait_sync, user_id, template_id, poll_interval
         )
-        timeout = (max_polls * poll_interval) + 60  # extra buffer
-        result = future.result(timeout=timeout)
-        return json.dumps(result, ensure_ascii=False)
+        result = await await_for_template_status(template_id, timeout)
+        waited = round(time.monotonic() - started, 1)
+        return json.dumps(_template_wait_result(template_id, result, waited, timeout), ensure_ascii=False)
     except Exception as e:
         logger.error("[CONTENT] wait_for_template_approval error: %s", e, exc_info=True)
         return json.dumps({"error": str(e), "status": "failed"}, ensure_ascii=False)
@@ -770,14 +730,16 @@ def start_background_monitoring(user_id: str, template_id: str) -> str:
     """
     Start background monitoring for a WhatsApp template approval.
 
-    Starts an APScheduler background job that polls get_template_by_id
-    via MCP every 15 seconds and syncs status to the local DB.
+    Adds the template to the shared background approval watcher, which
+    checks all of the user's pending templates with one get_templates MCP
+    call (every 15 seconds at first, backing off while it stays PENDING)
+    and syncs status changes to the local DB.
     Monitoring stops automatically when the template reaches a final
     status (APPROVED, REJECTED, PAUSED, DISABLED) or after 10
     consecutive MCP errors.
 
     Call this AFTER submit_template to begin proactive status tracking.
-    Use wait_for_template_approval for synchronous blocking poll, or
+    Use wait_for_template_approval to wait for the final status, or
     use this for fire-and-forget background monitoring.
 
     Args:
@@ -796,7 +758,7 @@ def start_background_monitoring(user_id: str, template_id: str) -> str:
             return json.dumps({
                 "status": "success",
                 "template_id": template_id,
-                "message": f"Background monitoring started for template {template_id}. Polling every 15 seconds.",
+                "message": f"Background monitoring started for template {template_id}. Checking every 15 seconds, backing off while pending.",
             })
         else:
             return json.dumps({
@@ -818,7 +780,7 @@ def stop_background_monitoring(template_id: str) -> str:
     """
     Stop background monitoring for a WhatsApp template.
 
-    Removes the APScheduler polling job. Call this after the template
+    Removes the template from the background approval watcher. Call this after the template
     reaches a final status or if the user cancels the broadcast.
 
     Args:
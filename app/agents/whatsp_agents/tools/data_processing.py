@@ -8,13 +8,12 @@ Uses ThreadPoolExecutor to run DB/MCP calls in separate threads
 (same pattern as onboarding and supervisor broadcasting agents).
 """
 
-import asyncio
 import json
 import concurrent.futures
 import nest_asyncio
 from langchain.tools import tool
 
-from ....config import logger
+from ....config import logger, settings
 
 # Apply nest_asyncio to allow nested event loops
 nest_asyncio.apply()
@@ -28,32 +27,9 @@ _executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
 # ============================================
 
 def _call_direct_api_mcp(tool_name: str, params: dict) -> dict:
-    """Call a Direct API MCP tool (port 9002) synchronously."""
-    from langchain_mcp_adapters.client import MultiServerMCPClient
-    from langchain_mcp_adapters.tools import load_mcp_tools
-    from app.utils.whsp_onboarding_agent import parse_mcp_result_with_debug as parse_mcp_result
-
-    async def _call():
-        client = MultiServerMCPClient({
-            "DirectApiMCP": {
-                "url": "http://127.0.0.1:9002/mcp",
-                "transport": "streamable-http"
-            }
-        })
-        async with client.session("DirectApiMCP") as session:
-            mcp_tools_list = await load_mcp_tools(session)
-            mcp_tools = {t.name: t for t in mcp_tools_list}
-            if tool_name not in mcp_tools:
-                return {"status": "failed", "error": f"MCP tool '{tool_name}' not found"}
-            result = await mcp_tools[tool_name].ainvoke(params)
-            return parse_mcp_result(result)
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(_call())
-    finally:
-        loop.close()
+    """Call a Direct API MCP tool (port 9002) synchronously via the shared session pool."""
+    from ..mcp_client.direct_api_pool import call_direct_api_mcp
+    return call_direct_api_mcp(tool_name, params)
 
 
 # ============================================
@@ -353,111 +329,71 @@ def _run_process_file_sync(
     name_column: str = None,
     default_country: str = "IN",
 ):
-    """Parse file, validate, deduplicate, score, and store contacts."""
-    from app.utils.data_processing.file_parser import parse_file
-    from app.utils.data_processing.phone_validator import validate_phone
-    from app.utils.data_processing.deduplicator import deduplicate_contacts
-    from app.utils.data_processing.quality_scorer import score_contacts
+    """
+    Parse file, validate, deduplicate, score, and store contacts.
+
+    Streams the file through the chunked pipeline: each chunk of
+    CONTACT_PROCESSING_CHUNK_SIZE rows is validated, deduplicated against
+    everything seen so far, scored and inserted before the next is read.
+    """
+    from app.utils.data_processing.file_parser import iter_file
+    from app.utils.data_processing.pipeline import process_contact_stream
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.processed_contact_repo import ProcessedContactRepository
     from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
 
-    # Step 1: Parse file
-    raw_contacts = parse_file(file_path, phone_column=phone_column, name_column=name_column)
-    logger.info(f"Parsed {len(raw_contacts)} contacts from file")
-
-    if not raw_contacts:
-        return {
-            "status": "failed",
-            "message": "No contacts found in the uploaded file. Please check the file format and column names."
-        }
-
-    # Step 2: Validate phone numbers
-    valid_contacts = []
-    invalid_contacts = []
-
-    for contact in raw_contacts:
-        phone = contact.get("phone", "")
-        is_valid, e164, country = validate_phone(phone, default_country)
-
-        contact["phone_e164"] = e164
-        contact["country_code"] = country
-        contact["is_valid"] = is_valid
-
-        if is_valid:
-            contact["validation_errors"] = []
-            valid_contacts.append(contact)
-        else:
-            contact["validation_errors"] = [f"Invalid phone: {phone}"]
-            contact["quality_score"] = 0
-            contact["is_duplicate"] = False
-            contact["duplicate_of"] = None
-            invalid_contacts.append(contact)
-
-    # Step 3: Deduplicate valid contacts
-    unique, duplicates = deduplicate_contacts(valid_contacts, default_country=default_country)
-
-    dup_records = []
-    for d in duplicates:
-        d["is_duplicate"] = True
-        d["quality_score"] = 0
-        dup_records.append(d)
-
-    # Step 4: Quality score unique contacts
-    score_contacts(unique)
-    for c in unique:
-        c["is_duplicate"] = False
-        c["duplicate_of"] = None
+    def _log_progress(stats):
+        logger.info(
+            f"[DATA_PROCESSING] job {broadcast_job_id}: chunk {stats.chunks}, "
+            f"{stats.total_parsed} parsed, {stats.records_stored} stored"
+        )
 
-    # Step 5: Store in DB
-    all_records = unique + dup_records + invalid_contacts
+    # Steps 1-5: Parse -> validate -> dedup -> score -> store, chunk by chunk
     with get_session() as session:
         contact_repo = ProcessedContactRepository(session=session)
-        count = contact_repo.bulk_create(all_records, broadcast_job_id, user_id)
+        stats = process_contact_stream(
+            iter_file(file_path, phone_column=phone_column, name_column=name_column),
+            sink=lambda records: contact_repo.bulk_create(records, broadcast_job_id, user_id),
+            default_country=default_country,
+            chunk_size=settings.CONTACT_PROCESSING_CHUNK_SIZE,
+            on_progress=_log_progress,
+        )
+        logger.info(f"Parsed {stats.total_parsed} contacts from file")
+
+        if not stats.total_parsed:
+            return {
+                "status": "failed",
+                "message": "No contacts found in the uploaded file. Please check the file format and column names."
+            }
 
-        valid_phones = [c["phone_e164"] for c in unique]
         broadcast_repo = BroadcastJobRepository(session=session)
         broadcast_repo.update_contacts(
             job_id=broadcast_job_id,
-            contacts_data=json.dumps(valid_phones),
-            total=len(raw_contacts),
-            valid=len(unique),
-            invalid=len(invalid_contacts)
+            contacts_data=json.dumps(stats.valid_phones),
+            total=stats.total_parsed,
+            valid=stats.valid_count,
+            invalid=stats.invalid_count
         )
 
-    # Quality distribution
-    scores = [c.get("quality_score", 0) for c in unique]
-    avg_score = sum(scores) / len(scores) if scores else 0
-
-    countries = {}
-    for c in unique:
-        cc = c.get("country_code", "UNKNOWN")
-        countries[cc] = countries.get(cc, 0) + 1
+    avg_score = stats.avg_quality_score
 
     return {
-        "status": "success" if len(unique) > 0 else "failed",
+        "status": "success" if stats.valid_count > 0 else "failed",
         "file_path": file_path,
-        "total_parsed": len(raw_contacts),
-        "valid_count": len(unique),
-        "invalid_count": len(invalid_contacts),
-        "duplicates_removed": len(duplicates),
-        "duplicate_breakdown": _count_dedup_stages(duplicates),
+        "total_parsed": stats.total_parsed,
+        "valid_count": stats.valid_count,
+        "invalid_count": stats.invalid_count,
+        "duplicates_removed": stats.duplicates_removed,
+        "duplicate_breakdown": stats.duplicate_breakdown,
         "avg_quality_score": round(avg_score, 1),
-        "quality_distribution": {
-            "high": sum(1 for s in scores if s >= 70),
-            "medium": sum(1 for s in scores if 40 <= s < 70),
-            "low": sum(1 for s in scores if s < 40),
-        },
-        "country_breakdown": countries,
-        "invalid_samples": [
-            {"phone": c["phone"], "row": c.get("source_row")}
-            for c in invalid_contacts[:10]
-        ],
-        "records_stored": count,
+        "quality_distribution": stats.quality_distribution,
+        "country_breakdown": stats.country_breakdown,
+        "invalid_samples": stats.invalid_samples,
+        "records_stored": stats.records_stored,
         "message": (
-            f"File processed: {len(raw_contacts)} contacts parsed, "
-            f"{len(unique)} valid, {len(invalid_contacts)} invalid, "
-            f"{len(duplicates)} duplicates removed. "
+            f"File processed: {stats.total_parsed} contacts parsed, "
+            f"{stats.valid_count} valid, {stats.invalid_count} invalid, "
+            f"{stats.duplicates_removed} duplicates removed. "
             f"Average quality score: {avg_score:.0f}/100."
         ),
     }
@@ -482,6 +418,8 @@ def process_contact_file(
     4. Quality scoring (0-100)
     5. Store processed contacts in database
 
+    Large files are streamed in chunks, so memory use stays flat.
+
     Args:
         user_id: User's unique identifier
         broadcast_job_id: The broadcast job ID
@@ -504,7 +442,7 @@ def process_contact_file(
             name_column=name_column,
             default_country=default_country,
         )
-        result = future.result(timeout=120)
+        result = future.result(timeout=settings.CONTACT_PROCESSING_TIMEOUT)
         return json.dumps(result, ensure_ascii=False)
     except Exception as e:
         logger.error("[DATA_PROCESSING] process_contact_file error: %s", e, exc_info=True)
@@ -2,25 +2,33 @@
 Backend tools for Delivery Agent.
 
 Business Policy: send_marketing_lite_message FIRST, fallback to send_message.
+send_template_broadcast queues dead-lettered lite recipients of the job again
+as template messages (unless their number or account cannot be reached).
 
-Handles message dispatch via MCP tools:
-- send_marketing_lite_message (port 9002) - cheaper, promotional text
-- send_message (port 9002) - full template messages (text, image, video, document)
-- mark_message_as_read (port 9002) - read status tracking
+The send tools do not send: they put the job's recipients on the durable
+delivery queue (delivery_queue table, app/utils/broadcasting/delivery_queue.py)
+and report its state. broadcast-worker processes (app/utils/broadcasting/worker.py)
+drain the queue through the Direct API batch tools (port 9002):
+- send_marketing_lite_message_batch - cheaper, promotional text
+- send_message_batch - full template messages (text, image, video, document)
+mark_message_as_read (port 9002) is still called directly for read receipts.
 
 Per doc section 3.6: Rate limiting, queue management (5 priorities),
 retry with exponential backoff, error code handling, delivery tracking.
 """
 
-import asyncio
 import json
-import time
 import concurrent.futures
 import nest_asyncio
-from datetime import datetime, timezone
 from langchain.tools import tool
 
 from ....config import logger
+from ....utils.broadcasting.delivery_queue import (
+    MAX_RETRIES,
+    NON_RETRYABLE_ERRORS,
+    priority_for,
+    start_delivery,
+)
 
 nest_asyncio.apply()
 _executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
@@ -38,70 +46,72 @@ TIER_LIMITS = {
     "TIER_4": float("inf"),
 }
 
-# ============================================
-# ERROR CODE CLASSIFICATION (per doc 3.6.5)
-# ============================================
+# Error code classification (NON_RETRYABLE_ERRORS, RETRYABLE_ERRORS, per doc
+# 3.6.5) and the RETRY_DELAYS backoff ladder (per doc 3.6.3) live with the
+# delivery queue workers that apply them.
 
-NON_RETRYABLE_ERRORS = {
-    "131026": "Message undeliverable - number not on WhatsApp",
-    "131047": "Re-engagement required - user must message first",
-    "131051": "Unsupported message type - fix template format",
-    "131031": "Business account locked - contact Meta support",
-}
 
-RETRYABLE_ERRORS = {
-    "131053": "Media upload failed",
-    "130429": "Rate limit exceeded",
-}
+# ============================================
+# DIRECT API MCP HELPER
+# ============================================
 
-# Exponential backoff delays in seconds (per doc 3.6.3)
-RETRY_DELAYS = [0, 30, 120, 600, 3600]  # immediate, 30s, 2m, 10m, 1h
-MAX_RETRIES = 5
+def _call_direct_api_mcp(tool_name: str, params: dict) -> dict:
+    """Call a Direct API MCP tool (port 9002) synchronously via the shared session pool."""
+    from ..mcp_client.direct_api_pool import call_direct_api_mcp
+    return call_direct_api_mcp(tool_name, params)
 
 
 # ============================================
-# DIRECT API MCP HELPER
+# DELIVERY QUEUE HELPERS
 # ============================================
 
-def _call_direct_api_mcp(tool_name: str, params: dict) -> dict:
-    """Call a Direct API MCP tool (port 9002) synchronously."""
-    from langchain_mcp_adapters.client import MultiServerMCPClient
-    from langchain_mcp_adapters.tools import load_mcp_tools
-    from app.utils.whsp_onboarding_agent import parse_mcp_result_with_debug as parse_mcp_result
-
-    async def _call():
-        client = MultiServerMCPClient({
-            "DirectApiMCP": {
-                "url": "http://127.0.0.1:9002/mcp",
-                "transport": "streamable-http"
-            }
-        })
-        async with client.session("DirectApiMCP") as session:
-            mcp_tools_list = await load_mcp_tools(session)
-            mcp_tools = {t.name: t for t in mcp_tools_list}
-            if tool_name not in mcp_tools:
-                return {"status": "failed", "error": f"MCP tool '{tool_name}' not found"}
-            result = await mcp_tools[tool_name].ainvoke(params)
-            return parse_mcp_result(result)
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(_call())
-    finally:
-        loop.close()
+def _get_queue_stats(broadcast_job_id: str) -> dict:
+    """Queue state of a job (counts per status and lane, retries, dead letters)."""
+    from app.database.postgresql.postgresql_connection import get_session
+    from app.database.postgresql.postgresql_repositories.delivery_queue_repo import DeliveryQueueRepository
 
+    with get_session() as session:
+        return DeliveryQueueRepository(session=session).get_queue_stats(broadcast_job_id)
 
-def _is_retryable(error_code: str) -> bool:
-    """Check if an error code is retryable."""
-    return str(error_code) in RETRYABLE_ERRORS
 
+def _enqueue_broadcast(
+    user_id: str, broadcast_job_id: str, recipients: list, method: str, payload: dict,
+    fallback_from: str = None,
+) -> dict:
+    """
+    Queue ``recipients`` (dicts with phone and priority) of a job and report the queue.
 
-def _extract_error_code(error) -> str:
-    """Extract error code from various error formats."""
-    if isinstance(error, dict):
-        return str(error.get("code", error.get("error_code", "")))
-    return str(error)
+    A READY_TO_SEND or PAUSED job moves to SENDING so the broadcast workers
+    pick it up. Recipients already queued for the job are skipped, so calling
+    a send tool twice never sends twice. With ``fallback_from``, dead rows of
+    that method are queued again under ``method`` (see start_delivery).
+    """
+    started = start_delivery(
+        user_id, broadcast_job_id, recipients, method=method, payload=payload, fallback_from=fallback_from,
+    )
+    queued, requeued, queue = started["queued"], started["requeued"], started["queue"]
+    return {
+        "status": "queued",
+        "method": method,
+        "phase": started["phase"],
+        "total": len(recipients),
+        "queued": queued,
+        "requeued": requeued,
+        "already_queued": len(recipients) - queued - requeued,
+        "queue": queue,
+        "message": (
+            f"{queued} of {len(recipients)} recipients queued for {method} delivery "
+            + (f"and {requeued} failed {fallback_from} recipients queued again " if requeued else "")
+            + f"({len(recipients) - queued - requeued} were already queued). "
+            f"Queue: {queue['pending']} pending, {queue['by_status'].get('SENT', 0)} sent, "
+            f"{queue['by_status'].get('DEAD', 0)} dead-lettered. "
+            + (
+                "Broadcast workers send in priority order; check progress with get_delivery_queue_status."
+                if started["phase"] == "SENDING" else
+                f"Job is {started['phase']}: workers only send SENDING jobs."
+            )
+        ),
+    }
 
 
 # ============================================
@@ -109,7 +119,7 @@ def _extract_error_code(error) -> str:
 # ============================================
 
 def _run_prepare_queue_sync(user_id: str, broadcast_job_id: str):
-    """Build multi-priority delivery queue and check rate limits."""
+    """Plan the multi-priority delivery queue and check rate limits."""
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
     from app.database.postgresql.postgresql_repositories.processed_contact_repo import ProcessedContactRepository
@@ -139,36 +149,25 @@ def _run_prepare_queue_sync(user_id: str, broadcast_job_id: str):
         contacts = contact_repo.get_by_broadcast_job(broadcast_job_id)
         valid_contacts = [c for c in contacts if not c.get("is_duplicate")]
 
-    # Build priority queues based on quality score and data
-    queues = {
-        "priority_1_urgent": [],      # Transactional
-        "priority_2_window": [],      # 24-hr window contacts
-        "priority_3_normal": [],      # Standard marketing
-        "priority_4_low": [],         # Bulk, non-time-sensitive
-        "priority_5_background": [],  # Re-engagement
+    # Priority lanes the send tools will queue these contacts in
+    lane_names = {
+        1: "priority_1_urgent",      # Transactional
+        2: "priority_2_window",      # 24-hr window contacts
+        3: "priority_3_normal",      # Standard marketing
+        4: "priority_4_low",         # Bulk, non-time-sensitive
+        5: "priority_5_background",  # Re-engagement
     }
-
+    queue_summary = {name: 0 for name in lane_names.values()}
     for contact in valid_contacts:
-        phone = contact["phone_e164"]
-        score = contact.get("quality_score", 50)
+        queue_summary[lane_names[priority_for(contact)]] += 1
 
-        # Classify by quality score
-        if score >= 80:
-            queues["priority_3_normal"].append(phone)
-        elif score >= 50:
-            queues["priority_4_low"].append(phone)
-        else:
-            queues["priority_5_background"].append(phone)
-
-    total_to_send = sum(len(q) for q in queues.values())
+    total_to_send = sum(queue_summary.values())
 
     # Check tier limit
     capped = False
     if tier_limit != float("inf") and total_to_send > tier_limit:
         capped = True
 
-    queue_summary = {k: len(v) for k, v in queues.items()}
-
     return {
         "status": "success",
         "total_contacts": total_to_send,
@@ -176,6 +175,7 @@ def _run_prepare_queue_sync(user_id: str, broadcast_job_id: str):
         "tier_limit": tier_limit if tier_limit != float("inf") else "unlimited",
         "capped": capped,
         "queue_summary": queue_summary,
+        "queue": _get_queue_stats(broadcast_job_id),
         "template_name": job.get("template_name"),
         "template_category": job.get("template_category"),
         "message": (
@@ -191,8 +191,9 @@ def prepare_delivery_queue(user_id: str, broadcast_job_id: str) -> str:
     """
     Prepare multi-priority delivery queue and check rate limits.
 
-    Builds 5-level priority queue and validates against messaging tier.
+    Plans the 5-level priority queue and validates against messaging tier.
     Priority: 1=Urgent/OTP, 2=24hr window, 3=Normal, 4=Low, 5=Background.
+    Also returns what is already queued for the job.
 
     Args:
         user_id: User's unique identifier
@@ -217,8 +218,8 @@ def prepare_delivery_queue(user_id: str, broadcast_job_id: str) -> str:
 
 def _run_send_lite_broadcast_sync(user_id: str, broadcast_job_id: str):
     """
-    Send broadcast via marketing lite message (cheaper, business policy).
-    Uses send_marketing_lite_message MCP tool.
+    Queue the broadcast for marketing lite delivery (cheaper, business policy).
+    Workers send it with the send_marketing_lite_message_batch MCP tool.
     """
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
@@ -276,71 +277,31 @@ def _run_send_lite_broadcast_sync(user_id: str, broadcast_job_id: str):
             }
 
         contacts = contact_repo.get_by_broadcast_job(broadcast_job_id)
-        valid_phones = [c["phone_e164"] for c in contacts if not c.get("is_duplicate")]
+        recipients = [
+            {"phone": c["phone_e164"], "priority": priority_for(c)}
+            for c in contacts if not c.get("is_duplicate")
+        ]
 
-    if not valid_phones:
+    if not recipients:
         return {"status": "failed", "message": "No valid contacts to send to"}
 
-    # Send via lite MCP tool
-    sent = 0
-    failed = 0
-    errors = []
-
-    for phone in valid_phones:
-        try:
-            result = _call_direct_api_mcp("send_marketing_lite_message", {
-                "to": phone,
-                "text_body": body_text,
-                "message_type": "text",
-                "recipient_type": "individual",
-            })
-
-            if isinstance(result, dict) and result.get("success"):
-                sent += 1
-            else:
-                failed += 1
-                error_detail = result.get("error", "Unknown") if isinstance(result, dict) else str(result)
-                error_code = _extract_error_code(result.get("error", {}) if isinstance(result, dict) else {})
-                errors.append({
-                    "phone": phone,
-                    "error": error_detail,
-                    "error_code": error_code,
-                    "retryable": _is_retryable(error_code),
-                })
-        except Exception as e:
-            failed += 1
-            errors.append({"phone": phone, "error": str(e), "retryable": True})
-
-    # Update broadcast job progress
-    with get_session() as session:
-        broadcast_repo = BroadcastJobRepository(session=session)
-        broadcast_repo.update_send_progress(broadcast_job_id, sent=sent, failed=failed)
-
-    retryable_count = sum(1 for e in errors if e.get("retryable"))
-
-    return {
-        "status": "success",
-        "method": "marketing_lite",
-        "total": len(valid_phones),
-        "sent": sent,
-        "failed": failed,
-        "retryable_failures": retryable_count,
-        "permanent_failures": failed - retryable_count,
-        "errors_preview": errors[:10],
-        "message": (
-            f"Lite broadcast: {sent} sent, {failed} failed out of {len(valid_phones)}. "
-            f"({retryable_count} retryable, {failed - retryable_count} permanent)."
-        ),
-    }
+    return _enqueue_broadcast(
+        user_id,
+        broadcast_job_id,
+        recipients,
+        method="lite",
+        payload={"text_body": body_text, "message_type": "text", "recipient_type": "individual"},
+    )
 
 
 @tool
 def send_lite_broadcast(user_id: str, broadcast_job_id: str) -> str:
     """
-    Send broadcast via marketing lite message (Business Policy: TRY FIRST).
+    Queue broadcast for marketing lite delivery (Business Policy: TRY FIRST).
 
-    Uses send_marketing_lite_message MCP tool - cheaper, optimized for promotional.
-    Sends template body text as lite message to all contacts.
+    Delivery workers send the template body text as a lite message to all
+    contacts with the send_marketing_lite_message MCP tool - cheaper, optimized
+    for promotional. Returns once the contacts are queued.
     If template has media/buttons, returns 'skipped' - use send_template_broadcast instead.
 
     Args:
@@ -348,12 +309,12 @@ def send_lite_broadcast(user_id: str, broadcast_job_id: str) -> str:
         broadcast_job_id: The broadcast job ID
 
     Returns:
-        JSON string with send results (sent, failed, errors) or 'skipped' if not applicable
+        JSON string with queued counts and queue state, or 'skipped' if not applicable
     """
     logger.info("[DELIVERY] send_lite_broadcast for job: %s", broadcast_job_id)
     try:
         future = _executor.submit(_run_send_lite_broadcast_sync, user_id, broadcast_job_id)
-        result = future.result(timeout=300)
+        result = future.result(timeout=60)
         return json.dumps(result, ensure_ascii=False)
     except Exception as e:
         logger.error("[DELIVERY] send_lite_broadcast error: %s", e, exc_info=True)
@@ -366,8 +327,8 @@ def send_lite_broadcast(user_id: str, broadcast_job_id: str) -> str:
 
 def _run_send_template_broadcast_sync(user_id: str, broadcast_job_id: str):
     """
-    Send broadcast via full template message.
-    Uses send_message MCP tool with message_type="template".
+    Queue the broadcast for full template delivery.
+    Workers send it with the send_message_batch MCP tool, message_type="template".
     """
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
@@ -387,83 +348,51 @@ def _run_send_template_broadcast_sync(user_id: str, broadcast_job_id: str):
             return {"status": "failed", "message": "No template selected for broadcast"}
 
         contacts = contact_repo.get_by_broadcast_job(broadcast_job_id)
-        valid_phones = [c["phone_e164"] for c in contacts if not c.get("is_duplicate")]
+        recipients = [
+            {"phone": c["phone_e164"], "priority": priority_for(c)}
+            for c in contacts if not c.get("is_duplicate")
+        ]
 
-    if not valid_phones:
+    if not recipients:
         return {"status": "failed", "message": "No valid contacts to send to"}
 
-    sent = 0
-    failed = 0
-    errors = []
-
-    for phone in valid_phones:
-        try:
-            result = _call_direct_api_mcp("send_message", {
-                "user_id": user_id,
-                "to": phone,
-                "message_type": "template",
-                "template_name": template_name,
-                "template_language_code": template_language,
-            })
-
-            if isinstance(result, dict) and (result.get("success") or result.get("status") == "success"):
-                sent += 1
-            else:
-                failed += 1
-                error_detail = result.get("error", "Unknown") if isinstance(result, dict) else str(result)
-                error_code = _extract_error_code(result.get("error", {}) if isinstance(result, dict) else {})
-                errors.append({
-                    "phone": phone,
-                    "error": error_detail,
-                    "error_code": error_code,
-                    "retryable": _is_retryable(error_code),
-                })
-        except Exception as e:
-            failed += 1
-            errors.append({"phone": phone, "error": str(e), "retryable": True})
-
-    # Update broadcast job progress
-    with get_session() as session:
-        broadcast_repo = BroadcastJobRepository(session=session)
-        broadcast_repo.update_send_progress(broadcast_job_id, sent=sent, failed=failed)
-
-    retryable_count = sum(1 for e in errors if e.get("retryable"))
-
-    return {
-        "status": "success",
-        "method": "template",
-        "total": len(valid_phones),
-        "sent": sent,
-        "failed": failed,
-        "retryable_failures": retryable_count,
-        "permanent_failures": failed - retryable_count,
-        "errors_preview": errors[:10],
-        "message": (
-            f"Template broadcast: {sent} sent, {failed} failed out of {len(valid_phones)}. "
-            f"({retryable_count} retryable, {failed - retryable_count} permanent)."
-        ),
-    }
+    return _enqueue_broadcast(
+        user_id,
+        broadcast_job_id,
+        recipients,
+        method="template",
+        payload={
+            "user_id": user_id,
+            "message_type": "template",
+            "template_name": template_name,
+            "template_language_code": template_language,
+        },
+        fallback_from="lite",
+    )
 
 
 @tool
 def send_template_broadcast(user_id: str, broadcast_job_id: str) -> str:
     """
-    Send broadcast via full template message (fallback when lite is not applicable).
+    Queue broadcast for full template delivery (fallback when lite is not applicable or failed).
 
-    Uses send_message MCP tool with message_type="template".
+    Delivery workers send with the send_message MCP tool, message_type="template".
     Supports all template types: text, image, video, document with buttons.
+    Contacts whose lite message was dead-lettered are queued again as
+    templates, unless the number is not on WhatsApp or the account is locked.
+    Returns once the contacts are queued.
 
     Args:
         user_id: User's unique identifier
         broadcast_job_id: The broadcast job ID
 
     Returns:
-        JSON string with send results (sent, failed, errors with error codes)
+        JSON string with queued counts and queue state
     """
     logger.info("[DELIVERY] send_template_broadcast for job: %s", broadcast_job_id)
     try:
         future = _executor.submit(_run_send_template_broadcast_sync, user_id, broadcast_job_id)
-        result = future.result(timeout=300)
+        result = future.result(timeout=60)
         return json.dumps(result, ensure_ascii=False)
     except Exception as e:
         logger.error("[DELIVERY] send_template_broadcast error: %s", e, exc_info=True)
@@ -475,93 +404,65 @@ def send_template_broadcast(user_id: str, broadcast_job_id: str) -> str:
 # ============================================
 
 def _run_retry_failed_sync(user_id: str, broadcast_job_id: str, max_retries: int = MAX_RETRIES):
-    """Retry failed messages with exponential backoff."""
+    """
+    Queue ledger failures that never went through the delivery queue, then report retries.
+
+    Queued recipients are retried by the delivery workers on the RETRY_DELAYS
+    ladder without any tool call. This only picks up retryable failures from
+    the broadcast_messages ledger that have no queue row (e.g. jobs sent
+    before the delivery queue), queues them for template delivery and reports the
+    job's scheduled retries and dead letters.
+    """
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
+    from app.database.postgresql.postgresql_repositories.broadcast_message_repo import BroadcastMessageRepository
+    from app.database.postgresql.postgresql_repositories.delivery_queue_repo import DeliveryQueueRepository
 
     with get_session() as session:
-        broadcast_repo = BroadcastJobRepository(session=session)
-        job = broadcast_repo.get_by_id(broadcast_job_id)
-
-    if not job:
-        return {"status": "failed", "message": "Broadcast job not found"}
-
-    template_name = job.get("template_name")
-    template_language = job.get("template_language", "en")
+        job = BroadcastJobRepository(session=session).get_by_id(broadcast_job_id)
+        if not job:
+            return {"status": "failed", "message": "Broadcast job not found"}
 
-    # Get failed contacts from the last send attempt
-    # In a production system, these would be stored in a separate table
-    # For now, we re-check all contacts and resend to those not yet delivered
-    from app.database.postgresql.postgresql_connection import get_session as gs
-    from app.database.postgresql.postgresql_repositories.processed_contact_repo import ProcessedContactRepository
+        ledger = BroadcastMessageRepository(session=session)
+        retry_phones = ledger.get_retryable_phones(
+            broadcast_job_id,
+            max_attempts=max_retries,
+            non_retryable_codes=NON_RETRYABLE_ERRORS,
+        )
+        failures_by_code = ledger.count_failures_by_code(broadcast_job_id)
+
+        queued = DeliveryQueueRepository(session=session).enqueue(
+            broadcast_job_id,
+            user_id,
+            [{"phone": phone} for phone in retry_phones],
+            method="template",
+            payload={
+                "user_id": user_id,
+                "message_type": "template",
+                "template_name": job.get("template_name"),
+                "template_language_code": job.get("template_language", "en"),
+            },
+        )
 
-    with gs() as session:
-        contact_repo = ProcessedContactRepository(session=session)
-        contacts = contact_repo.get_by_broadcast_job(broadcast_job_id)
-        all_phones = [c["phone_e164"] for c in contacts if not c.get("is_duplicate")]
-
-    # Track retry results
-    retried = 0
-    succeeded = 0
-    permanent_fails = 0
-    still_failing = 0
-
-    # Simulate retry with backoff (limited retries in single call)
-    retry_phones = all_phones[:50]  # Limit per retry batch
-
-    for phone in retry_phones:
-        for attempt in range(min(max_retries, 3)):  # Max 3 attempts per tool call
-            delay = RETRY_DELAYS[attempt] if attempt < len(RETRY_DELAYS) else RETRY_DELAYS[-1]
-
-            if delay > 0 and attempt > 0:
-                time.sleep(min(delay, 5))  # Cap sleep at 5s per attempt in tool context
-
-            try:
-                result = _call_direct_api_mcp("send_message", {
-                    "user_id": user_id,
-                    "to": phone,
-                    "message_type": "template",
-                    "template_name": template_name,
-                    "template_language_code": template_language,
-                })
-
-                if isinstance(result, dict) and (result.get("success") or result.get("status") == "success"):
-                    succeeded += 1
-                    retried += 1
-                    break
-                else:
-                    error_code = _extract_error_code(
-                        result.get("error", {}) if isinstance(result, dict) else {}
-                    )
-                    if not _is_retryable(error_code):
-                        permanent_fails += 1
-                        retried += 1
-                        break
-                    # Retryable - continue to next attempt
-            except Exception:
-                pass  # Will retry
-        else:
-            still_failing += 1
-            retried += 1
-
-    # Update progress
-    with gs() as session:
-        broadcast_repo = BroadcastJobRepository(session=session)
-        current_sent = job.get("sent_count", 0) + succeeded
-        current_failed = job.get("failed_count", 0) - succeeded
-        if current_failed < 0:
-            current_failed = 0
-        broadcast_repo.update_send_progress(broadcast_job_id, sent=current_sent, failed=current_failed)
+    queue = _get_queue_stats(broadcast_job_id)
+    permanent_fails = sum(n for code, n in failures_by_code.items() if code in NON_RETRYABLE_ERRORS)
 
     return {
         "status": "success",
-        "retried": retried,
-        "succeeded": succeeded,
+        "queued_for_retry": queued,
+        "retry_scheduled": queue["retry_scheduled"],
+        "next_retry_at": queue["next_retry_at"],
+        "dead_lettered": queue["by_status"].get("DEAD", 0),
+        "dead_by_code": queue["dead_by_code"],
         "permanent_failures": permanent_fails,
-        "still_failing": still_failing,
+        "failures_by_code": failures_by_code,
+        "queue": queue,
         "message": (
-            f"Retry complete: {retried} retried, {succeeded} now succeeded, "
-            f"{permanent_fails} permanent failures, {still_failing} still failing."
+            f"{queued} failed recipients newly queued for retry. "
+            f"{queue['retry_scheduled']} retries scheduled"
+            + (f" (next at {queue['next_retry_at']} UTC)" if queue["next_retry_at"] else "")
+            + f", {queue['by_status'].get('DEAD', 0)} dead-lettered, "
+            f"{permanent_fails} permanent failures in the ledger."
         ),
     }
 
@@ -569,23 +470,24 @@ def _run_retry_failed_sync(user_id: str, broadcast_job_id: str, max_retries: int
 @tool
 def retry_failed_messages(user_id: str, broadcast_job_id: str) -> str:
     """
-    Retry failed messages with exponential backoff.
+    Report and schedule retries of failed messages (exponential backoff).
 
-    Retries with delays: immediate, 30s, 2min, 10min, 1hr.
-    Non-retryable errors (131026, 131047, 131051, 131031) are marked permanent.
-    Retryable errors (131053 media, 130429 rate limit) are retried.
+    Delivery workers retry queued failures with delays: immediate, 30s,
+    2min, 10min, 1hr. Non-retryable errors (131026, 131047, 131051, 131031)
+    are dead-lettered. Retryable errors (131053 media, 130429 rate limit) are
+    retried. Failures from sends that bypassed the queue are queued here.
 
     Args:
         user_id: User's unique identifier
         broadcast_job_id: The broadcast job ID
 
     Returns:
-        JSON string with retry results
+        JSON string with scheduled retries and dead letters
     """
     logger.info("[DELIVERY] retry_failed_messages for job: %s", broadcast_job_id)
     try:
         future = _executor.submit(_run_retry_failed_sync, user_id, broadcast_job_id)
-        result = future.result(timeout=300)
+        result = future.result(timeout=60)
         return json.dumps(result, ensure_ascii=False)
     except Exception as e:
         logger.error("[DELIVERY] retry_failed_messages error: %s", e, exc_info=True)
@@ -593,28 +495,91 @@ def retry_failed_messages(user_id: str, broadcast_job_id: str) -> str:
 
 
 # ============================================
-# TOOL 5: GET DELIVERY SUMMARY
+# TOOL 5: GET DELIVERY QUEUE STATUS
+# ============================================
+
+def _run_queue_status_sync(user_id: str, broadcast_job_id: str):
+    """Queue state of a broadcast job."""
+    queue = _get_queue_stats(broadcast_job_id)
+    if not queue["total"]:
+        return {"status": "empty", "queue": queue, "message": "Nothing is queued for this broadcast job."}
+
+    by_status = queue["by_status"]
+    return {
+        "status": "success",
+        "broadcast_job_id": broadcast_job_id,
+        "complete": queue["pending"] == 0,
+        **queue,
+        "message": (
+            f"Queue: {by_status.get('SENT', 0)}/{queue['total']} sent, {queue['pending']} pending "
+            f"({queue['retry_scheduled']} waiting on retry), {by_status.get('DEAD', 0)} dead-lettered."
+        ),
+    }
+
+
+@tool
+def get_delivery_queue_status(user_id: str, broadcast_job_id: str) -> str:
+    """
+    Get the delivery queue state of a broadcast job.
+
+    Returns counts per status (QUEUED, LEASED, SENT, DEAD) and per priority
+    lane, scheduled retries with the next retry time, and dead letters by
+    error code. 'complete' is true once nothing is left to send.
+
+    Args:
+        user_id: User's unique identifier
+        broadcast_job_id: The broadcast job ID
+
+    Returns:
+        JSON string with queue state
+    """
+    logger.info("[DELIVERY] get_delivery_queue_status for job: %s", broadcast_job_id)
+    try:
+        future = _executor.submit(_run_queue_status_sync, user_id, broadcast_job_id)
+        result = future.result(timeout=15)
+        return json.dumps(result, ensure_ascii=False)
+    except Exception as e:
+        logger.error("[DELIVERY] get_delivery_queue_status error: %s", e, exc_info=True)
+        return json.dumps({"error": str(e), "status": "failed"}, ensure_ascii=False)
+
+
+# ============================================
+# TOOL 6: GET DELIVERY SUMMARY
 # ============================================
 
 def _run_get_delivery_summary_sync(user_id: str, broadcast_job_id: str):
     """Get final delivery metrics for a broadcast job."""
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
+    from app.database.postgresql.postgresql_repositories.broadcast_message_repo import BroadcastMessageRepository
 
     with get_session() as session:
         repo = BroadcastJobRepository(session=session)
         job = repo.get_by_id(broadcast_job_id)
+        if job:
+            ledger = BroadcastMessageRepository(session=session)
+            ledger_counts = ledger.get_delivery_counts(broadcast_job_id)
+            failures_by_code = ledger.count_failures_by_code(broadcast_job_id) if ledger_counts else {}
 
     if not job:
         return {"status": "failed", "message": "Broadcast job not found"}
 
     total = job.get("valid_contacts", 0)
-    sent = job.get("sent_count", 0)
-    failed = job.get("failed_count", 0)
-    pending = job.get("pending_count", 0)
-    delivered = job.get("delivered_count", 0)
+    if ledger_counts:
+        # Per-message ledger; jobs sent before it existed fall back to the job counters
+        sent = ledger_counts["sent"]
+        failed = ledger_counts["failed"]
+        delivered = ledger_counts["delivered"]
+        pending = max(0, total - sent - failed)
+    else:
+        sent = job.get("sent_count", 0)
+        failed = job.get("failed_count", 0)
+        pending = job.get("pending_count", 0)
+        delivered = job.get("delivered_count", 0)
 
     delivery_rate = round((sent / total * 100), 1) if total > 0 else 0
+    # Failed ledger rows may still be waiting on a scheduled retry
+    queue = _get_queue_stats(broadcast_job_id)
 
     return {
         "status": "success",
@@ -625,13 +590,17 @@ def _run_get_delivery_summary_sync(user_id: str, broadcast_job_id: str):
         "failed": failed,
         "pending": pending,
         "delivery_rate": delivery_rate,
+        "failures_by_code": failures_by_code,
+        "retry_scheduled": queue["retry_scheduled"],
+        "dead_lettered": queue["by_status"].get("DEAD", 0),
         "template_name": job.get("template_name"),
         "template_category": job.get("template_category"),
         "started_at": job.get("started_sending_at"),
         "completed_at": job.get("completed_at"),
         "message": (
             f"Delivery summary: {sent}/{total} sent ({delivery_rate}%), "
-            f"{delivered} delivered, {failed} failed, {pending} pending."
+            f"{delivered} delivered, {failed} failed ({queue['retry_scheduled']} retries scheduled), "
+            f"{pending} pending."
         ),
     }
 
@@ -662,18 +631,23 @@ def get_delivery_summary(user_id: str, broadcast_job_id: str) -> str:
 
 
 # ============================================
-# TOOL 6: MARK MESSAGES AS READ
+# TOOL 7: MARK MESSAGES AS READ
 # ============================================
 
 def _run_mark_read_sync(message_ids: list):
-    """Mark messages as read via MCP."""
+    """Mark messages as read via MCP and record the receipts in the delivery ledger."""
+    from app.database.postgresql.postgresql_connection import get_session
+    from app.database.postgresql.postgresql_repositories.broadcast_message_repo import BroadcastMessageRepository
+
     results = {"marked": 0, "failed": 0, "errors": []}
+    marked_ids = []
 
     for msg_id in message_ids:
         try:
             result = _call_direct_api_mcp("mark_message_as_read", {"message_id": msg_id})
             if isinstance(result, dict) and result.get("success"):
                 results["marked"] += 1
+                marked_ids.append(msg_id)
             else:
                 results["failed"] += 1
                 results["errors"].append({"message_id": msg_id, "error": str(result)})
@@ -681,6 +655,13 @@ def _run_mark_read_sync(message_ids: list):
             results["failed"] += 1
             results["errors"].append({"message_id": msg_id, "error": str(e)})
 
+    if marked_ids:
+        try:
+            with get_session() as session:
+                BroadcastMessageRepository(session=session).mark_status(marked_ids, "READ")
+        except Exception as e:
+            logger.error("[DELIVERY] Failed to record read receipts in ledger: %s", e)
+
     return {
         "status": "success",
         **results,
@@ -721,6 +702,7 @@ BACKEND_TOOLS = [
     send_lite_broadcast,
     send_template_broadcast,
     retry_failed_messages,
+    get_delivery_queue_status,
     get_delivery_summary,
     mark_messages_read,
 ]
@@ -8,7 +8,6 @@ Per doc section 3.4: Behavioral, demographic, lifecycle analysis,
 timezone clustering, and frequency capping.
 """
 
-import asyncio
 import json
 import concurrent.futures
 import nest_asyncio
@@ -34,6 +33,11 @@ LIFECYCLE_STAGES = {
     "churned": {"max_days": None, "label": "Churned", "action": "Exclude from broadcasts"},
 }
 
+# Classification cutoffs: (stage, max days since the latest consent event),
+# checked in order; older contacts are churned. Matches the thresholds the
+# per-contact classifier applied, under which "dormant" is never assigned.
+LIFECYCLE_STAGE_DAYS = (("new", 7), ("engaged", 30), ("active", 60), ("at_risk", 90))
+
 
 # ============================================
 # FREQUENCY CAP DEFAULTS (per doc 3.4.5)
@@ -67,91 +71,40 @@ OPTIMAL_SEND_HOURS = (10, 14)  # 10 AM to 2 PM local time
 # ============================================
 
 def _call_direct_api_mcp(tool_name: str, params: dict) -> dict:
-    """Call a Direct API MCP tool (port 9002) synchronously."""
-    from langchain_mcp_adapters.client import MultiServerMCPClient
-    from langchain_mcp_adapters.tools import load_mcp_tools
-    from app.utils.whsp_onboarding_agent import parse_mcp_result_with_debug as parse_mcp_result
-
-    async def _call():
-        client = MultiServerMCPClient({
-            "DirectApiMCP": {
-                "url": "http://127.0.0.1:9002/mcp",
-                "transport": "streamable-http"
-            }
-        })
-        async with client.session("DirectApiMCP") as session:
-            mcp_tools_list = await load_mcp_tools(session)
-            mcp_tools = {t.name: t for t in mcp_tools_list}
-            if tool_name not in mcp_tools:
-                return {"status": "failed", "error": f"MCP tool '{tool_name}' not found"}
-            result = await mcp_tools[tool_name].ainvoke(params)
-            return parse_mcp_result(result)
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(_call())
-    finally:
-        loop.close()
+    """Call a Direct API MCP tool (port 9002) synchronously via the shared session pool."""
+    from ..mcp_client.direct_api_pool import call_direct_api_mcp
+    return call_direct_api_mcp(tool_name, params)
 
 
 # ============================================
 # TOOL 1: CLASSIFY LIFECYCLE STAGES
 # ============================================
 
+def _classify_lifecycle(contact_repo, user_id: str, broadcast_job_id: str) -> dict:
+    """Assign and persist every contact's lifecycle stage; return stage counts."""
+    contact_repo.assign_lifecycle_stages(
+        broadcast_job_id, user_id, LIFECYCLE_STAGE_DAYS, fallback_stage="churned"
+    )
+    return contact_repo.count_by_lifecycle_stage(broadcast_job_id)
+
+
 def _run_classify_lifecycle_sync(user_id: str, broadcast_job_id: str):
-    """Classify contacts into lifecycle stages based on interaction history."""
+    """
+    Classify contacts into lifecycle stages based on interaction history.
+
+    Stages are computed in one set-based UPDATE and stored on each contact,
+    so segmentation can reuse them without recomputing.
+    """
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.processed_contact_repo import ProcessedContactRepository
-    from app.database.postgresql.postgresql_repositories.consent_log_repo import ConsentLogRepository
 
     with get_session() as session:
         contact_repo = ProcessedContactRepository(session=session)
-        consent_repo = ConsentLogRepository(session=session)
+        counts = _classify_lifecycle(contact_repo, user_id, broadcast_job_id)
 
-        contacts = contact_repo.get_by_broadcast_job(broadcast_job_id)
-        now = datetime.utcnow()
-
-        stages = {
-            "new": [], "engaged": [], "active": [],
-            "at_risk": [], "dormant": [], "churned": [],
-        }
-
-        for contact in contacts:
-            if contact.get("is_duplicate"):
-                continue
-
-            phone = contact["phone_e164"]
-            latest = consent_repo.get_latest_consent(user_id, phone)
-
-            if latest and latest.get("created_at"):
-                last_interaction = datetime.fromisoformat(latest["created_at"])
-                days_since = (now - last_interaction).days
-            else:
-                # No consent record - treat as new (from manual import)
-                days_since = 0
-
-            if days_since <= 7:
-                stages["new"].append(phone)
-            elif days_since <= 30:
-                stages["engaged"].append(phone)
-            elif days_since <= 60:
-                stages["active"].append(phone)
-            elif days_since <= 90:
-                # Check if they were active before (60+ days tenure)
-                # vs just at risk (no interaction 31-60 days)
-                if days_since <= 60:
-                    stages["active"].append(phone)
-                else:
-                    stages["at_risk"].append(phone)
-            elif days_since <= 90:
-                stages["dormant"].append(phone)
-            else:
-                stages["churned"].append(phone)
-
-    stage_counts = {k: len(v) for k, v in stages.items()}
+    stage_counts = {stage: counts.get(stage, 0) for stage in LIFECYCLE_STAGES}
     total = sum(stage_counts.values())
-    excluded = len(stages["churned"])
+    excluded = stage_counts["churned"]
 
     return {
         "status": "success",
@@ -160,8 +113,8 @@ def _run_classify_lifecycle_sync(user_id: str, broadcast_job_id: str):
         "churned_excluded": excluded,
         "eligible_count": total - excluded,
         "stage_details": {
-            k: {"count": len(v), "action": LIFECYCLE_STAGES[k]["action"]}
-            for k, v in stages.items()
+            k: {"count": v, "action": LIFECYCLE_STAGES[k]["action"]}
+            for k, v in stage_counts.items()
         },
         "message": (
             f"Lifecycle classification: {total} contacts classified. "
@@ -395,7 +348,7 @@ def _run_check_frequency_caps_sync(
     """Check frequency caps to prevent message fatigue."""
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.processed_contact_repo import ProcessedContactRepository
-    from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
+    from app.database.postgresql.postgresql_repositories.broadcast_message_repo import BroadcastMessageRepository
 
     cap_config = FREQUENCY_CAPS.get(campaign_type, FREQUENCY_CAPS["marketing"])
     combined_config = FREQUENCY_CAPS["combined"]
@@ -415,40 +368,27 @@ def _run_check_frequency_caps_sync(
             "message": f"Transactional messages: No frequency cap applied. All {len(valid_phones)} contacts eligible.",
         }
 
+    type_cap = cap_config["default"]
+    combined_cap = combined_config["default"]
+
     with get_session() as session:
         contact_repo = ProcessedContactRepository(session=session)
-        broadcast_repo = BroadcastJobRepository(session=session)
+        message_repo = BroadcastMessageRepository(session=session)
 
         valid_phones = contact_repo.get_valid_phones_by_job(broadcast_job_id)
 
-        # Get recent broadcast jobs for this user (within rolling period)
+        # Messages actually sent to each phone in the rolling period, from the
+        # delivery ledger; only phones already at a cap come back
         cutoff = datetime.utcnow() - timedelta(days=cap_config["period_days"])
-        recent_jobs = broadcast_repo.get_active_by_user(user_id)
-
-        # Count messages sent to each phone in the rolling period
-        phone_message_count = {}
-        for job in recent_jobs:
-            if job["id"] == broadcast_job_id:
-                continue  # Skip current job
-            if not job.get("completed_at"):
-                continue
-            completed = datetime.fromisoformat(job["completed_at"])
-            if completed < cutoff:
-                continue
-            # Get contacts from completed jobs
-            if job.get("contacts_data"):
-                try:
-                    sent_phones = json.loads(job["contacts_data"])
-                    for phone in sent_phones:
-                        phone_message_count[phone] = phone_message_count.get(phone, 0) + 1
-                except (json.JSONDecodeError, TypeError):
-                    pass
+        phone_message_count = message_repo.get_recent_send_counts(
+            user_id, cutoff,
+            min_count=min(type_cap, combined_cap),
+            exclude_job_id=broadcast_job_id,
+        )
 
     # Check caps
     eligible = []
     capped = []
-    type_cap = cap_config["default"]
-    combined_cap = combined_config["default"]
 
     for phone in valid_phones:
         count = phone_message_count.get(phone, 0)
@@ -516,19 +456,16 @@ def _run_create_segments_sync(
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.processed_contact_repo import ProcessedContactRepository
     from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
-    from app.database.postgresql.postgresql_repositories.consent_log_repo import ConsentLogRepository
 
     with get_session() as session:
         contact_repo = ProcessedContactRepository(session=session)
         broadcast_repo = BroadcastJobRepository(session=session)
 
-        contacts = contact_repo.get_by_broadcast_job(broadcast_job_id)
-        now = datetime.utcnow()
-
         segments = []
 
         if segment_by == "all":
             # Single segment with all valid contacts
+            contacts = contact_repo.get_by_broadcast_job(broadcast_job_id)
             valid = [c for c in contacts if not c.get("is_duplicate")]
             segments.append({
                 "name": "All Contacts",
@@ -536,52 +473,23 @@ def _run_create_segments_sync(
                 "contact_count": len(valid),
             })
         elif segment_by == "lifecycle":
-            # Segment by lifecycle stage
-            consent_repo = ConsentLogRepository(session=session)
-            stage_buckets = {
-                "new": [], "engaged": [], "active": [],
-                "at_risk": [], "dormant": [],
-            }
-            excluded_churned = 0
+            # Segment by the lifecycle stage stored on each contact
+            counts = contact_repo.count_by_lifecycle_stage(broadcast_job_id)
+            if None in counts:
+                counts = _classify_lifecycle(contact_repo, user_id, broadcast_job_id)
 
-            for contact in contacts:
-                if contact.get("is_duplicate"):
-                    continue
-                phone = contact["phone_e164"]
-                latest = consent_repo.get_latest_consent(user_id, phone)
-
-                if latest and latest.get("created_at"):
-                    last_dt = datetime.fromisoformat(latest["created_at"])
-                    days = (now - last_dt).days
-                else:
-                    days = 0
-
-                if days <= 7:
-                    stage_buckets["new"].append(phone)
-                elif days <= 30:
-                    stage_buckets["engaged"].append(phone)
-                elif days <= 60:
-                    stage_buckets["active"].append(phone)
-                elif days <= 90:
-                    stage_buckets["at_risk"].append(phone)
-                else:
-                    # Dormant or churned
-                    if days <= 90:
-                        stage_buckets["dormant"].append(phone)
-                    else:
-                        excluded_churned += 1
-
-            for stage, phones in stage_buckets.items():
-                if phones:
+            for stage, info in LIFECYCLE_STAGES.items():
+                if stage != "churned" and counts.get(stage):
                     segments.append({
-                        "name": LIFECYCLE_STAGES[stage]["label"],
+                        "name": info["label"],
                         "criteria": f"lifecycle_{stage}",
-                        "contact_count": len(phones),
-                        "recommended_action": LIFECYCLE_STAGES[stage]["action"],
+                        "contact_count": counts[stage],
+                        "recommended_action": info["action"],
                     })
 
         elif segment_by == "country":
             # Segment by country code
+            contacts = contact_repo.get_by_broadcast_job(broadcast_job_id)
             country_buckets = {}
             for contact in contacts:
                 if contact.get("is_duplicate"):
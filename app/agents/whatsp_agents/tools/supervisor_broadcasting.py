@@ -7,9 +7,12 @@ the Direct API MCP server (port 9002) and database for the broadcasting workflow
 IMPORTANT: These tools run in LangGraph's ASGI context.
 We use ThreadPoolExecutor to run MCP calls in separate threads with their own event loops.
 This pattern matches the working onboarding implementation and avoids all async/event loop conflicts.
+
+Messages are not sent from this process: send_broadcast_messages queues the
+contacts and broadcast-worker processes (app/utils/broadcasting/worker.py)
+do the sending.
 """
 
-import asyncio
 import json
 import re
 import uuid
@@ -31,38 +34,9 @@ _executor = concurrent.futures.ThreadPoolExecutor(max_workers=5)
 # ============================================
 
 def _call_direct_api_mcp(tool_name: str, params: dict) -> dict:
-    """
-    Generic helper to call a Direct API MCP tool (port 9002) synchronously.
-    Creates a fresh MCP client in a new event loop to avoid conflicts.
-    """
-    from langchain_mcp_adapters.client import MultiServerMCPClient
-    from langchain_mcp_adapters.tools import load_mcp_tools
-    from app.utils.whsp_onboarding_agent import parse_mcp_result_with_debug as parse_mcp_result
-
-    async def _call():
-        client = MultiServerMCPClient({
-            "DirectApiMCP": {
-                "url": "http://127.0.0.1:9002/mcp",
-                "transport": "streamable-http"
-            }
-        })
-
-        async with client.session("DirectApiMCP") as session:
-            mcp_tools_list = await load_mcp_tools(session)
-            mcp_tools = {t.name: t for t in mcp_tools_list}
-
-            if tool_name not in mcp_tools:
-                return {"status": "failed", "error": f"MCP tool '{tool_name}' not found"}
-
-            result = await mcp_tools[tool_name].ainvoke(params)
-            return parse_mcp_result(result)
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        return loop.run_until_complete(_call())
-    finally:
-        loop.close()
+    """Call a Direct API MCP tool (port 9002) synchronously via the shared session pool."""
+    from ..mcp_client.direct_api_pool import call_direct_api_mcp
+    return call_direct_api_mcp(tool_name, params)
 
 
 # ============================================
@@ -591,12 +565,21 @@ def check_template_approval_status(user_id: str, template_id: str) -> str:
 # ============================================
 
 def _run_send_broadcast_sync(user_id: str, broadcast_job_id: str):
-    """Send broadcast messages in batches using send_message MCP tool."""
-    from langchain_mcp_adapters.client import MultiServerMCPClient
-    from langchain_mcp_adapters.tools import load_mcp_tools
-    from app.utils.whsp_onboarding_agent import parse_mcp_result_with_debug as parse_mcp_result
+    """
+    Start (or resume) a broadcast: queue its contacts and hand it to the broadcast workers.
+
+    Nothing is sent from this process. The contacts go on the durable
+    delivery queue and the job moves to SENDING; broadcast-worker processes
+    send them over the pooled Direct API client and publish progress to the
+    job while sending. Recipients beyond the account's messaging tier limit
+    are scheduled for the following 24h windows instead of being dropped.
+    Calling it again (e.g. for a PAUSED job) resumes the job without
+    queueing anyone twice.
+    """
+    from app.utils.broadcasting.delivery_queue import schedule_by_tier, start_delivery
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
+    from .delivery import TIER_LIMITS
 
     # Load broadcast job from DB
     with get_session() as session:
@@ -614,91 +597,81 @@ def _run_send_broadcast_sync(user_id: str, broadcast_job_id: str):
         return {"status": "failed", "message": "No contacts to send to"}
     if not template_name:
         return {"status": "failed", "message": "No template selected"}
+    if job.get("phase") not in ("READY_TO_SEND", "SENDING", "PAUSED"):
+        return {"status": "failed", "message": f"Cannot send a broadcast in phase {job.get('phase')}"}
 
-    async def _send_all():
-        client = MultiServerMCPClient({
-            "DirectApiMCP": {
-                "url": "http://127.0.0.1:9002/mcp",
-                "transport": "streamable-http"
-            }
-        })
-
-        async with client.session("DirectApiMCP") as session:
-            mcp_tools_list = await load_mcp_tools(session)
-            mcp_tools = {t.name: t for t in mcp_tools_list}
-            send_tool = mcp_tools.get("send_message")
-
-            if not send_tool:
-                return {"status": "failed", "message": "send_message MCP tool not found"}
-
-            sent = 0
-            failed = 0
-            errors = []
-
-            for phone in contacts:
-                try:
-                    result = await send_tool.ainvoke({
-                        "user_id": user_id,
-                        "to": phone,
-                        "message_type": "template",
-                        "template_name": template_name,
-                        "template_language_code": template_language,
-                    })
-                    parsed = parse_mcp_result(result)
-                    if parsed.get("status") == "success":
-                        sent += 1
-                    else:
-                        failed += 1
-                        errors.append(f"{phone}: {parsed.get('error', 'Unknown error')}")
-                except Exception as e:
-                    failed += 1
-                    errors.append(f"{phone}: {str(e)}")
-
-            return {
-                "status": "success",
-                "total": len(contacts),
-                "sent": sent,
-                "failed": failed,
-                "errors": errors[:5],
-            }
-
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
+    # Messaging tier caps unique recipients per 24h; unknown tier -> no cap
+    tier = "UNKNOWN"
     try:
-        send_result = loop.run_until_complete(_send_all())
-    finally:
-        loop.close()
-
-    # Update progress in DB
-    with get_session() as session:
-        repo = BroadcastJobRepository(session=session)
-        repo.update_send_progress(
-            broadcast_job_id,
-            sent=send_result.get("sent", 0),
-            failed=send_result.get("failed", 0)
-        )
+        health = _call_direct_api_mcp("get_messaging_health_status", {"node_id": user_id})
+        data = health.get("data", health)
+        if isinstance(data, dict):
+            tier = str(data.get("messaging_tier", data.get("tier", "UNKNOWN")))
+    except Exception as e:
+        logger.warning("[BROADCAST] Tier lookup failed, queueing uncapped: %s", e)
+    tier_limit = TIER_LIMITS.get(tier.upper().replace(" ", "_"))
+
+    recipients = schedule_by_tier(contacts, tier_limit)
+    started = start_delivery(
+        user_id,
+        broadcast_job_id,
+        recipients,
+        method="template",
+        payload={
+            "user_id": user_id,
+            "message_type": "template",
+            "template_name": template_name,
+            "template_language_code": template_language,
+        },
+    )
 
-    send_result["message"] = (
-        f"Broadcast complete: {send_result.get('sent', 0)} sent, "
-        f"{send_result.get('failed', 0)} failed out of {send_result.get('total', 0)}."
+    queue = started["queue"]
+    deferred = sum(1 for r in recipients if r["not_before"] > recipients[0]["not_before"]) if recipients else 0
+    result = {
+        "status": "started" if started["phase"] == "SENDING" else "failed",
+        "phase": started["phase"],
+        "total": len(contacts),
+        "queued": started["queued"],
+        "messaging_tier": tier,
+        "deferred": deferred,
+        "sent": queue["by_status"].get("SENT", 0),
+        "pending": queue["pending"],
+        "dead_lettered": queue["by_status"].get("DEAD", 0),
+        "queue": queue,
+    }
+    if started["phase"] != "SENDING":
+        result["message"] = f"Contacts queued but the job is {started['phase']}; it is not being sent."
+        return result
+
+    result["message"] = (
+        f"Broadcast started: {started['queued']} recipients queued, {queue['pending']} pending, "
+        f"{result['sent']} already sent. Broadcast workers are sending in the background; "
+        "check progress with get_broadcast_status."
     )
-    return send_result
+    if deferred:
+        result["message"] += (
+            f" {deferred} recipients are scheduled for later 24h windows by the {tier} tier limit."
+        )
+    return result
 
 
 @tool
 def send_broadcast_messages(user_id: str, broadcast_job_id: str) -> str:
     """
-    Send broadcast messages to all validated contacts.
+    Start sending a broadcast to all validated contacts.
 
-    Reads contacts and template from the BroadcastJob, then sends
-    messages in sequence via the WhatsApp send_message API.
+    Queues the contacts of the BroadcastJob for template delivery and moves
+    the job to SENDING; background broadcast workers send the messages
+    (rate-limited, with retries) and update the job's progress. Returns
+    immediately. Pause with update_broadcast_phase(PAUSED); calling this
+    again resumes a paused job without sending anyone twice.
 
     Args:
         user_id: User's unique identifier
         broadcast_job_id: The broadcast job ID
 
     Returns:
-        JSON string with send results (sent count, failed count, errors)
+        JSON string with queued/pending counts and queue state
     """
     logger.info("[BROADCAST] send_broadcast_messages called for job: %s", broadcast_job_id)
     try:
@@ -707,7 +680,7 @@ def send_broadcast_messages(user_id: str, broadcast_job_id: str) -> str:
             user_id=user_id,
             broadcast_job_id=broadcast_job_id
         )
-        result = future.result(timeout=300)  # 5 min timeout for sending
+        result = future.result(timeout=120)
         if not isinstance(result, dict):
             result = {"error": "Invalid response format", "status": "failed"}
         return json.dumps(result, ensure_ascii=False)
@@ -800,16 +773,18 @@ def update_broadcast_phase(
 
 
 def _run_get_broadcast_status_sync(broadcast_job_id: str):
-    """Get current broadcast status from database."""
+    """Get current broadcast status and delivery queue state from database."""
     from app.database.postgresql.postgresql_connection import get_session
     from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
+    from app.database.postgresql.postgresql_repositories.delivery_queue_repo import DeliveryQueueRepository
 
     with get_session() as session:
         repo = BroadcastJobRepository(session=session)
         job = repo.get_by_id(broadcast_job_id)
 
         if job:
-            return {"status": "success", "broadcast": job}
+            queue = DeliveryQueueRepository(session=session).get_queue_stats(broadcast_job_id)
+            return {"status": "success", "broadcast": job, "queue": queue}
         else:
             return {"status": "failed", "message": "Broadcast job not found"}
 
@@ -819,13 +794,17 @@ def get_broadcast_status(broadcast_job_id: str) -> str:
     """
     Get the current status and details of a broadcast job.
 
-    Use this to resume a broadcast or check progress.
+    Use this to resume a broadcast or check progress. While SENDING, the
+    progress counters and the queue state are updated by the broadcast
+    workers after every batch; the job moves to COMPLETED by itself once
+    nothing is left to send.
 
     Args:
         broadcast_job_id: The broadcast job ID
 
     Returns:
         JSON string with full broadcast job details (phase, contacts, template, progress)
+        and the delivery queue state (pending, sent, scheduled retries, dead letters)
     """
     logger.info("[BROADCAST] get_broadcast_status called: job=%s", broadcast_job_id)
     try:
@@ -2,6 +2,8 @@
 # Assembles the graph via functools.partial dependency injection
 # Connects sub-agents (data_processing, etc.) as sub-graph nodes
 from functools import partial
+from ...config import settings
+from ...database.postgresql.checkpointer import get_checkpointer
 from .graphs.supervisor_broadcasting import create_graph
 from .states.supervisor_broadcasting import BroadcastingAgentState
 from .prompts.supervisor_broadcasting import BROADCASTING_SYSTEM_PROMPT
@@ -55,6 +57,9 @@ def _assemble_graph():
         tools=BACKEND_TOOLS,
         route_after_tool_func=_create_route_after_tool_func(),
         sub_agents=sub_agents,
+        # Durable state only with the Postgres backend; otherwise the LangGraph
+        # runtime serving the graph supplies persistence as before
+        checkpointer=get_checkpointer() if settings.CHECKPOINT_BACKEND == "postgres" else None,
     )
 
 
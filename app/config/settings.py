@@ -59,6 +59,7 @@ class Settings(BaseSettings):
     #openai api keys
     OPENAI_API_KEY:str
     BRAVE_API_KEY: Optional[str] = None
+    BRAVE_SEARCH_URL: str = "https://api.search.brave.com/res/v1/web/search"
 
     #nvidia
     NVIDIA_API_KEY:str
@@ -113,6 +114,66 @@ class Settings(BaseSettings):
     DRAFTING_LIMITATION_COMMON_FALLBACK: bool = True  # use common articles as last-resort fallback
     DRAFTING_PROCEDURAL_SEARCH: bool = False           # disabled for speed — skip slow web search
     DRAFTING_LEGAL_RESEARCH_ENABLED: bool = False     # False=skip LegalResearch websearch (Brave API)
+    DRAFTING_WEBSEARCH_CACHE_TTL_SECONDS: int = 604800  # Brave results reused per normalized query (fee schedules change rarely)
+    DRAFTING_WEBSEARCH_CACHE_MAX_ENTRIES: int = 2048  # LRU bound on cached queries per process
+
+    # Drafting LLM calls (app/services/llm_limiter.py) — shared across concurrent graph sessions
+    DRAFTING_LLM_MAX_CONCURRENCY: int = 8             # in-flight ainvoke calls per underlying model
+    DRAFTING_LLM_TIMEOUT: float = 180.0               # seconds per LLM call (excluding queueing); 0 = no timeout
+    DRAFTING_BATCH_CONCURRENCY: int = 4               # graph runs in flight per run_drafting_batch (agents/drafting_agents/batch.py)
+
+    # Drafting LLM response cache (app/services/llm_cache.py) — content-addressed, shared across sessions
+    DRAFTING_LLM_CACHE_ENABLED: bool = True           # serve identical (model, params, messages) calls from cache
+    DRAFTING_LLM_CACHE_BACKEND: str = "sqlite"        # "sqlite" (DRAFTING_LLM_CACHE_PATH) or "postgres" (app database)
+    DRAFTING_LLM_CACHE_PATH: str = ".cache/drafting_llm_cache.sqlite3"
+    DRAFTING_LLM_CACHE_TTL_SECONDS: int = 86400       # entries older than this are ignored and purged; 0 = never expire
+    DRAFTING_LLM_CACHE_MAX_ENTRIES: int = 20000       # LRU-evict beyond this many entries; 0 = unbounded
+    DRAFTING_LLM_CACHE_SKIP_NODES: str = ""           # comma-separated graph nodes that never use the cache, e.g. "review"
+    EMBEDDING_CACHE_ENABLED: bool = True              # persistent (model, sha256(text)) -> vector cache for Qdrant embeddings
+    EMBEDDING_CACHE_DIR: str = ".cache/embeddings"     # one memory-mapped float32 store per embedding model
+
+    # LangGraph checkpointer (app/database/postgresql/checkpointer.py)
+    CHECKPOINT_BACKEND: str = "memory"                # "memory" (in-process MemorySaver) or "postgres" (app database, survives restarts)
+    CHECKPOINT_POOL_SIZE: int = 10                    # max pooled async connections per event loop
+    CHECKPOINT_TTL_SECONDS: int = 604800              # threads idle longer than this are pruned; 0 = keep forever
+    CHECKPOINT_PRUNE_EVERY: int = 500                 # checkpoint writes between TTL pruning passes; 0 = never auto-prune
+    CHECKPOINT_COMPACT_CHANNELS: str = "rag,draft"    # large state keys whose superseded versions are deleted per thread
+    CHECKPOINT_COMPRESS_MIN_BYTES: int = 4096         # zlib-compress serialized values at least this large; 0 = off
+
+    # broadcast-worker (app/utils/broadcasting/worker.py) — separate process, N replicas in docker-compose.prod.yml
+    BROADCAST_WORKER_CONCURRENCY: int = 4             # drain threads per worker process, one batch MCP call each
+    BROADCAST_WORKER_SWEEP_SECONDS: float = 5.0       # how often a worker completes SENDING jobs with nothing left to send
+    BROADCAST_WORKER_RATE_PER_SEC: float = 80.0       # messages/sec per worker process, shared by its drain threads (Cloud API default per-number throughput, Tier 1/2)
+
+    # Durable delivery queue (app/utils/broadcasting/delivery_queue.py) — drained by broadcast-worker
+    DELIVERY_QUEUE_LEASE_SIZE: int = 200              # due rows a worker leases per poll (one batch MCP call per job)
+    DELIVERY_QUEUE_LEASE_SECONDS: int = 300           # leases older than this return to the queue (worker died mid-batch)
+    DELIVERY_QUEUE_SETTLE_MARGIN_SECONDS: int = 30    # batch calls time out this long before their lease expires
+    DELIVERY_QUEUE_POLL_SECONDS: float = 1.0          # worker sleep when nothing is due
+    DELIVERY_QUEUE_BATCH_CONCURRENCY: int = 16        # requests in flight inside the MCP server per batch call
+
+    # Contact file ingestion (app/utils/data_processing/pipeline.py)
+    CONTACT_PROCESSING_CHUNK_SIZE: int = 5000         # rows validated/deduped/inserted per chunk
+    CONTACT_PROCESSING_TIMEOUT: int = 1800            # seconds process_contact_file waits before returning
+    CONTACT_COPY_INSERT: bool = True                  # PostgreSQL: bulk insert via COPY FROM STDIN (False = ORM add_all)
+
+    # AiSensy HTTP client limiter (app/core/rate_limiter.py) — per account / per endpoint, shared by all client sessions
+    AISENSY_LIMITER_ENABLED: bool = True              # False = plain aiohttp sessions, no limiter or circuit breaker
+    AISENSY_LIMITER_INITIAL_CONCURRENCY: int = 16     # in-flight requests per account (JWT / partner key) at start
+    AISENSY_LIMITER_MIN_CONCURRENCY: int = 1          # AIMD floor
+    AISENSY_LIMITER_MAX_CONCURRENCY: int = 64         # AIMD ceiling
+    AISENSY_LIMITER_DECREASE_FACTOR: float = 0.5      # limit multiplier on 429 / 503 / 130429
+    AISENSY_LIMITER_THROTTLE_PAUSE_SECONDS: float = 1.0  # account pause after throttling without Retry-After
+    AISENSY_CIRCUIT_FAILURE_THRESHOLD: int = 5        # consecutive 5xx / timeouts / connection errors that open an endpoint circuit
+    AISENSY_CIRCUIT_OPEN_SECONDS: float = 30.0        # seconds an open circuit rejects requests before a probe
+
+    # Direct API MCP session pool (app/agents/whatsp_agents/mcp_client/direct_api_pool.py)
+    DIRECT_API_MCP_POOL_SIZE: int = 4                 # shared streamable-http sessions per process
+    DIRECT_API_MCP_HEALTHCHECK_SECONDS: int = 30      # ping sessions idle longer than this
+
+    # Direct API MCP user context cache (app/database/postgresql/user_context.py) — JWT / project / business per user
+    USER_CONTEXT_CACHE_TTL_SECONDS: int = 300         # entries reloaded from Postgres after this; 0 = no caching
+    USER_CONTEXT_CACHE_MAX_ENTRIES: int = 10000       # LRU bound on cached users per MCP server process
 
     # Ollama model configuration (override in .env)
     OLLAMA_PRIMARY_MODEL: str = "glm-5:cloud"               # deep generation (intake fallback, general)
@@ -1,4 +1,503 @@
 """
-rate_limiter.py - Auto-generated
-Implement your logic here
+Adaptive rate limiting and circuit breaking for the AiSensy HTTP clients.
+
+Both AiSensy base clients (Direct API and Partner API) open their sessions as
+``RateLimitedSession``, so every request made by any client method goes
+through two process-wide guards:
+
+    - ``AdaptiveLimiter`` per account: requests signed with the same JWT
+      (one WABA project), or the same Partner API key, share one concurrency
+      limit. Waiters are served in arrival order, so concurrent broadcasts on
+      one account interleave instead of one starving the others. The limit
+      adapts AIMD-style: it grows by one slot per window of successful
+      responses and is cut by ``AISENSY_LIMITER_DECREASE_FACTOR`` (at most
+      once per cooldown) on throttling, i.e. HTTP 429/503 or a 130429/80007
+      error code. ``Retry-After`` and an exhausted ``X-RateLimit-Remaining``
+      (with ``X-RateLimit-Reset``) pause the whole account until the given
+      time.
+    - ``CircuitBreaker`` per endpoint (method + first path segment): after
+      ``AISENSY_CIRCUIT_FAILURE_THRESHOLD`` consecutive 5xx responses,
+      timeouts or connection errors the endpoint is rejected locally for
+      ``AISENSY_CIRCUIT_OPEN_SECONDS``, then a single probe decides whether
+      it closes again. Rejections raise ``CircuitOpenError``, a connection
+      error, so the clients report them as failed calls without a request.
+
+``get_rate_limiter_stats()`` returns the current limit, in-flight/waiting
+counts and throttle counters of every account plus the state of every
+circuit; the MCP servers serve it on ``GET /metrics/rate-limiter``.
 """
+from __future__ import annotations
+
+import asyncio
+import errno
+import hashlib
+import re
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Deque, Dict, Mapping, Optional, Tuple
+
+import aiohttp
+from yarl import URL
+
+from app.config import logger, settings
+
+
+# WhatsApp error codes that mean "slow down" rather than "this message failed"
+THROTTLE_CODES = {"130429", "80007"}
+_ERROR_CODE_RE = re.compile(r'"code"\s*:\s*"?(\d+)')
+
+
+# ============================================
+# ADAPTIVE CONCURRENCY (per account)
+# ============================================
+
+class AdaptiveLimiter:
+    """
+    AIMD concurrency limit for one account, shared by every event loop.
+
+    State is guarded by a thread lock; waiting coroutines are woken on their
+    own loop, so the MCP servers and the app-side pool can share limiters.
+    """
+
+    def __init__(
+        self,
+        key: str,
+        initial: Optional[int] = None,
+        min_limit: Optional[int] = None,
+        max_limit: Optional[int] = None,
+        decrease_factor: Optional[float] = None,
+        cooldown_s: float = 1.0,
+    ):
+        self.key = key
+        self.min_limit = max(1, min_limit or settings.AISENSY_LIMITER_MIN_CONCURRENCY)
+        self.max_limit = max(self.min_limit, max_limit or settings.AISENSY_LIMITER_MAX_CONCURRENCY)
+        start = initial or settings.AISENSY_LIMITER_INITIAL_CONCURRENCY
+        self.limit = float(min(self.max_limit, max(self.min_limit, start)))
+        self.decrease_factor = decrease_factor or settings.AISENSY_LIMITER_DECREASE_FACTOR
+        self.cooldown_s = cooldown_s
+        self.in_flight = 0
+        self.paused_until = 0.0
+        self._last_decrease = 0.0
+        self._waiters: Deque[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = deque()
+        self._lock = threading.Lock()
+        self.stats = {
+            "requests": 0, "throttled": 0, "errors": 0,
+            "decreases": 0, "pauses": 0, "peak_in_flight": 0,
+        }
+        self.rate_limit_header: Optional[str] = None
+
+    @property
+    def capacity(self) -> int:
+        return max(self.min_limit, int(self.limit))
+
+    async def acquire(self) -> None:
+        """Wait for a slot (FIFO), then for any active pause to end."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if not self._waiters and self.in_flight < self.capacity:
+                self._take_slot()
+                future = None
+            else:
+                future = loop.create_future()
+                self._waiters.append((loop, future))
+        if future is not None:
+            try:
+                await future
+            except asyncio.CancelledError:
+                with self._lock:
+                    try:
+                        self._waiters.remove((loop, future))
+                        granted = False
+                    except ValueError:
+                        granted = True
+                # A cancelled hand-over returns the slot itself (_hand_over)
+                if granted and not future.cancelled():
+                    self.release()
+                raise
+
+        # A pause set while this request waited applies before it is sent
+        while True:
+            delay = self.paused_until - time.monotonic()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def _take_slot(self) -> None:
+        self.in_flight += 1
+        self.stats["requests"] += 1
+        self.stats["peak_in_flight"] = max(self.stats["peak_in_flight"], self.in_flight)
+
+    def _grant_waiters(self) -> None:
+        while self._waiters and self.in_flight < self.capacity:
+            loop, future = self._waiters.popleft()
+            if future.done():
+                continue
+            self._take_slot()
+            loop.call_soon_threadsafe(self._hand_over, future)
+
+    def _hand_over(self, future: asyncio.Future) -> None:
+        if future.cancelled():
+            self.release()
+        else:
+            future.set_result(True)
+
+    def release(self, outcome: Optional[str] = None, pause_s: Optional[float] = None) -> None:
+        """
+        Return a slot and adapt the limit.
+
+        Args:
+            outcome: "ok" (additive increase), "throttled" (multiplicative
+                decrease), "error" (counted only) or None (no signal)
+            pause_s: Seconds every request of this account must wait
+                (from Retry-After / rate headers)
+        """
+        now = time.monotonic()
+        with self._lock:
+            self.in_flight = max(0, self.in_flight - 1)
+            if outcome == "ok":
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / max(self.limit, 1.0))
+            elif outcome == "throttled":
+                self.stats["throttled"] += 1
+                if now - self._last_decrease >= self.cooldown_s:
+                    self.limit = max(float(self.min_limit), self.limit * self.decrease_factor)
+                    self._last_decrease = now
+                    self.stats["decreases"] += 1
+            elif outcome == "error":
+                self.stats["errors"] += 1
+            if pause_s and pause_s > 0 and now + pause_s > self.paused_until:
+                self.paused_until = now + pause_s
+                self.stats["pauses"] += 1
+            self._grant_waiters()
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "limit": round(self.limit, 2),
+                "in_flight": self.in_flight,
+                "waiting": len(self._waiters),
+                "paused_for_s": round(max(0.0, self.paused_until - time.monotonic()), 2),
+                "rate_limit_header": self.rate_limit_header,
+                **self.stats,
+            }
+
+
+# ============================================
+# CIRCUIT BREAKER (per endpoint)
+# ============================================
+
+class CircuitOpenError(aiohttp.ClientConnectorError):
+    """Raised instead of sending a request to an endpoint whose circuit is open."""
+
+    def __init__(self, endpoint: str, retry_in: float):
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+        self._conn_key = None
+        self._os_error = None
+        OSError.__init__(self, errno.ECONNREFUSED, f"Circuit open for {endpoint}; retry in {retry_in:.1f}s")
+
+    def __str__(self) -> str:
+        return self.strerror
+
+
+class CircuitBreaker:
+    """Closed -> open after consecutive failures -> half-open single probe -> closed."""
+
+    def __init__(self, endpoint: str, failure_threshold: Optional[int] = None, open_seconds: Optional[float] = None):
+        self.endpoint = endpoint
+        self.failure_threshold = max(1, failure_threshold or settings.AISENSY_CIRCUIT_FAILURE_THRESHOLD)
+        self.open_seconds = settings.AISENSY_CIRCUIT_OPEN_SECONDS if open_seconds is None else open_seconds
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.opened_count = 0
+        self.rejected = 0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def before_request(self) -> None:
+        """Raise ``CircuitOpenError`` unless a request may be sent now."""
+        with self._lock:
+            if self.state == "closed":
+                return
+            retry_in = self.opened_at + self.open_seconds - time.monotonic()
+            if self.state == "open" and retry_in <= 0:
+                self.state = "half_open"
+            if self.state == "half_open" and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return
+            self.rejected += 1
+        raise CircuitOpenError(self.endpoint, max(0.0, retry_in))
+
+    def record(self, success: bool) -> None:
+        with self._lock:
+            self._probe_in_flight = False
+            if success:
+                self.failures = 0
+                if self.state != "closed":
+                    logger.info(f"[RATE LIMITER] circuit closed for {self.endpoint}")
+                self.state = "closed"
+                return
+            self.failures += 1
+            if self.state == "half_open" or (self.state == "closed" and self.failures >= self.failure_threshold):
+                self.state = "open"
+                self.opened_at = time.monotonic()
+                self.opened_count += 1
+                logger.warning(
+                    f"[RATE LIMITER] circuit opened for {self.endpoint} after {self.failures} failures "
+                    f"({self.open_seconds:.0f}s)"
+                )
+
+    def cancel_probe(self) -> None:
+        """Forget a half-open probe that was never sent (e.g. cancelled while queued)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "state": self.state,
+                "consecutive_failures": self.failures,
+                "opened": self.opened_count,
+                "rejected": self.rejected,
+            }
+
+
+# ============================================
+# REGISTRY / METRICS
+# ============================================
+
+_limiters: Dict[str, AdaptiveLimiter] = {}
+_breakers: Dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_account_limiter(key: str) -> AdaptiveLimiter:
+    limiter = _limiters.get(key)
+    if limiter is None:
+        with _registry_lock:
+            limiter = _limiters.setdefault(key, AdaptiveLimiter(key))
+    return limiter
+
+
+def get_circuit_breaker(endpoint: str) -> CircuitBreaker:
+    breaker = _breakers.get(endpoint)
+    if breaker is None:
+        with _registry_lock:
+            breaker = _breakers.setdefault(endpoint, CircuitBreaker(endpoint))
+    return breaker
+
+
+def get_rate_limiter_stats() -> Dict[str, Any]:
+    """Snapshot of every account limiter and endpoint circuit."""
+    return {
+        "accounts": {key: limiter.snapshot() for key, limiter in sorted(_limiters.items())},
+        "circuits": {endpoint: breaker.snapshot() for endpoint, breaker in sorted(_breakers.items())},
+    }
+
+
+def reset_rate_limiters() -> None:
+    with _registry_lock:
+        _limiters.clear()
+        _breakers.clear()
+
+
+def account_key_for_token(token: str) -> str:
+    """Limiter key for a bearer token (hashed, so tokens never reach metrics)."""
+    return "jwt:" + hashlib.sha256(token.encode("utf-8")).hexdigest()[:12]
+
+
+def endpoint_key(method: str, url: Any) -> str:
+    """``POST /messages``, ``GET /get-template`` (ids and sub-paths folded)."""
+    segments = [s for s in URL(str(url)).path.split("/") if s]
+    if segments[:1] == ["partner"] and len(segments) > 2:
+        # /partner/{partner_id}/<route>/...
+        segments = segments[2:]
+    return f"{method.upper()} /{segments[0] if segments else ''}"
+
+
+# ============================================
+# RESPONSE SIGNALS
+# ============================================
+
+def _seconds_from_header(value: Optional[str], now: float) -> Optional[float]:
+    """Seconds from a delta-seconds, epoch-seconds or HTTP-date header value."""
+    if not value:
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+        except (TypeError, ValueError):
+            return None
+    # Large values are absolute epoch timestamps (X-RateLimit-Reset style)
+    return max(0.0, number - now) if number > 1e9 else max(0.0, number)
+
+
+def pause_from_headers(headers: Mapping[str, str], throttled: bool) -> Optional[float]:
+    """Account pause implied by Retry-After or an exhausted X-RateLimit-Remaining."""
+    now = time.time()
+    retry_after = _seconds_from_header(headers.get("Retry-After"), now)
+    if retry_after is not None:
+        return retry_after
+    remaining = headers.get("X-RateLimit-Remaining")
+    if remaining is not None and remaining.strip() in ("0", "0.0"):
+        reset = _seconds_from_header(headers.get("X-RateLimit-Reset"), now)
+        if reset is not None:
+            return reset
+    if throttled:
+        return settings.AISENSY_LIMITER_THROTTLE_PAUSE_SECONDS
+    return None
+
+
+async def classify_response(response: aiohttp.ClientResponse) -> str:
+    """"ok", "throttled" or "error" for a response; error bodies are read (and cached)."""
+    status = response.status
+    if status in (429, 503):
+        return "throttled"
+    if status < 400:
+        return "ok"
+    try:
+        body = (await response.read()).decode("utf-8", errors="replace")
+    except Exception:
+        body = ""
+    match = _ERROR_CODE_RE.search(body)
+    if match and match.group(1) in THROTTLE_CODES:
+        return "throttled"
+    # 4xx other than throttling is a request problem, not an endpoint one
+    return "error" if status >= 500 else "ok"
+
+
+# ============================================
+# SESSION
+# ============================================
+
+class _ResponseContext:
+    """``async with session.post(...)`` / ``await session.post(...)`` for a request coroutine."""
+
+    def __init__(self, coro: Any):
+        self._coro = coro
+        self._response: Optional[aiohttp.ClientResponse] = None
+
+    def __await__(self):
+        return self._coro.__await__()
+
+    async def __aenter__(self) -> aiohttp.ClientResponse:
+        self._response = await self._coro
+        return self._response
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if self._response is not None:
+            self._response.release()
+
+
+class RateLimitedSession:
+    """
+    ``aiohttp.ClientSession`` wrapper whose requests pass the endpoint
+    circuit and the account limiter.
+
+    Offers the session surface the AiSensy clients use (``get`` / ``post`` /
+    ``put`` / ``patch`` / ``delete``, ``closed``, ``close()``); keyword
+    arguments other than ``account_key`` go to ``aiohttp.ClientSession``.
+    ``account_key`` fixes the limiter key (Partner API); without it the key
+    is derived from the request's (or the session's) ``Authorization``
+    bearer token, so per-call JWTs of the Direct API map to their account.
+    Queueing for a slot does not count towards the session timeout. A slot
+    is held until the response body has been read; the body is buffered, so
+    callers' ``json()`` / ``text()`` do not touch the network.
+    """
+
+    def __init__(self, *, account_key: Optional[str] = None, **kwargs: Any):
+        self._session = aiohttp.ClientSession(**kwargs)
+        self._account_key = account_key
+
+    @property
+    def closed(self) -> bool:
+        return self._session.closed
+
+    @property
+    def headers(self) -> Any:
+        return self._session.headers
+
+    async def close(self) -> None:
+        await self._session.close()
+
+    async def __aenter__(self) -> "RateLimitedSession":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    def request(self, method: str, url: Any, **kwargs: Any) -> _ResponseContext:
+        return _ResponseContext(self._request(method, url, **kwargs))
+
+    def get(self, url: Any, **kwargs: Any) -> _ResponseContext:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: Any, **kwargs: Any) -> _ResponseContext:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: Any, **kwargs: Any) -> _ResponseContext:
+        return self.request("PUT", url, **kwargs)
+
+    def patch(self, url: Any, **kwargs: Any) -> _ResponseContext:
+        return self.request("PATCH", url, **kwargs)
+
+    def delete(self, url: Any, **kwargs: Any) -> _ResponseContext:
+        return self.request("DELETE", url, **kwargs)
+
+    def _limiter_key(self, headers: Any) -> str:
+        if self._account_key:
+            return self._account_key
+        auth = (headers or {}).get("Authorization") or self.headers.get("Authorization") or ""
+        token = auth[7:] if auth.startswith("Bearer ") else auth
+        return account_key_for_token(token) if token else "anonymous"
+
+    async def _request(self, method: str, url: Any, **kwargs: Any) -> aiohttp.ClientResponse:
+        if not settings.AISENSY_LIMITER_ENABLED:
+            return await self._session.request(method, url, **kwargs)
+
+        breaker = get_circuit_breaker(endpoint_key(method, url))
+        breaker.before_request()
+        limiter = get_account_limiter(self._limiter_key(kwargs.get("headers")))
+        try:
+            await limiter.acquire()
+        except BaseException:
+            breaker.cancel_probe()
+            raise
+
+        outcome: Optional[str] = None
+        pause_s: Optional[float] = None
+        try:
+            response = await self._session.request(method, url, **kwargs)
+            # The slot covers the whole exchange: buffer the body before releasing it
+            await response.read()
+            outcome = await classify_response(response)
+            pause_s = pause_from_headers(response.headers, outcome == "throttled")
+            if response.headers.get("X-RateLimit-Limit"):
+                limiter.rate_limit_header = response.headers["X-RateLimit-Limit"]
+            breaker.record(outcome != "error")
+            return response
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            outcome = "error"
+            breaker.record(False)
+            raise
+        except BaseException:
+            breaker.cancel_probe()
+            raise
+        finally:
+            limiter.release(outcome, pause_s)
+
+
+__all__ = [
+    "AdaptiveLimiter",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "RateLimitedSession",
+    "get_account_limiter",
+    "get_circuit_breaker",
+    "get_rate_limiter_stats",
+    "reset_rate_limiters",
+]
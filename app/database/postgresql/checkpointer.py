@@ -0,0 +1,304 @@
+"""
+LangGraph checkpointers for the drafting and broadcasting graphs.
+
+``get_checkpointer()`` returns the saver selected by ``CHECKPOINT_BACKEND``:
+
+    - ``memory``: a fresh in-process ``MemorySaver`` (lost on restart)
+    - ``postgres``: the process-wide ``PostgresCheckpointer`` on the
+      application database (postgresql_connection settings)
+
+``PostgresCheckpointer`` wraps langgraph's ``AsyncPostgresSaver`` (tables
+``checkpoints`` / ``checkpoint_blobs`` / ``checkpoint_writes``, created on first
+use) and adds:
+
+    - a pooled async connection (``CHECKPOINT_POOL_SIZE``), opened lazily on the
+      event loop that first uses it, so graphs can be compiled with the
+      checkpointer at import time
+    - compact blobs: serialized values of ``CHECKPOINT_COMPRESS_MIN_BYTES`` or
+      more are zlib-compressed
+    - heavy-channel compaction: when a checkpoint writes a new version of a
+      channel in ``CHECKPOINT_COMPACT_CHANNELS`` (default ``rag,draft``), the
+      thread's older versions of that channel are deleted, so intermediate
+      checkpoints stop carrying their own copy of the RAG bundle and every
+      draft revision. The latest checkpoint always stays resumable; replaying
+      an older one sees those channels empty.
+    - TTL pruning: threads whose newest checkpoint is older than
+      ``CHECKPOINT_TTL_SECONDS`` are deleted every ``CHECKPOINT_PRUNE_EVERY``
+      writes, or on demand with ``await checkpointer.prune()``
+
+Only the async graph API (``ainvoke`` / ``astream`` / ``aget_state``) is
+supported; the sync methods raise ``NotImplementedError``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import threading
+import weakref
+import zlib
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence, Tuple
+
+from langgraph.checkpoint.base import (
+    BaseCheckpointSaver,
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+)
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from ...config.logging import logger
+from ...config.settings import settings
+
+
+# Threads removed per pruning statement batch
+_PRUNE_BATCH = 500
+
+_STALE_THREADS_SQL = """
+SELECT thread_id FROM checkpoints
+GROUP BY thread_id
+HAVING max((checkpoint->>'ts')::timestamptz) < now() - make_interval(secs => %s)
+LIMIT %s
+"""
+
+_DELETE_OLD_BLOB_VERSIONS_SQL = """
+DELETE FROM checkpoint_blobs
+WHERE thread_id = %s AND checkpoint_ns = %s AND channel = %s AND version <> %s
+"""
+
+
+class CompressingSerializer(JsonPlusSerializer):
+    """JsonPlusSerializer that zlib-compresses payloads of ``min_bytes`` or more.
+
+    Compressed payloads are tagged ``<type>+zlib``; untagged payloads written
+    before compression was enabled still load.
+    """
+
+    _SUFFIX = "+zlib"
+
+    def __init__(self, min_bytes: int = 4096, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.min_bytes = min_bytes
+
+    def dumps_typed(self, obj: Any) -> Tuple[str, bytes]:
+        type_, data = super().dumps_typed(obj)
+        if self.min_bytes and isinstance(data, bytes) and len(data) >= self.min_bytes:
+            return type_ + self._SUFFIX, zlib.compress(data, 6)
+        return type_, data
+
+    def loads_typed(self, data: Tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_.endswith(self._SUFFIX):
+            return super().loads_typed((type_[: -len(self._SUFFIX)], zlib.decompress(payload)))
+        return super().loads_typed(data)
+
+
+def _database_conninfo() -> str:
+    from .postgresql_connection import DATABASE_URL
+
+    # SQLAlchemy dialect prefix -> plain libpq URL for psycopg
+    return DATABASE_URL.replace("postgresql+psycopg://", "postgresql://", 1)
+
+
+class PostgresCheckpointer(BaseCheckpointSaver):
+    """Pooled, compacting, TTL-pruned ``AsyncPostgresSaver`` (see module docstring).
+
+    One underlying saver (and connection pool) is created per event loop on
+    first use. ``saver_factory`` replaces the Postgres saver, e.g. in tests.
+    """
+
+    def __init__(
+        self,
+        conninfo: Optional[str] = None,
+        *,
+        pool_size: Optional[int] = None,
+        ttl_seconds: Optional[int] = None,
+        prune_every: Optional[int] = None,
+        compact_channels: Optional[Sequence[str]] = None,
+        compress_min_bytes: Optional[int] = None,
+        saver_factory: Optional[Callable[["PostgresCheckpointer"], Any]] = None,
+    ):
+        min_bytes = settings.CHECKPOINT_COMPRESS_MIN_BYTES if compress_min_bytes is None else compress_min_bytes
+        super().__init__(serde=CompressingSerializer(min_bytes=min_bytes))
+        self.conninfo = conninfo
+        self.pool_size = pool_size or settings.CHECKPOINT_POOL_SIZE
+        self.ttl_seconds = settings.CHECKPOINT_TTL_SECONDS if ttl_seconds is None else ttl_seconds
+        self.prune_every = settings.CHECKPOINT_PRUNE_EVERY if prune_every is None else prune_every
+        if compact_channels is None:
+            compact_channels = [c.strip() for c in settings.CHECKPOINT_COMPACT_CHANNELS.split(",")]
+        self.compact_channels = frozenset(c for c in compact_channels if c)
+        self._saver_factory = saver_factory or PostgresCheckpointer._build_postgres_saver
+        self._savers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Any]" = weakref.WeakKeyDictionary()
+        self._locks: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = weakref.WeakKeyDictionary()
+        self._puts = 0
+
+    # ------------------------------------------------------------------
+    # Underlying saver
+    # ------------------------------------------------------------------
+
+    async def _build_postgres_saver(self) -> Any:
+        from langgraph.checkpoint.postgres.aio import AsyncPostgresSaver
+        from psycopg.rows import dict_row
+        from psycopg_pool import AsyncConnectionPool
+
+        pool = AsyncConnectionPool(
+            self.conninfo or _database_conninfo(),
+            min_size=1,
+            max_size=self.pool_size,
+            open=False,
+            kwargs={"autocommit": True, "prepare_threshold": 0, "row_factory": dict_row},
+        )
+        await pool.open()
+        saver = AsyncPostgresSaver(pool, serde=self.serde)
+        await saver.setup()
+        logger.info(f"[CHECKPOINT] Postgres checkpointer ready (pool_size={self.pool_size})")
+        return saver
+
+    async def _saver(self) -> Any:
+        loop = asyncio.get_running_loop()
+        saver = self._savers.get(loop)
+        if saver is not None:
+            return saver
+        lock = self._locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            if loop not in self._savers:
+                self._savers[loop] = await self._saver_factory(self)
+        return self._savers[loop]
+
+    @staticmethod
+    def _pool(saver: Any) -> Any:
+        pool = getattr(saver, "conn", None)
+        return pool if hasattr(pool, "connection") else None
+
+    # ------------------------------------------------------------------
+    # BaseCheckpointSaver (async)
+    # ------------------------------------------------------------------
+
+    async def aget_tuple(self, config: Dict[str, Any]) -> Optional[CheckpointTuple]:
+        return await (await self._saver()).aget_tuple(config)
+
+    async def alist(
+        self,
+        config: Optional[Dict[str, Any]],
+        *,
+        filter: Optional[Dict[str, Any]] = None,
+        before: Optional[Dict[str, Any]] = None,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[CheckpointTuple]:
+        saver = await self._saver()
+        async for item in saver.alist(config, filter=filter, before=before, limit=limit):
+            yield item
+
+    async def aput(
+        self,
+        config: Dict[str, Any],
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> Dict[str, Any]:
+        saver = await self._saver()
+        next_config = await saver.aput(config, checkpoint, metadata, new_versions)
+        await self._compact(saver, config, new_versions)
+        self._puts += 1
+        if self.prune_every and self._puts % self.prune_every == 0:
+            try:
+                await self.prune()
+            except Exception as e:
+                logger.warning(f"[CHECKPOINT] pruning failed: {e}")
+        return next_config
+
+    async def aput_writes(
+        self,
+        config: Dict[str, Any],
+        writes: Sequence[Tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        await (await self._saver()).aput_writes(config, writes, task_id, task_path)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        await (await self._saver()).adelete_thread(thread_id)
+
+    def get_next_version(self, current: Optional[str], channel: Any) -> str:
+        # Same scheme as AsyncPostgresSaver: zero-padded counter + random suffix
+        if current is None:
+            current_v = 0
+        elif isinstance(current, int):
+            current_v = current
+        else:
+            current_v = int(current.split(".")[0])
+        return f"{current_v + 1:032}.{random.random():016}"
+
+    # ------------------------------------------------------------------
+    # Compaction / pruning
+    # ------------------------------------------------------------------
+
+    async def _compact(self, saver: Any, config: Dict[str, Any], new_versions: ChannelVersions) -> None:
+        heavy = [(channel, str(version)) for channel, version in new_versions.items() if channel in self.compact_channels]
+        pool = self._pool(saver)
+        if not heavy or pool is None:
+            return
+        configurable = config["configurable"]
+        thread_id = str(configurable["thread_id"])
+        checkpoint_ns = configurable.get("checkpoint_ns", "")
+        async with pool.connection() as conn:
+            for channel, version in heavy:
+                await conn.execute(_DELETE_OLD_BLOB_VERSIONS_SQL, (thread_id, checkpoint_ns, channel, version))
+
+    async def prune(self, ttl_seconds: Optional[int] = None) -> int:
+        """Delete threads idle for longer than ``ttl_seconds``; returns threads removed."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        pool = self._pool(await self._saver())
+        if not ttl or pool is None:
+            return 0
+        removed = 0
+        async with pool.connection() as conn:
+            while True:
+                async with conn.transaction():
+                    rows = await (await conn.execute(_STALE_THREADS_SQL, (ttl, _PRUNE_BATCH))).fetchall()
+                    thread_ids = [row["thread_id"] for row in rows]
+                    if not thread_ids:
+                        break
+                    for table in ("checkpoint_writes", "checkpoint_blobs", "checkpoints"):
+                        await conn.execute(f"DELETE FROM {table} WHERE thread_id = ANY(%s)", (thread_ids,))
+                removed += len(thread_ids)
+                if len(thread_ids) < _PRUNE_BATCH:
+                    break
+        if removed:
+            logger.info(f"[CHECKPOINT] pruned {removed} threads idle for more than {ttl}s")
+        return removed
+
+    async def aclose(self) -> None:
+        """Close the connection pool opened on the running event loop."""
+        saver = self._savers.pop(asyncio.get_running_loop(), None)
+        pool = self._pool(saver)
+        if pool is not None:
+            await pool.close()
+
+
+_postgres_checkpointer: Optional[PostgresCheckpointer] = None
+_postgres_checkpointer_lock = threading.Lock()
+
+
+def get_checkpointer(backend: Optional[str] = None) -> BaseCheckpointSaver:
+    """Checkpointer for ``backend`` (defaults to ``CHECKPOINT_BACKEND``).
+
+    Raises:
+        ValueError: for a backend other than "memory" or "postgres"
+    """
+    global _postgres_checkpointer
+    backend = (backend or settings.CHECKPOINT_BACKEND).lower()
+    if backend == "memory":
+        return MemorySaver()
+    if backend != "postgres":
+        raise ValueError(f"Unknown checkpoint backend {backend!r} (expected 'memory' or 'postgres')")
+    if _postgres_checkpointer is None:
+        with _postgres_checkpointer_lock:
+            if _postgres_checkpointer is None:
+                _postgres_checkpointer = PostgresCheckpointer()
+    return _postgres_checkpointer
+
+
+__all__ = ["CompressingSerializer", "PostgresCheckpointer", "get_checkpointer"]
@@ -7,7 +7,7 @@ WARNING: This will DELETE ALL DATA in the database tables!
 from sqlmodel import SQLModel
 from .postgresql_connection import engine
 from .models import (
-    User, BusinessCreation, ProjectCreation, TempMemory, BroadcastJob,
+    User, BusinessCreation, ProjectCreation, TempMemory, BroadcastJob, BroadcastMessage, DeliveryQueueItem,
     TemplateCreation, ProcessedContact, ConsentLog, SuppressionList,
     DraftingSession, DraftingFact, AgentOutput, DraftingValidation,
     MainRule, StagingRule, PromotionLog,
@@ -38,6 +38,8 @@ def create_all_tables():
     print("  - project_creations")
     print("  - temporary_notes (for JWT tokens, runtime/broadcasting status)")
     print("  - broadcast_jobs (for broadcast campaign tracking)")
+    print("  - broadcast_messages (per-recipient delivery ledger)")
+    print("  - delivery_queue (durable send queue with priority lanes and retries)")
     print("  - template_creations (for WhatsApp template lifecycle)")
     print("  - processed_contacts (for validated broadcast contacts)")
     print("  - consent_logs (for opt-in/opt-out audit trail)")
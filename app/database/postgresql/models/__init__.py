@@ -3,6 +3,8 @@ from .project_creation import ProjectCreation
 from .user_table import User
 from .temp_memory import TempMemory
 from .broadcast_job import BroadcastJob
+from .broadcast_message import BroadcastMessage
+from .delivery_queue import DeliveryQueueItem
 from .template_creation import TemplateCreation
 from .processed_contact import ProcessedContact
 from .consent_log import ConsentLog
@@ -17,7 +19,7 @@ from .drafting import (
 
 __all__ = [
     "BusinessCreation", "ProjectCreation", "User", "TempMemory",
-    "BroadcastJob", "TemplateCreation", "ProcessedContact", "ConsentLog", "SuppressionList",
+    "BroadcastJob", "BroadcastMessage", "DeliveryQueueItem", "TemplateCreation", "ProcessedContact", "ConsentLog", "SuppressionList",
     "DraftingSession", "DraftingFact", "AgentOutput", "DraftingValidation",
     "MainRule", "StagingRule", "PromotionLog",
     "VerifiedCitation", "DraftVersion", "ClarificationHistory",
@@ -0,0 +1,49 @@
+# app/database/postgresql/models/broadcast_message.py
+"""BroadcastMessage model: per-recipient delivery ledger for broadcast jobs."""
+from sqlmodel import SQLModel, Field
+from sqlalchemy import Index, Text, UniqueConstraint
+from typing import Optional
+from datetime import datetime
+
+
+class BroadcastMessage(SQLModel, table=True):
+    """
+    One row per (broadcast job, phone) recording the delivery outcome.
+
+    Written by the broadcast worker after every batch it settles
+    (app/utils/broadcasting/delivery_queue.py, upserted, so queue retries
+    update the same row) and by read/delivery receipts.
+    Frequency caps, retries and delivery reports query this table instead
+    of decoding BroadcastJob.contacts_data.
+
+    Status values: SENT, DELIVERED, READ, FAILED
+    """
+    __tablename__ = "broadcast_messages"
+    __table_args__ = (
+        UniqueConstraint("broadcast_job_id", "phone_e164", name="uq_broadcast_message_job_phone"),
+        # Frequency caps: messages a user sent to a phone within a rolling window
+        Index("ix_broadcast_messages_user_phone_sent", "user_id", "phone_e164", "sent_at"),
+        # Retries and reports: rows of a job by status
+        Index("ix_broadcast_messages_job_status", "broadcast_job_id", "status"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    broadcast_job_id: str
+    user_id: str
+    phone_e164: str
+
+    status: str = Field(default="SENT")
+    message_id: Optional[str] = Field(default=None, index=True)  # WhatsApp wamid
+
+    # Last failure (cleared on success)
+    error_code: Optional[str] = Field(default=None)
+    error_message: Optional[str] = Field(default=None, sa_type=Text)
+
+    attempts: int = Field(default=0)
+
+    # Timestamps
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    sent_at: Optional[datetime] = Field(default=None)        # first successful send
+    delivered_at: Optional[datetime] = Field(default=None)
+    read_at: Optional[datetime] = Field(default=None)
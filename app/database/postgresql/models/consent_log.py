@@ -7,7 +7,7 @@ Per doc section 3.3.2 & 3.3.3:
 - Audit trail: Immutable log of all consent events
 """
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Text
+from sqlalchemy import Index, Text
 from typing import Optional
 from datetime import datetime
 
@@ -20,6 +20,10 @@ class ConsentLog(SQLModel, table=True):
     This provides a complete audit trail for TRAI, GDPR, and WhatsApp compliance.
     """
     __tablename__ = "consent_logs"
+    __table_args__ = (
+        # Latest consent action per phone for a user
+        Index("ix_consent_logs_user_phone_created", "user_id", "phone_e164", "created_at"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str = Field(index=True)
@@ -0,0 +1,57 @@
+# app/database/postgresql/models/delivery_queue.py
+"""DeliveryQueueItem model: durable, prioritised send queue for broadcast jobs."""
+from sqlmodel import SQLModel, Field
+from sqlalchemy import JSON, Index, Text, UniqueConstraint
+from typing import Any, Dict, Optional
+from datetime import datetime
+
+
+class DeliveryQueueItem(SQLModel, table=True):
+    """
+    One row per (broadcast job, phone) waiting to be sent by a delivery worker.
+
+    The delivery tools only enqueue rows; worker processes lease due rows with
+    ``SELECT ... FOR UPDATE SKIP LOCKED`` (lowest priority lane first), send
+    them through the Direct API batch tools and write the outcome back here
+    and to the broadcast_messages ledger. A retryable failure re-queues the
+    row with ``next_attempt_at`` pushed along the backoff ladder; a
+    non-retryable code or exhausted attempts moves it to DEAD.
+
+    Priority lanes: 1=Urgent/OTP, 2=24hr window, 3=Normal, 4=Low, 5=Background
+    Status values: QUEUED, LEASED, SENT, DEAD
+    """
+    __tablename__ = "delivery_queue"
+    __table_args__ = (
+        UniqueConstraint("broadcast_job_id", "phone_e164", name="uq_delivery_queue_job_phone"),
+        # Leasing: due rows by lane, and expired leases
+        Index("ix_delivery_queue_lease", "status", "priority", "next_attempt_at"),
+        # Queue reports: rows of a job by status
+        Index("ix_delivery_queue_job_status", "broadcast_job_id", "status"),
+    )
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    broadcast_job_id: str
+    user_id: str
+    phone_e164: str
+
+    priority: int = Field(default=3)
+    method: str = Field(default="template")  # "lite" or "template"
+    payload: Optional[Dict[str, Any]] = Field(default=None, sa_type=JSON)  # batch tool params
+
+    status: str = Field(default="QUEUED")
+    attempts: int = Field(default=0)
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow)
+
+    # Lease held by a worker (cleared when the row is settled or re-queued)
+    leased_by: Optional[str] = Field(default=None)
+    lease_expires_at: Optional[datetime] = Field(default=None)
+
+    message_id: Optional[str] = Field(default=None)  # WhatsApp wamid once sent
+
+    # Last failure
+    error_code: Optional[str] = Field(default=None)
+    error_message: Optional[str] = Field(default=None, sa_type=Text)
+
+    # Timestamps
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    updated_at: datetime = Field(default_factory=datetime.utcnow)
@@ -6,7 +6,7 @@ Maps to the ProcessedContact output schema from the Data Processing Agent:
     custom_fields, source_row, validation_errors
 """
 from sqlmodel import SQLModel, Field
-from sqlalchemy import JSON
+from sqlalchemy import JSON, Index
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 
@@ -20,6 +20,10 @@ class ProcessedContact(SQLModel, table=True):
     and quality-scored.
     """
     __tablename__ = "processed_contacts"
+    __table_args__ = (
+        # Compliance checks: probe a job's contacts by phone
+        Index("ix_processed_contacts_job_phone", "broadcast_job_id", "phone_e164"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     broadcast_job_id: str = Field(index=True)
@@ -47,4 +51,8 @@ class ProcessedContact(SQLModel, table=True):
     is_duplicate: bool = Field(default=False)
     duplicate_of: Optional[str] = Field(default=None)  # Phone number it duplicates
 
+    # Lifecycle stage (new, engaged, active, at_risk, dormant, churned) set by
+    # the segmentation agent; None until the job has been classified
+    lifecycle_stage: Optional[str] = Field(default=None)
+
     created_at: datetime = Field(default_factory=datetime.utcnow)
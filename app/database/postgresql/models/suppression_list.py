@@ -8,7 +8,7 @@ Per doc section 3.3.4:
 - Bounce List: Numbers that consistently fail delivery
 """
 from sqlmodel import SQLModel, Field
-from sqlalchemy import Text
+from sqlalchemy import Index, Text
 from typing import Optional
 from datetime import datetime
 
@@ -25,6 +25,10 @@ class SuppressionList(SQLModel, table=True):
     - competitor: Optional exclusion of competitor contacts
     """
     __tablename__ = "suppression_lists"
+    __table_args__ = (
+        # Compliance checks: a user's suppressions for a phone
+        Index("ix_suppression_lists_user_phone", "user_id", "phone_e164"),
+    )
 
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: str = Field(index=True)
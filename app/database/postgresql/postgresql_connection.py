@@ -1,8 +1,12 @@
-from contextlib import contextmanager
-from typing import Annotated
+import asyncio
+import weakref
+from contextlib import asynccontextmanager, contextmanager
+from typing import Annotated, AsyncIterator
 
 from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
 from sqlmodel import Session, create_engine
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from ...config.logging import logger
 from ...config.settings import settings
@@ -35,3 +39,24 @@ def get_session():
         session.close()
 
 SessionDep = Annotated[Session, Depends(get_session)]
+
+
+# Async engine (psycopg 3 async driver) for hot paths inside async servers.
+# Pooled connections belong to the event loop that opened them, so each loop
+# gets its own engine.
+_async_engines: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncEngine]" = weakref.WeakKeyDictionary()
+
+
+def get_async_engine() -> AsyncEngine:
+    loop = asyncio.get_running_loop()
+    async_engine = _async_engines.get(loop)
+    if async_engine is None:
+        async_engine = create_async_engine(DATABASE_URL, pool_pre_ping=True)
+        _async_engines[loop] = async_engine
+    return async_engine
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncIterator[AsyncSession]:
+    async with AsyncSession(get_async_engine(), expire_on_commit=False) as session:
+        yield session
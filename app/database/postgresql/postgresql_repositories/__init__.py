@@ -1,12 +1,15 @@
 from .business_creation_repo import BusinessCreationRepository
 from .users_creation_repo import UserCreationRepository
 from .project_creation import ProjectCreationRepository
-from .memory_repo import MemoryRepository
+from .memory_repo import MemoryRepository, AsyncMemoryRepository
 from .broadcast_job_repo import BroadcastJobRepository
+from .broadcast_message_repo import BroadcastMessageRepository
+from .delivery_queue_repo import DeliveryQueueRepository
 from .template_creation_repo import TemplateCreationRepository
 from .processed_contact_repo import ProcessedContactRepository
 from .consent_log_repo import ConsentLogRepository
 from .suppression_list_repo import SuppressionListRepository
+from .compliance_repo import ComplianceRepository
 
 
 __all__ = [
@@ -14,9 +17,13 @@ __all__ = [
     "UserCreationRepository",
     "ProjectCreationRepository",
     "MemoryRepository",
+    "AsyncMemoryRepository",
     "BroadcastJobRepository",
+    "BroadcastMessageRepository",
+    "DeliveryQueueRepository",
     "TemplateCreationRepository",
     "ProcessedContactRepository",
     "ConsentLogRepository",
     "SuppressionListRepository",
+    "ComplianceRepository",
 ]
\ No newline at end of file
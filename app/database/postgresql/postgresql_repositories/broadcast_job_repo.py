@@ -94,6 +94,18 @@ class BroadcastJobRepository:
             logger.error(f"Failed to get broadcast jobs for user {user_id}: {e}")
             raise e
 
+    def get_ids_by_phase(self, phase: str) -> List[str]:
+        """IDs of active broadcast jobs currently in ``phase``."""
+        try:
+            statement = select(BroadcastJob.id).where(
+                BroadcastJob.phase == phase,
+                BroadcastJob.is_active == True,
+            )
+            return list(self.session.exec(statement).all())
+        except Exception as e:
+            logger.error(f"Failed to get broadcast jobs in phase {phase}: {e}")
+            raise e
+
     def update_phase(
         self, job_id: str, new_phase: str, error_message: Optional[str] = None,
         scheduled_for: Optional[datetime] = None
@@ -0,0 +1,244 @@
+"""BroadcastMessage Repository for the per-recipient delivery ledger."""
+from __future__ import annotations
+from typing import Dict, Iterable, List, Optional
+from datetime import datetime
+from dataclasses import dataclass
+from sqlalchemy import case, func, or_, update
+from sqlmodel import Session, select
+from ..models.broadcast_message import BroadcastMessage
+from app import logger
+
+
+# Statuses that count as a message having gone out, in receipt order
+SUCCESS_STATUSES = ("SENT", "DELIVERED", "READ")
+
+
+def _dialect_insert(session: Session):
+    """INSERT construct with ON CONFLICT support for the session's database."""
+    dialect = session.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"broadcast_messages upsert not supported on {dialect}")
+    return insert
+
+
+@dataclass
+class BroadcastMessageRepository:
+    """Repository for BroadcastMessage ledger operations."""
+    session: Session
+
+    def record_outcomes(
+        self,
+        broadcast_job_id: str,
+        user_id: str,
+        outcomes: Iterable[dict],
+    ) -> int:
+        """
+        Upsert send outcomes into the ledger, one row per (job, phone).
+
+        A repeated attempt increments ``attempts`` on the existing row. Once a
+        row has been sent it stays successful: a later failure (e.g. a resend
+        after a crash) does not downgrade it.
+
+        Args:
+            broadcast_job_id: The broadcast job the messages belong to
+            user_id: User who owns the broadcast
+            outcomes: Dicts with phone, success, message_id, error, error_code
+                      (the shape of SendOutcome.to_dict())
+
+        Returns:
+            int: Number of ledger rows written
+        """
+        now = datetime.utcnow()
+        rows = {}
+        for o in outcomes:
+            success = bool(o.get("success"))
+            rows[o["phone"]] = {
+                "broadcast_job_id": broadcast_job_id,
+                "user_id": user_id,
+                "phone_e164": o["phone"],
+                "status": "SENT" if success else "FAILED",
+                "message_id": o.get("message_id"),
+                "error_code": None if success else o.get("error_code"),
+                "error_message": None if success else o.get("error"),
+                "attempts": 1,
+                "created_at": now,
+                "updated_at": now,
+                "sent_at": now if success else None,
+            }
+        if not rows:
+            return 0
+
+        try:
+            table = BroadcastMessage.__table__
+            stmt = _dialect_insert(self.session)(table)
+            # Plain comparison: expanding IN (...) cannot be used with executemany
+            was_sent = table.c.status != "FAILED"
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["broadcast_job_id", "phone_e164"],
+                set_={
+                    "status": case((was_sent, table.c.status), else_=stmt.excluded.status),
+                    "message_id": func.coalesce(table.c.message_id, stmt.excluded.message_id),
+                    "error_code": case((was_sent, table.c.error_code), else_=stmt.excluded.error_code),
+                    "error_message": case((was_sent, table.c.error_message), else_=stmt.excluded.error_message),
+                    "attempts": table.c.attempts + 1,
+                    "updated_at": stmt.excluded.updated_at,
+                    "sent_at": func.coalesce(table.c.sent_at, stmt.excluded.sent_at),
+                },
+            )
+            self.session.execute(stmt, list(rows.values()))
+            self.session.commit()
+            return len(rows)
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to record {len(rows)} outcomes for job {broadcast_job_id}: {e}")
+            raise e
+
+    def mark_status(self, message_ids: List[str], status: str) -> int:
+        """
+        Apply a DELIVERED/READ receipt to ledger rows by WhatsApp message id.
+
+        Rows only move forward (SENT -> DELIVERED -> READ).
+
+        Returns:
+            int: Number of rows updated
+        """
+        if status not in SUCCESS_STATUSES[1:] or not message_ids:
+            return 0
+        try:
+            now = datetime.utcnow()
+            earlier = SUCCESS_STATUSES[:SUCCESS_STATUSES.index(status)]
+            values = {"status": status, "updated_at": now}
+            values["delivered_at" if status == "DELIVERED" else "read_at"] = now
+            result = self.session.execute(
+                update(BroadcastMessage)
+                .where(
+                    BroadcastMessage.message_id.in_(message_ids),
+                    BroadcastMessage.status.in_(earlier),
+                )
+                .values(**values)
+            )
+            self.session.commit()
+            return result.rowcount or 0
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to mark {len(message_ids)} messages {status}: {e}")
+            raise e
+
+    def get_recent_send_counts(
+        self,
+        user_id: str,
+        since: datetime,
+        min_count: int = 1,
+        exclude_job_id: Optional[str] = None,
+    ) -> Dict[str, int]:
+        """
+        Messages sent per phone by this user since ``since``.
+
+        Served by the (user_id, phone_e164, sent_at) index. Only phones with at
+        least ``min_count`` messages are returned, so callers checking a cap
+        get just the capped numbers back.
+        """
+        try:
+            statement = (
+                select(BroadcastMessage.phone_e164, func.count())
+                .where(
+                    BroadcastMessage.user_id == user_id,
+                    BroadcastMessage.sent_at >= since,
+                )
+                .group_by(BroadcastMessage.phone_e164)
+                .having(func.count() >= min_count)
+            )
+            if exclude_job_id:
+                statement = statement.where(BroadcastMessage.broadcast_job_id != exclude_job_id)
+            return {phone: count for phone, count in self.session.exec(statement).all()}
+        except Exception as e:
+            logger.error(f"Failed to get recent send counts for user {user_id}: {e}")
+            raise e
+
+    def get_retryable_phones(
+        self,
+        broadcast_job_id: str,
+        max_attempts: int,
+        non_retryable_codes: Iterable[str] = (),
+        limit: Optional[int] = None,
+    ) -> List[str]:
+        """
+        Phones of a job whose last attempt failed with a retryable error.
+
+        Rows that already used ``max_attempts`` attempts or failed with one of
+        ``non_retryable_codes`` are left out.
+        """
+        try:
+            statement = (
+                select(BroadcastMessage.phone_e164)
+                .where(
+                    BroadcastMessage.broadcast_job_id == broadcast_job_id,
+                    BroadcastMessage.status == "FAILED",
+                    BroadcastMessage.attempts < max_attempts,
+                )
+                .order_by(BroadcastMessage.id)
+            )
+            codes = list(non_retryable_codes)
+            if codes:
+                statement = statement.where(or_(
+                    BroadcastMessage.error_code.is_(None),
+                    BroadcastMessage.error_code.notin_(codes),
+                ))
+            if limit:
+                statement = statement.limit(limit)
+            return list(self.session.exec(statement).all())
+        except Exception as e:
+            logger.error(f"Failed to get retryable phones for job {broadcast_job_id}: {e}")
+            raise e
+
+    def count_by_status(self, broadcast_job_id: str) -> Dict[str, int]:
+        """Ledger row counts per status for a job (empty if nothing was sent yet)."""
+        try:
+            statement = (
+                select(BroadcastMessage.status, func.count())
+                .where(BroadcastMessage.broadcast_job_id == broadcast_job_id)
+                .group_by(BroadcastMessage.status)
+            )
+            return {status: count for status, count in self.session.exec(statement).all()}
+        except Exception as e:
+            logger.error(f"Failed to count statuses for job {broadcast_job_id}: {e}")
+            raise e
+
+    def get_delivery_counts(self, broadcast_job_id: str) -> Dict[str, int]:
+        """
+        Cumulative sent/delivered/read/failed counts for a job's delivery report.
+
+        A read message also counts as delivered and sent. Returns an empty
+        dict when the job has no ledger rows (e.g. sent before the ledger).
+        """
+        counts = self.count_by_status(broadcast_job_id)
+        if not counts:
+            return {}
+        read = counts.get("READ", 0)
+        delivered = counts.get("DELIVERED", 0) + read
+        return {
+            "sent": counts.get("SENT", 0) + delivered,
+            "delivered": delivered,
+            "read": read,
+            "failed": counts.get("FAILED", 0),
+        }
+
+    def count_failures_by_code(self, broadcast_job_id: str) -> Dict[str, int]:
+        """Failed rows of a job grouped by WhatsApp error code ("unknown" when absent)."""
+        try:
+            statement = (
+                select(BroadcastMessage.error_code, func.count())
+                .where(
+                    BroadcastMessage.broadcast_job_id == broadcast_job_id,
+                    BroadcastMessage.status == "FAILED",
+                )
+                .group_by(BroadcastMessage.error_code)
+            )
+            return {code or "unknown": count for code, count in self.session.exec(statement).all()}
+        except Exception as e:
+            logger.error(f"Failed to count failures for job {broadcast_job_id}: {e}")
+            raise e
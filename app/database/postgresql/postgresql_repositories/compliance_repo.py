@@ -0,0 +1,211 @@
+"""Compliance Repository: set-based opt-in and suppression checks for a broadcast job.
+
+Each check is a fixed number of SQL statements regardless of audience size:
+the job's contacts are anti-joined against consent_logs / suppression_lists
+inside the database, and only counts plus a bounded sample come back.
+"""
+from __future__ import annotations
+from datetime import datetime
+from dataclasses import dataclass
+from sqlalchemy import func, insert, literal, or_, update
+from sqlmodel import Session, select
+from ..models.consent_log import ConsentLog
+from ..models.processed_contact import ProcessedContact
+from ..models.suppression_list import SuppressionList
+from app import logger
+
+
+# Consent events that define a contact's current state. Audit rows such as
+# EXCLUDED are ignored, so logging an exclusion never masks an earlier opt-out.
+CONSENT_ACTIONS = ("OPT_IN", "OPT_OUT", "PAUSE", "RESUME", "OPT_OUT_MARKETING")
+OPTED_OUT_ACTIONS = ("OPT_OUT", "PAUSE", "OPT_OUT_MARKETING")
+
+
+@dataclass
+class ComplianceRepository:
+    """Repository for set-based compliance checks over a job's contacts."""
+    session: Session
+
+    def _job_phones(self, broadcast_job_id: str):
+        """Valid, non-duplicate phones of a job (same rows as get_valid_phones_by_job)."""
+        return (
+            select(ProcessedContact.phone_e164.label("phone_e164"))
+            .where(
+                ProcessedContact.broadcast_job_id == broadcast_job_id,
+                ProcessedContact.is_duplicate == False,
+                ProcessedContact.phone_e164 != "",
+            )
+            .subquery("job_phones")
+        )
+
+    def _opted_out(self, user_id: str):
+        """Phones whose latest consent action for the user is an opt-out."""
+        ranked = (
+            select(
+                ConsentLog.phone_e164,
+                ConsentLog.action,
+                func.row_number().over(
+                    partition_by=ConsentLog.phone_e164,
+                    order_by=(ConsentLog.created_at.desc(), ConsentLog.id.desc()),
+                ).label("rn"),
+            )
+            .where(ConsentLog.user_id == user_id, ConsentLog.action.in_(CONSENT_ACTIONS))
+            .subquery("latest_consent")
+        )
+        return (
+            select(ranked.c.phone_e164)
+            .where(ranked.c.rn == 1, ranked.c.action.in_(OPTED_OUT_ACTIONS))
+            .subquery("opted_out")
+        )
+
+    def check_opt_in(
+        self,
+        user_id: str,
+        broadcast_job_id: str,
+        sample_size: int = 10,
+        source: str = "compliance_check",
+    ) -> dict:
+        """
+        Count a job's contacts without consent and log one EXCLUDED audit row each.
+
+        The audit rows are written with a single INSERT ... SELECT, so no phone
+        list is loaded into Python.
+
+        Returns:
+            dict with total, excluded_count and excluded_sample (up to sample_size phones)
+        """
+        try:
+            now = datetime.utcnow()
+            job_phones = self._job_phones(broadcast_job_id)
+            opted_out = self._opted_out(user_id)
+            on_opted_out = opted_out.c.phone_e164 == job_phones.c.phone_e164
+
+            total, excluded = self.session.exec(
+                select(func.count(), func.count(opted_out.c.phone_e164))
+                .select_from(job_phones)
+                .outerjoin(opted_out, on_opted_out)
+            ).one()
+
+            sample = []
+            if excluded:
+                sample = list(self.session.exec(
+                    select(job_phones.c.phone_e164)
+                    .join(opted_out, on_opted_out)
+                    .order_by(job_phones.c.phone_e164)
+                    .limit(sample_size)
+                ).all())
+
+                self.session.execute(
+                    insert(ConsentLog).from_select(
+                        ["user_id", "phone_e164", "action", "source", "broadcast_job_id", "created_at"],
+                        select(
+                            literal(user_id),
+                            job_phones.c.phone_e164,
+                            literal("EXCLUDED"),
+                            literal(source),
+                            literal(broadcast_job_id),
+                            literal(now),
+                        ).join(opted_out, on_opted_out),
+                    )
+                )
+                self.session.commit()
+
+            logger.info(f"Opt-in check for job {broadcast_job_id}: {excluded}/{total} excluded")
+            return {"total": total, "excluded_count": excluded, "excluded_sample": sample}
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed opt-in check for job {broadcast_job_id}: {e}")
+            raise e
+
+    def filter_suppressed(
+        self,
+        user_id: str,
+        broadcast_job_id: str,
+        sample_size: int = 10,
+    ) -> dict:
+        """
+        Count a job's contacts on an active suppression list.
+
+        Expired temporary suppressions are deactivated first (one UPDATE) and
+        never match. Campaign suppressions only apply to their own job.
+
+        Returns:
+            dict with total, filtered_count, filtered_by_type (distinct phones
+            per suppression type) and filtered_sample (up to sample_size phones)
+        """
+        try:
+            now = datetime.utcnow()
+            self._deactivate_expired(user_id, now)
+
+            job_phones = self._job_phones(broadcast_job_id)
+            active = (
+                select(SuppressionList.phone_e164, SuppressionList.suppression_type)
+                .where(
+                    SuppressionList.user_id == user_id,
+                    SuppressionList.is_active == True,
+                    or_(SuppressionList.expires_at.is_(None), SuppressionList.expires_at >= now),
+                    or_(
+                        SuppressionList.suppression_type != "campaign",
+                        SuppressionList.broadcast_job_id.is_(None),
+                        SuppressionList.broadcast_job_id == broadcast_job_id,
+                    ),
+                )
+                .subquery("active_suppressions")
+            )
+            suppressed = select(active.c.phone_e164).distinct().subquery("suppressed")
+            on_suppressed = suppressed.c.phone_e164 == job_phones.c.phone_e164
+
+            total, filtered = self.session.exec(
+                select(func.count(), func.count(suppressed.c.phone_e164))
+                .select_from(job_phones)
+                .outerjoin(suppressed, on_suppressed)
+            ).one()
+
+            by_type = {}
+            sample = []
+            if filtered:
+                by_type = {
+                    suppression_type: count
+                    for suppression_type, count in self.session.exec(
+                        select(active.c.suppression_type, func.count(active.c.phone_e164.distinct()))
+                        .select_from(job_phones)
+                        .join(active, active.c.phone_e164 == job_phones.c.phone_e164)
+                        .group_by(active.c.suppression_type)
+                    ).all()
+                }
+                sample = list(self.session.exec(
+                    select(job_phones.c.phone_e164)
+                    .join(suppressed, on_suppressed)
+                    .order_by(job_phones.c.phone_e164)
+                    .limit(sample_size)
+                ).all())
+
+            logger.info(f"Suppression filter for job {broadcast_job_id}: {filtered}/{total} filtered")
+            return {
+                "total": total,
+                "filtered_count": filtered,
+                "filtered_by_type": by_type,
+                "filtered_sample": sample,
+            }
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed suppression filter for job {broadcast_job_id}: {e}")
+            raise e
+
+    def _deactivate_expired(self, user_id: str, now: datetime) -> int:
+        """Deactivate a user's expired temporary suppressions in one UPDATE."""
+        result = self.session.execute(
+            update(SuppressionList)
+            .where(
+                SuppressionList.user_id == user_id,
+                SuppressionList.suppression_type == "temporary",
+                SuppressionList.is_active == True,
+                SuppressionList.expires_at != None,
+                SuppressionList.expires_at < now,
+            )
+            .values(is_active=False)
+        )
+        self.session.commit()
+        if result.rowcount:
+            logger.info(f"Cleaned up {result.rowcount} expired temporary suppressions")
+        return result.rowcount or 0
@@ -0,0 +1,402 @@
+"""DeliveryQueue Repository for the durable broadcast send queue."""
+from __future__ import annotations
+from typing import Any, Dict, Iterable, List, Sequence
+from datetime import datetime, timedelta
+from dataclasses import dataclass
+from sqlalchemy import bindparam, case, func, update
+from sqlmodel import Session, select
+from ..models.broadcast_job import BroadcastJob
+from ..models.delivery_queue import DeliveryQueueItem
+from .broadcast_message_repo import _dialect_insert
+from app import logger
+
+
+# Statuses of rows a worker still has to send
+PENDING_STATUSES = ("QUEUED", "LEASED")
+
+# error_message of rows reclaimed from a worker that never settled them
+LEASE_EXPIRED_ERROR = "Lease expired before the batch was settled"
+
+
+@dataclass
+class DeliveryQueueRepository:
+    """Repository for DeliveryQueueItem operations."""
+    session: Session
+
+    def enqueue(
+        self,
+        broadcast_job_id: str,
+        user_id: str,
+        recipients: Iterable[dict],
+        method: str,
+        payload: Dict[str, Any],
+    ) -> int:
+        """
+        Add recipients of a job to the queue.
+
+        Recipients are due immediately unless they carry a ``not_before``
+        datetime (e.g. the next messaging tier window). A phone already
+        queued for the job (in any status) is left as it is, so calling this
+        again for the same job never resends or resets rows.
+
+        Args:
+            broadcast_job_id: The broadcast job the messages belong to
+            user_id: User who owns the broadcast
+            recipients: Dicts with phone, priority (1-5) and optional not_before
+            method: "lite" or "template", selects the batch MCP tool
+            payload: Batch tool params shared by every recipient of the job
+
+        Returns:
+            int: Number of rows newly queued
+        """
+        now = datetime.utcnow()
+        rows = {}
+        for r in recipients:
+            rows[r["phone"]] = {
+                "broadcast_job_id": broadcast_job_id,
+                "user_id": user_id,
+                "phone_e164": r["phone"],
+                "priority": int(r.get("priority", 3)),
+                "method": method,
+                "payload": payload,
+                "status": "QUEUED",
+                "attempts": 0,
+                "next_attempt_at": r.get("not_before") or now,
+                "created_at": now,
+                "updated_at": now,
+            }
+        if not rows:
+            return 0
+
+        try:
+            table = DeliveryQueueItem.__table__
+            stmt = (
+                _dialect_insert(self.session)(table)
+                .on_conflict_do_nothing(index_elements=["broadcast_job_id", "phone_e164"])
+                .returning(table.c.id)
+            )
+            inserted = len(self.session.execute(stmt, list(rows.values())).all())
+            self.session.commit()
+            return inserted
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to enqueue {len(rows)} recipients for job {broadcast_job_id}: {e}")
+            raise e
+
+    def lease(self, worker_id: str, limit: int, lease_seconds: int, max_attempts: int) -> List[Dict[str, Any]]:
+        """
+        Lease up to ``limit`` due rows for ``worker_id``, lowest priority lane first.
+
+        Only rows of jobs in the SENDING phase are leased, so pausing a job
+        holds its queued rows until it is resumed. Rows are picked with
+        ``FOR UPDATE SKIP LOCKED``, so concurrent workers never lease the same
+        row and never wait on each other. Leases older than ``lease_seconds``
+        (a worker that died mid-batch) are reclaimed first; a reclaim counts
+        as an attempt, so a batch that keeps crashing or hanging its worker
+        moves to DEAD after ``max_attempts`` instead of being resent forever.
+
+        Returns:
+            list[dict]: Leased rows ordered by priority, then due time
+        """
+        try:
+            now = datetime.utcnow()
+            table = DeliveryQueueItem.__table__
+            exhausted = table.c.attempts + 1 >= max_attempts
+            self.session.execute(
+                update(table)
+                .where(table.c.status == "LEASED", table.c.lease_expires_at < now)
+                .values(
+                    status=case((exhausted, "DEAD"), else_="QUEUED"),
+                    attempts=table.c.attempts + 1,
+                    error_code=None,
+                    error_message=LEASE_EXPIRED_ERROR,
+                    leased_by=None,
+                    lease_expires_at=None,
+                    updated_at=now,
+                )
+            )
+            due = (
+                select(table.c.id)
+                .where(
+                    table.c.status == "QUEUED",
+                    table.c.next_attempt_at <= now,
+                    table.c.broadcast_job_id.in_(
+                        select(BroadcastJob.id).where(BroadcastJob.phase == "SENDING")
+                    ),
+                )
+                .order_by(table.c.priority, table.c.next_attempt_at, table.c.id)
+                .limit(limit)
+                .with_for_update(skip_locked=True)
+            )
+            rows = self.session.execute(
+                update(table)
+                .where(table.c.id.in_(due.scalar_subquery()))
+                .values(
+                    status="LEASED",
+                    leased_by=worker_id,
+                    lease_expires_at=now + timedelta(seconds=lease_seconds),
+                    updated_at=now,
+                )
+                .returning(*table.c)
+            ).mappings().all()
+            self.session.commit()
+            return sorted((dict(r) for r in rows), key=lambda r: (r["priority"], r["next_attempt_at"], r["id"]))
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to lease delivery queue rows for worker {worker_id}: {e}")
+            raise e
+
+    def settle(
+        self,
+        worker_id: str,
+        results: Iterable[dict],
+        retry_delays: Sequence[int],
+        max_attempts: int,
+        non_retryable_codes: Iterable[str] = (),
+    ) -> Dict[str, Any]:
+        """
+        Write send results back to rows leased by ``worker_id``.
+
+        A success marks the row SENT. A failure with one of
+        ``non_retryable_codes``, or one that used up ``max_attempts``, marks it
+        DEAD. Any other failure re-queues it at ``now + retry_delays[attempts]``
+        (the last delay repeats if the ladder is shorter than ``max_attempts``).
+        Rows whose lease expired and were taken over by another worker (or
+        reclaimed) are left untouched and not counted: the rows still held are
+        locked first, and only those are updated.
+
+        Args:
+            worker_id: Worker holding the leases
+            results: Dicts with id, attempts (before this send), success,
+                     message_id, error, error_code
+
+        Returns:
+            dict: Rows settled per outcome (sent, retry, dead) and the
+                  settled_ids actually updated
+        """
+        now = datetime.utcnow()
+        dead_codes = {str(c) for c in non_retryable_codes}
+        counts: Dict[str, Any] = {"sent": 0, "retry": 0, "dead": 0, "settled_ids": []}
+        planned = {}
+        for r in results:
+            attempts = r["attempts"] + 1
+            error_code = r.get("error_code")
+            if r.get("success"):
+                outcome, status, next_at = "sent", "SENT", now
+            elif (error_code and str(error_code) in dead_codes) or attempts >= max_attempts:
+                outcome, status, next_at = "dead", "DEAD", now
+            else:
+                delay = retry_delays[min(attempts, len(retry_delays) - 1)]
+                outcome, status, next_at = "retry", "QUEUED", now + timedelta(seconds=delay)
+            planned[r["id"]] = (outcome, {
+                "b_id": r["id"],
+                "b_status": status,
+                "b_attempts": attempts,
+                "b_next_attempt_at": next_at,
+                "b_message_id": r.get("message_id"),
+                "b_error_code": None if r.get("success") else error_code,
+                "b_error_message": None if r.get("success") else r.get("error"),
+            })
+        if not planned:
+            return counts
+
+        try:
+            table = DeliveryQueueItem.__table__
+            held = sorted(self.session.execute(
+                select(table.c.id)
+                .where(
+                    table.c.id.in_(list(planned)),
+                    table.c.status == "LEASED",
+                    table.c.leased_by == worker_id,
+                )
+                .with_for_update()
+            ).scalars().all())
+            if held:
+                stmt = (
+                    update(table)
+                    .where(
+                        table.c.id == bindparam("b_id"),
+                        table.c.status == "LEASED",
+                        table.c.leased_by == worker_id,
+                    )
+                    .values(
+                        status=bindparam("b_status"),
+                        attempts=bindparam("b_attempts"),
+                        next_attempt_at=bindparam("b_next_attempt_at"),
+                        message_id=func.coalesce(bindparam("b_message_id"), table.c.message_id),
+                        error_code=bindparam("b_error_code"),
+                        error_message=bindparam("b_error_message"),
+                        leased_by=None,
+                        lease_expires_at=None,
+                        updated_at=now,
+                    )
+                )
+                self.session.execute(stmt, [planned[row_id][1] for row_id in held])
+            self.session.commit()
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to settle {len(planned)} delivery queue rows for worker {worker_id}: {e}")
+            raise e
+
+        for row_id in held:
+            counts[planned[row_id][0]] += 1
+        counts["settled_ids"] = held
+        if len(held) < len(planned):
+            logger.warning(
+                f"Worker {worker_id} lost the lease on {len(planned) - len(held)} of {len(planned)} rows; "
+                "their results were discarded"
+            )
+        return counts
+
+    def release(self, worker_id: str, ids: Iterable[int]) -> int:
+        """
+        Return rows leased by ``worker_id`` to the queue unsent.
+
+        Used when a worker runs out of lease time before sending them; no
+        attempt is counted.
+
+        Returns:
+            int: Number of rows released
+        """
+        ids = list(ids)
+        if not ids:
+            return 0
+        try:
+            now = datetime.utcnow()
+            table = DeliveryQueueItem.__table__
+            result = self.session.execute(
+                update(table)
+                .where(table.c.id.in_(ids), table.c.status == "LEASED", table.c.leased_by == worker_id)
+                .values(status="QUEUED", leased_by=None, lease_expires_at=None, updated_at=now)
+            )
+            self.session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to release {len(ids)} delivery queue rows for worker {worker_id}: {e}")
+            raise e
+
+    def requeue_dead(
+        self,
+        broadcast_job_id: str,
+        from_method: str,
+        method: str,
+        payload: Dict[str, Any],
+        skip_codes: Iterable[str] = (),
+    ) -> int:
+        """
+        Queue the dead-lettered ``from_method`` rows of a job again under ``method``.
+
+        Used for the lite -> template fallback: the rows keep their phone and
+        lane, start over with no attempts and are due immediately. Rows that
+        died with one of ``skip_codes`` stay dead.
+
+        Returns:
+            int: Number of rows queued again
+        """
+        try:
+            now = datetime.utcnow()
+            table = DeliveryQueueItem.__table__
+            conditions = [
+                table.c.broadcast_job_id == broadcast_job_id,
+                table.c.method == from_method,
+                table.c.status == "DEAD",
+            ]
+            skip_codes = list(skip_codes)
+            if skip_codes:
+                conditions.append(table.c.error_code.is_(None) | table.c.error_code.notin_(skip_codes))
+            result = self.session.execute(
+                update(table)
+                .where(*conditions)
+                .values(
+                    method=method,
+                    payload=payload,
+                    status="QUEUED",
+                    attempts=0,
+                    next_attempt_at=now,
+                    error_code=None,
+                    error_message=None,
+                    updated_at=now,
+                )
+            )
+            self.session.commit()
+            return result.rowcount
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to requeue dead {from_method} rows of job {broadcast_job_id}: {e}")
+            raise e
+
+    def get_queue_stats(self, broadcast_job_id: str) -> Dict[str, Any]:
+        """
+        Queue state of a job for the delivery tools.
+
+        Returns row counts per status and per priority lane, how many queued
+        rows are waiting on a retry, the earliest scheduled attempt and the
+        dead-letter breakdown by error code. Empty counts when nothing was
+        queued for the job.
+        """
+        try:
+            by_lane = self.session.exec(
+                select(DeliveryQueueItem.priority, DeliveryQueueItem.status, func.count())
+                .where(DeliveryQueueItem.broadcast_job_id == broadcast_job_id)
+                .group_by(DeliveryQueueItem.priority, DeliveryQueueItem.status)
+            ).all()
+            retrying, next_attempt_at = self.session.exec(
+                select(func.count(), func.min(DeliveryQueueItem.next_attempt_at))
+                .where(
+                    DeliveryQueueItem.broadcast_job_id == broadcast_job_id,
+                    DeliveryQueueItem.status == "QUEUED",
+                    DeliveryQueueItem.attempts > 0,
+                )
+            ).one()
+            dead_by_code = self.session.exec(
+                select(DeliveryQueueItem.error_code, func.count())
+                .where(
+                    DeliveryQueueItem.broadcast_job_id == broadcast_job_id,
+                    DeliveryQueueItem.status == "DEAD",
+                )
+                .group_by(DeliveryQueueItem.error_code)
+            ).all()
+        except Exception as e:
+            logger.error(f"Failed to get queue stats for job {broadcast_job_id}: {e}")
+            raise e
+
+        statuses: Dict[str, int] = {}
+        lanes: Dict[int, Dict[str, int]] = {}
+        for priority, status, count in by_lane:
+            statuses[status] = statuses.get(status, 0) + count
+            lanes.setdefault(priority, {})[status] = count
+        return {
+            "total": sum(statuses.values()),
+            "by_status": statuses,
+            "by_priority": {p: lanes[p] for p in sorted(lanes)},
+            "pending": sum(statuses.get(s, 0) for s in PENDING_STATUSES),
+            "retry_scheduled": retrying,
+            "next_retry_at": next_attempt_at.isoformat() if retrying and next_attempt_at else None,
+            "dead_by_code": {code or "unknown": count for code, count in dead_by_code},
+        }
+
+    def count_pending_by_job(self, broadcast_job_ids: Iterable[str]) -> Dict[str, Dict[str, int]]:
+        """
+        Total and still-pending (QUEUED/LEASED) rows per job.
+
+        Jobs with no queue rows are left out, so callers can tell "never
+        queued" apart from "fully drained".
+        """
+        job_ids = list(broadcast_job_ids)
+        if not job_ids:
+            return {}
+        try:
+            pending = func.sum(case((DeliveryQueueItem.status.in_(PENDING_STATUSES), 1), else_=0))
+            statement = (
+                select(DeliveryQueueItem.broadcast_job_id, func.count(), pending)
+                .where(DeliveryQueueItem.broadcast_job_id.in_(job_ids))
+                .group_by(DeliveryQueueItem.broadcast_job_id)
+            )
+            return {
+                job_id: {"total": total, "pending": int(pending or 0)}
+                for job_id, total, pending in self.session.exec(statement).all()
+            }
+        except Exception as e:
+            logger.error(f"Failed to count pending rows for {len(job_ids)} jobs: {e}")
+            raise e
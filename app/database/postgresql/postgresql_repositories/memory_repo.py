@@ -4,7 +4,9 @@ from typing import Optional, List
 from datetime import datetime
 from dataclasses import dataclass
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from ..models import TempMemory
+from ..user_context import invalidate_user_context
 from app import logger
 
 
@@ -75,6 +77,7 @@ class MemoryRepository:
                 self.session.add(existing)
                 self.session.commit()
                 self.session.refresh(existing)
+                invalidate_user_context(user_id)
 
                 logger.info("=" * 60)
                 logger.info("✓ TEMP MEMORY UPDATED (Subsequent Broadcasting)")
@@ -106,6 +109,7 @@ class MemoryRepository:
                 self.session.add(temp_memory)
                 self.session.commit()
                 self.session.refresh(temp_memory)
+                invalidate_user_context(user_id)
 
                 logger.info("=" * 60)
                 logger.info("✓ TEMP MEMORY CREATED (First Broadcasting)")
@@ -363,6 +367,7 @@ class MemoryRepository:
                 record.is_active = False
                 record.updated_at = datetime.utcnow()
                 self.session.commit()
+                invalidate_user_context(user_id)
                 logger.info(f"✓ Deactivated temp memory for user_id={user_id}, project_id={project_id}")
                 return True
             return False
@@ -410,3 +415,40 @@ class MemoryRepository:
         except Exception as e:
             logger.error(f"Failed to get all temp memory for user_id={user_id}: {e}")
             raise e
+
+
+@dataclass
+class AsyncMemoryRepository:
+    """Async TempMemory reads for the MCP servers' per-call account lookups."""
+    session: AsyncSession
+
+    async def get_user_context(self, user_id: str) -> Optional[dict]:
+        """
+        Get the account context of the most recent active temp memory for a user_id.
+
+        Selects only the columns API calls need (no credentials), the same
+        record ``MemoryRepository.get_by_user_id`` returns.
+
+        Args:
+            user_id: User ID to search for
+
+        Returns:
+            dict: jwt_token, project_id and business_id, or None if not found
+        """
+        try:
+            statement = select(
+                TempMemory.jwt_token, TempMemory.project_id, TempMemory.business_id
+            ).where(
+                TempMemory.user_id == user_id,
+                TempMemory.is_active == True
+            ).order_by(TempMemory.updated_at.desc()).limit(1)
+
+            record = (await self.session.exec(statement)).first()
+            if record is None:
+                return None
+            jwt_token, project_id, business_id = record
+            return {"jwt_token": jwt_token, "project_id": project_id, "business_id": business_id}
+
+        except Exception as e:
+            logger.error(f"Failed to get user context for user_id={user_id}: {e}")
+            raise e
@@ -1,11 +1,60 @@
 """ProcessedContact Repository for bulk contact storage and retrieval."""
 from __future__ import annotations
-from typing import List
-from datetime import datetime
+import json
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from datetime import datetime, timedelta
 from dataclasses import dataclass
+from sqlalchemy import and_, case, update
 from sqlmodel import Session, select, func
+from ..models.consent_log import ConsentLog
 from ..models.processed_contact import ProcessedContact
-from app import logger
+from .compliance_repo import CONSENT_ACTIONS
+from app import logger, settings
+
+
+# Column order for COPY FROM STDIN; must match _copy_row
+COPY_COLUMNS = (
+    "broadcast_job_id", "user_id", "phone_e164", "name", "email",
+    "country_code", "quality_score", "custom_fields", "source_row",
+    "validation_errors", "is_duplicate", "duplicate_of", "created_at",
+)
+COPY_SQL = (
+    f"COPY {ProcessedContact.__tablename__} ({', '.join(COPY_COLUMNS)}) FROM STDIN"
+)
+
+_dump_json = json.JSONEncoder(separators=(",", ":"), ensure_ascii=False).encode
+
+
+def _json_text(value) -> str:
+    """Serialize a JSON column value for COPY.
+
+    None becomes JSON ``null`` rather than SQL NULL, as SQLAlchemy's JSON
+    type does on the ORM path.
+    """
+    if value is None:
+        return "null"
+    if not value:
+        return "[]" if isinstance(value, list) else "{}"
+    return _dump_json(value)
+
+
+def _copy_row(c: dict, broadcast_job_id: str, user_id: str, created_at: datetime) -> tuple:
+    """Build one COPY row in COPY_COLUMNS order, with the same defaults as the ORM path."""
+    return (
+        broadcast_job_id,
+        user_id,
+        c.get("phone_e164", ""),
+        c.get("name"),
+        c.get("email"),
+        c.get("country_code", ""),
+        c.get("quality_score", 0),
+        _json_text(c.get("custom_fields")),
+        c.get("source_row"),
+        _json_text(c.get("validation_errors")),
+        c.get("is_duplicate", False),
+        c.get("duplicate_of"),
+        created_at,
+    )
 
 
 @dataclass
@@ -22,6 +71,10 @@ class ProcessedContactRepository:
         """
         Bulk insert processed contacts into the database.
 
+        On PostgreSQL (psycopg 3) rows are streamed with COPY FROM STDIN;
+        other databases (SQLite in tests) or CONTACT_COPY_INSERT=False use
+        the ORM add_all path.
+
         Args:
             contacts: List of dicts with keys: phone_e164, name, email,
                       country_code, quality_score, custom_fields, source_row,
@@ -32,6 +85,9 @@ class ProcessedContactRepository:
         Returns:
             int: Number of records created
         """
+        if self.supports_copy():
+            return self.copy_insert(contacts, broadcast_job_id, user_id)
+
         try:
             logger.info(f"Bulk inserting {len(contacts)} processed contacts for job {broadcast_job_id}")
 
@@ -65,6 +121,48 @@ class ProcessedContactRepository:
             logger.error(f"Failed to bulk insert processed contacts: {e}")
             raise e
 
+    def supports_copy(self) -> bool:
+        """Whether bulk_create can use COPY on this session's database."""
+        if not settings.CONTACT_COPY_INSERT:
+            return False
+        dialect = self.session.get_bind().dialect
+        return dialect.name == "postgresql" and dialect.driver == "psycopg"
+
+    def copy_insert(
+        self,
+        contacts: Iterable[dict],
+        broadcast_job_id: str,
+        user_id: str,
+    ) -> int:
+        """
+        Stream processed contacts into PostgreSQL with COPY FROM STDIN.
+
+        Runs inside the session's transaction and commits once at the end.
+        ``contacts`` can be any iterable (e.g. a generator), so rows are
+        written as they are produced without building ORM objects.
+
+        Returns:
+            int: Number of records created
+        """
+        try:
+            created_at = datetime.utcnow()
+            count = 0
+            dbapi_conn = self.session.connection().connection.driver_connection
+            with dbapi_conn.cursor() as cursor:
+                with cursor.copy(COPY_SQL) as copy:
+                    for c in contacts:
+                        copy.write_row(_copy_row(c, broadcast_job_id, user_id, created_at))
+                        count += 1
+            self.session.commit()
+
+            logger.info(f"Copied {count} processed contacts for job {broadcast_job_id}")
+            return count
+
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to copy processed contacts for job {broadcast_job_id}: {e}")
+            raise e
+
     def get_by_broadcast_job(self, broadcast_job_id: str) -> List[dict]:
         """Get all processed contacts for a broadcast job."""
         try:
@@ -145,6 +243,88 @@ class ProcessedContactRepository:
             logger.error(f"Failed to get quality summary for job {broadcast_job_id}: {e}")
             raise e
 
+    def assign_lifecycle_stages(
+        self,
+        broadcast_job_id: str,
+        user_id: str,
+        stage_days: Sequence[Tuple[str, int]],
+        fallback_stage: str,
+        now: Optional[datetime] = None,
+    ) -> int:
+        """
+        Classify every contact of a job by days since its latest consent event.
+
+        A single UPDATE ... FROM joins the job's contacts to their latest consent
+        timestamp (one grouped query) and buckets it with a CASE over
+        precomputed cutoffs, so nothing is loaded into Python.
+
+        Args:
+            stage_days: Ordered (stage, max_days) pairs; a contact gets the first
+                stage whose max_days covers it. Contacts without consent events
+                count as 0 days old.
+            fallback_stage: Stage for contacts older than every max_days
+            now: Reference time (defaults to utcnow)
+
+        Returns:
+            Number of contacts updated
+        """
+        try:
+            now = now or datetime.utcnow()
+            latest = (
+                select(ProcessedContact.id, func.max(ConsentLog.created_at).label("last_at"))
+                .outerjoin(ConsentLog, and_(
+                    ConsentLog.user_id == user_id,
+                    ConsentLog.phone_e164 == ProcessedContact.phone_e164,
+                    ConsentLog.action.in_(CONSENT_ACTIONS),
+                ))
+                .where(ProcessedContact.broadcast_job_id == broadcast_job_id)
+                .group_by(ProcessedContact.id)
+                .subquery("latest_consent")
+            )
+            # (now - last).days <= max_days  <=>  last > now - (max_days + 1) days
+            stage = case(
+                (latest.c.last_at.is_(None), stage_days[0][0]),
+                *(
+                    (latest.c.last_at > now - timedelta(days=max_days + 1), name)
+                    for name, max_days in stage_days
+                ),
+                else_=fallback_stage,
+            )
+            result = self.session.execute(
+                update(ProcessedContact)
+                .where(ProcessedContact.id == latest.c.id)
+                .values(lifecycle_stage=stage)
+                .execution_options(synchronize_session=False)
+            )
+            self.session.commit()
+            logger.info(f"Assigned lifecycle stages to {result.rowcount} contacts for job {broadcast_job_id}")
+            return result.rowcount or 0
+        except Exception as e:
+            self.session.rollback()
+            logger.error(f"Failed to assign lifecycle stages for job {broadcast_job_id}: {e}")
+            raise e
+
+    def count_by_lifecycle_stage(self, broadcast_job_id: str) -> Dict[Optional[str], int]:
+        """
+        Count a job's non-duplicate contacts per stored lifecycle stage.
+
+        Returns:
+            dict stage -> count; the None key counts contacts not yet classified
+        """
+        try:
+            statement = (
+                select(ProcessedContact.lifecycle_stage, func.count())
+                .where(
+                    ProcessedContact.broadcast_job_id == broadcast_job_id,
+                    ProcessedContact.is_duplicate == False,
+                )
+                .group_by(ProcessedContact.lifecycle_stage)
+            )
+            return {stage: count for stage, count in self.session.exec(statement).all()}
+        except Exception as e:
+            logger.error(f"Failed to count lifecycle stages for job {broadcast_job_id}: {e}")
+            raise e
+
     def _to_dict(self, record: ProcessedContact) -> dict:
         """Convert ProcessedContact record to dictionary."""
         return {
@@ -161,5 +341,6 @@ class ProcessedContactRepository:
             "validation_errors": record.validation_errors,
             "is_duplicate": record.is_duplicate,
             "duplicate_of": record.duplicate_of,
+            "lifecycle_stage": record.lifecycle_stage,
             "created_at": record.created_at.isoformat() if record.created_at else None,
         }
@@ -0,0 +1,181 @@
+"""
+In-process TTL cache of the account context the Direct API MCP tools sign calls with.
+
+Every Direct API tool needs the user's JWT (and the project / business it
+belongs to) before it can call AiSensy. ``get_user_context(user_id)`` serves
+it from memory:
+
+    - hits return a frozen ``UserContext`` without touching Postgres, so the
+      send tools stay off the database for the life of an entry
+    - misses load the context with one async query (``AsyncMemoryRepository``,
+      JWT / project / business columns only); concurrent misses for the same
+      user on one event loop share that query
+    - entries expire after ``USER_CONTEXT_CACHE_TTL_SECONDS`` and the least
+      recently used ones are evicted beyond ``USER_CONTEXT_CACHE_MAX_ENTRIES``
+    - ``invalidate_user_context`` drops a user's entry; MemoryRepository calls
+      it whenever it writes the JWT (``create_on_verification_success``, which
+      ``regenerate_jwt_bearer_token`` uses) or deactivates the record. A load
+      that was in flight during an invalidation is not cached.
+
+Users without a JWT are not cached, so onboarding that finishes in another
+process is picked up on the next call. The messaging tier is not stored in
+the database; ``remember_tier`` attaches the tier last reported by
+``get_messaging_health_status`` to the cached entry.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import dataclasses
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
+
+from ...config.logging import logger
+from ...config.settings import settings
+
+
+@dataclass(frozen=True)
+class UserContext:
+    """Account context of one user for Direct API calls."""
+    user_id: str
+    jwt_token: str
+    project_id: Optional[str] = None
+    business_id: Optional[str] = None
+    tier: Optional[str] = None
+
+
+async def _load_user_context(user_id: str) -> Optional[UserContext]:
+    from .postgresql_connection import get_async_session
+    from .postgresql_repositories.memory_repo import AsyncMemoryRepository
+
+    async with get_async_session() as session:
+        record = await AsyncMemoryRepository(session=session).get_user_context(user_id)
+    if not record or not record.get("jwt_token"):
+        return None
+    return UserContext(
+        user_id=user_id,
+        jwt_token=record["jwt_token"],
+        project_id=record.get("project_id"),
+        business_id=record.get("business_id"),
+    )
+
+
+class UserContextCache:
+    """TTL + LRU cache of ``UserContext`` keyed on user_id, shared by every event loop."""
+
+    def __init__(self, loader=_load_user_context, clock=time.monotonic):
+        self._loader = loader
+        self._clock = clock
+        # invalidate() is called from synchronous repository code on any thread
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[float, UserContext]]" = OrderedDict()
+        # Bumped by every invalidation; loads started before it are not cached
+        self._generation = 0
+        # Loads in flight are tasks, bound to the loop that started them
+        self._in_flight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Task]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self.stats = {"hits": 0, "misses": 0, "loads": 0, "coalesced": 0, "invalidations": 0}
+
+    def peek(self, user_id: str) -> Optional[UserContext]:
+        """Cached context of ``user_id`` if present and fresh, without loading."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is None:
+                return None
+            stored_at, context = entry
+            if self._clock() - stored_at > settings.USER_CONTEXT_CACHE_TTL_SECONDS:
+                del self._entries[user_id]
+                return None
+            self._entries.move_to_end(user_id)
+            return context
+
+    async def get(self, user_id: str) -> Optional[UserContext]:
+        """Context of ``user_id`` from the cache, loading it from Postgres on a miss."""
+        context = self.peek(user_id)
+        if context is not None:
+            self.stats["hits"] += 1
+            return context
+        self.stats["misses"] += 1
+
+        in_flight = self._in_flight.setdefault(asyncio.get_running_loop(), {})
+        task = in_flight.get(user_id)
+        if task is not None:
+            self.stats["coalesced"] += 1
+            return await asyncio.shield(task)
+
+        task = asyncio.ensure_future(self._load(user_id))
+        in_flight[user_id] = task
+        try:
+            return await asyncio.shield(task)
+        finally:
+            if in_flight.get(user_id) is task:
+                del in_flight[user_id]
+
+    async def _load(self, user_id: str) -> Optional[UserContext]:
+        generation = self._generation
+        self.stats["loads"] += 1
+        context = await self._loader(user_id)
+        if context is not None:
+            with self._lock:
+                if generation == self._generation:
+                    self._store(context)
+        return context
+
+    def _store(self, context: UserContext) -> None:
+        if settings.USER_CONTEXT_CACHE_TTL_SECONDS <= 0:
+            return
+        self._entries[context.user_id] = (self._clock(), context)
+        self._entries.move_to_end(context.user_id)
+        while len(self._entries) > settings.USER_CONTEXT_CACHE_MAX_ENTRIES:
+            self._entries.popitem(last=False)
+
+    def set_tier(self, user_id: str, tier: str) -> None:
+        """Attach ``tier`` to the cached context of ``user_id`` (keeps its age)."""
+        with self._lock:
+            entry = self._entries.get(user_id)
+            if entry is not None:
+                stored_at, context = entry
+                self._entries[user_id] = (stored_at, dataclasses.replace(context, tier=tier))
+
+    def invalidate(self, user_id: Optional[str] = None) -> None:
+        """Drop the entry of ``user_id``, or every entry when None."""
+        with self._lock:
+            self._generation += 1
+            self.stats["invalidations"] += 1
+            if user_id is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(user_id, None)
+
+    def get_stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self.stats, "entries": len(self._entries)}
+
+
+_user_context_cache = UserContextCache()
+
+
+async def get_user_context(user_id: str) -> Optional[UserContext]:
+    """Account context of ``user_id`` (None if the user has no JWT yet)."""
+    return await _user_context_cache.get(user_id)
+
+
+def invalidate_user_context(user_id: Optional[str] = None) -> None:
+    """Forget the cached context of ``user_id`` (every user when None)."""
+    _user_context_cache.invalidate(user_id)
+    logger.debug("User context cache invalidated for %s", user_id or "all users")
+
+
+def remember_tier(user_id: str, tier: str) -> None:
+    """Record the messaging tier last reported for ``user_id`` on its cached context."""
+    _user_context_cache.set_tier(user_id, tier)
+
+
+def get_user_context_stats() -> Dict[str, Any]:
+    """Hit / miss / load counters and current size of the user context cache."""
+    return _user_context_cache.get_stats()
@@ -1,3 +1,4 @@
 from .qudrant import qdrant_db
+from .embedding_cache import get_embedding_cache_stats
 
-__all__ = ["qdrant_db"]
\ No newline at end of file
+__all__ = ["qdrant_db", "get_embedding_cache_stats"]
\ No newline at end of file
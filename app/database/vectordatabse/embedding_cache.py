@@ -0,0 +1,291 @@
+"""
+Persistent embedding cache keyed by (embedding model, sha256 of text).
+
+One directory per model under ``EMBEDDING_CACHE_DIR``:
+
+    vectors.f32   float32 rows, appended, opened with ``np.memmap`` (no load copy)
+    keys.bin      32-byte sha256 digests, row ``i`` belongs to vector row ``i``
+    meta.json     model name, vector dimension and compaction generation
+
+Rows are appended under an exclusive file lock, vectors before keys, so a
+crashed writer leaves at most an orphan vector row that is ignored on load.
+Other processes pick up new rows on their next miss, and re-read the whole
+index when the generation shows the store was compacted. Repeated texts that
+two processes embed at once become duplicate rows, which ``compact`` removes.
+
+Usage:
+    python -m app.database.vectordatabse.embedding_cache stats
+    python -m app.database.vectordatabse.embedding_cache compact [--model NAME]
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from ...config import logger, settings
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX hosts fall back to the thread lock
+    fcntl = None
+
+
+_KEY_BYTES = 32
+
+
+def text_key(text: str) -> bytes:
+    return hashlib.sha256(text.encode("utf-8", errors="surrogatepass")).digest()
+
+
+def _model_dir_name(model: str) -> str:
+    slug = re.sub(r"[^A-Za-z0-9._-]+", "_", model).strip("_") or "default"
+    return f"{slug}-{hashlib.sha1(model.encode()).hexdigest()[:8]}"
+
+
+class EmbeddingCache:
+    """Append-only memory-mapped embedding store for one embedding model."""
+
+    def __init__(self, directory: str | Path, model: str):
+        self.model = model
+        self.directory = Path(directory) / _model_dir_name(model)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._vectors_path = self.directory / "vectors.f32"
+        self._keys_path = self.directory / "keys.bin"
+        self._meta_path = self.directory / "meta.json"
+        self._lock = threading.RLock()
+        self._index: Dict[bytes, int] = {}
+        self._rows = 0
+        self._dim: Optional[int] = None
+        self._generation = 0
+        self._matrix: Optional[np.memmap] = None
+        self._stats = {"hits": 0, "misses": 0, "writes": 0}
+        self._load_meta()
+        self._refresh()
+
+    # -- storage ------------------------------------------------------------
+
+    def _load_meta(self) -> int:
+        """Read dimension from meta.json and return the stored compaction generation."""
+        try:
+            meta = json.loads(self._meta_path.read_text(encoding="utf-8"))
+            self._dim = int(meta["dim"]) or None
+            return int(meta.get("generation", 0))
+        except (OSError, ValueError, KeyError, TypeError):
+            self._dim = None
+            return 0
+
+    def _write_meta(self, generation: int = 0) -> None:
+        tmp = self._meta_path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"model": self.model, "dim": self._dim, "generation": generation}),
+            encoding="utf-8",
+        )
+        os.replace(tmp, self._meta_path)
+
+    @contextmanager
+    def _file_lock(self) -> Iterator[None]:
+        with self._lock:
+            if fcntl is None:
+                yield
+                return
+            with open(self.directory / ".lock", "a") as handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _stored_rows(self) -> int:
+        if not self._dim:
+            return 0
+        try:
+            key_rows = self._keys_path.stat().st_size // _KEY_BYTES
+            vector_rows = self._vectors_path.stat().st_size // (self._dim * 4)
+        except OSError:
+            return 0
+        return min(key_rows, vector_rows)
+
+    def _refresh(self) -> None:
+        """Index rows appended since the last refresh and remap the vector file."""
+        with self._lock:
+            generation = self._load_meta()
+            rows = self._stored_rows()
+            if generation != self._generation or rows < self._rows:
+                # Compacted (possibly by another process): rebuild the index from scratch
+                self._rows, self._index, self._matrix = 0, {}, None
+                self._generation = generation
+            elif rows == self._rows and self._matrix is not None:
+                return
+            if rows > self._rows:
+                with open(self._keys_path, "rb") as handle:
+                    handle.seek(self._rows * _KEY_BYTES)
+                    data = handle.read((rows - self._rows) * _KEY_BYTES)
+                for offset in range(0, len(data), _KEY_BYTES):
+                    # Later rows win, matching what compaction keeps
+                    self._index[data[offset:offset + _KEY_BYTES]] = self._rows + offset // _KEY_BYTES
+                self._rows = rows
+            self._matrix = (
+                np.memmap(self._vectors_path, dtype=np.float32, mode="r", shape=(rows, self._dim))
+                if rows else None
+            )
+
+    def _append(self, keys: Sequence[bytes], vectors: np.ndarray) -> None:
+        with self._file_lock():
+            generation = self._load_meta()
+            if self._dim is None:
+                self._dim = int(vectors.shape[1])
+                self._write_meta(generation)
+            if vectors.shape[1] != self._dim:
+                raise ValueError(f"Embedding dimension {vectors.shape[1]} != cached dimension {self._dim}")
+            # Truncate any partial row left by a crashed writer so rows stay aligned
+            rows = self._stored_rows()
+            with open(self._vectors_path, "ab") as handle:
+                handle.truncate(rows * self._dim * 4)
+                handle.write(np.ascontiguousarray(vectors, dtype=np.float32).tobytes())
+            with open(self._keys_path, "ab") as handle:
+                handle.truncate(rows * _KEY_BYTES)
+                handle.write(b"".join(keys))
+        self._refresh()
+
+    # -- public API ---------------------------------------------------------
+
+    def get_many(self, texts: Sequence[str]) -> Tuple[List[Optional[List[float]]], List[int]]:
+        """Cached vectors for ``texts`` (None where missing) and the indexes of the misses."""
+        keys = [text_key(text) for text in texts]
+        with self._lock:
+            if any(key not in self._index for key in keys):
+                self._refresh()
+            found: List[Optional[List[float]]] = []
+            missing: List[int] = []
+            for position, key in enumerate(keys):
+                row = self._index.get(key)
+                if row is None or self._matrix is None:
+                    found.append(None)
+                    missing.append(position)
+                else:
+                    found.append(self._matrix[row].tolist())
+            self._stats["hits"] += len(keys) - len(missing)
+            self._stats["misses"] += len(missing)
+        return found, missing
+
+    def put_many(self, texts: Sequence[str], vectors: Sequence[Sequence[float]]) -> None:
+        if not texts:
+            return
+        unique: Dict[bytes, Sequence[float]] = {}
+        for text, vector in zip(texts, vectors):
+            key = text_key(text)
+            if key not in self._index:
+                unique[key] = vector
+        if not unique:
+            return
+        self._append(list(unique), np.asarray(list(unique.values()), dtype=np.float32))
+        with self._lock:
+            self._stats["writes"] += len(unique)
+
+    def stats(self) -> Dict[str, object]:
+        with self._lock:
+            lookups = self._stats["hits"] + self._stats["misses"]
+            return {
+                "model": self.model,
+                "path": str(self.directory),
+                "dim": self._dim,
+                "rows": self._rows,
+                "unique_keys": len(self._index),
+                "duplicate_rows": self._rows - len(self._index),
+                "size_bytes": self._rows * ((self._dim or 0) * 4 + _KEY_BYTES),
+                "hit_rate": round(self._stats["hits"] / lookups, 4) if lookups else 0.0,
+                **self._stats,
+            }
+
+    def compact(self, keep: Optional[set[str]] = None) -> Dict[str, int]:
+        """Rewrite the store without duplicate rows (and, if given, only texts in ``keep``)."""
+        keep_keys = {text_key(text) for text in keep} if keep is not None else None
+        with self._file_lock():
+            self._rows, self._index, self._matrix = 0, {}, None
+            self._generation = -1
+            self._refresh()
+            before = self._rows
+            entries = sorted(
+                (row, key) for key, row in self._index.items()
+                if keep_keys is None or key in keep_keys
+            )
+            rows = [row for row, _ in entries]
+            vectors = np.array(self._matrix[rows], dtype=np.float32) if rows else np.empty((0, self._dim or 0), np.float32)
+
+            self._matrix = None
+            tmp_vectors = self._vectors_path.with_suffix(".f32.tmp")
+            tmp_keys = self._keys_path.with_suffix(".bin.tmp")
+            tmp_vectors.write_bytes(vectors.tobytes())
+            tmp_keys.write_bytes(b"".join(key for _, key in entries))
+            os.replace(tmp_vectors, self._vectors_path)
+            os.replace(tmp_keys, self._keys_path)
+            self._write_meta(self._generation + 1)
+            self._refresh()
+        logger.info(f"Embedding cache {self.model}: compacted {before} -> {self._rows} rows")
+        return {"rows_before": before, "rows_after": self._rows}
+
+
+_caches: Dict[str, EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(model: str) -> Optional[EmbeddingCache]:
+    """Process-wide cache for ``model``, or None when disabled or unavailable."""
+    if not settings.EMBEDDING_CACHE_ENABLED or not model:
+        return None
+    cache = _caches.get(model)
+    if cache is None:
+        with _caches_lock:
+            cache = _caches.get(model)
+            if cache is None:
+                try:
+                    cache = _caches[model] = EmbeddingCache(settings.EMBEDDING_CACHE_DIR, model)
+                except Exception as e:
+                    logger.warning(f"Embedding cache unavailable at {settings.EMBEDDING_CACHE_DIR}: {e}")
+                    return None
+    return cache
+
+
+def get_embedding_cache_stats() -> Dict[str, Dict[str, object]]:
+    """Stats for every embedding cache opened in this process."""
+    return {model: cache.stats() for model, cache in _caches.items()}
+
+
+def _stored_models(directory: Path) -> List[str]:
+    models = []
+    for meta_path in sorted(directory.glob("*/meta.json")):
+        try:
+            models.append(json.loads(meta_path.read_text(encoding="utf-8"))["model"])
+        except (OSError, ValueError, KeyError):
+            continue
+    return models
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Inspect or compact the persistent embedding cache")
+    parser.add_argument("command", choices=["stats", "compact"])
+    parser.add_argument("--model", default=None, help="Embedding model (default: every cached model)")
+    parser.add_argument("--dir", default=settings.EMBEDDING_CACHE_DIR)
+    args = parser.parse_args()
+
+    models = [args.model] if args.model else _stored_models(Path(args.dir))
+    report = {}
+    for model in models:
+        cache = EmbeddingCache(args.dir, model)
+        report[model] = cache.compact() if args.command == "compact" else cache.stats()
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Optional
 from ...config import settings, logger
 from qdrant_client import QdrantClient, AsyncQdrantClient, models
@@ -6,6 +7,8 @@ from qdrant_client.http.exceptions import ResponseHandlingException
 from dataclasses import dataclass, field
 from ...core.exceptions import vectorStorCreationError, VectorstoreDeletionError, PayloadinsertionError, EmbeddingRetrievalError
 from ...services.llm_service import embeddings_model
+from .embedding_cache import get_embedding_cache
+from .sparse_encoder import SPARSE_VECTOR_NAME, sparse_vector_params
 
 
 @dataclass
@@ -20,25 +23,66 @@ class QdrantDB:
         api_key=getattr(settings, "QDRANT_API_KEY", None) or getattr(settings, "QUADRANT_API_KEY", None),
         timeout=30,          # explicit 30s timeout — prevents silent hang on idle connection
     ))
+    _sparse_support: dict = field(default_factory=dict, repr=False)
+
+    @staticmethod
+    def _embedding_cache():
+        model = getattr(embeddings_model, "model", None) or settings.embeddings_model_name
+        return get_embedding_cache(model)
+
+    @staticmethod
+    def _merge_cached(texts, cached, missing, embedded, cache):
+        """Fill cache misses with freshly embedded vectors and store them."""
+        if missing:
+            cache.put_many([texts[i] for i in missing], embedded)
+            for position, vector in zip(missing, embedded):
+                cached[position] = list(vector)
+        return cached
 
     def get_embeddings_batch(self, texts):
-        """Get embeddings for multiple texts using the configured embedding model."""
-        return embeddings_model.embed_documents(texts)
+        """Get embeddings for multiple texts using the configured embedding model.
+
+        Vectors are served from the persistent embedding cache when present;
+        only the misses are sent to the provider.
+        """
+        cache = self._embedding_cache()
+        if cache is None:
+            return embeddings_model.embed_documents(texts)
+        cached, missing = cache.get_many(texts)
+        embedded = embeddings_model.embed_documents([texts[i] for i in missing]) if missing else []
+        return self._merge_cached(texts, cached, missing, embedded, cache)
 
     async def aget_embeddings_batch(self, texts):
-        """Get embeddings for multiple texts using the configured embedding model."""
-        if hasattr(embeddings_model, "aembed_documents"):
-            return await embeddings_model.aembed_documents(texts)
-        return embeddings_model.embed_documents(texts)
+        """Get embeddings for multiple texts using the configured embedding model.
 
-    def create_collection(self,collection_name:str, embedding_size:int):
-        """Create a Qdrant collection with specified embedding size"""
+        Cache lookups and writes touch disk and take file locks, so they run
+        in a worker thread instead of on the event loop.
+        """
+        cache = self._embedding_cache()
+        if cache is not None:
+            cached, missing = await asyncio.to_thread(cache.get_many, texts)
+            if not missing:
+                return cached
+            miss_texts = [texts[i] for i in missing]
+        else:
+            miss_texts = texts
+        if hasattr(embeddings_model, "aembed_documents"):
+            embedded = await embeddings_model.aembed_documents(miss_texts)
+        else:
+            embedded = embeddings_model.embed_documents(miss_texts)
+        if cache is None:
+            return embedded
+        return await asyncio.to_thread(self._merge_cached, texts, cached, missing, embedded, cache)
+
+    def create_collection(self,collection_name:str, embedding_size:int, sparse_vector_name:Optional[str]=None):
+        """Create a Qdrant collection with specified embedding size (and optional BM25 sparse vectors)"""
         try:
             self.client.create_collection(
             collection_name=collection_name,
             vectors_config=models.VectorParams(
                 size=embedding_size,
-                distance=models.Distance.COSINE))
+                distance=models.Distance.COSINE),
+            sparse_vectors_config={sparse_vector_name: sparse_vector_params()} if sparse_vector_name else None)
             logger.info(f"Collection {collection_name} successfuly created with embedding size {embedding_size}.")
         except Exception as e:
             raise vectorStorCreationError(f"Error creating collection {collection_name}: {e}")
@@ -171,10 +215,79 @@ class QdrantDB:
         if score_threshold is not None:
             search_kwargs["score_threshold"] = score_threshold
 
+        return await self._aquery_with_reconnect(search_kwargs, label="aquery_by_embedding")
+
+    async def ahas_sparse_vector(self, collection_name: str, vector_name: str = SPARSE_VECTOR_NAME) -> bool:
+        """Whether the collection stores the named sparse vector (cached per collection)."""
+        key = (collection_name, vector_name)
+        if key not in self._sparse_support:
+            try:
+                info = await self.async_client.get_collection(collection_name=collection_name)
+            except Exception as e:
+                logger.warning(f"Could not inspect '{collection_name}' for sparse vectors: {e}")
+                return False
+            sparse = getattr(info.config.params, "sparse_vectors", None) or {}
+            self._sparse_support[key] = vector_name in sparse
+        return self._sparse_support[key]
+
+    async def aquery_hybrid(
+        self,
+        collection_name: str,
+        query_embedding: list,
+        sparse_vector: models.SparseVector,
+        top_k: int = 5,
+        fetch_k: int = 48,
+        hnsw_ef: int = 128,
+        query_filter=None,
+        score_threshold: Optional[float] = None,
+        sparse_vector_name: str = SPARSE_VECTOR_NAME,
+        boost_filter=None,
+    ):
+        """Dense + BM25 sparse search fused with reciprocal-rank fusion in one request.
+
+        Each branch fetches ``fetch_k`` candidates (the dense branch honours
+        ``score_threshold``); returned scores are RRF scores, not cosine.
+        ``boost_filter`` adds the same two branches restricted to that filter,
+        so matching points rank higher without excluding everything else.
+        """
+        def _branches(branch_filter):
+            return [
+                models.Prefetch(
+                    query=query_embedding,
+                    limit=fetch_k,
+                    filter=branch_filter,
+                    params=SearchParams(hnsw_ef=hnsw_ef),
+                    score_threshold=score_threshold,
+                ),
+                models.Prefetch(
+                    query=sparse_vector,
+                    using=sparse_vector_name,
+                    limit=fetch_k,
+                    filter=branch_filter,
+                ),
+            ]
+
+        prefetch = _branches(query_filter)
+        if boost_filter is not None:
+            boosted = boost_filter
+            if query_filter is not None:
+                boosted = Filter(must=[query_filter, boost_filter])
+            prefetch += _branches(boosted)
+
+        search_kwargs: dict = dict(
+            collection_name=collection_name,
+            prefetch=prefetch,
+            query=models.FusionQuery(fusion=models.Fusion.RRF),
+            limit=top_k,
+        )
+        return await self._aquery_with_reconnect(search_kwargs, label="aquery_hybrid")
+
+    async def _aquery_with_reconnect(self, search_kwargs: dict, label: str):
+        collection_name = search_kwargs["collection_name"]
         for attempt in range(2):  # attempt 0 = normal, attempt 1 = after reconnect
             try:
                 result = (await self.async_client.query_points(**search_kwargs)).points
-                logger.info(f"aquery_by_embedding: {len(result)} points from '{collection_name}'.")
+                logger.info(f"{label}: {len(result)} points from '{collection_name}'.")
                 return result
             except ResponseHandlingException as e:
                 if attempt == 0:
@@ -0,0 +1,117 @@
+"""
+BM25 sparse vectors for hybrid (sparse + dense) Qdrant retrieval.
+
+Documents are encoded at indexing time with BM25 term-frequency saturation and
+length normalization; IDF is applied by Qdrant itself (sparse vector params
+with ``Modifier.IDF``), so it stays correct as books are added or removed
+without re-encoding stored points. Queries are encoded as unit weights over
+their unique terms.
+
+Terms are lower-cased alphanumeric tokens plus adjacent-token bigrams, so exact
+statutory phrases ("order 37", "rule 2", "54 specific") carry their own
+weight. Roman numerals after structural headings are normalized to digits
+("Order XXXVII" and "Order 37" produce the same terms) and plurals are folded
+("injunctions" -> "injunction"). Term ids are crc32 hashes of the term text.
+"""
+
+from __future__ import annotations
+
+import re
+import zlib
+from collections import Counter
+
+from qdrant_client import models
+
+
+SPARSE_VECTOR_NAME = "bm25"
+# Stored in the civil index manifest; bump when tokenization or weighting changes
+SPARSE_ENCODER_VERSION = "bm25-v1"
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+# Average chunk length in unigram tokens (civil chunks are ~1400 characters)
+BM25_AVG_DOC_LEN = 200.0
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_ROMAN_RE = re.compile(r"m{0,3}(cm|cd|d?c{0,3})(xc|xl|l?x{0,3})(ix|iv|v?i{0,3})")
+_ROMAN_VALUES = {"i": 1, "v": 5, "x": 10, "l": 50, "c": 100, "d": 500, "m": 1000}
+_NUMBERED_HEADINGS = frozenset({"order", "part", "chapter", "schedule", "appendix", "article"})
+_STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "of", "to", "in", "on", "at", "by", "for", "with",
+    "from", "as", "is", "are", "was", "were", "be", "been", "it", "its", "this", "that",
+    "these", "those", "which", "who", "whom", "such", "any", "all", "no", "not", "shall",
+    "may", "if", "than", "then", "so", "into", "upon", "there", "their", "he", "his",
+    "her", "she", "they", "them", "has", "have", "had", "do", "does", "did", "but",
+})
+
+
+def _roman_to_int(token: str) -> int | None:
+    if not token or not _ROMAN_RE.fullmatch(token):
+        return None
+    total = 0
+    prev = 0
+    for ch in reversed(token):
+        value = _ROMAN_VALUES[ch]
+        total = total - value if value < prev else total + value
+        prev = max(prev, value)
+    return total or None
+
+
+def _singular(token: str) -> str:
+    if len(token) <= 3 or token.isdigit():
+        return token
+    if token.endswith("ies"):
+        return token[:-3] + "y"
+    if token.endswith("s") and not token.endswith(("ss", "us", "is")):
+        return token[:-1]
+    return token
+
+
+def tokenize(text: str) -> list[str]:
+    """Lower-cased, singular tokens without stopwords; roman numerals after headings become digits."""
+    tokens: list[str] = []
+    previous = ""
+    for token in _TOKEN_RE.findall((text or "").lower()):
+        if previous in _NUMBERED_HEADINGS:
+            number = _roman_to_int(token)
+            if number is not None:
+                token = str(number)
+        previous = token
+        if token not in _STOPWORDS:
+            tokens.append(_singular(token))
+    return tokens
+
+
+def _terms(tokens: list[str]) -> list[str]:
+    return tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+
+
+def _term_id(term: str) -> int:
+    return zlib.crc32(term.encode("utf-8"))
+
+
+def _to_sparse(weights: dict[int, float]) -> models.SparseVector:
+    indices = sorted(weights)
+    return models.SparseVector(indices=indices, values=[weights[i] for i in indices])
+
+
+def encode_document(text: str) -> models.SparseVector:
+    """BM25 document-side weights (TF saturation and length normalization, no IDF)."""
+    tokens = tokenize(text)
+    if not tokens:
+        return models.SparseVector(indices=[], values=[])
+    norm = BM25_K1 * (1 - BM25_B + BM25_B * len(tokens) / BM25_AVG_DOC_LEN)
+    weights: dict[int, float] = {}
+    for term, tf in Counter(_terms(tokens)).items():
+        term_id = _term_id(term)
+        weights[term_id] = weights.get(term_id, 0.0) + tf * (BM25_K1 + 1) / (tf + norm)
+    return _to_sparse(weights)
+
+
+def encode_query(text: str) -> models.SparseVector:
+    """Unit weight per unique query term; Qdrant multiplies in the IDF."""
+    return _to_sparse({_term_id(term): 1.0 for term in set(_terms(tokenize(text)))})
+
+
+def sparse_vector_params() -> models.SparseVectorParams:
+    return models.SparseVectorParams(modifier=models.Modifier.IDF)
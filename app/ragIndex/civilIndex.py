@@ -4,28 +4,59 @@ Build and maintain a civil-law RAG index in Qdrant.
 This module ingests all supported files from the Books/books folder and upserts
 them into the `civil` collection using the shared Qdrant client and embeddings
 model from app.database.vectordatabse.qudrant.
+
+Indexing is incremental. A manifest records each book's content hash, chunker
+parameters, embedding model and chunk count:
+
+    - unchanged books (same hash/params/model, same point count in Qdrant) are skipped
+    - changed books re-embed only chunks whose point IDs are not already stored,
+      then their stale points are deleted
+    - books removed from disk have their points deleted
+
+PDF page extraction runs in a process pool, and embedding batches are computed
+in a thread pool ahead of the upserts that consume them.
+
+Each point also stores a BM25 sparse vector (``bm25``) for hybrid retrieval in
+app/utils/draftingAgent/qdrant_rag.py. Collections created before sparse
+vectors existed get the sparse config added (or are rebuilt with
+``recreate_on_mismatch=True`` where the server cannot add it), and their
+points are backfilled without re-embedding.
 """
 
 from __future__ import annotations
 
 import hashlib
 import json
+import os
 import re
 import time
 import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Iterable, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional
 
 from qdrant_client import models
 from qdrant_client.models import PointStruct
 
 try:
-    from ..config import logger
+    from ..config import logger, settings
     from ..database.vectordatabse.qudrant import qdrant_db
+    from ..database.vectordatabse.sparse_encoder import (
+        SPARSE_ENCODER_VERSION,
+        SPARSE_VECTOR_NAME,
+        encode_document,
+        sparse_vector_params,
+    )
 except ImportError:  # pragma: no cover - enables direct script execution
-    from app.config import logger
+    from app.config import logger, settings
     from app.database.vectordatabse.qudrant import qdrant_db
+    from app.database.vectordatabse.sparse_encoder import (
+        SPARSE_ENCODER_VERSION,
+        SPARSE_VECTOR_NAME,
+        encode_document,
+        sparse_vector_params,
+    )
 
 
 DEFAULT_COLLECTION_NAME = "civil"
@@ -34,6 +65,10 @@ DEFAULT_CHUNK_SIZE = 1400
 DEFAULT_CHUNK_OVERLAP = 200
 DEFAULT_EMBED_BATCH_SIZE = 64
 DEFAULT_UPSERT_BATCH_SIZE = 64
+DEFAULT_EXTRACT_WORKERS = min(4, os.cpu_count() or 1)
+DEFAULT_EMBED_CONCURRENCY = 4
+PDF_PAGES_PER_TASK = 40
+MANIFEST_VERSION = 1
 
 
 def _project_root() -> Path:
@@ -338,7 +373,28 @@ def _chunk_point_id(source_path: str, page_number: int | None, chunk_index: int,
     return str(uuid.uuid5(uuid.NAMESPACE_URL, raw))
 
 
-def _extract_pdf_payloads(
+def _extract_pdf_page_range(file_path: str, start: int, stop: int) -> list[tuple[int, str]]:
+    """Cleaned text of pages [start, stop) as (1-based page number, text). Runs in worker processes."""
+    try:
+        from pypdf import PdfReader
+    except ImportError as exc:  # pragma: no cover - dependency expected
+        raise RuntimeError("pypdf is required to index PDF books.") from exc
+
+    reader = PdfReader(file_path)
+    pages: list[tuple[int, str]] = []
+    for index in range(start, min(stop, len(reader.pages))):
+        pages.append((index + 1, _clean_text(reader.pages[index].extract_text() or "")))
+    return pages
+
+
+def _pdf_page_count(file_path: Path) -> int:
+    from pypdf import PdfReader
+
+    return len(PdfReader(str(file_path)).pages)
+
+
+def _payloads_from_pages(
+    pages: Iterable[tuple[int, str]],
     file_path: Path,
     project_root: Path,
     chunk_size: int,
@@ -346,20 +402,13 @@ def _extract_pdf_payloads(
     collection_name: str,
     indexed_at_utc: str,
 ) -> list[dict[str, Any]]:
-    try:
-        from pypdf import PdfReader
-    except ImportError as exc:  # pragma: no cover - dependency expected
-        raise RuntimeError("pypdf is required to index PDF books.") from exc
-
-    reader = PdfReader(str(file_path))
     payloads: list[dict[str, Any]] = []
     source_path = _safe_relative_path(file_path, project_root)
     book_title = file_path.stem.replace("_", " ").strip()
     file_size_bytes = file_path.stat().st_size
     global_chunk_index = 0
 
-    for page_number, page in enumerate(reader.pages, start=1):
-        page_text = _clean_text(page.extract_text() or "")
+    for page_number, page_text in pages:
         if not page_text:
             continue
 
@@ -386,6 +435,26 @@ def _extract_pdf_payloads(
     return payloads
 
 
+def _extract_pdf_payloads(
+    file_path: Path,
+    project_root: Path,
+    chunk_size: int,
+    chunk_overlap: int,
+    collection_name: str,
+    indexed_at_utc: str,
+) -> list[dict[str, Any]]:
+    pages = _extract_pdf_page_range(str(file_path), 0, _pdf_page_count(file_path))
+    return _payloads_from_pages(
+        pages,
+        file_path=file_path,
+        project_root=project_root,
+        chunk_size=chunk_size,
+        chunk_overlap=chunk_overlap,
+        collection_name=collection_name,
+        indexed_at_utc=indexed_at_utc,
+    )
+
+
 def _extract_text_payloads(
     file_path: Path,
     project_root: Path,
@@ -491,7 +560,11 @@ def _ensure_collection(
 
     state = "existing"
     if not exists:
-        qdrant_db.create_collection(collection_name=collection_name, embedding_size=embedding_size)
+        qdrant_db.create_collection(
+            collection_name=collection_name,
+            embedding_size=embedding_size,
+            sparse_vector_name=SPARSE_VECTOR_NAME,
+        )
         state = "created"
     else:
         info = client.get_collection(collection_name=collection_name)
@@ -510,7 +583,11 @@ def _ensure_collection(
                 embedding_size,
             )
             qdrant_db.delete_collection(collection_name=collection_name)
-            qdrant_db.create_collection(collection_name=collection_name, embedding_size=embedding_size)
+            qdrant_db.create_collection(
+                collection_name=collection_name,
+                embedding_size=embedding_size,
+                sparse_vector_name=SPARSE_VECTOR_NAME,
+            )
             state = "recreated"
 
     keyword_fields = [
@@ -588,6 +665,196 @@ def _upsert_points_with_retry(
             time.sleep(delay)
 
 
+# ---------------------------------------------------------------------------
+# Manifest
+# ---------------------------------------------------------------------------
+
+def _default_manifest_path(collection_name: str) -> Path:
+    return _project_root() / ".cache" / "rag_index" / f"{collection_name}.manifest.json"
+
+
+def _load_manifest(path: Path) -> dict[str, Any]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {"version": MANIFEST_VERSION, "books": {}}
+    if data.get("version") != MANIFEST_VERSION or not isinstance(data.get("books"), dict):
+        return {"version": MANIFEST_VERSION, "books": {}}
+    return data
+
+
+def _save_manifest(path: Path, manifest: dict[str, Any]) -> None:
+    """Write atomically so an interrupted run never leaves a truncated manifest."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_text(json.dumps(manifest, indent=2, sort_keys=True), encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _file_sha256(file_path: Path, previous: Optional[dict[str, Any]] = None) -> str:
+    """Content hash; reused from the manifest when size and mtime are unchanged."""
+    stat = file_path.stat()
+    if previous and previous.get("size") == stat.st_size and previous.get("mtime_ns") == stat.st_mtime_ns:
+        return previous["sha256"]
+    digest = hashlib.sha256()
+    with file_path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _embedding_model_name() -> str:
+    return str(getattr(settings, "embeddings_model_name", "") or "")
+
+
+def _source_filter(source_path: str, keep_ids: Optional[list[str]] = None) -> models.Filter:
+    must_not = [models.HasIdCondition(has_id=keep_ids)] if keep_ids else None
+    return models.Filter(
+        must=[models.FieldCondition(key="source_path", match=models.MatchValue(value=source_path))],
+        must_not=must_not,
+    )
+
+
+def _count_source_points(collection_name: str, source_path: str) -> int:
+    result = qdrant_db.client.count(
+        collection_name=collection_name,
+        count_filter=_source_filter(source_path),
+        exact=True,
+    )
+    return int(getattr(result, "count", 0))
+
+
+def _delete_source_points(collection_name: str, source_path: str, keep_ids: Optional[list[str]] = None) -> None:
+    qdrant_db.client.delete(
+        collection_name=collection_name,
+        points_selector=models.FilterSelector(filter=_source_filter(source_path, keep_ids)),
+        wait=True,
+    )
+
+
+def _existing_point_ids(collection_name: str, point_ids: list[str], batch_size: int = 256) -> set[str]:
+    existing: set[str] = set()
+    for batch in _iter_batches(point_ids, batch_size):
+        records = qdrant_db.client.retrieve(
+            collection_name=collection_name,
+            ids=batch,
+            with_payload=False,
+            with_vectors=False,
+        )
+        existing.update(str(record.id) for record in records)
+    return existing
+
+
+def _collection_exists(collection_name: str) -> bool:
+    client = qdrant_db.client
+    if hasattr(client, "collection_exists"):
+        return bool(client.collection_exists(collection_name=collection_name))
+    try:
+        client.get_collection(collection_name=collection_name)
+        return True
+    except Exception:
+        return False
+
+
+def _has_sparse_vectors(collection_name: str) -> bool:
+    info = qdrant_db.client.get_collection(collection_name=collection_name)
+    sparse = getattr(info.config.params, "sparse_vectors", None) or {}
+    return SPARSE_VECTOR_NAME in sparse
+
+
+def _ensure_sparse_vectors(collection_name: str, recreate_on_mismatch: bool) -> tuple[bool, str]:
+    """Make an existing collection accept BM25 sparse vectors.
+
+    Returns (hybrid_enabled, collection_state). Servers that cannot add a sparse
+    vector to an existing collection need ``recreate_on_mismatch=True``; the
+    rebuild re-embeds through the embedding cache.
+    """
+    if _has_sparse_vectors(collection_name):
+        return True, "existing"
+    try:
+        qdrant_db.client.update_collection(
+            collection_name=collection_name,
+            sparse_vectors_config={SPARSE_VECTOR_NAME: sparse_vector_params()},
+        )
+        if _has_sparse_vectors(collection_name):
+            logger.info("Added '%s' sparse vectors to '%s'.", SPARSE_VECTOR_NAME, collection_name)
+            return True, "existing"
+    except Exception as exc:
+        logger.warning("Could not add sparse vectors to '%s': %s", collection_name, exc)
+
+    if not recreate_on_mismatch:
+        logger.warning(
+            "Collection '%s' has no '%s' sparse vectors; indexing dense-only. "
+            "Set recreate_on_mismatch=True to rebuild it for hybrid retrieval.",
+            collection_name,
+            SPARSE_VECTOR_NAME,
+        )
+        return False, "existing"
+
+    embedding_size = _extract_existing_vector_size(qdrant_db.client.get_collection(collection_name=collection_name))
+    logger.warning("Recreating collection '%s' to add sparse vectors.", collection_name)
+    qdrant_db.delete_collection(collection_name=collection_name)
+    _ensure_collection(collection_name, embedding_size=embedding_size, recreate_on_mismatch=False)
+    return True, "recreated"
+
+
+def _backfill_sparse_vectors(collection_name: str, payloads: list[dict[str, Any]], batch_size: int) -> None:
+    """Attach BM25 vectors to points that were indexed before sparse vectors existed."""
+    for batch in _iter_batches(payloads, batch_size):
+        qdrant_db.client.update_vectors(
+            collection_name=collection_name,
+            points=[
+                models.PointVectors(
+                    id=payload["chunk_id"],
+                    vector={SPARSE_VECTOR_NAME: encode_document(payload["document"])},
+                )
+                for payload in batch
+            ],
+            wait=False,
+        )
+
+
+# ---------------------------------------------------------------------------
+# Parallel extraction / pipelined embedding
+# ---------------------------------------------------------------------------
+
+def _submit_extraction(
+    file_path: Path,
+    pool: Optional[ProcessPoolExecutor],
+) -> Callable[[], list[tuple[int, str]]]:
+    """Queue page extraction for a PDF; returns a callable yielding its (page, text) list."""
+    if pool is None:
+        return lambda: _extract_pdf_page_range(str(file_path), 0, _pdf_page_count(file_path))
+
+    page_count = _pdf_page_count(file_path)
+    futures = [
+        pool.submit(_extract_pdf_page_range, str(file_path), start, start + PDF_PAGES_PER_TASK)
+        for start in range(0, page_count, PDF_PAGES_PER_TASK)
+    ]
+    return lambda: [page for future in futures for page in future.result()]
+
+
+def _embedded_batches(
+    payloads: list[dict[str, Any]],
+    batch_size: int,
+    executor: ThreadPoolExecutor,
+    window: int,
+) -> Iterator[tuple[list[dict[str, Any]], list[list[float]]]]:
+    """Yield (payload batch, embeddings) in order, keeping up to `window` batches in flight."""
+    batches = list(_iter_batches(payloads, batch_size))
+    in_flight: list[tuple[list[dict[str, Any]], Future]] = []
+    next_batch = 0
+    while next_batch < len(batches) or in_flight:
+        while next_batch < len(batches) and len(in_flight) < max(1, window):
+            batch = batches[next_batch]
+            in_flight.append((batch, executor.submit(
+                qdrant_db.get_embeddings_batch, [item["document"] for item in batch],
+            )))
+            next_batch += 1
+        batch, future = in_flight.pop(0)
+        yield batch, future.result()
+
+
 def build_civil_index(
     books_dir: str | Path | None = None,
     collection_name: str = DEFAULT_COLLECTION_NAME,
@@ -596,14 +863,24 @@ def build_civil_index(
     chunk_overlap: int = DEFAULT_CHUNK_OVERLAP,
     embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE,
     upsert_batch_size: int = DEFAULT_UPSERT_BATCH_SIZE,
+    manifest_path: str | Path | None = None,
+    force: bool = False,
+    extract_workers: int = DEFAULT_EXTRACT_WORKERS,
+    embed_concurrency: int = DEFAULT_EMBED_CONCURRENCY,
 ) -> dict[str, Any]:
     """
     Build/update the civil RAG index from all files in Books/books.
 
+    Only books whose content, chunker parameters or embedding model changed
+    since the last run (per the manifest) are extracted and embedded.
+    `force=True` ignores the manifest and re-indexes every book.
+
     Returns a summary dict with counts, errors, and final collection status.
     """
+    started = time.perf_counter()
     project_root = _project_root()
     books_path = _resolve_books_dir(books_dir)
+    manifest_file = Path(manifest_path) if manifest_path else _default_manifest_path(collection_name)
 
     summary: dict[str, Any] = {
         "status": "success",
@@ -611,12 +888,16 @@ def build_civil_index(
         "books_dir": str(books_path),
         "books_discovered": 0,
         "books_processed": 0,
+        "books_unchanged": 0,
+        "books_removed": 0,
         "books_failed": 0,
         "books_skipped_empty": 0,
         "chunks_discovered": 0,
+        "chunks_reused": 0,
         "chunks_upserted": 0,
         "collection_state": "unknown",
         "final_point_count": None,
+        "elapsed_s": None,
         "errors": [],
     }
 
@@ -644,99 +925,244 @@ def build_civil_index(
         logger.exception("Qdrant connectivity check failed before indexing.")
         return summary
 
-    indexed_at_utc = datetime.now(timezone.utc).isoformat()
-    collection_ready = False
+    manifest = {"version": MANIFEST_VERSION, "books": {}} if force else _load_manifest(manifest_file)
+    previous_books: dict[str, Any] = manifest["books"]
+    collection_ready = _collection_exists(collection_name)
+    hybrid = True
+    if collection_ready:
+        try:
+            hybrid, summary["collection_state"] = _ensure_sparse_vectors(collection_name, recreate_on_mismatch)
+        except Exception as exc:
+            summary["status"] = "failed"
+            summary["errors"].append(f"Could not prepare sparse vectors for '{collection_name}': {exc}")
+            logger.exception("Sparse vector setup failed for %s", collection_name)
+            return summary
+    embedding_model = _embedding_model_name()
+    params = {
+        "chunk_size": chunk_size,
+        "chunk_overlap": chunk_overlap,
+        "embedding_model": embedding_model,
+        "sparse_encoder": SPARSE_ENCODER_VERSION if hybrid else None,
+    }
 
+    # 1. Decide which books need work.
+    pending: list[tuple[Path, str, str, dict[str, Any]]] = []
+    current_sources: set[str] = set()
     for file_path in book_files:
+        source_path = _safe_relative_path(file_path, project_root)
+        current_sources.add(source_path)
+        previous = previous_books.get(source_path)
         try:
-            payloads = _extract_payloads_for_file(
-                file_path=file_path,
-                project_root=project_root,
-                chunk_size=chunk_size,
-                chunk_overlap=chunk_overlap,
-                collection_name=collection_name,
-                indexed_at_utc=indexed_at_utc,
-            )
-        except Exception as exc:
+            sha256 = _file_sha256(file_path, previous)
+        except OSError as exc:
             summary["books_failed"] += 1
-            summary["errors"].append(f"Extraction failed for {file_path.name}: {exc}")
-            logger.exception("Failed extracting chunks from %s", file_path)
+            summary["errors"].append(f"Could not read {file_path.name}: {exc}")
             continue
 
-        if not payloads:
-            summary["books_skipped_empty"] += 1
-            logger.warning("Skipping empty/unsupported content file: %s", file_path.name)
+        unchanged = (
+            collection_ready
+            and previous is not None
+            and previous.get("sha256") == sha256
+            and all(previous.get(key) == value for key, value in params.items())
+        )
+        if unchanged:
+            try:
+                unchanged = _count_source_points(collection_name, source_path) == previous.get("chunk_count")
+            except Exception as exc:
+                logger.warning("Point count check failed for %s, re-indexing: %s", source_path, exc)
+                unchanged = False
+        if unchanged:
+            summary["books_unchanged"] += 1
             continue
+        pending.append((file_path, source_path, sha256, previous or {}))
 
-        summary["chunks_discovered"] += len(payloads)
-        file_upserted = 0
-
+    # 2. Drop points of books no longer on disk.
+    for source_path in sorted(set(previous_books) - current_sources):
         try:
-            for payload_batch in _iter_batches(payloads, batch_size=embed_batch_size):
-                documents = [item["document"] for item in payload_batch]
-                embeddings = qdrant_db.get_embeddings_batch(documents)
-
-                if len(embeddings) != len(payload_batch):
-                    raise ValueError(
-                        f"Embedding count mismatch for {file_path.name}: "
-                        f"{len(embeddings)} != {len(payload_batch)}"
-                    )
+            if collection_ready:
+                _delete_source_points(collection_name, source_path)
+            del previous_books[source_path]
+            summary["books_removed"] += 1
+            logger.info("Removed points for deleted book %s from '%s'.", source_path, collection_name)
+        except Exception as exc:
+            summary["errors"].append(f"Could not remove points for {source_path}: {exc}")
+    if summary["books_removed"]:
+        _save_manifest(manifest_file, manifest)
+
+    # 3. Extract (PDF pages in a process pool), embed ahead of upserts, prune stale points.
+    indexed_at_utc = datetime.now(timezone.utc).isoformat()
+    pdf_count = sum(1 for item in pending if item[0].suffix.lower() == ".pdf")
+    use_pool = extract_workers > 1 and pdf_count > 0
+    pool = ProcessPoolExecutor(max_workers=extract_workers) if use_pool else None
+    embedder = ThreadPoolExecutor(max_workers=max(1, embed_concurrency), thread_name_prefix="civil-embed")
 
-                if not collection_ready:
-                    summary["collection_state"] = _ensure_collection(
+    try:
+        # Queue every PDF up front so workers stay busy while earlier books embed.
+        extractions: list[Callable[[], list[tuple[int, str]]] | Exception | None] = []
+        for file_path, *_ in pending:
+            if file_path.suffix.lower() != ".pdf":
+                extractions.append(None)
+                continue
+            try:
+                extractions.append(_submit_extraction(file_path, pool))
+            except Exception as exc:
+                extractions.append(exc)
+
+        for (file_path, source_path, sha256, previous), extract in zip(pending, extractions):
+            try:
+                if isinstance(extract, Exception):
+                    raise extract
+                if extract is not None:
+                    payloads = _payloads_from_pages(
+                        extract(),
+                        file_path=file_path,
+                        project_root=project_root,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
                         collection_name=collection_name,
-                        embedding_size=len(embeddings[0]),
-                        recreate_on_mismatch=recreate_on_mismatch,
+                        indexed_at_utc=indexed_at_utc,
                     )
-                    collection_ready = True
-
-                paired = list(zip(payload_batch, embeddings))
-                for pair_batch in _iter_batches(paired, batch_size=upsert_batch_size):
-                    points = [
-                        PointStruct(
-                            id=payload["chunk_id"],
-                            vector=vector,
-                            payload=payload,
-                        )
-                        for payload, vector in pair_batch
-                    ]
-                    written = _upsert_points_with_retry(
+                else:
+                    payloads = _extract_text_payloads(
+                        file_path=file_path,
+                        project_root=project_root,
+                        chunk_size=chunk_size,
+                        chunk_overlap=chunk_overlap,
                         collection_name=collection_name,
-                        points=points,
+                        indexed_at_utc=indexed_at_utc,
+                    )
+            except Exception as exc:
+                summary["books_failed"] += 1
+                summary["errors"].append(f"Extraction failed for {file_path.name}: {exc}")
+                logger.exception("Failed extracting chunks from %s", file_path)
+                continue
+
+            if not payloads:
+                summary["books_skipped_empty"] += 1
+                logger.warning("Skipping empty/unsupported content file: %s", file_path.name)
+                continue
+
+            summary["chunks_discovered"] += len(payloads)
+            point_ids = [payload["chunk_id"] for payload in payloads]
+            file_upserted = 0
+
+            try:
+                # Point IDs hash the chunk text, so stored IDs embedded with the
+                # same model can be kept as they are.
+                reusable: set[str] = set()
+                if collection_ready and previous.get("embedding_model") == embedding_model:
+                    reusable = _existing_point_ids(collection_name, point_ids)
+                to_embed = [payload for payload in payloads if payload["chunk_id"] not in reusable]
+                if hybrid and reusable and previous.get("sparse_encoder") != SPARSE_ENCODER_VERSION:
+                    _backfill_sparse_vectors(
+                        collection_name,
+                        [payload for payload in payloads if payload["chunk_id"] in reusable],
+                        upsert_batch_size,
                     )
-                    file_upserted += written
-
-            summary["books_processed"] += 1
-            summary["chunks_upserted"] += file_upserted
-            logger.info(
-                "Indexed %s chunks from %s into '%s'.",
-                file_upserted,
-                file_path.name,
-                collection_name,
-            )
 
-        except Exception as exc:
-            summary["books_failed"] += 1
-            summary["errors"].append(f"Upsert failed for {file_path.name}: {exc}")
-            logger.exception("Failed indexing file %s", file_path.name)
+                for payload_batch, embeddings in _embedded_batches(
+                    to_embed, embed_batch_size, embedder, window=embed_concurrency,
+                ):
+                    if len(embeddings) != len(payload_batch):
+                        raise ValueError(
+                            f"Embedding count mismatch for {file_path.name}: "
+                            f"{len(embeddings)} != {len(payload_batch)}"
+                        )
+
+                    if not collection_ready:
+                        summary["collection_state"] = _ensure_collection(
+                            collection_name=collection_name,
+                            embedding_size=len(embeddings[0]),
+                            recreate_on_mismatch=recreate_on_mismatch,
+                        )
+                        collection_ready = True
+
+                    paired = list(zip(payload_batch, embeddings))
+                    for pair_batch in _iter_batches(paired, batch_size=upsert_batch_size):
+                        points = [
+                            PointStruct(
+                                id=payload["chunk_id"],
+                                vector=(
+                                    {"": vector, SPARSE_VECTOR_NAME: encode_document(payload["document"])}
+                                    if hybrid else vector
+                                ),
+                                payload=payload,
+                            )
+                            for payload, vector in pair_batch
+                        ]
+                        written = _upsert_points_with_retry(
+                            collection_name=collection_name,
+                            points=points,
+                        )
+                        file_upserted += written
+
+                if previous and collection_ready:
+                    _delete_source_points(collection_name, source_path, keep_ids=point_ids)
+
+                stat = file_path.stat()
+                previous_books[source_path] = {
+                    "sha256": sha256,
+                    "size": stat.st_size,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "chunk_count": len(payloads),
+                    "indexed_at_utc": indexed_at_utc,
+                    **params,
+                }
+                _save_manifest(manifest_file, manifest)
+
+                summary["books_processed"] += 1
+                summary["chunks_upserted"] += file_upserted
+                summary["chunks_reused"] += len(payloads) - len(to_embed)
+                logger.info(
+                    "Indexed %s chunks (%s reused) from %s into '%s'.",
+                    file_upserted,
+                    len(payloads) - len(to_embed),
+                    file_path.name,
+                    collection_name,
+                )
+
+            except Exception as exc:
+                summary["books_failed"] += 1
+                summary["errors"].append(f"Upsert failed for {file_path.name}: {exc}")
+                logger.exception("Failed indexing file %s", file_path.name)
+    finally:
+        embedder.shutdown(wait=True)
+        if pool is not None:
+            pool.shutdown(wait=True)
 
-    if summary["books_processed"] == 0:
+    if summary["books_processed"] == 0 and summary["books_unchanged"] == 0:
         summary["status"] = "failed" if summary["errors"] else "skipped"
 
-    try:
-        count_result = qdrant_db.client.count(
-            collection_name=collection_name,
-            exact=True,
-        )
-        summary["final_point_count"] = int(getattr(count_result, "count", 0))
-    except Exception as exc:
-        summary["errors"].append(f"Could not fetch final point count: {exc}")
+    if collection_ready:
+        try:
+            count_result = qdrant_db.client.count(
+                collection_name=collection_name,
+                exact=True,
+            )
+            summary["final_point_count"] = int(getattr(count_result, "count", 0))
+        except Exception as exc:
+            summary["errors"].append(f"Could not fetch final point count: {exc}")
 
+    summary["elapsed_s"] = round(time.perf_counter() - started, 2)
     return summary
 
 
 def main() -> None:
-    result = build_civil_index()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Build/update the civil RAG index incrementally")
+    parser.add_argument("--books-dir", default=None)
+    parser.add_argument("--collection", default=DEFAULT_COLLECTION_NAME)
+    parser.add_argument("--force", action="store_true", help="Ignore the manifest and re-index every book")
+    parser.add_argument("--workers", type=int, default=DEFAULT_EXTRACT_WORKERS, help="PDF extraction processes")
+    args = parser.parse_args()
+
+    result = build_civil_index(
+        books_dir=args.books_dir,
+        collection_name=args.collection,
+        force=args.force,
+        extract_workers=args.workers,
+    )
     print(json.dumps(result, indent=2))
 
 
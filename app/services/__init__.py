@@ -1,3 +1,5 @@
 from .llm_service import openai_model, draft_openai_model, draft_ollama_model, review_openai_model, review_ollama_model, nvidia_model, ollma_model, glm_model
+from .llm_limiter import ainvoke_llm, get_llm_limiter_stats
+from .llm_cache import get_llm_cache_stats
 
-__all__ = ["openai_model", "draft_openai_model", "draft_ollama_model", "review_openai_model", "review_ollama_model", "nvidia_model", "ollma_model", "glm_model"]
\ No newline at end of file
+__all__ = ["openai_model", "draft_openai_model", "draft_ollama_model", "review_openai_model", "review_ollama_model", "nvidia_model", "ollma_model", "glm_model", "ainvoke_llm", "get_llm_limiter_stats", "get_llm_cache_stats"]
\ No newline at end of file
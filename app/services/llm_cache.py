@@ -0,0 +1,297 @@
+"""
+Content-addressed LLM response cache for the drafting graph.
+
+A LangChain ``BaseCache`` attached by ``_LazyModel`` to the drafting models
+(``cache_responses=True``). Entries are keyed on sha256 of:
+
+    - the model's ``llm_string`` (provider, model name, temperature, reasoning,
+      bound kwargs such as structured-output schema / format, stop words)
+    - the normalized messages (message ids dropped; CRLF and trailing spaces
+      removed from content)
+
+Storage is one table in SQLite (default, ``DRAFTING_LLM_CACHE_PATH``) or the
+application's PostgreSQL database (``DRAFTING_LLM_CACHE_BACKEND=postgres``).
+Entries older than ``DRAFTING_LLM_CACHE_TTL_SECONDS`` are ignored and purged;
+above ``DRAFTING_LLM_CACHE_MAX_ENTRIES`` the least recently used are evicted.
+
+The graph node making the call is read from the LangGraph run config, which
+gives per-node hit/miss counters and per-node opt-out
+(``DRAFTING_LLM_CACHE_SKIP_NODES``). Retries that resend identical messages
+bypass the lookup via ``ainvoke_llm(..., cache=False)`` and overwrite the
+entry with the fresh response.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import defaultdict
+from typing import Any, Dict, Optional, Sequence
+
+from langchain_core.caches import RETURN_VAL_TYPE, BaseCache
+from langchain_core.messages import messages_from_dict, message_to_dict
+from langchain_core.outputs import ChatGeneration, Generation
+from langchain_core.runnables.config import var_child_runnable_config
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table, Text, create_engine, delete, func, select, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import Engine
+
+from ..config import logger, settings
+
+
+# Set by ainvoke_llm(cache=False): skip the lookup but still store the response
+llm_cache_bypass: contextvars.ContextVar[bool] = contextvars.ContextVar("llm_cache_bypass", default=False)
+
+_metadata = MetaData()
+llm_cache_table = Table(
+    "drafting_llm_cache",
+    _metadata,
+    Column("key", String(64), primary_key=True),
+    Column("node", String(64), nullable=False, default=""),
+    Column("llm_string", Text, nullable=False),
+    Column("value", Text, nullable=False),
+    Column("created_at", Float, nullable=False),
+    Column("last_used_at", Float, nullable=False, index=True),
+    Column("hits", Integer, nullable=False, default=0),
+)
+
+# Writes between TTL purge / LRU eviction passes
+_EVICT_EVERY = 100
+
+
+def current_node() -> str:
+    """Name of the LangGraph node running the current call ("" outside a graph)."""
+    config = var_child_runnable_config.get() or {}
+    return (config.get("metadata") or {}).get("langgraph_node") or ""
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Drop message ids and normalize content whitespace in a serialized message list."""
+    try:
+        messages = json.loads(prompt)
+    except (TypeError, ValueError):
+        return prompt
+    if not isinstance(messages, list):
+        return prompt
+
+    normalized = []
+    for message in messages:
+        kwargs = dict(message.get("kwargs", {})) if isinstance(message, dict) else {}
+        kwargs.pop("id", None)
+        content = kwargs.get("content", "")
+        if isinstance(content, str):
+            kwargs["content"] = "\n".join(
+                line.rstrip() for line in content.replace("\r\n", "\n").split("\n")
+            ).strip()
+        normalized.append(kwargs)
+    return json.dumps(normalized, ensure_ascii=False, sort_keys=True, default=str)
+
+
+def cache_key(prompt: str, llm_string: str) -> str:
+    return hashlib.sha256(f"{llm_string}\x00{normalize_prompt(prompt)}".encode("utf-8")).hexdigest()
+
+
+def _dump_generations(generations: Sequence[Generation]) -> str:
+    return json.dumps([
+        {"message": message_to_dict(g.message)} if isinstance(g, ChatGeneration) else {"text": g.text}
+        for g in generations
+    ])
+
+
+def _load_generations(value: str) -> RETURN_VAL_TYPE:
+    generations = []
+    for item in json.loads(value):
+        if "message" in item:
+            generations.append(ChatGeneration(message=messages_from_dict([item["message"]])[0]))
+        else:
+            generations.append(Generation(text=item["text"]))
+    return generations
+
+
+class DraftingLLMCache(BaseCache):
+    """SQLAlchemy-backed response cache with TTL, LRU eviction and per-node counters."""
+
+    def __init__(
+        self,
+        engine: Engine,
+        ttl_seconds: float = 0,
+        max_entries: int = 0,
+        skip_nodes: Sequence[str] = (),
+        clock=time.time,
+    ):
+        self.engine = engine
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.skip_nodes = frozenset(n for n in skip_nodes if n)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._writes = 0
+        self._stats: Dict[str, Dict[str, int]] = defaultdict(
+            lambda: {"hits": 0, "misses": 0, "writes": 0, "bypassed": 0, "skipped": 0}
+        )
+        _metadata.create_all(engine, tables=[llm_cache_table])
+
+    def _count(self, node: str, counter: str) -> None:
+        with self._lock:
+            self._stats[node or "-"][counter] += 1
+
+    def _expired(self, created_at: float, now: float) -> bool:
+        return bool(self.ttl_seconds) and created_at < now - self.ttl_seconds
+
+    def lookup(self, prompt: str, llm_string: str) -> Optional[RETURN_VAL_TYPE]:
+        node = current_node()
+        if node in self.skip_nodes:
+            self._count(node, "skipped")
+            return None
+        if llm_cache_bypass.get():
+            self._count(node, "bypassed")
+            return None
+
+        key = cache_key(prompt, llm_string)
+        now = self._clock()
+        try:
+            with self.engine.begin() as conn:
+                row = conn.execute(
+                    select(llm_cache_table.c.value, llm_cache_table.c.created_at)
+                    .where(llm_cache_table.c.key == key)
+                ).first()
+                if row is None or self._expired(row.created_at, now):
+                    self._count(node, "misses")
+                    return None
+                conn.execute(
+                    update(llm_cache_table)
+                    .where(llm_cache_table.c.key == key)
+                    .values(last_used_at=now, hits=llm_cache_table.c.hits + 1)
+                )
+            self._count(node, "hits")
+            return _load_generations(row.value)
+        except Exception as e:
+            logger.warning(f"LLM cache lookup failed for node {node or '-'}: {e}")
+            self._count(node, "misses")
+            return None
+
+    def update(self, prompt: str, llm_string: str, return_val: RETURN_VAL_TYPE) -> None:
+        node = current_node()
+        if node in self.skip_nodes:
+            return
+        now = self._clock()
+        values = {
+            "key": cache_key(prompt, llm_string),
+            "node": node,
+            "llm_string": llm_string,
+            "value": _dump_generations(return_val),
+            "created_at": now,
+            "last_used_at": now,
+            "hits": 0,
+        }
+        insert = pg_insert if self.engine.dialect.name == "postgresql" else sqlite_insert
+        stmt = insert(llm_cache_table).values(**values)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[llm_cache_table.c.key],
+            set_={k: stmt.excluded[k] for k in ("node", "value", "created_at", "last_used_at", "hits")},
+        )
+        try:
+            with self.engine.begin() as conn:
+                conn.execute(stmt)
+            self._count(node, "writes")
+            with self._lock:
+                self._writes += 1
+                due = self._writes % _EVICT_EVERY == 1
+            if due:
+                self.evict(now)
+        except Exception as e:
+            logger.warning(f"LLM cache write failed for node {node or '-'}: {e}")
+
+    def evict(self, now: Optional[float] = None) -> int:
+        """Purge expired entries, then trim to max_entries by least recent use."""
+        now = self._clock() if now is None else now
+        removed = 0
+        with self.engine.begin() as conn:
+            if self.ttl_seconds:
+                removed += conn.execute(
+                    delete(llm_cache_table).where(llm_cache_table.c.created_at < now - self.ttl_seconds)
+                ).rowcount or 0
+            if self.max_entries:
+                excess = conn.execute(select(func.count()).select_from(llm_cache_table)).scalar_one() - self.max_entries
+                if excess > 0:
+                    oldest = (
+                        select(llm_cache_table.c.key)
+                        .order_by(llm_cache_table.c.last_used_at)
+                        .limit(excess)
+                        .scalar_subquery()
+                    )
+                    removed += conn.execute(
+                        delete(llm_cache_table).where(llm_cache_table.c.key.in_(oldest))
+                    ).rowcount or 0
+        if removed:
+            logger.info(f"LLM cache evicted {removed} entries")
+        return removed
+
+    def clear(self, **kwargs: Any) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(delete(llm_cache_table))
+
+    def stats(self) -> Dict[str, Dict[str, int]]:
+        with self._lock:
+            return {node: dict(counters) for node, counters in self._stats.items()}
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+
+_cache: Optional[DraftingLLMCache] = None
+_cache_lock = threading.Lock()
+
+
+def _build_engine() -> Engine:
+    if settings.DRAFTING_LLM_CACHE_BACKEND == "postgres":
+        from ..database.postgresql.postgresql_connection import engine
+
+        return engine
+    path = settings.DRAFTING_LLM_CACHE_PATH
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    return create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+
+
+def get_llm_cache() -> Optional[DraftingLLMCache]:
+    """Process-wide drafting LLM cache, or None when disabled or unavailable."""
+    global _cache
+    if not settings.DRAFTING_LLM_CACHE_ENABLED:
+        return None
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                try:
+                    _cache = DraftingLLMCache(
+                        _build_engine(),
+                        ttl_seconds=settings.DRAFTING_LLM_CACHE_TTL_SECONDS,
+                        max_entries=settings.DRAFTING_LLM_CACHE_MAX_ENTRIES,
+                        skip_nodes=[n.strip() for n in settings.DRAFTING_LLM_CACHE_SKIP_NODES.split(",")],
+                    )
+                except Exception as e:
+                    logger.warning(f"LLM cache unavailable ({settings.DRAFTING_LLM_CACHE_BACKEND}): {e}")
+                    return None
+    return _cache
+
+
+def attach_llm_cache(model):
+    """Return a shallow copy of a chat model that reads/writes the drafting cache.
+
+    A copy is used because fallbacks such as ``openai_model`` are shared with
+    agents that must never be served cached responses.
+    """
+    cache = get_llm_cache()
+    if cache is None or model is None or not hasattr(model, "model_copy") or "cache" not in type(model).model_fields:
+        return model
+    return model.model_copy(update={"cache": cache})
+
+
+def get_llm_cache_stats() -> Dict[str, Dict[str, int]]:
+    """Per-node counters: hits, misses, writes, bypassed (retries) and skipped (opt-out)."""
+    return _cache.stats() if _cache is not None else {}
@@ -0,0 +1,127 @@
+"""
+Async LLM call limiter for graph nodes.
+
+Every drafting-graph LLM call goes through ``ainvoke_llm`` so that:
+
+    - calls never block the event loop (``ainvoke`` instead of ``invoke``)
+    - at most ``DRAFTING_LLM_MAX_CONCURRENCY`` calls per underlying model are
+      in flight across all concurrent graph sessions; the rest queue
+    - a call that exceeds ``DRAFTING_LLM_TIMEOUT`` seconds raises ``TimeoutError``
+      instead of pinning a session forever
+
+Limits are keyed by the provider model (e.g. ``ChatOllama:glm-5:cloud``), so
+``with_structured_output`` / ``bind`` wrappers around the same model share
+one limit.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from typing import Any, Dict, Optional
+
+from ..config import settings
+from .llm_cache import llm_cache_bypass
+
+
+# asyncio primitives are bound to the loop they are first used on, so
+# semaphores are kept per event loop and dropped with it.
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Semaphore]]" = (
+    weakref.WeakKeyDictionary()
+)
+_stats: Dict[str, Dict[str, int]] = {}
+
+
+def _underlying_model(model: Any) -> Any:
+    """Unwrap lazy wrappers, structured-output sequences and bindings."""
+    for _ in range(8):
+        if hasattr(model, "resolve_model"):
+            model = model.resolve_model()
+        elif hasattr(model, "first") and hasattr(model, "last"):
+            model = model.first
+        elif hasattr(model, "bound"):
+            model = model.bound
+        else:
+            break
+    return model
+
+
+def limiter_key(model: Any) -> str:
+    """Concurrency key for a model or any runnable wrapping one."""
+    base = _underlying_model(model)
+    name = getattr(base, "model_name", None) or getattr(base, "model", None)
+    if not isinstance(name, str) or not name:
+        return type(base).__name__
+    return f"{type(base).__name__}:{name}"
+
+
+def _semaphore(key: str, limit: int) -> asyncio.Semaphore:
+    loop = asyncio.get_running_loop()
+    per_loop = _semaphores.setdefault(loop, {})
+    if key not in per_loop:
+        per_loop[key] = asyncio.Semaphore(max(1, limit))
+    return per_loop[key]
+
+
+async def ainvoke_llm(
+    model: Any,
+    messages: Any,
+    *,
+    key: Optional[str] = None,
+    timeout: Optional[float] = None,
+    max_concurrency: Optional[int] = None,
+    cache: bool = True,
+    **kwargs: Any,
+) -> Any:
+    """Run ``model.ainvoke(messages)`` under the per-model limit and timeout.
+
+    Args:
+        model: Chat model or runnable (structured output, binding, lazy model)
+        messages: Input passed to ``ainvoke``
+        key: Override the concurrency key (defaults to ``limiter_key(model)``)
+        timeout: Seconds to wait for the call, excluding queueing
+            (defaults to ``DRAFTING_LLM_TIMEOUT``; ``0`` disables it)
+        max_concurrency: Limit used when the key's semaphore is first created
+            (defaults to ``DRAFTING_LLM_MAX_CONCURRENCY``)
+        cache: False skips the response-cache lookup (the fresh response is
+            still stored). Pass False when retrying identical messages.
+
+    Raises:
+        TimeoutError: if the call does not finish within ``timeout`` seconds
+    """
+    key = key or limiter_key(model)
+    limit = max_concurrency or settings.DRAFTING_LLM_MAX_CONCURRENCY
+    timeout = settings.DRAFTING_LLM_TIMEOUT if timeout is None else timeout
+    stats = _stats.setdefault(key, {"calls": 0, "in_flight": 0, "waiting": 0, "timeouts": 0, "peak_in_flight": 0})
+
+    semaphore = _semaphore(key, limit)
+    stats["waiting"] += 1
+    try:
+        await semaphore.acquire()
+    finally:
+        stats["waiting"] -= 1
+
+    stats["in_flight"] += 1
+    stats["calls"] += 1
+    stats["peak_in_flight"] = max(stats["peak_in_flight"], stats["in_flight"])
+    bypass = llm_cache_bypass.set(not cache)
+    try:
+        if timeout and timeout > 0:
+            return await asyncio.wait_for(model.ainvoke(messages, **kwargs), timeout)
+        return await model.ainvoke(messages, **kwargs)
+    except asyncio.TimeoutError:
+        stats["timeouts"] += 1
+        raise TimeoutError(f"LLM call to {key} timed out after {timeout:.0f}s") from None
+    finally:
+        llm_cache_bypass.reset(bypass)
+        stats["in_flight"] -= 1
+        semaphore.release()
+
+
+def get_llm_limiter_stats() -> Dict[str, Dict[str, int]]:
+    """Snapshot of per-model call counters (calls, in_flight, waiting, timeouts, peak)."""
+    return {key: dict(values) for key, values in _stats.items()}
+
+
+def reset_llm_limiter_stats() -> None:
+    _stats.clear()
@@ -13,17 +13,21 @@ import threading
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 
 from ..config import settings
+from .llm_cache import attach_llm_cache
 
 
 class _LazyModel:
     """Thread-safe lazy model wrapper.
 
     Defers provider/client initialization until the model is actually used.
+    With ``cache_responses=True`` the resolved model reads/writes the drafting
+    LLM response cache (see llm_cache.py).
     """
 
-    def __init__(self, name: str, factory):
+    def __init__(self, name: str, factory, cache_responses: bool = False):
         self._name = name
         self._factory = factory
+        self._cache_responses = cache_responses
         self._model = None
         self._loaded = False
         self._lock = threading.Lock()
@@ -35,6 +39,8 @@ class _LazyModel:
             if not self._loaded:
                 try:
                     self._model = self._factory()
+                    if self._cache_responses:
+                        self._model = attach_llm_cache(self._model)
                 except Exception:
                     self._model = None
                 self._loaded = True
@@ -192,6 +198,7 @@ intake_ollama_model = _LazyModel(
         ),
         openai_model,
     ),
+    cache_responses=True,
 )
 
 # Draft: glm-5:cloud (reasoning, #1 intelligence) → fallback OpenAI
@@ -206,6 +213,7 @@ draft_ollama_model = _LazyModel(
         ),
         draft_openai_model,
     ),
+    cache_responses=True,
 )
 
 # Review: qwen3.5:cloud (reasoning, low hallucination) → fallback OpenAI
@@ -220,6 +228,7 @@ review_ollama_model = _LazyModel(
         ),
         review_openai_model,
     ),
+    cache_responses=True,
 )
 
 # Fallback models
@@ -267,6 +276,7 @@ glm_model = _LazyModel(
         ollma_fallback_model,
         openai_model,
     ),
+    cache_responses=True,
 )
 
 
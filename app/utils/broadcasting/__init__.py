@@ -0,0 +1,40 @@
+"""Broadcast delivery utilities.
+
+The durable delivery queue drained by broadcast-worker processes, the token
+bucket that paces it and the per-recipient send outcome parsing.
+"""
+from .send_engine import (
+    TokenBucket,
+    SendOutcome,
+    build_outcome,
+)
+from .delivery_queue import (
+    NON_RETRYABLE_ERRORS,
+    RETRYABLE_ERRORS,
+    RETRY_DELAYS,
+    MAX_RETRIES,
+    priority_for,
+    schedule_by_tier,
+    start_delivery,
+    finalize_jobs,
+    get_send_bucket,
+    drain_once,
+    run_worker,
+)
+
+__all__ = [
+    "TokenBucket",
+    "SendOutcome",
+    "build_outcome",
+    "NON_RETRYABLE_ERRORS",
+    "RETRYABLE_ERRORS",
+    "RETRY_DELAYS",
+    "MAX_RETRIES",
+    "priority_for",
+    "schedule_by_tier",
+    "start_delivery",
+    "finalize_jobs",
+    "get_send_bucket",
+    "drain_once",
+    "run_worker",
+]
@@ -0,0 +1,399 @@
+"""Durable delivery queue: priority lanes, scheduled retries, dead-lettering.
+
+The broadcast tools enqueue a job's recipients into the ``delivery_queue``
+table with ``start_delivery`` and return; broadcast-worker processes
+(app/utils/broadcasting/worker.py) drain it:
+
+    - ``drain_once`` leases the next due rows (lane 1 first) with
+      ``FOR UPDATE SKIP LOCKED``, so any number of workers can run side by side
+    - Leased rows are grouped per job and sent with one batch MCP call,
+      paced by the worker process's ``TokenBucket`` (``get_send_bucket``)
+    - Outcomes go to the broadcast_messages ledger and back to the queue: a
+      retryable failure is re-queued along ``RETRY_DELAYS``, a
+      ``NON_RETRYABLE_ERRORS`` code or the last attempt moves the row to DEAD
+    - ``run_worker`` repeats that until stopped, sleeping while nothing is due
+    - ``finalize_jobs`` moves SENDING jobs whose queue has drained to COMPLETED
+    - ``start_delivery(..., fallback_from="lite")`` queues a job's dead lite
+      rows again as template rows (the lite -> template fallback)
+
+Only rows of SENDING jobs are leased: pausing a job holds its rows. A worker
+that dies mid-batch leaves its rows LEASED; they return to the queue once
+``DELIVERY_QUEUE_LEASE_SECONDS`` have passed, counting as an attempt (DEAD
+after ``MAX_RETRIES``).
+"""
+from __future__ import annotations
+
+import json
+import os
+import socket
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from app.config import logger, settings
+from .send_engine import TokenBucket
+
+
+# ============================================
+# RETRY POLICY (per doc 3.6.3 / 3.6.5)
+# ============================================
+
+NON_RETRYABLE_ERRORS = {
+    "131026": "Message undeliverable - number not on WhatsApp",
+    "131047": "Re-engagement required - user must message first",
+    "131051": "Unsupported message type - fix template format",
+    "131031": "Business account locked - contact Meta support",
+}
+
+RETRYABLE_ERRORS = {
+    "131053": "Media upload failed",
+    "130429": "Rate limit exceeded",
+}
+
+# Exponential backoff delays in seconds: RETRY_DELAYS[n] is the wait before attempt n + 1
+RETRY_DELAYS = [0, 30, 120, 600, 3600]  # immediate, 30s, 2m, 10m, 1h
+MAX_RETRIES = 5
+
+# Dead lite rows a template send cannot rescue: the number or the account is the problem
+TEMPLATE_FALLBACK_SKIP_CODES = {"131026", "131031"}
+
+# Job phases that never send again
+FINISHED_PHASES = ("COMPLETED", "FAILED", "CANCELLED")
+
+# Batch MCP tool per queue method
+BATCH_TOOLS = {
+    "lite": "send_marketing_lite_message_batch",
+    "template": "send_message_batch",
+}
+
+
+def priority_for(contact: dict) -> int:
+    """
+    Priority lane of a processed contact.
+
+    1=Urgent/OTP, 2=24hr window, 3=Normal, 4=Low, 5=Background. Broadcast
+    contacts carry no transactional or session-window flag, so they land in
+    lanes 3-5 by quality score.
+    """
+    score = contact.get("quality_score", 50)
+    if score >= 80:
+        return 3
+    if score >= 50:
+        return 4
+    return 5
+
+
+def schedule_by_tier(phones: List[str], tier_limit: Optional[float], priority: int = 3) -> List[Dict[str, Any]]:
+    """
+    Queue recipients for ``phones``, spreading them over messaging tier windows.
+
+    The tier caps unique recipients per rolling 24h, so the first
+    ``tier_limit`` phones are due now, the next ``tier_limit`` in 24h, and so
+    on. No limit (None / inf) makes every phone due now.
+    """
+    now = datetime.utcnow()
+    window = int(tier_limit) if tier_limit not in (None, float("inf")) and tier_limit > 0 else None
+    return [
+        {
+            "phone": phone,
+            "priority": priority,
+            "not_before": now + timedelta(days=i // window) if window else now,
+        }
+        for i, phone in enumerate(phones)
+    ]
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}-{os.getpid()}"
+
+
+# ============================================
+# SENDING
+# ============================================
+
+def _call_direct_api_mcp(tool_name: str, params: dict, timeout: Optional[float] = None) -> dict:
+    """Call a Direct API MCP tool (port 9002) synchronously via the shared session pool."""
+    from app.agents.whatsp_agents.mcp_client.direct_api_pool import call_direct_api_mcp
+    return call_direct_api_mcp(tool_name, params, timeout=timeout)
+
+
+def send_batch(
+    batch_tool: str, params: dict, phones: List[str], timeout: Optional[float] = None
+) -> List[Dict[str, Any]]:
+    """
+    Send to ``phones`` with one batch MCP call, waiting at most ``timeout`` seconds.
+
+    Returns one outcome per phone (phone, success, message_id, error,
+    error_code). If the call fails as a whole (including a timeout), or a
+    phone is missing from the results, that phone fails without an error
+    code, which the queue treats as retryable.
+    """
+    try:
+        result = _call_direct_api_mcp(batch_tool, {
+            **params,
+            "recipients": [{"to": phone} for phone in phones],
+            "max_concurrency": settings.DELIVERY_QUEUE_BATCH_CONCURRENCY,
+        }, timeout=timeout)
+    except TimeoutError:
+        result = {"success": False, "error": f"Batch call timed out after {timeout:.0f}s"}
+    except Exception as e:
+        result = {"success": False, "error": str(e)}
+
+    if isinstance(result, dict) and isinstance(result.get("results"), list):
+        entries = {entry.get("to"): entry for entry in result["results"]}
+        batch_error = "No result for recipient"
+    else:
+        entries = {}
+        batch_error = result.get("error", "Unknown") if isinstance(result, dict) else str(result)
+
+    outcomes = []
+    for phone in phones:
+        entry = entries.get(phone) or {"ok": False, "error": batch_error}
+        error_code = entry.get("code")
+        outcomes.append({
+            "phone": phone,
+            "success": bool(entry.get("ok")),
+            "message_id": entry.get("id"),
+            "error": entry.get("error"),
+            "error_code": str(error_code) if error_code is not None else None,
+        })
+    return outcomes
+
+
+# ============================================
+# JOBS
+# ============================================
+
+def start_delivery(
+    user_id: str,
+    broadcast_job_id: str,
+    recipients: List[Dict[str, Any]],
+    method: str,
+    payload: Dict[str, Any],
+    fallback_from: Optional[str] = None,
+) -> Dict[str, Any]:
+    """
+    Queue ``recipients`` of a job and hand the job to the broadcast workers.
+
+    A READY_TO_SEND or PAUSED job is moved to SENDING, the only phase whose
+    rows workers lease. Recipients already queued for the job are skipped,
+    so starting a job twice never sends twice.
+
+    With ``fallback_from`` (e.g. "lite"), rows of that method that were
+    dead-lettered are queued again under ``method`` with ``payload``, except
+    those whose error code is in TEMPLATE_FALLBACK_SKIP_CODES. A job that has
+    already finished (COMPLETED, FAILED, CANCELLED) cannot send again, so
+    nothing is queued for it.
+
+    Returns:
+        dict: queued (newly queued rows), requeued (dead rows queued again),
+        phase and queue stats
+    """
+    from app.database.postgresql.postgresql_connection import get_session
+    from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
+    from app.database.postgresql.postgresql_repositories.delivery_queue_repo import DeliveryQueueRepository
+
+    with get_session() as session:
+        queue_repo = DeliveryQueueRepository(session=session)
+        job_repo = BroadcastJobRepository(session=session)
+        job = job_repo.get_by_id(broadcast_job_id)
+        phase = job.get("phase") if job else None
+        if phase in FINISHED_PHASES:
+            return {"queued": 0, "requeued": 0, "phase": phase, "queue": queue_repo.get_queue_stats(broadcast_job_id)}
+
+        requeued = 0
+        if fallback_from:
+            requeued = queue_repo.requeue_dead(
+                broadcast_job_id, fallback_from, method, payload, skip_codes=TEMPLATE_FALLBACK_SKIP_CODES,
+            )
+        queued = queue_repo.enqueue(broadcast_job_id, user_id, recipients, method=method, payload=payload)
+
+        if phase in ("READY_TO_SEND", "PAUSED") and job_repo.update_phase(broadcast_job_id, "SENDING"):
+            phase = "SENDING"
+
+        return {
+            "queued": queued,
+            "requeued": requeued,
+            "phase": phase,
+            "queue": queue_repo.get_queue_stats(broadcast_job_id),
+        }
+
+
+def finalize_jobs() -> List[str]:
+    """
+    Complete SENDING jobs whose queued rows are all sent or dead-lettered.
+
+    Jobs with no queue rows (not started through the queue) are left alone.
+    Safe to run from every worker: a job completed by another worker fails
+    the SENDING -> COMPLETED transition here and is skipped.
+
+    Returns:
+        list[str]: IDs of the jobs completed by this call
+    """
+    from app.database.postgresql.postgresql_connection import get_session
+    from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
+    from app.database.postgresql.postgresql_repositories.delivery_queue_repo import DeliveryQueueRepository
+
+    completed = []
+    with get_session() as session:
+        job_repo = BroadcastJobRepository(session=session)
+        counts = DeliveryQueueRepository(session=session).count_pending_by_job(job_repo.get_ids_by_phase("SENDING"))
+        for broadcast_job_id, count in counts.items():
+            if count["pending"] == 0 and job_repo.update_phase(broadcast_job_id, "COMPLETED"):
+                completed.append(broadcast_job_id)
+                logger.info("[DELIVERY_QUEUE] Job %s drained (%d rows), marked COMPLETED", broadcast_job_id, count["total"])
+    return completed
+
+
+# ============================================
+# WORKER
+# ============================================
+
+def _record_progress(broadcast_job_id: str, user_id: str, outcomes: List[Dict[str, Any]]) -> None:
+    """Write outcomes to the ledger and refresh the job counters from it."""
+    from app.database.postgresql.postgresql_connection import get_session
+    from app.database.postgresql.postgresql_repositories.broadcast_job_repo import BroadcastJobRepository
+    from app.database.postgresql.postgresql_repositories.broadcast_message_repo import (
+        BroadcastMessageRepository,
+        SUCCESS_STATUSES,
+    )
+
+    try:
+        with get_session() as session:
+            ledger = BroadcastMessageRepository(session=session)
+            ledger.record_outcomes(broadcast_job_id, user_id, outcomes)
+            status_counts = ledger.count_by_status(broadcast_job_id)
+            BroadcastJobRepository(session=session).update_send_progress(
+                broadcast_job_id,
+                sent=sum(status_counts.get(s, 0) for s in SUCCESS_STATUSES),
+                failed=status_counts.get("FAILED", 0),
+            )
+    except Exception as e:
+        logger.error("[DELIVERY_QUEUE] Failed to record %d outcomes for job %s: %s", len(outcomes), broadcast_job_id, e)
+
+
+_send_bucket: Optional[TokenBucket] = None
+_send_bucket_lock = threading.Lock()
+
+
+def get_send_bucket() -> TokenBucket:
+    """Process-wide bucket pacing batch sends at ``BROADCAST_WORKER_RATE_PER_SEC``, created on first use."""
+    global _send_bucket
+    with _send_bucket_lock:
+        if _send_bucket is None:
+            _send_bucket = TokenBucket(rate=settings.BROADCAST_WORKER_RATE_PER_SEC)
+    return _send_bucket
+
+
+def drain_once(worker_id: str, limit: Optional[int] = None, bucket: Optional[TokenBucket] = None) -> Dict[str, int]:
+    """
+    Lease one batch of due rows, send it and settle every row.
+
+    Each batch call first takes one token per recipient from ``bucket``
+    (default: the process-wide ``get_send_bucket()``), pacing every drain
+    thread of the process together.
+
+    Sending must finish while the lease still holds, otherwise another worker
+    reclaims the rows and sends them again. Every batch call therefore times
+    out ``DELIVERY_QUEUE_SETTLE_MARGIN_SECONDS`` before the lease expires,
+    and groups there is no lease time left for are released unsent.
+
+    Returns:
+        dict: leased, sent, retry and dead row counts for this batch
+    """
+    from app.database.postgresql.postgresql_connection import get_session
+    from app.database.postgresql.postgresql_repositories.delivery_queue_repo import DeliveryQueueRepository
+
+    bucket = bucket or get_send_bucket()
+    send_deadline = (
+        time.monotonic() + settings.DELIVERY_QUEUE_LEASE_SECONDS - settings.DELIVERY_QUEUE_SETTLE_MARGIN_SECONDS
+    )
+    with get_session() as session:
+        items = DeliveryQueueRepository(session=session).lease(
+            worker_id,
+            limit=limit or settings.DELIVERY_QUEUE_LEASE_SIZE,
+            lease_seconds=settings.DELIVERY_QUEUE_LEASE_SECONDS,
+            max_attempts=MAX_RETRIES,
+        )
+
+    totals = {"leased": len(items), "sent": 0, "retry": 0, "dead": 0}
+    groups: Dict[tuple, List[Dict[str, Any]]] = {}
+    for item in items:
+        key = (item["broadcast_job_id"], item["user_id"], item["method"], json.dumps(item["payload"], sort_keys=True))
+        groups.setdefault(key, []).append(item)
+
+    for (broadcast_job_id, user_id, method, _), group in groups.items():
+        bucket.take(len(group))
+        remaining = send_deadline - time.monotonic()
+        if remaining <= 0:
+            with get_session() as session:
+                released = DeliveryQueueRepository(session=session).release(worker_id, [i["id"] for i in group])
+            logger.warning("[DELIVERY_QUEUE] %s out of lease time, released %d rows of job %s", worker_id, released, broadcast_job_id)
+            continue
+        outcomes = send_batch(
+            BATCH_TOOLS[method], group[0]["payload"] or {}, [i["phone_e164"] for i in group], timeout=remaining,
+        )
+        results = [
+            {"id": item["id"], "attempts": item["attempts"], **outcome}
+            for item, outcome in zip(group, outcomes)
+        ]
+        with get_session() as session:
+            counts = DeliveryQueueRepository(session=session).settle(
+                worker_id,
+                results,
+                retry_delays=RETRY_DELAYS,
+                max_attempts=MAX_RETRIES,
+                non_retryable_codes=NON_RETRYABLE_ERRORS,
+            )
+        # Rows whose lease was lost meanwhile belong to another worker now
+        settled = set(counts["settled_ids"])
+        settled_outcomes = [outcome for item, outcome in zip(group, outcomes) if item["id"] in settled]
+        if settled_outcomes:
+            _record_progress(broadcast_job_id, user_id, settled_outcomes)
+        for outcome in ("sent", "retry", "dead"):
+            totals[outcome] += counts[outcome]
+        logger.info(
+            "[DELIVERY_QUEUE] %s job %s: %d sent, %d retry scheduled, %d dead-lettered",
+            worker_id, broadcast_job_id, counts["sent"], counts["retry"], counts["dead"],
+        )
+
+    return totals
+
+
+def run_worker(
+    worker_id: Optional[str] = None,
+    stop_event: Optional[threading.Event] = None,
+    exit_when_idle: bool = False,
+    bucket: Optional[TokenBucket] = None,
+) -> Dict[str, int]:
+    """
+    Drain the queue until ``stop_event`` is set, pacing sends with ``bucket`` (see drain_once).
+
+    Sleeps ``DELIVERY_QUEUE_POLL_SECONDS`` whenever nothing is due. With
+    ``exit_when_idle`` it returns at the first empty poll instead (rows
+    waiting on a later retry are left for the next run).
+
+    Returns:
+        dict: Totals over the worker's lifetime
+    """
+    worker_id = worker_id or default_worker_id()
+    stop_event = stop_event or threading.Event()
+    totals = {"leased": 0, "sent": 0, "retry": 0, "dead": 0}
+    logger.info("[DELIVERY_QUEUE] Worker %s started", worker_id)
+
+    while not stop_event.is_set():
+        try:
+            batch = drain_once(worker_id, bucket=bucket)
+        except Exception as e:
+            logger.error("[DELIVERY_QUEUE] Worker %s batch failed: %s", worker_id, e, exc_info=True)
+            batch = {"leased": 0}
+        for key, n in batch.items():
+            totals[key] += n
+        if not batch["leased"]:
+            if exit_when_idle:
+                break
+            stop_event.wait(settings.DELIVERY_QUEUE_POLL_SECONDS)
+
+    logger.info("[DELIVERY_QUEUE] Worker %s stopped: %s", worker_id, totals)
+    return totals
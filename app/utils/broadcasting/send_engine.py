@@ -0,0 +1,136 @@
+"""Send-side building blocks shared by the broadcast worker and the batch tools.
+
+    - ``TokenBucket`` paces the broadcast worker's batch sends
+      (app/utils/broadcasting/delivery_queue.py)
+    - ``build_outcome`` turns one Direct API send response into a
+      ``SendOutcome`` (success, wamid, error, WhatsApp error code); the batch
+      MCP tools reduce every recipient's response with it
+"""
+from __future__ import annotations
+
+import asyncio
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+
+# WhatsApp error codes embedded in the raw error body, e.g. {"error": {"code": 131026}}
+_ERROR_CODE_RE = re.compile(r'"code"\s*:\s*"?(\d+)')
+
+
+# ============================================
+# RATE LIMITING
+# ============================================
+
+class TokenBucket:
+    """
+    Token bucket shared by asyncio tasks and threads.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Callers reserve their tokens under a lock (running into debt when the
+    bucket is short) and then wait the debt out, so they are served in
+    arrival order: ``acquire()`` from async code, ``take()`` from blocking
+    code such as the broadcast worker's drain threads.
+    """
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Consume ``tokens`` and return how long the caller must wait for them."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= tokens
+            return max(0.0, -self._tokens / self.rate)
+
+    async def acquire(self, tokens: float = 1.0) -> None:
+        """Wait until ``tokens`` are available, then consume them."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+    def take(self, tokens: float = 1.0) -> None:
+        """Blocking ``acquire()`` for threads."""
+        wait = self._reserve(tokens)
+        if wait > 0:
+            time.sleep(wait)
+
+
+# ============================================
+# RESULT TYPES
+# ============================================
+
+@dataclass
+class SendOutcome:
+    """Result of a single send attempt."""
+    index: int
+    phone: str
+    success: bool
+    message_id: Optional[str] = None
+    error: Optional[str] = None
+    error_code: Optional[str] = None
+    latency_ms: float = 0.0
+
+    def to_dict(self) -> dict:
+        return {
+            "phone": self.phone,
+            "success": self.success,
+            "message_id": self.message_id,
+            "error": self.error,
+            "error_code": self.error_code,
+        }
+
+
+# ============================================
+# RESULT PARSING
+# ============================================
+
+def _extract_error_code(result: Dict[str, Any]) -> Optional[str]:
+    """Pull the WhatsApp error code out of a failed Direct API response."""
+    error = result.get("error")
+    if isinstance(error, dict):
+        code = error.get("code", error.get("error_code"))
+        return str(code) if code is not None else None
+    match = _ERROR_CODE_RE.search(str(result.get("details") or ""))
+    return match.group(1) if match else None
+
+
+def _extract_message_id(result: Dict[str, Any]) -> Optional[str]:
+    """Pull the wamid out of a successful /messages response."""
+    data = result.get("data")
+    if isinstance(data, dict):
+        messages = data.get("messages")
+        if isinstance(messages, list) and messages and isinstance(messages[0], dict):
+            return messages[0].get("id")
+    return None
+
+
+def build_outcome(index: int, phone: str, result: Any, latency_ms: float = 0.0) -> SendOutcome:
+    """Convert a parsed MCP/Direct API result into a ``SendOutcome``."""
+    if not isinstance(result, dict):
+        return SendOutcome(index, phone, False, error=str(result), latency_ms=latency_ms)
+
+    if result.get("success") or result.get("status") == "success":
+        return SendOutcome(
+            index, phone, True,
+            message_id=_extract_message_id(result),
+            latency_ms=latency_ms,
+        )
+
+    error = result.get("error") or result.get("message") or "Unknown error"
+    return SendOutcome(
+        index, phone, False,
+        error=error if isinstance(error, str) else str(error),
+        error_code=_extract_error_code(result),
+        latency_ms=latency_ms,
+    )
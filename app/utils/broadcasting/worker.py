@@ -0,0 +1,122 @@
+"""broadcast-worker: standalone process that sends queued broadcasts.
+
+Runs outside the LangGraph server, so a large broadcast neither competes with
+chat traffic nor dies when the graph server restarts. Each process runs
+``concurrency`` drain threads over the durable delivery queue plus a sweep
+that completes drained jobs:
+
+    - drain threads lease due rows of SENDING jobs (``FOR UPDATE SKIP LOCKED``,
+      so replicas never share a row), send them over the pooled Direct API
+      MCP client and publish progress to the BroadcastJob counters and the
+      broadcast_messages ledger after every batch
+    - the drain threads share one ``TokenBucket`` that caps the process at
+      ``BROADCAST_WORKER_RATE_PER_SEC`` messages per second
+    - every ``BROADCAST_WORKER_SWEEP_SECONDS`` the main thread moves SENDING
+      jobs with nothing left to send to COMPLETED
+
+The agent only starts (queue + SENDING), pauses (PAUSED) and observes jobs;
+throughput scales with the number of worker replicas.
+
+Usage:
+    broadcast-worker
+    broadcast-worker --concurrency 8 --lease-size 500
+    broadcast-worker --rate 80                              # at most 80 messages/sec per process
+    python -m app.utils.broadcasting.worker --until-idle    # drain what is due, then exit
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import signal
+import threading
+from typing import Dict, Optional
+
+from app.config import logger, settings
+from .delivery_queue import default_worker_id, finalize_jobs, run_worker
+
+
+def run_broadcast_worker(
+    worker_id: Optional[str] = None,
+    concurrency: Optional[int] = None,
+    stop_event: Optional[threading.Event] = None,
+    exit_when_idle: bool = False,
+) -> Dict[str, int]:
+    """
+    Run drain threads and the job sweep until ``stop_event`` is set.
+
+    With ``exit_when_idle`` every thread stops at its first empty poll and
+    the call returns after a final sweep.
+
+    Returns:
+        dict: leased, sent, retry and dead totals over all threads
+    """
+    worker_id = worker_id or default_worker_id()
+    concurrency = concurrency or settings.BROADCAST_WORKER_CONCURRENCY
+    stop_event = stop_event or threading.Event()
+    results = []
+
+    def _drain(thread_id: str) -> None:
+        results.append(run_worker(thread_id, stop_event=stop_event, exit_when_idle=exit_when_idle))
+
+    threads = [
+        threading.Thread(target=_drain, args=(f"{worker_id}-{i}",), name=f"broadcast-worker-{i}", daemon=True)
+        for i in range(concurrency)
+    ]
+    for thread in threads:
+        thread.start()
+    logger.info("[BROADCAST_WORKER] %s running %d drain threads", worker_id, concurrency)
+
+    while any(thread.is_alive() for thread in threads):
+        try:
+            finalize_jobs()
+        except Exception as e:
+            logger.error("[BROADCAST_WORKER] Job sweep failed: %s", e, exc_info=True)
+        stop_event.wait(settings.BROADCAST_WORKER_SWEEP_SECONDS)
+        if stop_event.is_set():
+            break
+
+    for thread in threads:
+        thread.join()
+    finalize_jobs()
+
+    totals = {"leased": 0, "sent": 0, "retry": 0, "dead": 0}
+    for result in results:
+        for key, n in result.items():
+            totals[key] += n
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Send queued broadcasts (run as many replicas as needed)")
+    parser.add_argument("--worker-id", default=None, help="Lease owner prefix (default: host-pid)")
+    parser.add_argument("--concurrency", type=int, default=settings.BROADCAST_WORKER_CONCURRENCY,
+                        help="Drain threads, each with one batch MCP call in flight")
+    parser.add_argument("--lease-size", type=int, default=settings.DELIVERY_QUEUE_LEASE_SIZE)
+    parser.add_argument("--poll-seconds", type=float, default=settings.DELIVERY_QUEUE_POLL_SECONDS)
+    parser.add_argument("--rate", type=float, default=settings.BROADCAST_WORKER_RATE_PER_SEC,
+                        help="Messages/sec for this process across its drain threads")
+    parser.add_argument("--until-idle", action="store_true", help="Exit when nothing is due")
+    args = parser.parse_args()
+
+    settings.DELIVERY_QUEUE_LEASE_SIZE = args.lease_size
+    settings.DELIVERY_QUEUE_POLL_SECONDS = args.poll_seconds
+    settings.BROADCAST_WORKER_RATE_PER_SEC = args.rate
+
+    # SIGINT / SIGTERM (docker stop) finish the batches in flight, then exit
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda *_: stop.set())
+
+    try:
+        totals = run_broadcast_worker(
+            args.worker_id, concurrency=args.concurrency, stop_event=stop, exit_when_idle=args.until_idle,
+        )
+    finally:
+        from app.agents.whatsp_agents.mcp_client.direct_api_pool import get_direct_api_pool
+
+        get_direct_api_pool().shutdown()
+    print(json.dumps(totals))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,11 +1,13 @@
 """Data processing utilities for broadcasting workflow.
 
-Handles phone validation, file parsing, deduplication, and quality scoring.
+Handles phone validation, file parsing, deduplication, quality scoring,
+and the chunked pipeline that streams a contact file through all of them.
 """
 from .phone_validator import validate_phone, normalize_phone
-from .file_parser import parse_file, parse_excel, parse_csv
-from .deduplicator import deduplicate_contacts
+from .file_parser import parse_file, parse_excel, parse_csv, iter_file, iter_excel, iter_csv
+from .deduplicator import deduplicate_contacts, ContactDeduplicator
 from .quality_scorer import score_contact, score_contacts
+from .pipeline import process_contact_stream, ContactStreamStats
 
 __all__ = [
     "validate_phone",
@@ -13,7 +15,13 @@ __all__ = [
     "parse_file",
     "parse_excel",
     "parse_csv",
+    "iter_file",
+    "iter_excel",
+    "iter_csv",
     "deduplicate_contacts",
+    "ContactDeduplicator",
     "score_contact",
     "score_contacts",
+    "process_contact_stream",
+    "ContactStreamStats",
 ]
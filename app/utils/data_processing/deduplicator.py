@@ -1,5 +1,5 @@
 """Multi-stage contact deduplication pipeline."""
-from typing import Optional
+from typing import Dict, Optional
 from .phone_validator import normalize_phone
 from app.config import logger
 
@@ -33,76 +33,193 @@ def deduplicate_contacts(
 
     logger.info(f"Deduplicating {len(contacts)} contacts (4-stage pipeline)")
 
-    unique = []
-    duplicates = []
-
-    # Track seen phones at each stage
-    seen_raw = set()           # Stage 1: exact raw strings
-    seen_normalized = set()    # Stage 2: E.164 normalized
-    seen_fuzzy = {}            # Stage 3: e164 -> contact for fuzzy matching
-
-    for contact in contacts:
-        phone = contact.get("phone", "").strip()
-        if not phone:
-            continue
-
-        # Stage 1: Exact match
-        if phone in seen_raw:
-            dup = {**contact, "duplicate_of": phone, "dedup_stage": "exact"}
-            duplicates.append(dup)
-            continue
-
-        # Stage 2: Normalized match
-        normalized = normalize_phone(phone, default_country)
-        if normalized in seen_normalized:
-            dup = {**contact, "duplicate_of": normalized, "dedup_stage": "normalized"}
-            duplicates.append(dup)
-            continue
-
-        # Stage 3: Fuzzy match (Levenshtein distance <= 1)
-        fuzzy_match = _fuzzy_find(normalized, seen_fuzzy)
-        if fuzzy_match:
-            dup = {**contact, "duplicate_of": fuzzy_match, "dedup_stage": "fuzzy"}
-            duplicates.append(dup)
-            continue
-
-        # Stage 4: Cross-campaign dedup
-        if cross_campaign_phones and normalized in cross_campaign_phones:
-            dup = {**contact, "duplicate_of": normalized, "dedup_stage": "cross_campaign"}
-            duplicates.append(dup)
-            continue
-
-        # Not a duplicate - add to unique
-        seen_raw.add(phone)
-        seen_normalized.add(normalized)
-        seen_fuzzy[normalized] = phone
-        contact["phone_normalized"] = normalized
-        unique.append(contact)
+    dedup = ContactDeduplicator(default_country, cross_campaign_phones)
+    unique, duplicates = dedup.process(contacts)
 
     logger.info(
         f"Deduplication complete: {len(unique)} unique, {len(duplicates)} duplicates removed"
     )
 
     # Log stage breakdown
-    stage_counts = {}
-    for d in duplicates:
-        stage = d.get("dedup_stage", "unknown")
-        stage_counts[stage] = stage_counts.get(stage, 0) + 1
-    if stage_counts:
-        logger.info(f"Duplicate breakdown by stage: {stage_counts}")
+    if dedup.stage_counts:
+        logger.info(f"Duplicate breakdown by stage: {dedup.stage_counts}")
 
     return (unique, duplicates)
 
 
-def _fuzzy_find(phone: str, seen: dict) -> Optional[str]:
+class ContactDeduplicator:
+    """
+    Stateful 4-stage deduplicator for streaming contacts in chunks.
+
+    Keeps the seen-phone state between ``process`` calls, so feeding a file
+    chunk by chunk gives the same unique/duplicate split as deduplicating
+    the whole list at once.
     """
-    Check if phone is within Levenshtein distance 1 of any seen number.
 
-    Only compares numbers of similar length (within 1 char difference).
+    def __init__(self, default_country: str = "IN", cross_campaign_phones: Optional[set] = None):
+        self.default_country = default_country
+        self.cross_campaign_phones = cross_campaign_phones
+        self.stage_counts: Dict[str, int] = {}
+
+        # Track seen phones at each stage
+        self._seen_raw = set()                # Stage 1: exact raw strings
+        self._seen_fuzzy = FuzzyPhoneIndex()  # Stages 2-3: E.164 normalized, distance-1 lookups
+
+    def process(self, contacts: list, normalized_key: Optional[str] = None) -> tuple:
+        """
+        Deduplicate one batch of contacts against everything seen so far.
+
+        Args:
+            contacts: List of contact dicts (must have "phone" key)
+            normalized_key: Contact field that already holds the E.164 form of
+                "phone" (e.g. "phone_e164" after validation); skips re-normalizing
+
+        Returns:
+            tuple: (unique_contacts, duplicates_removed) for this batch
+        """
+        unique = []
+        duplicates = []
+        seen_raw = self._seen_raw
+        seen_fuzzy = self._seen_fuzzy
+        cross_campaign_phones = self.cross_campaign_phones
+
+        for contact in contacts:
+            phone = contact.get("phone", "").strip()
+            if not phone:
+                continue
+
+            # Stage 1: Exact match
+            if phone in seen_raw:
+                duplicates.append(self._duplicate(contact, phone, "exact"))
+                continue
+
+            # Stage 2: Normalized match
+            normalized = (normalized_key and contact.get(normalized_key)) or normalize_phone(
+                phone, self.default_country
+            )
+            if normalized in seen_fuzzy:
+                duplicates.append(self._duplicate(contact, normalized, "normalized"))
+                continue
+
+            # Stage 3: Fuzzy match (Levenshtein distance <= 1)
+            fuzzy_match = _fuzzy_find(normalized, seen_fuzzy)
+            if fuzzy_match:
+                duplicates.append(self._duplicate(contact, fuzzy_match, "fuzzy"))
+                continue
+
+            # Stage 4: Cross-campaign dedup
+            if cross_campaign_phones and normalized in cross_campaign_phones:
+                duplicates.append(self._duplicate(contact, normalized, "cross_campaign"))
+                continue
+
+            # Not a duplicate - add to unique
+            seen_raw.add(phone)
+            seen_fuzzy.add(normalized)
+            contact["phone_normalized"] = normalized
+            unique.append(contact)
+
+        return (unique, duplicates)
+
+    def _duplicate(self, contact: dict, duplicate_of: str, stage: str) -> dict:
+        self.stage_counts[stage] = self.stage_counts.get(stage, 0) + 1
+        return {**contact, "duplicate_of": duplicate_of, "dedup_stage": stage}
+
+
+class FuzzyPhoneIndex:
+    """
+    Index of E.164 numbers for Levenshtein distance <= 1 lookups.
+
+    Each stored number of length L is cut into ``PARTS`` slices and filed
+    under one blocking key per slice: the number with that slice removed
+    (the text before it plus the text after it). A single insertion,
+    deletion or substitution lands in one slice, so any number within
+    distance 1 of a stored one keeps at least one of those keys intact. A
+    lookup probes the keys a neighbour of length L-1, L or L+1 would have,
+    then verifies the few candidates with a real distance check. Each key
+    keeps most of the digits, so buckets stay near-singleton and lookup
+    cost does not grow with the number of indexed phones.
+
+    Lookups return the earliest-added match, the same one a linear scan in
+    insertion order would find.
+    """
+
+    PARTS = 4
+
+    def __init__(self):
+        self._order: Dict[str, int] = {}
+        self._buckets: dict = {}
+        self._slices: Dict[int, list] = {}
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+    def __contains__(self, phone: str) -> bool:
+        return phone in self._order
+
+    def _keys(self, length: int, phone: str) -> list:
+        """Blocking keys a stored number of ``length`` chars would share with ``phone``."""
+        slices = self._slices.get(length)
+        if slices is None:
+            cuts = [length * i // self.PARTS for i in range(self.PARTS + 1)]
+            # (chars kept before the dropped slice, chars kept after it)
+            slices = self._slices[length] = [
+                (cuts[i], length - cuts[i + 1]) for i in range(self.PARTS)
+            ]
+        n = len(phone)
+        return [
+            hash((length, head, phone[:head], phone[n - tail:] if tail <= n else phone))
+            for head, tail in slices
+        ]
+
+    def add(self, phone: str) -> None:
+        """Index ``phone``; re-adding a known number is a no-op."""
+        if phone in self._order:
+            return
+        self._order[phone] = len(self._order)
+        for key in self._keys(len(phone), phone):
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                self._buckets[key] = phone
+            elif isinstance(bucket, list):
+                bucket.append(phone)
+            else:
+                self._buckets[key] = [bucket, phone]
+
+    def find(self, phone: str, distance) -> Optional[str]:
+        """
+        Return the earliest-added number within distance 1 of ``phone``.
+
+        Args:
+            phone: E.164 formatted phone to check
+            distance: Levenshtein distance function used to verify candidates
+
+        Returns:
+            str: The matching phone number, or None if no fuzzy match
+        """
+        best = None
+        best_order = len(self._order)
+        n = len(phone)
+        for length in (n - 1, n, n + 1):
+            if length < 1:
+                continue
+            for key in self._keys(length, phone):
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    continue
+                for candidate in (bucket if isinstance(bucket, list) else (bucket,)):
+                    order = self._order[candidate]
+                    if order < best_order and distance(phone, candidate) <= 1:
+                        best, best_order = candidate, order
+        return best
+
+
+def _fuzzy_find(phone: str, seen: FuzzyPhoneIndex) -> Optional[str]:
+    """
+    Check if phone is within Levenshtein distance 1 of any seen number.
 
     Args:
         phone: E.164 formatted phone to check
-        seen: Dict of {e164_phone: original_phone}
+        seen: Index of previously accepted E.164 numbers
 
     Returns:
         str: The matching phone number, or None if no fuzzy match
@@ -115,12 +232,4 @@ def _fuzzy_find(phone: str, seen: dict) -> Optional[str]:
     except ImportError:
         return None
 
-    phone_len = len(phone)
-    for existing in seen:
-        # Skip if length difference > 1 (can't be distance <= 1)
-        if abs(len(existing) - phone_len) > 1:
-            continue
-        if lev_distance(phone, existing) <= 1:
-            return existing
-
-    return None
+    return seen.find(phone, lev_distance)
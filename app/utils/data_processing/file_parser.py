@@ -1,7 +1,8 @@
 """File parsing utilities for extracting contacts from Excel and CSV files."""
+import codecs
 import csv
 import os
-from typing import Optional
+from typing import Iterator, Optional
 from app.config import logger
 
 
@@ -10,6 +11,14 @@ PHONE_PATTERNS = {"phone", "mobile", "number", "contact", "whatsapp", "cell", "t
 NAME_PATTERNS = {"name", "full_name", "fullname", "contact_name", "first_name", "firstname"}
 EMAIL_PATTERNS = {"email", "e-mail", "mail", "email_address"}
 
+# Cell values read as missing -- pandas' default na_values, kept so the CSV
+# parser treats the same cells as empty as the earlier pandas-based one
+CSV_NA_VALUES = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+})
+
 
 def _find_column(headers: list, patterns: set, explicit: str = None) -> Optional[str]:
     """Find matching column header from patterns or explicit name."""
@@ -23,6 +32,84 @@ def _find_column(headers: list, patterns: set, explicit: str = None) -> Optional
     return None
 
 
+def _build_contact(
+    row_dict: dict,
+    row_idx: int,
+    phone_col: str,
+    name_col: Optional[str],
+    email_col: Optional[str],
+) -> Optional[dict]:
+    """Turn one header->value row into a contact dict (None if the phone cell is empty)."""
+    phone_val = row_dict.get(phone_col)
+    if phone_val is None or not str(phone_val).strip():
+        return None
+
+    # Build custom fields (everything except phone/name/email)
+    skip_cols = {phone_col, name_col, email_col} - {None}
+    custom_fields = {
+        k: str(v) for k, v in row_dict.items()
+        if k not in skip_cols and v is not None
+    }
+
+    name_val = row_dict.get(name_col) if name_col else None
+    email_val = row_dict.get(email_col) if email_col else None
+
+    return {
+        "phone": str(phone_val).strip(),
+        "name": str(name_val).strip() if name_val else None,
+        "email": str(email_val).strip() if email_val else None,
+        "source_row": row_idx,
+        "custom_fields": custom_fields if custom_fields else {},
+    }
+
+
+def _detect_columns(headers: list, phone_column: str = None, name_column: str = None) -> tuple:
+    """Resolve (phone_col, name_col, email_col) or raise if no phone column is found."""
+    phone_col = _find_column(headers, PHONE_PATTERNS, phone_column)
+    name_col = _find_column(headers, NAME_PATTERNS, name_column)
+    email_col = _find_column(headers, EMAIL_PATTERNS)
+
+    if not phone_col:
+        raise ValueError(
+            f"Could not detect phone column. Headers found: {headers}. "
+            f"Please specify phone_column parameter."
+        )
+    return phone_col, name_col, email_col
+
+
+def iter_excel(
+    file_path: str,
+    phone_column: str = None,
+    name_column: str = None,
+) -> Iterator[dict]:
+    """
+    Stream contacts from an Excel (.xlsx) file one row at a time.
+
+    Uses openpyxl's read-only mode, so memory stays flat regardless of the
+    number of rows. Same output as ``parse_excel``.
+    """
+    import openpyxl
+
+    logger.info(f"Streaming Excel file: {file_path}")
+
+    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        rows = wb.active.iter_rows(values_only=True)
+        header_row = next(rows, None)
+        if header_row is None:
+            return
+
+        headers = [str(h).strip() if h else f"col_{i}" for i, h in enumerate(header_row)]
+        phone_col, name_col, email_col = _detect_columns(headers, phone_column, name_column)
+
+        for row_idx, row in enumerate(rows, start=2):
+            contact = _build_contact(dict(zip(headers, row)), row_idx, phone_col, name_col, email_col)
+            if contact:
+                yield contact
+    finally:
+        wb.close()
+
+
 def parse_excel(
     file_path: str,
     phone_column: str = None,
@@ -42,56 +129,85 @@ def parse_excel(
         list[dict]: List of contact dicts with keys:
             phone, name, email, source_row, custom_fields
     """
-    import openpyxl
+    contacts = list(iter_excel(file_path, phone_column, name_column))
+    logger.info(f"Parsed {len(contacts)} contacts from Excel file")
+    return contacts
 
-    logger.info(f"Parsing Excel file: {file_path}")
 
-    wb = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
-    ws = wb.active
+def _detect_encoding(file_path: str) -> str:
+    """Return "utf-8" if the whole file decodes as UTF-8, else "latin-1" (reads in 1 MB blocks)."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        with open(file_path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                decoder.decode(block)
+            decoder.decode(b"", final=True)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin-1"
 
-    rows = list(ws.iter_rows(values_only=True))
-    wb.close()
 
-    if not rows:
-        return []
+def _dedupe_headers(headers: list) -> list:
+    """Rename repeated headers to name.1, name.2, ... (same as pandas)."""
+    counts = {}
+    result = []
+    for h in headers:
+        if h in counts:
+            counts[h] += 1
+            result.append(f"{h}.{counts[h]}")
+        else:
+            counts[h] = 0
+            result.append(h)
+    return result
 
-    headers = [str(h).strip() if h else f"col_{i}" for i, h in enumerate(rows[0])]
 
-    phone_col = _find_column(headers, PHONE_PATTERNS, phone_column)
-    name_col = _find_column(headers, NAME_PATTERNS, name_column)
-    email_col = _find_column(headers, EMAIL_PATTERNS)
+def iter_csv(
+    file_path: str,
+    phone_column: str = None,
+    name_column: str = None,
+) -> Iterator[dict]:
+    """
+    Stream contacts from a CSV file one row at a time.
 
-    if not phone_col:
-        raise ValueError(
-            f"Could not detect phone column. Headers found: {headers}. "
-            f"Please specify phone_column parameter."
-        )
+    Plain ``csv`` module iteration with the same delimiter sniffing, encoding
+    fallback and missing-value rules the pandas-based parser used (blank
+    lines skipped, pandas' default NA markers treated as empty), so output
+    matches ``parse_csv`` without loading the file into a DataFrame.
+    """
+    logger.info(f"Streaming CSV file: {file_path}")
 
-    contacts = []
-    for row_idx, row in enumerate(rows[1:], start=2):
-        row_dict = dict(zip(headers, row))
-
-        phone_val = row_dict.get(phone_col)
-        if not phone_val:
-            continue
-
-        # Build custom fields (everything except phone/name/email)
-        skip_cols = {phone_col, name_col, email_col} - {None}
-        custom_fields = {
-            k: str(v) for k, v in row_dict.items()
-            if k not in skip_cols and v is not None
-        }
-
-        contacts.append({
-            "phone": str(phone_val).strip(),
-            "name": str(row_dict.get(name_col, "")).strip() if name_col and row_dict.get(name_col) else None,
-            "email": str(row_dict.get(email_col, "")).strip() if email_col and row_dict.get(email_col) else None,
-            "source_row": row_idx,
-            "custom_fields": custom_fields if custom_fields else {},
-        })
+    encoding = _detect_encoding(file_path)
 
-    logger.info(f"Parsed {len(contacts)} contacts from Excel file")
-    return contacts
+    with open(file_path, "r", encoding=encoding, newline="") as f:
+        # Detect delimiter
+        sample = f.read(8192)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|")
+            sep = dialect.delimiter
+        except csv.Error:
+            sep = ","
+        f.seek(0)
+
+        reader = csv.reader(f, delimiter=sep)
+        header_row = next(reader, None)
+        if header_row is None:
+            return
+
+        headers = _dedupe_headers([str(c).strip() for c in header_row])
+        phone_col, name_col, email_col = _detect_columns(headers, phone_column, name_column)
+
+        data_row = 0
+        for row in reader:
+            if not row:
+                continue  # blank line
+            data_row += 1
+            row_dict = {
+                h: (None if v in CSV_NA_VALUES else v)
+                for h, v in zip(headers, row)
+            }
+            contact = _build_contact(row_dict, data_row + 1, phone_col, name_col, email_col)
+            if contact:
+                yield contact
 
 
 def parse_csv(
@@ -113,68 +229,36 @@ def parse_csv(
         list[dict]: List of contact dicts with keys:
             phone, name, email, source_row, custom_fields
     """
-    import pandas as pd
-
-    logger.info(f"Parsing CSV file: {file_path}")
-
-    # Try utf-8 first, fall back to latin-1
-    for encoding in ("utf-8", "latin-1"):
-        try:
-            # Detect delimiter
-            with open(file_path, "r", encoding=encoding) as f:
-                sample = f.read(8192)
-            try:
-                dialect = csv.Sniffer().sniff(sample, delimiters=",;\t|")
-                sep = dialect.delimiter
-            except csv.Error:
-                sep = ","
-
-            df = pd.read_csv(file_path, sep=sep, encoding=encoding, dtype=str)
-            break
-        except UnicodeDecodeError:
-            continue
-    else:
-        raise ValueError(f"Could not read CSV file with supported encodings: {file_path}")
-
-    df.columns = [str(c).strip() for c in df.columns]
-    headers = list(df.columns)
-
-    phone_col = _find_column(headers, PHONE_PATTERNS, phone_column)
-    name_col = _find_column(headers, NAME_PATTERNS, name_column)
-    email_col = _find_column(headers, EMAIL_PATTERNS)
+    contacts = list(iter_csv(file_path, phone_column, name_column))
+    logger.info(f"Parsed {len(contacts)} contacts from CSV file")
+    return contacts
 
-    if not phone_col:
-        raise ValueError(
-            f"Could not detect phone column. Headers found: {headers}. "
-            f"Please specify phone_column parameter."
-        )
 
-    contacts = []
-    skip_cols = {phone_col, name_col, email_col} - {None}
+def iter_file(file_path: str, **kwargs) -> Iterator[dict]:
+    """
+    Auto-detect file format and stream contacts.
 
-    for row_idx, row in df.iterrows():
-        phone_val = row.get(phone_col)
-        if pd.isna(phone_val) or not str(phone_val).strip():
-            continue
+    Same formats and errors as ``parse_file``; the format check happens
+    before the first row is read.
+    """
+    return _parser_for(file_path, streaming=True)(file_path, **kwargs)
 
-        custom_fields = {
-            k: str(v) for k, v in row.items()
-            if k not in skip_cols and not pd.isna(v)
-        }
 
-        name_val = row.get(name_col) if name_col else None
-        email_val = row.get(email_col) if email_col else None
+def _parser_for(file_path: str, streaming: bool):
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"File not found: {file_path}")
 
-        contacts.append({
-            "phone": str(phone_val).strip(),
-            "name": str(name_val).strip() if name_val and not pd.isna(name_val) else None,
-            "email": str(email_val).strip() if email_val and not pd.isna(email_val) else None,
-            "source_row": row_idx + 2,  # +2 for 1-based + header row
-            "custom_fields": custom_fields if custom_fields else {},
-        })
+    ext = os.path.splitext(file_path)[1].lower()
 
-    logger.info(f"Parsed {len(contacts)} contacts from CSV file")
-    return contacts
+    if ext in (".xlsx", ".xls"):
+        return iter_excel if streaming else parse_excel
+    elif ext == ".csv":
+        return iter_csv if streaming else parse_csv
+    else:
+        raise ValueError(
+            f"Unsupported file format: '{ext}'. "
+            f"Supported formats: .xlsx, .xls, .csv"
+        )
 
 
 def parse_file(file_path: str, **kwargs) -> list:
@@ -194,17 +278,4 @@ def parse_file(file_path: str, **kwargs) -> list:
         ValueError: If file format is not supported
         FileNotFoundError: If file does not exist
     """
-    if not os.path.exists(file_path):
-        raise FileNotFoundError(f"File not found: {file_path}")
-
-    ext = os.path.splitext(file_path)[1].lower()
-
-    if ext in (".xlsx", ".xls"):
-        return parse_excel(file_path, **kwargs)
-    elif ext == ".csv":
-        return parse_csv(file_path, **kwargs)
-    else:
-        raise ValueError(
-            f"Unsupported file format: '{ext}'. "
-            f"Supported formats: .xlsx, .xls, .csv"
-        )
+    return _parser_for(file_path, streaming=False)(file_path, **kwargs)
@@ -0,0 +1,150 @@
+"""Chunked contact processing pipeline: parse -> validate -> dedup -> score -> store.
+
+Contacts flow through in bounded-size chunks, so memory stays flat no matter
+how large the uploaded file is. Only the dedup state (seen numbers) and the
+list of unique E.164 numbers grow with the input.
+"""
+from dataclasses import dataclass, field
+from itertools import islice
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .deduplicator import ContactDeduplicator
+from .phone_validator import validate_phone
+from .quality_scorer import score_contact
+from app.config import logger
+
+
+# Sink receives one chunk of records ready for ProcessedContactRepository.bulk_create
+ChunkSink = Callable[[list], int]
+ProgressFn = Callable[["ContactStreamStats"], None]
+
+
+@dataclass
+class ContactStreamStats:
+    """Running totals for a streamed contact file."""
+    chunks: int = 0
+    total_parsed: int = 0
+    valid_count: int = 0
+    invalid_count: int = 0
+    duplicates_removed: int = 0
+    records_stored: int = 0
+    score_sum: int = 0
+    quality_distribution: Dict[str, int] = field(
+        default_factory=lambda: {"high": 0, "medium": 0, "low": 0}
+    )
+    country_breakdown: Dict[str, int] = field(default_factory=dict)
+    duplicate_breakdown: Dict[str, int] = field(default_factory=dict)
+    invalid_samples: List[dict] = field(default_factory=list)
+    valid_phones: List[str] = field(default_factory=list)
+
+    @property
+    def avg_quality_score(self) -> float:
+        return self.score_sum / self.valid_count if self.valid_count else 0
+
+
+def _chunks(items: Iterable, size: int):
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def process_contact_stream(
+    contacts: Iterable[dict],
+    sink: ChunkSink,
+    default_country: str = "IN",
+    chunk_size: int = 5000,
+    on_progress: Optional[ProgressFn] = None,
+    invalid_sample_size: int = 10,
+) -> ContactStreamStats:
+    """
+    Validate, deduplicate, score and store contacts chunk by chunk.
+
+    Produces the same records as running each step over the full list:
+    deduplication state carries across chunks, so a number in chunk 5 is
+    still caught as a duplicate of one in chunk 1.
+
+    Args:
+        contacts: Iterable of parsed contact dicts (e.g. from ``iter_file``)
+        sink: Called with each chunk's records; returns how many were stored
+        default_country: Country code for phone validation
+        chunk_size: Contacts per chunk
+        on_progress: Called with the running stats after every chunk
+        invalid_sample_size: Number of invalid rows kept for reporting
+
+    Returns:
+        ContactStreamStats: Totals, distributions and the unique E.164 numbers
+    """
+    stats = ContactStreamStats()
+    dedup = ContactDeduplicator(default_country)
+
+    for chunk in _chunks(contacts, chunk_size):
+        valid_contacts = []
+        invalid_contacts = []
+
+        # Step 1: Validate phone numbers
+        for contact in chunk:
+            phone = contact.get("phone", "")
+            is_valid, e164, country = validate_phone(phone, default_country)
+
+            contact["phone_e164"] = e164
+            contact["country_code"] = country
+            contact["is_valid"] = is_valid
+
+            if is_valid:
+                contact["validation_errors"] = []
+                valid_contacts.append(contact)
+            else:
+                contact["validation_errors"] = [f"Invalid phone: {phone}"]
+                contact["quality_score"] = 0
+                contact["is_duplicate"] = False
+                contact["duplicate_of"] = None
+                invalid_contacts.append(contact)
+                if len(stats.invalid_samples) < invalid_sample_size:
+                    stats.invalid_samples.append({"phone": phone, "row": contact.get("source_row")})
+
+        # Step 2: Deduplicate against everything seen so far
+        unique, duplicates = dedup.process(valid_contacts, normalized_key="phone_e164")
+        for d in duplicates:
+            d["is_duplicate"] = True
+            d["quality_score"] = 0
+
+        # Step 3: Quality score unique contacts
+        for c in unique:
+            score = score_contact(c)
+            c["quality_score"] = score
+            c["is_duplicate"] = False
+            c["duplicate_of"] = None
+
+            stats.score_sum += score
+            if score >= 70:
+                stats.quality_distribution["high"] += 1
+            elif score >= 40:
+                stats.quality_distribution["medium"] += 1
+            else:
+                stats.quality_distribution["low"] += 1
+            cc = c.get("country_code", "UNKNOWN")
+            stats.country_breakdown[cc] = stats.country_breakdown.get(cc, 0) + 1
+            stats.valid_phones.append(c["phone_e164"])
+
+        # Step 4: Store this chunk
+        stats.records_stored += sink(unique + duplicates + invalid_contacts)
+
+        stats.chunks += 1
+        stats.total_parsed += len(chunk)
+        stats.valid_count += len(unique)
+        stats.invalid_count += len(invalid_contacts)
+        stats.duplicates_removed += len(duplicates)
+        stats.duplicate_breakdown = dict(dedup.stage_counts)
+
+        logger.info(
+            f"Processed chunk {stats.chunks}: {stats.total_parsed} contacts so far "
+            f"({stats.valid_count} valid, {stats.invalid_count} invalid, "
+            f"{stats.duplicates_removed} duplicates)"
+        )
+        if on_progress:
+            on_progress(stats)
+
+    return stats
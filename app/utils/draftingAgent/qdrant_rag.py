@@ -3,14 +3,17 @@ from __future__ import annotations
 import os
 import re
 from dataclasses import dataclass, replace
+from functools import lru_cache
 from typing import Any, Optional
 
 from qdrant_client.models import FieldCondition, Filter, MatchValue
 
 try:
     from ...config import logger
+    from ...database.vectordatabse.sparse_encoder import SPARSE_VECTOR_NAME, encode_query
 except ImportError:  # pragma: no cover - fallback for direct execution contexts
     from app.config import logger
+    from app.database.vectordatabse.sparse_encoder import SPARSE_VECTOR_NAME, encode_query
 
 
 @dataclass(frozen=True)
@@ -26,6 +29,10 @@ class DraftingQdrantProfile:
     hnsw_ef: int = 128
     min_doc_length: int = 60
 
+    # Fuse dense and BM25 sparse candidates (RRF) when the collection has sparse vectors.
+    hybrid: bool = True
+    sparse_vector_name: str = SPARSE_VECTOR_NAME
+
     # Payload field names — configurable per collection schema.
     act_name_field: str = "act_name"
     source_type_field: str = "source_type"
@@ -71,9 +78,11 @@ def get_active_qdrant_profile() -> DraftingQdrantProfile:
     Resolve active RAG collection/profile from env:
     - DRAFTING_RAG_PROFILE: logical profile name (default: civil)
     - DRAFTING_RAG_COLLECTION: explicit collection override
+    - DRAFTING_RAG_HYBRID: "0"/"false" forces dense-only retrieval
     """
     profile_name = os.getenv("DRAFTING_RAG_PROFILE", "civil").strip().lower()
     collection_override = os.getenv("DRAFTING_RAG_COLLECTION", "").strip()
+    hybrid_env = os.getenv("DRAFTING_RAG_HYBRID", "").strip().lower()
 
     profile = PROFILE_REGISTRY.get(profile_name)
     if profile is None:
@@ -86,6 +95,8 @@ def get_active_qdrant_profile() -> DraftingQdrantProfile:
 
     if collection_override:
         profile = replace(profile, collection_name=collection_override)
+    if hybrid_env in {"0", "false", "no", "off"}:
+        profile = replace(profile, hybrid=False)
     return profile
 
 
@@ -325,10 +336,19 @@ def _structural_match_bonus(
     return hits / checks
 
 
+_WORD_RE = re.compile(r"[a-zA-Z][a-zA-Z0-9_]+")
+
+
+@lru_cache(maxsize=4096)
+def _document_terms(text: str) -> frozenset[str]:
+    """Word set of a chunk; cached because the same chunks recur across queries."""
+    return frozenset(_WORD_RE.findall(text.lower()))
+
+
 def _keyword_overlap_score(query_terms: tuple[str, ...], text: str) -> float:
     if not query_terms or not text:
         return 0.0
-    doc_terms = set(re.findall(r"[a-zA-Z][a-zA-Z0-9_]+", text.lower()))
+    doc_terms = _document_terms(text)
     if not doc_terms:
         return 0.0
     overlap = len(set(query_terms) & doc_terms)
@@ -351,12 +371,20 @@ def _rerank_points(
     points: list[Any],
     intent: RetrievalIntent,
     profile: DraftingQdrantProfile,
+    normalize_scores: bool = False,
 ) -> list[Any]:
+    """Blend retrieval score, keyword overlap and structural matches.
+
+    ``normalize_scores`` rescales scores to [0, 1] by the best candidate —
+    used for RRF-fused results, whose raw scores are not cosine similarities.
+    """
+    top_score = max((float(getattr(p, "score", 0.0) or 0.0) for p in points), default=0.0)
+    scale = 1.0 / top_score if normalize_scores and top_score > 0 else 1.0
     scored = []
     for point in points:
         payload = point.payload or {}
         text = _payload_get(payload, profile.content_fields, "")
-        vector_score = float(getattr(point, "score", 0.0) or 0.0)
+        vector_score = float(getattr(point, "score", 0.0) or 0.0) * scale
         keyword_score = _keyword_overlap_score(intent.legal_terms, text)
         structural_bonus = _structural_match_bonus(payload, intent, profile)
         combined = (0.60 * vector_score) + (0.25 * keyword_score) + (0.15 * structural_bonus)
@@ -406,7 +434,33 @@ async def retrieve_drafting_context(
     structural_filter = _build_structural_filter(intent=intent, profile=profile)
     filters_to_try = _dedupe_filters([structural_filter, None])
 
+    hybrid = profile.hybrid and await qdrant_db.ahas_sparse_vector(
+        profile.collection_name, profile.sparse_vector_name,
+    )
+
     search_results = []
+    if hybrid:
+        # One round-trip: dense + BM25 branches, plus the same branches under the
+        # structural filter as a ranking boost (section/order/rule payloads are
+        # heuristic, so they must not exclude exact-phrase matches).
+        logger.info(
+            "DraftingRAGTool: hybrid search%s on '%s'.",
+            " with structural boost" if structural_filter is not None else "",
+            profile.collection_name,
+        )
+        search_results = await qdrant_db.aquery_hybrid(
+            collection_name=profile.collection_name,
+            query_embedding=query_embedding,
+            sparse_vector=encode_query(query),
+            top_k=profile.fetch_k,
+            fetch_k=profile.fetch_k,
+            hnsw_ef=profile.hnsw_ef,
+            score_threshold=profile.score_threshold,
+            sparse_vector_name=profile.sparse_vector_name,
+            boost_filter=structural_filter,
+        )
+        filters_to_try = []
+
     for idx, query_filter in enumerate(filters_to_try, start=1):
         label = "structural filter" if query_filter is not None else "semantic-only"
         logger.info(
@@ -432,7 +486,7 @@ async def retrieve_drafting_context(
         )
         return "No relevant documents found for the given query."
 
-    ranked = _rerank_points(points=search_results, intent=intent, profile=profile)
+    ranked = _rerank_points(points=search_results, intent=intent, profile=profile, normalize_scores=hybrid)
     ranked = qdrant_db.post_filter(ranked, min_doc_length=profile.min_doc_length)
     ranked = _select_top_points(points=ranked, profile=profile)
 
@@ -6,6 +6,7 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
 from app import settings, logger
+from app.core.rate_limiter import RateLimitedSession
 
 
 @dataclass
@@ -13,18 +14,20 @@ class AiSensyBaseClient:
     """Base client with shared functionality."""
     timeout: int = 30
     BASE_URL: str = field(default_factory=lambda: settings.BASE_URL)
-    _session: Optional[aiohttp.ClientSession] = field(default=None, init=False, repr=False)
+    _session: Optional[RateLimitedSession] = field(default=None, init=False, repr=False)
     
-    async def _get_session(self) -> aiohttp.ClientSession:
+    async def _get_session(self) -> RateLimitedSession:
         """Get or create HTTP session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
+            # All Partner API calls share one account limit, see app/core/rate_limiter.py
+            self._session = RateLimitedSession(
                 timeout=aiohttp.ClientTimeout(total=self.timeout),
                 headers={
                     "Accept": "application/json",
                     "Content-Type": "application/json",
                     "X-AiSensy-Partner-API-Key": settings.AiSensy_API_Key,
-                }
+                },
+                account_key=f"partner:{settings.PARTNER_ID}",
             )
             logger.debug("New HTTP session created")
         return self._session
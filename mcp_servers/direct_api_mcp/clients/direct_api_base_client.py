@@ -6,6 +6,7 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
 from app import settings, logger
+from app.core.rate_limiter import RateLimitedSession
 
 
 @dataclass
@@ -14,13 +15,14 @@ class AiSensyDirectApiClient:
     
     timeout: int = 30
     BASE_URL: str = settings.Direct_BASE_URL
-    _session: Optional[aiohttp.ClientSession] = field(default=None, init=False, repr=False)
+    _session: Optional[RateLimitedSession] = field(default=None, init=False, repr=False)
     _token: str = field(default_factory=lambda: settings.AiSensy_API_Key)
     
-    async def _get_session(self) -> aiohttp.ClientSession:
+    async def _get_session(self) -> RateLimitedSession:
         """Get or create HTTP session."""
         if self._session is None or self._session.closed:
-            self._session = aiohttp.ClientSession(
+            # Requests are limited per account (JWT) and per endpoint, see app/core/rate_limiter.py
+            self._session = RateLimitedSession(
                 timeout=aiohttp.ClientTimeout(total=self.timeout),
                 headers={
                     "Accept": "application/json",
@@ -99,12 +99,15 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
 
     # ==================== TEMPLATES ====================
 
-    async def get_templates(self,jwt_token:str) -> Dict[str, Any]:
+    async def get_templates(self,jwt_token:str, after: Optional[str] = None) -> Dict[str, Any]:
         """
         Fetch all templates from the AiSensy Direct API.
         
         Endpoint: GET /get-templates
 
+        Args:
+            after: Paging cursor (``paging.cursors.after`` of the previous page).
+
         Returns:
             Dict[str, Any]: A dictionary containing all templates
             as returned by the AiSensy API.
@@ -119,8 +122,10 @@ class AiSensyDirectApiGetClient(AiSensyDirectApiClient):
                 "Authorization": f"Bearer {jwt_token}"
             }
 
+            params = {"after": after} if after else None
+
             session = await self._get_session()
-            async with session.get(url,headers=headers) as response:
+            async with session.get(url,headers=headers,params=params) as response:
                 if response.status == 200:
                     data = await response.json()
                     logger.info("Successfully fetched templates")
@@ -52,7 +52,13 @@ from .media import (
 )
 
 # Messages tools
-from .messages import send_message, send_marketing_lite_message, mark_message_as_read
+from .messages import (
+    send_message,
+    send_marketing_lite_message,
+    mark_message_as_read,
+    send_message_batch,
+    send_marketing_lite_message_batch,
+)
 
 from .templates import (compare_template,edit_template,submit_whatsapp_template_message,
                                   get_templates,get_template_by_id,
@@ -133,6 +139,8 @@ __all__ = [
     "send_message",
     "send_marketing_lite_message",
     "mark_message_as_read",
+    "send_message_batch",
+    "send_marketing_lite_message_batch",
     # Phone number
     "get_all_phone_numbers",
     "get_display_name_status",
@@ -9,6 +9,7 @@ from ... import mcp
 from ....clients import get_direct_api_post_client
 from ....models import MessagingHealthStatusRequest
 from app import logger
+from app.database.postgresql.user_context import remember_tier
 
 
 @mcp.tool(
@@ -54,6 +55,11 @@ async def get_messaging_health_status(node_id: str) -> Dict[str, Any]:
             
             if response.get("success"):
                 logger.info(f"Successfully retrieved messaging health status for node: {request.node_id}")
+                data = response.get("data")
+                tier = data.get("messaging_tier", data.get("tier")) if isinstance(data, dict) else None
+                if tier:
+                    # Callers pass the user_id as node_id
+                    remember_tier(request.node_id, str(tier))
             else:
                 logger.warning(
                     f"Failed to retrieve messaging health status: {response.get('error')}"
@@ -17,6 +17,7 @@ from app.database.postgresql.postgresql_repositories import (
     ProjectCreationRepository,
     MemoryRepository
 )
+from app.database.postgresql.user_context import invalidate_user_context
 
 
 @mcp.tool(
@@ -142,6 +143,9 @@ async def regenerate_jwt_bearer_token(user_id: str, direct_api: bool = True) ->
             )
 
             if response.get("success"):
+                # The previous JWT may be revoked now, even if saving the new one below fails
+                invalidate_user_context(user_id)
+
                 logger.info("=" * 80)
                 logger.info("✓ Successfully regenerated JWT bearer token")
                 logger.info(f"  - User: {email}")
@@ -1,6 +1,9 @@
 from .send_message import send_message
 from .send_lite_message import send_marketing_lite_message
 from .mark_message_as_read import mark_message_as_read
+from .send_message_batch import send_message_batch
+from .send_lite_message_batch import send_marketing_lite_message_batch
 
 
-__all__=["send_message","send_marketing_lite_message","mark_message_as_read"]
\ No newline at end of file
+__all__=["send_message","send_marketing_lite_message","mark_message_as_read",
+         "send_message_batch","send_marketing_lite_message_batch"]
\ No newline at end of file
@@ -0,0 +1,77 @@
+"""
+Shared fan-out helper for the batch message tools.
+
+Sends one request per recipient over the shared POST client session with a
+bounded number of requests in flight, and reduces each Direct API response
+to a compact per-recipient entry so a 1000-recipient batch stays small on
+the wire back to the MCP caller.
+"""
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List
+
+from app.utils.broadcasting import build_outcome
+
+
+MAX_BATCH_SIZE = 1000
+MAX_BATCH_CONCURRENCY = 64
+
+
+def compact_result(to: str, response: Dict[str, Any]) -> Dict[str, Any]:
+    """Reduce a Direct API send response to {to, ok, id} or {to, ok, error, status_code, code}."""
+    outcome = build_outcome(0, to, response, 0.0)
+    if outcome.success:
+        return {"to": to, "ok": True, "id": outcome.message_id}
+    entry = {"to": to, "ok": False, "error": outcome.error}
+    if isinstance(response, dict) and response.get("status_code") is not None:
+        entry["status_code"] = response["status_code"]
+    if outcome.error_code:
+        entry["code"] = outcome.error_code
+    return entry
+
+
+async def fan_out(
+    recipients: List[Dict[str, Any]],
+    send_one: Callable[[Dict[str, Any]], Awaitable[Dict[str, Any]]],
+    max_concurrency: int,
+) -> Dict[str, Any]:
+    """
+    Run ``send_one`` for every recipient with at most ``max_concurrency`` in flight.
+
+    Results keep the input order. Exceptions from ``send_one`` are recorded
+    as failed entries instead of aborting the batch.
+    """
+    semaphore = asyncio.Semaphore(max(1, min(max_concurrency, MAX_BATCH_CONCURRENCY)))
+
+    async def _guarded(recipient: Dict[str, Any]) -> Dict[str, Any]:
+        to = str(recipient.get("to", ""))
+        async with semaphore:
+            try:
+                return compact_result(to, await send_one(recipient))
+            except ValueError as e:
+                return {"to": to, "ok": False, "error": f"Validation error: {e}"}
+            except Exception as e:
+                return {"to": to, "ok": False, "error": str(e)}
+
+    started = time.perf_counter()
+    results = await asyncio.gather(*(_guarded(r) for r in recipients))
+    sent = sum(1 for r in results if r["ok"])
+    return {
+        "success": True,
+        "total": len(results),
+        "sent": sent,
+        "failed": len(results) - sent,
+        "elapsed_ms": round((time.perf_counter() - started) * 1000, 1),
+        "results": results,
+    }
+
+
+def check_batch(recipients: Any) -> str:
+    """Return an error message if ``recipients`` is not a usable batch, else ''."""
+    if not isinstance(recipients, list) or not recipients:
+        return "recipients must be a non-empty list"
+    if len(recipients) > MAX_BATCH_SIZE:
+        return f"Batch too large: {len(recipients)} recipients (max {MAX_BATCH_SIZE} per call)"
+    if not all(isinstance(r, dict) and r.get("to") for r in recipients):
+        return "Every recipient must be an object with a 'to' phone number"
+    return ""
@@ -0,0 +1,100 @@
+"""
+MCP Tool: Post Send Marketing Lite Message Batch
+
+Sends a Marketing Lite message to many recipients in one MCP call via the AiSensy Direct API.
+"""
+from typing import Any, Dict, List, Optional
+
+from .. import mcp
+from ...clients import get_direct_api_post_client
+from ...models import SendMarketingLiteMessageRequest
+from ._batch import check_batch, fan_out
+from app import logger
+
+
+@mcp.tool(
+    name="send_marketing_lite_message_batch",
+    description=(
+        "Sends a Marketing Lite message to a batch of recipients via the AiSensy Direct API. "
+        "Sends concurrently over one shared HTTP session; each recipient may carry its own text. "
+        "Returns compact per-recipient results: {to, ok, id} or {to, ok, error, status_code, code}."
+    ),
+    tags={
+        "message",
+        "marketing",
+        "send",
+        "batch",
+        "broadcast",
+        "whatsapp",
+        "post",
+        "direct-api",
+        "aisensy"
+    },
+    meta={
+        "version": "1.0.0",
+        "author": "AiSensy Team",
+        "category": "Messaging"
+    }
+)
+async def send_marketing_lite_message_batch(
+    recipients: List[Dict[str, Any]],
+    text_body: Optional[str] = None,
+    message_type: str = "text",
+    max_concurrency: int = 16,
+    recipient_type: str = "individual"
+) -> Dict[str, Any]:
+    """
+    Send a Marketing Lite message to a batch of recipients.
+
+    Args:
+        recipients: List of recipient objects, each with "to" and optionally
+            "text_body" overriding the batch-level text (max 1000 per call)
+        text_body: Default message body text
+        message_type: Type of message (default: "text")
+        max_concurrency: Requests in flight at once (default: 16, max: 64)
+        recipient_type: Type of recipient (default: "individual")
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the batch was processed
+        - total / sent / failed (int): Per-recipient counts
+        - results (list): Compact per-recipient results in input order
+        - error (str): Error message if the batch was rejected
+    """
+    try:
+        batch_error = check_batch(recipients)
+        if batch_error:
+            logger.warning(f"send_marketing_lite_message_batch rejected: {batch_error}")
+            return {"success": False, "error": batch_error}
+
+        async with get_direct_api_post_client() as client:
+
+            async def _send_one(recipient: Dict[str, Any]) -> Dict[str, Any]:
+                request = SendMarketingLiteMessageRequest(
+                    to=str(recipient["to"]),
+                    text_body=recipient.get("text_body", text_body),
+                    message_type=message_type,
+                    recipient_type=recipient_type
+                )
+                return await client.send_marketing_lite_message(
+                    to=request.to,
+                    message_type=request.message_type,
+                    text_body=request.text_body,
+                    recipient_type=request.recipient_type
+                )
+
+            response = await fan_out(recipients, _send_one, max_concurrency)
+
+        logger.info(
+            f"send_marketing_lite_message_batch: {response['sent']} sent, "
+            f"{response['failed']} failed of {response['total']} in {response['elapsed_ms']}ms"
+        )
+        return response
+
+    except Exception as e:
+        error_msg = f"Unexpected error sending marketing lite message batch: {str(e)}"
+        logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
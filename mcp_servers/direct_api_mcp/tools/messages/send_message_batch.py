@@ -0,0 +1,145 @@
+"""
+MCP Tool: Post Send Message Batch
+
+Sends a WhatsApp message to many recipients in one MCP call via the AiSensy Direct API.
+"""
+from typing import Any, Dict, List, Optional
+
+from .. import mcp
+from ...clients import get_direct_api_post_client
+from ...models import SendMessageRequest
+from ._batch import check_batch, fan_out
+from app import logger
+from app.database.postgresql.user_context import get_user_context, invalidate_user_context
+
+
+@mcp.tool(
+    name="send_message_batch",
+    description=(
+        "Sends a WhatsApp message to a batch of recipients via the AiSensy Direct API. "
+        "Resolves the JWT once and sends concurrently over one shared HTTP session. "
+        "Each recipient may carry its own template components (e.g. personalised body parameters). "
+        "Returns compact per-recipient results: {to, ok, id} or {to, ok, error, status_code, code}."
+    ),
+    tags={
+        "message",
+        "send",
+        "batch",
+        "broadcast",
+        "whatsapp",
+        "post",
+        "direct-api",
+        "aisensy"
+    },
+    meta={
+        "version": "1.0.0",
+        "author": "AiSensy Team",
+        "category": "Messaging"
+    }
+)
+async def send_message_batch(
+    user_id: str,
+    recipients: List[Dict[str, Any]],
+    message_type: str = "template",
+    template_name: Optional[str] = None,
+    template_language_code: Optional[str] = None,
+    template_language_policy: Optional[str] = "deterministic",
+    template_components: Optional[list] = None,
+    text_body: Optional[str] = None,
+    media_link: Optional[str] = None,
+    media_caption: Optional[str] = None,
+    media_filename: Optional[str] = None,
+    max_concurrency: int = 16,
+    recipient_type: str = "individual"
+) -> Dict[str, Any]:
+    """
+    Send the same message to a batch of recipients.
+
+    Args:
+        user_id: User ID to fetch JWT token from TempMemory (looked up once per batch)
+        recipients: List of recipient objects, each with "to" and optionally
+            "template_components" or "text_body" overriding the batch-level value
+            (max 1000 per call)
+        message_type: Type of message (default: "template")
+        template_name: Template name (required for type "template")
+        template_language_code: Template language code (required for type "template")
+        template_language_policy: Template language policy (default: "deterministic")
+        template_components: Default template components for recipients without their own
+        text_body: Default message body for type "text"
+        media_link: URL of the media (for image, video, audio, document)
+        media_caption: Caption for the media (optional)
+        media_filename: Filename for document type (optional)
+        max_concurrency: Requests in flight at once (default: 16, max: 64)
+        recipient_type: Type of recipient (default: "individual")
+
+    Returns:
+        Dict containing:
+        - success (bool): Whether the batch was processed
+        - total / sent / failed (int): Per-recipient counts
+        - results (list): Compact per-recipient results in input order
+        - error (str): Error message if the batch was rejected
+    """
+    try:
+        batch_error = check_batch(recipients)
+        if batch_error:
+            logger.warning(f"send_message_batch rejected: {batch_error}")
+            return {"success": False, "error": batch_error}
+
+        context = await get_user_context(user_id)
+        if not context or not context.jwt_token:
+            error_msg = f"No JWT token found in TempMemory for user_id: {user_id}"
+            logger.error(error_msg)
+            return {"success": False, "error": error_msg}
+
+        jwt_token = context.jwt_token
+
+        async with get_direct_api_post_client() as client:
+
+            async def _send_one(recipient: Dict[str, Any]) -> Dict[str, Any]:
+                request = SendMessageRequest(
+                    to=str(recipient["to"]),
+                    message_type=message_type,
+                    text_body=recipient.get("text_body", text_body),
+                    media_link=media_link,
+                    media_caption=media_caption,
+                    media_filename=media_filename,
+                    template_name=template_name,
+                    template_language_code=template_language_code,
+                    template_language_policy=template_language_policy,
+                    template_components=recipient.get("template_components", template_components),
+                    recipient_type=recipient_type
+                )
+                return await client.send_message(
+                    to=request.to,
+                    message_type=request.message_type,
+                    jwt_token=jwt_token,
+                    text_body=request.text_body,
+                    media_link=request.media_link,
+                    media_caption=request.media_caption,
+                    media_filename=request.media_filename,
+                    template_name=request.template_name,
+                    template_language_code=request.template_language_code,
+                    template_language_policy=request.template_language_policy,
+                    template_components=request.template_components,
+                    recipient_type=request.recipient_type
+                )
+
+            response = await fan_out(recipients, _send_one, max_concurrency)
+
+        if any(r.get("status_code") == 401 for r in response["results"]):
+            # JWT rejected: reload it (e.g. regenerated by another process) on the next call
+            invalidate_user_context(user_id)
+
+        logger.info(
+            f"send_message_batch for user_id {user_id}: {response['sent']} sent, "
+            f"{response['failed']} failed of {response['total']} in {response['elapsed_ms']}ms"
+        )
+        return response
+
+    except Exception as e:
+        error_msg = f"Unexpected error sending message batch: {str(e)}"
+        logger.exception(error_msg)
+        return {
+            "success": False,
+            "error": error_msg
+        }
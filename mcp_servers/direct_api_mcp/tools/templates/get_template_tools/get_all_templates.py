@@ -3,13 +3,12 @@ MCP Tool: Get Templates
 
 Fetches all templates from the AiSensy Direct API.
 """
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 
 from ... import mcp
 from ....clients import get_direct_api_get_client
 from app import logger
-from app.database.postgresql.postgresql_connection import get_session
-from app.database.postgresql.postgresql_repositories import MemoryRepository
+from app.database.postgresql.user_context import get_user_context
 
 
 @mcp.tool(
@@ -17,7 +16,8 @@ from app.database.postgresql.postgresql_repositories import MemoryRepository
     description=(
         "Fetches all WhatsApp templates from the AiSensy Direct API. "
         "Returns a list of all templates associated with the account "
-        "including their name, category, language, and approval status."
+        "including their name, category, language, and approval status. "
+        "Results are paged; pass paging.cursors.after as 'after' for the next page."
     ),
     tags={
         "templates",
@@ -33,9 +33,12 @@ from app.database.postgresql.postgresql_repositories import MemoryRepository
         "category": "Template Management"
     }
 )
-async def get_templates(user_id:str) -> Dict[str, Any]:
+async def get_templates(user_id:str, after: Optional[str] = None) -> Dict[str, Any]:
     """
     Fetch all templates.
+
+    Args:
+        after: Paging cursor of the page to fetch (omit for the first page).
     
     Returns:
         Dict containing:
@@ -45,21 +48,16 @@ async def get_templates(user_id:str) -> Dict[str, Any]:
     """
     try:
         
-        logger.info(f"Fetching JWT token from TempMemory for user_id: {user_id}")
-        with get_session() as session:
-            memory_repo = MemoryRepository(session=session)
-            memory_record = memory_repo.get_by_user_id(user_id)
-
-        if not memory_record or not memory_record.get("jwt_token"):
+        context = await get_user_context(user_id)
+        if not context or not context.jwt_token:
             error_msg = f"No JWT token found in TempMemory for user_id: {user_id}"
             logger.error(error_msg)
             return {"success": False, "error": error_msg}
 
-        jwt_token = memory_record["jwt_token"]
-        logger.info(f"JWT token fetched successfully for user_id: {user_id}")
+        jwt_token = context.jwt_token
         
         async with get_direct_api_get_client() as client:
-            response = await client.get_templates(jwt_token=jwt_token)
+            response = await client.get_templates(jwt_token=jwt_token, after=after)
             
             if response.get("success"):
                 data = response.get("data", [])
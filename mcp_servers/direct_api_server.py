@@ -1,8 +1,26 @@
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
 from direct_api_mcp import mcp
+from app.core.rate_limiter import get_rate_limiter_stats
+from app.database.postgresql.user_context import get_user_context_stats
+
+
+@mcp.custom_route("/metrics/rate-limiter", methods=["GET"])
+async def rate_limiter_metrics(request: Request) -> JSONResponse:
+    """AiSensy client limiter and circuit state for this server process."""
+    return JSONResponse(get_rate_limiter_stats())
+
+
+@mcp.custom_route("/metrics/user-context", methods=["GET"])
+async def user_context_metrics(request: Request) -> JSONResponse:
+    """JWT / account context cache counters for this server process."""
+    return JSONResponse(get_user_context_stats())
+
 
 if __name__ == "__main__":
     mcp.run(
         transport="http",
         host="0.0.0.0",
         port=9002,
-    )
\ No newline at end of file
+    )
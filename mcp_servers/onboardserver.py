@@ -1,5 +1,16 @@
 # server.py
-from boarding_mcp import mcp  
+from starlette.requests import Request
+from starlette.responses import JSONResponse
+
+from boarding_mcp import mcp
+from app.core.rate_limiter import get_rate_limiter_stats
+
+
+@mcp.custom_route("/metrics/rate-limiter", methods=["GET"])
+async def rate_limiter_metrics(request: Request) -> JSONResponse:
+    """AiSensy client limiter and circuit state for this server process."""
+    return JSONResponse(get_rate_limiter_stats())
+
 
 if __name__ == "__main__":
     mcp.run(
@@ -0,0 +1,154 @@
+"""
+Contact File Ingestion Benchmark
+
+Writes a synthetic contact CSV (default 1M rows, ~10% duplicates and ~2%
+invalid numbers) and runs it through the streaming pipeline used by
+process_contact_file: iter_file -> validate -> dedup -> score -> store.
+Records go to a throwaway SQLite database through ProcessedContactRepository
+(or are discarded with --sink null). Reports throughput and peak RSS.
+
+Run one mode per process so peak RSS is not shared between runs:
+
+Usage:
+    python scripts/benchmark_contact_ingest.py
+    python scripts/benchmark_contact_ingest.py --rows 200000 --chunk-size 5000 --sink null
+    python scripts/benchmark_contact_ingest.py --rows 200000 --mode legacy
+"""
+
+import argparse
+import csv
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlmodel import Session, SQLModel, create_engine
+
+from app.database.postgresql.models.processed_contact import ProcessedContact
+from app.database.postgresql.postgresql_repositories.processed_contact_repo import ProcessedContactRepository
+from app.utils.data_processing import (
+    deduplicate_contacts,
+    iter_file,
+    parse_file,
+    process_contact_stream,
+    score_contacts,
+    validate_phone,
+)
+
+
+# ============================================
+# DATA
+# ============================================
+
+def write_csv(path: str, rows: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    recent = []
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["name", "phone", "email", "city", "plan"])
+        for i in range(rows):
+            roll = rng.random()
+            if recent and roll < 0.10:
+                phone = rng.choice(recent)                              # duplicate
+            elif roll < 0.12:
+                phone = str(rng.randint(10_000, 99_999))                # invalid
+            else:
+                phone = "+91" + str(rng.randint(6_000_000_000, 9_999_999_999))
+                recent.append(phone)
+                if len(recent) > 10_000:
+                    recent.pop(rng.randrange(len(recent)))
+            writer.writerow([f"Contact {i}", phone, f"c{i}@example.com", "Pune", rng.choice(("gold", "silver"))])
+
+
+def rss_mb() -> float:
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+# ============================================
+# SINKS / MODES
+# ============================================
+
+def make_sink(kind: str, db_path: str):
+    if kind == "null":
+        return (lambda records: len(records)), None
+    engine = create_engine(f"sqlite:///{db_path}")
+    SQLModel.metadata.create_all(engine, tables=[ProcessedContact.__table__])
+    session = Session(engine)
+    repo = ProcessedContactRepository(session=session)
+    return (lambda records: repo.bulk_create(records, "bench-job", "bench-user")), session
+
+
+def run_streaming(path: str, sink, chunk_size: int) -> dict:
+    stats = process_contact_stream(iter_file(path), sink=sink, chunk_size=chunk_size)
+    return {
+        "parsed": stats.total_parsed,
+        "valid": stats.valid_count,
+        "invalid": stats.invalid_count,
+        "duplicates": stats.duplicates_removed,
+        "stored": stats.records_stored,
+    }
+
+
+def run_legacy(path: str, sink) -> dict:
+    """The pre-streaming flow: every stage holds the full list."""
+    raw = parse_file(path)
+    valid, invalid = [], []
+    for c in raw:
+        ok, e164, cc = validate_phone(c["phone"])
+        c.update(phone_e164=e164, country_code=cc, is_valid=ok)
+        (valid if ok else invalid).append(c)
+    unique, duplicates = deduplicate_contacts(valid)
+    score_contacts(unique)
+    stored = sink(unique + duplicates + invalid)
+    return {
+        "parsed": len(raw),
+        "valid": len(unique),
+        "invalid": len(invalid),
+        "duplicates": len(duplicates),
+        "stored": stored,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark streaming contact ingestion")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--chunk-size", type=int, default=5000)
+    parser.add_argument("--sink", choices=("sqlite", "null"), default="sqlite")
+    parser.add_argument("--mode", choices=("streaming", "legacy"), default="streaming")
+    parser.add_argument("--csv", help="Reuse an existing CSV instead of generating one")
+    args = parser.parse_args()
+
+    workdir = tempfile.mkdtemp(prefix="contact_ingest_")
+    path = args.csv or os.path.join(workdir, "contacts.csv")
+    if not args.csv:
+        started = time.perf_counter()
+        write_csv(path, args.rows)
+        print(f"wrote {args.rows} rows to {path} in {time.perf_counter() - started:.1f}s")
+
+    baseline = rss_mb()
+    sink, session = make_sink(args.sink, os.path.join(workdir, "contacts.db"))
+    started = time.perf_counter()
+    try:
+        if args.mode == "streaming":
+            result = run_streaming(path, sink, args.chunk_size)
+        else:
+            result = run_legacy(path, sink)
+    finally:
+        if session is not None:
+            session.close()
+    elapsed = time.perf_counter() - started
+
+    print()
+    print(f"mode={args.mode} sink={args.sink} chunk_size={args.chunk_size}")
+    print(f"result: {result}")
+    print(f"elapsed: {elapsed:.1f}s ({result['parsed'] / elapsed:,.0f} rows/s)")
+    print(f"peak RSS: {rss_mb():.0f} MB (baseline after imports: {baseline:.0f} MB)")
+
+
+if __name__ == "__main__":
+    main()
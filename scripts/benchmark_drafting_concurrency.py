@@ -0,0 +1,286 @@
+"""
+Drafting Graph Concurrency Benchmark
+
+Runs N simultaneous ``drafting_graph.ainvoke`` sessions against a local fake
+chat model (fixed async latency, canned intake JSON and plaint text, no
+network). Every LLM reference in the drafting nodes is patched to the fake,
+so the numbers show how the graph itself behaves under concurrency: whether
+nodes block the event loop and how calls queue behind the per-model limiter.
+
+Reports wall time, sessions/sec, per-session p50/p95 and per-node p50/p95.
+
+Usage:
+    python scripts/benchmark_drafting_concurrency.py
+    python scripts/benchmark_drafting_concurrency.py --sessions 50 --latency-ms 400 --max-concurrency 8
+"""
+
+import argparse
+import asyncio
+import importlib
+import logging
+import os
+import sys
+import time
+from collections import defaultdict
+from typing import Any, Dict, List, Optional
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langchain_core.runnables import RunnableLambda
+
+from app.config import settings
+
+
+SCENARIO = (
+    "Draft a plaint for recovery of Rs.15,00,000 given as a hand loan. "
+    "The plaintiff Ram Kumar, aged 45, resident of Jayanagar, Bengaluru, "
+    "advanced Rs.15,00,000 to the defendant Suresh Patel, aged 38, resident of "
+    "Koramangala, Bengaluru, on 15.03.2024 via NEFT bank transfer "
+    "(UTR: AXIB20240315123456). There was no written agreement. "
+    "Despite a legal notice dated 01.07.2024, the defendant has failed to repay. "
+    "File in City Civil Court, Bengaluru."
+)
+
+INTAKE_CLASSIFY = {
+    "facts": {
+        "summary": "Hand loan of Rs.15,00,000 advanced by NEFT on 15.03.2024 and not repaid.",
+        "chronology": [
+            {"date": "15.03.2024", "event": "Loan advanced via NEFT"},
+            {"date": "01.07.2024", "event": "Legal notice issued"},
+        ],
+        "amounts": {"principal": 1500000, "interest_rate": 12},
+        "cause_of_action_date": "20.06.2024",
+    },
+    "jurisdiction": {"country": "India", "state": "Karnataka", "city": "Bengaluru",
+                     "court_type": "City Civil Court", "place": "Bengaluru"},
+    "parties": {
+        "primary": {"name": "Ram Kumar", "age": "45", "address": "Jayanagar, Bengaluru", "role": "plaintiff"},
+        "opposite": [{"name": "Suresh Patel", "age": "38", "address": "Koramangala, Bengaluru", "role": "defendant"}],
+    },
+    "evidence": [{"type": "bank_transfer", "description": "NEFT transfer", "ref": "AXIB20240315123456"}],
+    "law_domain": "Civil",
+    "doc_type": "plaint",
+    "cause_type": "money_recovery_loan",
+    "classification": {"topics": ["money recovery"], "risk_level": "low"},
+    "rag_plan": {"collections": [], "queries": []},
+}
+
+# Passing review for the review node's structured output
+REVIEW = {"review": {"review_pass": True}}
+
+PLAINT_TEXT = "\n\n".join([
+    "IN THE COURT OF THE CITY CIVIL JUDGE AT BENGALURU",
+    "O.S. No. ____ of 2024",
+    "Ram Kumar, aged 45 years, residing at Jayanagar, Bengaluru ... PLAINTIFF",
+    "Suresh Patel, aged 38 years, residing at Koramangala, Bengaluru ... DEFENDANT",
+    "PLAINT UNDER ORDER VII RULE 1 OF THE CODE OF CIVIL PROCEDURE, 1908",
+    "FACTS OF THE CASE\n" + (
+        "1. The Plaintiff advanced a sum of Rs.15,00,000 to the Defendant on 15.03.2024 "
+        "by NEFT transfer bearing UTR AXIB20240315123456. The Defendant has failed to repay "
+        "the amount despite demands and a legal notice dated 01.07.2024. "
+    ) * 3,
+    "CAUSE OF ACTION\nThe cause of action arose on 20.06.2024 when the Defendant defaulted.",
+    "JURISDICTION\nThe Defendant resides within the jurisdiction of this Court.",
+    "PRAYER\nThe Plaintiff prays for a decree of Rs.15,00,000 with interest at 12% per annum.",
+])
+
+
+# ============================================
+# FAKE CHAT MODEL
+# ============================================
+
+class FakeDraftingChatModel(BaseChatModel):
+    """Chat model that sleeps for ``latency_s`` and returns canned drafting output.
+
+    ``with_structured_output(schema)`` returns the canned review for
+    ``ReviewNode`` and the canned intake/classify payload for every other schema.
+    """
+
+    model_name: str = "fake-drafting"
+    latency_s: float = 0.2
+
+    @property
+    def _llm_type(self) -> str:
+        return "fake-drafting"
+
+    def _result(self, **kwargs: Any) -> ChatResult:
+        schema = kwargs.get("structured_schema")
+        if schema is None:
+            content = PLAINT_TEXT
+        else:
+            payload = REVIEW if schema.__name__ == "ReviewNode" else INTAKE_CLASSIFY
+            content = schema.model_validate(payload).model_dump_json()
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=content))])
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        time.sleep(self.latency_s)
+        return self._result(**kwargs)
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(self.latency_s)
+        return self._result(**kwargs)
+
+    def with_structured_output(self, schema, **kwargs):
+        return self.bind(structured_schema=schema) | RunnableLambda(
+            lambda message: schema.model_validate_json(message.content)
+        )
+
+
+# Node module attribute -> fake model name (one limiter key per real model role)
+_MODEL_PATCHES = {
+    "intake_classify": {"ollma_model": "fake-glm"},
+    "intake": {"ollma_model": "fake-glm"},
+    "classifiy": {"ollma_model": "fake-glm"},
+    "enrichment": {"glm_model": "fake-glm"},
+    "draft_single_call": {"draft_openai_model": "fake-draft"},
+    "draft_template_fill": {"draft_openai_model": "fake-draft"},
+    "section_drafter": {"draft_openai_model": "fake-draft"},
+    "section_fixer": {"draft_openai_model": "fake-draft"},
+    "reviews": {"review_ollama_model": "fake-review"},
+}
+
+
+def patch_models(latency_s: float) -> None:
+    fakes: Dict[str, FakeDraftingChatModel] = {}
+    for module_name, attrs in _MODEL_PATCHES.items():
+        module = importlib.import_module(f"app.agents.drafting_agents.nodes.{module_name}")
+        for attr, model_name in attrs.items():
+            if model_name not in fakes:
+                fakes[model_name] = FakeDraftingChatModel(model_name=model_name, latency_s=latency_s)
+            setattr(module, attr, fakes[model_name])
+
+
+# ============================================
+# PER-NODE TIMING
+# ============================================
+
+class NodeTimer(BaseCallbackHandler):
+    """Records wall time of every graph node run (chain runs named after their node)."""
+
+    run_inline = True
+
+    def __init__(self):
+        self._started: Dict[Any, tuple] = {}
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+
+    def on_chain_start(self, serialized, inputs, *, run_id, metadata=None, **kwargs):
+        node = (metadata or {}).get("langgraph_node")
+        if node and kwargs.get("name") == node:
+            self._started[run_id] = (node, time.perf_counter())
+
+    def _finish(self, run_id) -> None:
+        started = self._started.pop(run_id, None)
+        if started:
+            node, t0 = started
+            self.durations[node].append(time.perf_counter() - t0)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._finish(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._finish(run_id)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+
+async def run_benchmark(sessions: int, timer: NodeTimer) -> Dict[str, Any]:
+    from app.agents.drafting_agents import drafting_graph
+
+    async def _one(i: int) -> Optional[float]:
+        t0 = time.perf_counter()
+        try:
+            result = await drafting_graph.ainvoke(
+                {"user_request": SCENARIO},
+                config={"callbacks": [timer], "recursion_limit": 60},
+            )
+        except Exception as exc:
+            print(f"session {i} failed: {exc}")
+            return None
+        if not (result.get("final_draft") or result.get("draft")):
+            print(f"session {i} finished without a draft: {result.get('errors')}")
+        return time.perf_counter() - t0
+
+    # Event-loop lag probe: a blocked loop shows up as large sleep overshoot
+    lag: List[float] = []
+    stop = asyncio.Event()
+
+    async def _probe():
+        while not stop.is_set():
+            t0 = time.perf_counter()
+            await asyncio.sleep(0.01)
+            lag.append(time.perf_counter() - t0 - 0.01)
+
+    probe = asyncio.create_task(_probe())
+    t0 = time.perf_counter()
+    latencies = await asyncio.gather(*(_one(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - t0
+    stop.set()
+    await probe
+
+    return {
+        "elapsed_s": elapsed,
+        "latencies": [x for x in latencies if x is not None],
+        "failed": sum(1 for x in latencies if x is None),
+        "max_loop_lag_ms": max(lag, default=0.0) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark concurrent drafting graph sessions")
+    parser.add_argument("--sessions", type=int, default=20)
+    parser.add_argument("--latency-ms", type=float, default=200.0, help="Fake LLM latency per call")
+    parser.add_argument("--max-concurrency", type=int, default=settings.DRAFTING_LLM_MAX_CONCURRENCY,
+                        help="In-flight LLM calls per model (DRAFTING_LLM_MAX_CONCURRENCY)")
+    parser.add_argument("--verbose", action="store_true", help="Keep node logging")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+    settings.DRAFTING_LLM_MAX_CONCURRENCY = args.max_concurrency
+    patch_models(args.latency_ms / 1000)
+
+    timer = NodeTimer()
+    report = asyncio.run(run_benchmark(args.sessions, timer))
+
+    from app.services import get_llm_limiter_stats
+
+    latencies = report["latencies"]
+    print()
+    print(
+        f"sessions={args.sessions} fake_latency={args.latency_ms:.0f}ms "
+        f"max_concurrency={args.max_concurrency} failed={report['failed']}"
+    )
+    print(
+        f"wall={report['elapsed_s']:.2f}s sessions/s={len(latencies) / report['elapsed_s']:.2f} "
+        f"session_p50={percentile(latencies, 50):.2f}s session_p95={percentile(latencies, 95):.2f}s "
+        f"max_loop_lag={report['max_loop_lag_ms']:.0f}ms"
+    )
+    print()
+    print(f"{'node':<32} {'runs':>6} {'p50_ms':>10} {'p95_ms':>10}")
+    for node, durations in sorted(timer.durations.items(), key=lambda kv: -percentile(kv[1], 95)):
+        print(
+            f"{node:<32} {len(durations):>6} {percentile(durations, 50) * 1000:>10.1f} "
+            f"{percentile(durations, 95) * 1000:>10.1f}"
+        )
+    print()
+    for key, stats in get_llm_limiter_stats().items():
+        print(f"limiter {key}: calls={stats['calls']} peak_in_flight={stats['peak_in_flight']} timeouts={stats['timeouts']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""
+LKB Keyword Matching Benchmark
+
+For every registered Civil cause type, builds a long synthetic draft (the
+cause's keywords scattered through legal filler text) and times:
+
+  infer    ``infer_cause_type`` against the previous per-cause, per-keyword
+           ``kw in text`` scoring loop (results are checked to agree)
+  gates    one Aho-Corasick pass over the draft for every keyword registered
+           with the Civil automaton against one ``kw in text`` scan per keyword
+
+Usage:
+    python scripts/benchmark_lkb_keywords.py
+    python scripts/benchmark_lkb_keywords.py --draft-chars 60000 --repeats 5
+"""
+
+import argparse
+import importlib
+import os
+import random
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.agents.drafting_agents import lkb
+
+
+FILLER = (
+    "The plaintiff respectfully submits that the facts stated hereinabove are true and correct "
+    "to the best of his knowledge and belief, and that the cause of action arose within the "
+    "territorial jurisdiction of this Hon'ble Court. "
+)
+
+
+# ============================================
+# DATA
+# ============================================
+
+def make_draft(keywords: list, chars: int, rng: random.Random) -> str:
+    parts = []
+    size = 0
+    while size < chars:
+        piece = FILLER if not keywords or rng.random() < 0.8 else rng.choice(keywords) + ". "
+        parts.append(piece)
+        size += len(piece)
+    return "".join(parts)
+
+
+# ============================================
+# PREVIOUS IMPLEMENTATION
+# ============================================
+
+def legacy_infer_cause_type(doc_type, user_request, topics=None):
+    text = f"{doc_type} {user_request} {' '.join(topics or [])}".lower()
+    domain_entries = lkb._REGISTRY.get("civil", {})
+    best, best_score = "", 0.0
+    for code, entry in domain_entries.items():
+        score = sum(1.0 for kw in entry.get("doc_type_keywords", []) if kw.lower() in text)
+        if code == "money_recovery_loan" and ("advance" in text and ("fail" in text or "refund" in text)):
+            score -= 0.5
+        if code == "declaration_title" and ("possession" in text or "vacate" in text):
+            score -= 0.5
+        if code == "permanent_injunction" and ("declaration" in text or "title" in text):
+            score -= 0.25
+        if code == "summary_suit_instrument" and "order 37" in text:
+            score += 0.75
+        if code == "specific_performance" and "agreement to sell" in text:
+            score += 0.5
+        if code.startswith("recovery_of_possession") and ("unauthorized occupation" in text or "vacate" in text):
+            score += 0.5
+        if code.startswith("recovery_of_possession") and ("encroach" in text and "damages" in text and "possession" not in text):
+            score -= 0.25
+        if score > best_score:
+            best, best_score = code, score
+    if not best or best_score <= 0:
+        return "", 0.0
+    total = max(len(domain_entries[best].get("doc_type_keywords", [])), 1)
+    return best, min(best_score / total, 0.70)
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+
+def best_of(fn, repeats: int) -> float:
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark LKB keyword matching")
+    parser.add_argument("--draft-chars", type=int, default=30_000)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    # Loading the node registers the consistency-gate vocabulary with the matcher
+    importlib.import_module("app.agents.drafting_agents.nodes.civil_decision")
+
+    rng = random.Random(42)
+    entries = lkb._REGISTRY["civil"]
+    matcher = lkb._KEYWORD_MATCHERS["civil"]
+    patterns = sorted(matcher.patterns)
+    drafts = [
+        make_draft([kw.lower() for kw in entry.get("doc_type_keywords", [])], args.draft_chars, rng)
+        for entry in entries.values()
+    ]
+    lowered = [draft.lower() for draft in drafts]
+
+    mismatches = sum(
+        lkb.infer_cause_type("plaint", draft) != legacy_infer_cause_type("plaint", draft)
+        for draft in drafts
+    )
+    mismatches += sum(
+        matcher.find(text) != frozenset(kw for kw in patterns if kw in text)
+        for text in lowered
+    )
+
+    infer_old = best_of(lambda: [legacy_infer_cause_type("plaint", d) for d in drafts], args.repeats)
+    infer_new = best_of(lambda: [lkb.infer_cause_type("plaint", d) for d in drafts], args.repeats)
+    scan_old = best_of(lambda: [[kw for kw in patterns if kw in t] for t in lowered], args.repeats)
+    scan_new = best_of(lambda: [matcher.find(t) for t in lowered], args.repeats)
+
+    print()
+    print(
+        f"causes={len(entries)} keywords={len(patterns)} draft_chars={args.draft_chars} "
+        f"mismatches={mismatches}"
+    )
+    print(f"{'stage':<8} {'old_ms/draft':>13} {'new_ms/draft':>13} {'speedup':>8}")
+    for stage, old, new in (("infer", infer_old, infer_new), ("gates", scan_old, scan_new)):
+        per_old = old / len(drafts) * 1000
+        per_new = new / len(drafts) * 1000
+        print(f"{stage:<8} {per_old:>13.2f} {per_new:>13.2f} {per_old / per_new:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Direct API MCP Pool Benchmark
+
+Starts a local stub MCP server (same stub as benchmark_send_engine.py) and
+measures per-call latency of two ways of calling a Direct API MCP tool:
+
+- before: the old per-call helper -- new MultiServerMCPClient, new event
+  loop, new streamable-http session and load_mcp_tools on every call
+- after:  DirectApiMCPPool.call -- persistent sessions, cached catalog
+
+Usage:
+    python scripts/benchmark_mcp_pool.py
+    python scripts/benchmark_mcp_pool.py --calls 300 --latency-ms 0 --pool-size 4
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from langchain_mcp_adapters.client import MultiServerMCPClient
+from langchain_mcp_adapters.tools import load_mcp_tools
+
+from benchmark_send_engine import build_stub_server, free_port, start_stub_server
+from app.agents.whatsp_agents.mcp_client.direct_api_pool import DirectApiMCPPool
+from app.utils.whsp_onboarding_agent import parse_mcp_result
+
+
+PARAMS = {
+    "user_id": "bench",
+    "to": "+919000000000",
+    "message_type": "template",
+    "template_name": "bench_template",
+    "template_language_code": "en_US",
+}
+
+
+# ============================================
+# CALL STRATEGIES
+# ============================================
+
+def call_fresh_client(url: str, tool_name: str, params: dict) -> dict:
+    """Replica of the per-call helper the tool modules used before the pool."""
+
+    async def _call():
+        client = MultiServerMCPClient({
+            "DirectApiMCP": {"url": url, "transport": "streamable-http"}
+        })
+        async with client.session("DirectApiMCP") as session:
+            mcp_tools = {t.name: t for t in await load_mcp_tools(session)}
+            result = await mcp_tools[tool_name].ainvoke(params)
+            return parse_mcp_result(result)
+
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    try:
+        return loop.run_until_complete(_call())
+    finally:
+        loop.close()
+
+
+def measure(label: str, fn, calls: int) -> dict:
+    fn()  # warm-up (first connection, catalog fetch)
+    latencies = []
+    started = time.perf_counter()
+    for _ in range(calls):
+        t0 = time.perf_counter()
+        result = fn()
+        latencies.append((time.perf_counter() - t0) * 1000)
+        if result.get("status") != "success":
+            raise RuntimeError(f"{label}: unexpected result {result}")
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "label": label,
+        "calls": calls,
+        "p50_ms": statistics.median(latencies),
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1],
+        "calls_per_sec": calls / elapsed,
+    }
+
+
+# ============================================
+# MAIN
+# ============================================
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-call vs pooled Direct API MCP sessions")
+    parser.add_argument("--calls", type=int, default=100)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Stub send_message latency")
+    parser.add_argument("--pool-size", type=int, default=4)
+    args = parser.parse_args()
+
+    port = free_port()
+    start_stub_server(build_stub_server(args.latency_ms, fail_every=0), port)
+    url = f"http://127.0.0.1:{port}/mcp"
+
+    pool = DirectApiMCPPool(url=url, size=args.pool_size)
+    try:
+        rows = [
+            measure("before (client per call)", lambda: call_fresh_client(url, "send_message", PARAMS), args.calls),
+            measure("after (pooled session)", lambda: pool.call("send_message", PARAMS), args.calls),
+        ]
+        pool_status = pool.status()
+    finally:
+        pool.shutdown()
+
+    print()
+    print(f"calls={args.calls} stub_latency={args.latency_ms:.0f}ms pool_size={args.pool_size}")
+    print(f"{'strategy':>26} {'p50_ms':>8} {'p95_ms':>8} {'calls/s':>9}")
+    for row in rows:
+        print(f"{row['label']:>26} {row['p50_ms']:>8.1f} {row['p95_ms']:>8.1f} {row['calls_per_sec']:>9.1f}")
+    print(f"pool status: {pool_status}")
+
+
+if __name__ == "__main__":
+    main()
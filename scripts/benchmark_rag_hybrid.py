@@ -0,0 +1,219 @@
+"""
+Drafting RAG Retrieval Benchmark — dense-only vs hybrid (dense + BM25, RRF)
+
+Runs a fixed set of statutory queries through ``retrieve_drafting_context``
+twice, once with ``hybrid=False`` and once with ``hybrid=True``, and reports
+per-mode recall@k, MRR@k and latency p50/p95. A result chunk is relevant when
+it comes from the expected book and matches the query's pattern.
+
+Modes:
+    live     (default) the configured Qdrant collection and embedding model
+    offline  indexes the given books into an in-memory Qdrant with a local
+             hashed character-trigram embedder (a lexical stand-in for the
+             dense model, no network), then runs the same comparison
+
+Usage:
+    python scripts/benchmark_rag_hybrid.py
+    python scripts/benchmark_rag_hybrid.py --offline --books books
+    python scripts/benchmark_rag_hybrid.py --offline --top-k 5 --verbose
+"""
+
+import argparse
+import asyncio
+import hashlib
+import logging
+import math
+import os
+import re
+import sys
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+from typing import Any, Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+# (query, expected book file prefix, pattern a relevant chunk must contain)
+QUERIES = [
+    ("Order XXXVII Rule 2 institution of summary suits", "the_code_of_civil_procedure", r"institution of summary suits"),
+    ("Article 54 limitation for specific performance of a contract", "A1963-36", r"54\.\s*For specific performance"),
+    ("Order VII Rule 11 rejection of plaint", "the_code_of_civil_procedure", r"rejection of plaint"),
+    ("Section 9 courts to try all civil suits unless barred", "the_code_of_civil_procedure", r"courts to try all civil suits"),
+    ("Section 20 suit where defendant resides or cause of action arises", "the_code_of_civil_procedure",
+     r"where defendants reside or cause of action arises"),
+    ("Order XXXIX temporary injunction", "the_code_of_civil_procedure", r"temporary injunction"),
+    ("Section 10 specific performance of contract enforceable", "Specific_Relief_Act_1963",
+     r"specific performance of contract enforceable"),
+    ("Section 73 compensation for loss caused by breach of contract", "Indian_Contract_act",
+     r"compensation for loss or damage caused by breach"),
+    ("Order VI Rule 15 verification of pleadings", "the_code_of_civil_procedure", r"verification of pleadings"),
+    ("Order VIII written statement by defendant", "the_code_of_civil_procedure", r"written statement"),
+    ("limitation period for suit on a promissory note", "A1963-36", r"promissory note"),
+    ("Section 3 bar of limitation", "A1963-36", r"bar of limitation"),
+    ("Order XX Rule 18 decree in suit for partition", "the_code_of_civil_procedure", r"suit for partition"),
+    ("Section 11 res judicata", "the_code_of_civil_procedure", r"res judicata"),
+    ("Section 25 agreement without consideration is void", "Indian_Contract_act", r"agreement without consideration"),
+]
+
+OFFLINE_BOOKS = [
+    "the_code_of_civil_procedure,_1908.pdf",
+    "A1963-36.pdf",
+    "Specific_Relief_Act_1963.pdf",
+    "Indian_Contract_act.pdf",
+]
+
+
+# ============================================
+# OFFLINE INDEX
+# ============================================
+
+def _hashed_trigram_embedding(text: str, dim: int = 384) -> List[float]:
+    vector = [0.0] * dim
+    normalized = " ".join(re.findall(r"[a-z0-9]+", text.lower()))
+    for i in range(len(normalized) - 2):
+        digest = hashlib.blake2b(normalized[i:i + 3].encode(), digest_size=4).digest()
+        vector[int.from_bytes(digest, "little") % dim] += 1.0
+    norm = math.sqrt(sum(v * v for v in vector)) or 1.0
+    return [v / norm for v in vector]
+
+
+def build_offline_db(books_dir: Path) -> Any:
+    from qdrant_client import QdrantClient
+
+    from app.database.vectordatabse.qudrant import QdrantDB
+    from app.ragIndex import civilIndex
+
+    class _SyncAsAsync:
+        """Async facade over the in-memory client (local async and sync clients don't share data)."""
+
+        def __init__(self, client):
+            self._client = client
+
+        def __getattr__(self, name):
+            method = getattr(self._client, name)
+
+            async def _call(*args, **kwargs):
+                return method(*args, **kwargs)
+
+            return _call
+
+    class OfflineQdrantDB(QdrantDB):
+        def get_embeddings_batch(self, texts):
+            return [_hashed_trigram_embedding(t) for t in texts]
+
+        async def aget_embeddings_batch(self, texts):
+            return self.get_embeddings_batch(texts)
+
+    client = QdrantClient(":memory:")
+    db = OfflineQdrantDB(client=client, async_client=_SyncAsAsync(client))
+    civilIndex.qdrant_db = db
+
+    with tempfile.TemporaryDirectory() as tmp:
+        subset = Path(tmp) / "books"
+        subset.mkdir()
+        for name in OFFLINE_BOOKS:
+            if (books_dir / name).exists():
+                os.symlink((books_dir / name).resolve(), subset / name)
+        t0 = time.perf_counter()
+        summary = civilIndex.build_civil_index(
+            books_dir=subset,
+            collection_name="civil",
+            manifest_path=Path(tmp) / "manifest.json",
+            extract_workers=1,
+        )
+    print(
+        f"offline index: {summary['books_processed']} books, {summary['final_point_count']} chunks "
+        f"in {time.perf_counter() - t0:.1f}s"
+    )
+    return db
+
+
+# ============================================
+# EVALUATION
+# ============================================
+
+def _documents(context: str) -> List[str]:
+    return [part for part in re.split(r"\n\n(?=\[Document )", context) if part.startswith("[Document ")]
+
+
+def _is_relevant(document: str, book: str, pattern: str) -> bool:
+    header, _, body = document.partition("]:")
+    book_hint = book.replace("_", " ").lower()
+    in_book = book_hint in header.lower() or book.lower() in header.lower()
+    return in_book and re.search(pattern, body, flags=re.IGNORECASE) is not None
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+async def evaluate(db: Any, profile: Any, repeats: int, verbose: bool) -> Dict[str, Any]:
+    from app.utils.draftingAgent import retrieve_drafting_context
+
+    hits = 0
+    reciprocal_ranks: List[float] = []
+    latencies: List[float] = []
+    for query, book, pattern in QUERIES:
+        context = ""
+        for _ in range(repeats):
+            t0 = time.perf_counter()
+            context = await retrieve_drafting_context(query=query, qdrant_db=db, profile=profile)
+            latencies.append(time.perf_counter() - t0)
+        documents = _documents(context)[:profile.top_k]
+        rank = next((i for i, doc in enumerate(documents, start=1) if _is_relevant(doc, book, pattern)), None)
+        hits += rank is not None
+        reciprocal_ranks.append(1.0 / rank if rank else 0.0)
+        if verbose:
+            print(f"  {'hybrid' if profile.hybrid else 'dense '} rank={rank or '-':>2}  {query}")
+    return {
+        f"recall@{profile.top_k}": hits / len(QUERIES),
+        f"mrr@{profile.top_k}": sum(reciprocal_ranks) / len(QUERIES),
+        "p50_ms": percentile(latencies, 50) * 1000,
+        "p95_ms": percentile(latencies, 95) * 1000,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dense-only vs hybrid drafting retrieval")
+    parser.add_argument("--offline", action="store_true", help="Index local books into in-memory Qdrant")
+    parser.add_argument("--books", default="books", help="Books directory for --offline")
+    parser.add_argument("--top-k", type=int, default=8)
+    parser.add_argument("--repeats", type=int, default=3, help="Timed runs per query")
+    parser.add_argument("--verbose", action="store_true", help="Print per-query ranks and keep logging")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+
+    from app.utils.draftingAgent import get_active_qdrant_profile
+
+    if args.offline:
+        db = build_offline_db(Path(args.books))
+    else:
+        from app.database import qdrant_db as db
+
+    profile = replace(get_active_qdrant_profile(), top_k=args.top_k)
+    results = {}
+    for hybrid in (False, True):
+        mode = "hybrid" if hybrid else "dense"
+        results[mode] = asyncio.run(evaluate(db, replace(profile, hybrid=hybrid), args.repeats, args.verbose))
+
+    print()
+    print(f"queries={len(QUERIES)} collection={profile.collection_name} top_k={args.top_k}")
+    print(f"{'mode':<8} {'recall@k':>9} {'mrr@k':>7} {'p50_ms':>8} {'p95_ms':>8}")
+    for mode, r in results.items():
+        print(
+            f"{mode:<8} {r[f'recall@{args.top_k}']:>9.2f} {r[f'mrr@{args.top_k}']:>7.2f} "
+            f"{r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
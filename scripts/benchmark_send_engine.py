@@ -0,0 +1,226 @@
+"""
+Broadcast Worker Send Benchmark
+
+Starts a local stub MCP server exposing fake ``send_message`` and
+``send_message_batch`` tools (fixed latency, no WhatsApp traffic), queues a
+broadcast in a throwaway SQLite copy of the delivery tables and drains it
+with ``run_broadcast_worker`` -- the same ``drain_once`` path (lease, token
+bucket, batch MCP call through the Direct API pool, settle, ledger) the
+broadcast-worker processes run. Reports messages/sec for each drain-thread
+count.
+
+Usage:
+    python scripts/benchmark_send_engine.py
+    python scripts/benchmark_send_engine.py --messages 2000 --latency-ms 80 --concurrency 1 4 8 --rate 200
+"""
+
+import argparse
+import asyncio
+import os
+import socket
+import sys
+import tempfile
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastmcp import FastMCP
+
+
+# ============================================
+# STUB MCP SERVER
+# ============================================
+
+def build_stub_server(latency_ms: float, fail_every: int) -> FastMCP:
+    """Stub Direct API MCP server whose send tools only sleep."""
+    stub = FastMCP(name="Stub Directapi Server")
+    counter = {"n": 0}
+
+    async def _send_one(to: str) -> dict:
+        await asyncio.sleep(latency_ms / 1000)
+        counter["n"] += 1
+        if fail_every and counter["n"] % fail_every == 0:
+            return {"to": to, "ok": False, "error": "Bad request", "status_code": 400, "code": "131026"}
+        return {"to": to, "ok": True, "id": f"wamid.{uuid.uuid4().hex}"}
+
+    @stub.tool(name="send_message")
+    async def send_message(
+        user_id: str,
+        to: str,
+        message_type: str = "text",
+        template_name: str = None,
+        template_language_code: str = None,
+    ) -> dict:
+        entry = await _send_one(to)
+        if entry["ok"]:
+            return {"success": True, "data": {"messages": [{"id": entry["id"]}]}}
+        return {
+            "success": False,
+            "error": entry["error"],
+            "status_code": entry["status_code"],
+            "details": '{"error": {"code": 131026}}',
+        }
+
+    @stub.tool(name="send_message_batch")
+    async def send_message_batch(
+        user_id: str,
+        recipients: List[Dict[str, Any]],
+        message_type: str = "text",
+        template_name: str = None,
+        template_language_code: str = None,
+        max_concurrency: int = 16,
+    ) -> dict:
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def _guarded(recipient: dict) -> dict:
+            async with semaphore:
+                return await _send_one(recipient["to"])
+
+        results = await asyncio.gather(*(_guarded(r) for r in recipients))
+        sent = sum(1 for r in results if r["ok"])
+        return {"success": True, "total": len(results), "sent": sent, "failed": len(results) - sent, "results": results}
+
+    return stub
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def start_stub_server(stub: FastMCP, port: int) -> None:
+    """Run the stub server in a daemon thread and wait until it accepts connections."""
+    thread = threading.Thread(
+        target=stub.run,
+        kwargs={"transport": "http", "host": "127.0.0.1", "port": port},
+        daemon=True,
+    )
+    thread.start()
+    deadline = time.time() + 15
+    while time.time() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise RuntimeError(f"Stub MCP server did not start on port {port}")
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+
+def use_sqlite_queue(path: str) -> None:
+    """Point the repositories' get_session at a SQLite file holding the delivery tables."""
+    from sqlmodel import Session, SQLModel, create_engine
+
+    from app.database.postgresql import postgresql_connection
+    from app.database.postgresql.models.broadcast_job import BroadcastJob
+    from app.database.postgresql.models.broadcast_message import BroadcastMessage
+    from app.database.postgresql.models.delivery_queue import DeliveryQueueItem
+
+    engine = create_engine(f"sqlite:///{path}", connect_args={"check_same_thread": False})
+    SQLModel.metadata.create_all(
+        engine, tables=[BroadcastJob.__table__, BroadcastMessage.__table__, DeliveryQueueItem.__table__]
+    )
+
+    @contextmanager
+    def _get_session():
+        session = Session(engine)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    postgresql_connection.get_session = _get_session
+
+
+def queue_job(phones: List[str]) -> str:
+    from app.database.postgresql.models.broadcast_job import BroadcastJob
+    from app.database.postgresql.postgresql_connection import get_session
+    from app.database.postgresql.postgresql_repositories import DeliveryQueueRepository
+
+    job_id = f"bench-{uuid.uuid4().hex[:12]}"
+    with get_session() as session:
+        session.add(BroadcastJob(
+            id=job_id, user_id="bench", project_id="bench", phase="SENDING",
+            template_name="bench_template", valid_contacts=len(phones),
+        ))
+        session.commit()
+        DeliveryQueueRepository(session=session).enqueue(
+            job_id, "bench", [{"phone": phone} for phone in phones], method="template",
+            payload={
+                "user_id": "bench",
+                "message_type": "template",
+                "template_name": "bench_template",
+                "template_language_code": "en_US",
+            },
+        )
+    return job_id
+
+
+def run_benchmark(messages: int, levels: list, rate: float) -> list:
+    from app.utils.broadcasting import TokenBucket
+    from app.utils.broadcasting import delivery_queue
+    from app.utils.broadcasting.worker import run_broadcast_worker
+
+    rows = []
+    for concurrency in levels:
+        queue_job([f"+9190000{i:05d}" for i in range(messages)])
+        # A fresh bucket per level so one run's debt does not slow the next
+        delivery_queue._send_bucket = TokenBucket(rate=rate)
+        started = time.perf_counter()
+        totals = run_broadcast_worker("bench", concurrency=concurrency, exit_when_idle=True)
+        rows.append((concurrency, time.perf_counter() - started, totals))
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the broadcast worker's send path")
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Stub per-recipient send latency")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8], help="Drain threads")
+    parser.add_argument("--lease-size", type=int, default=100, help="Rows per lease (one batch MCP call)")
+    parser.add_argument("--rate", type=float, default=1000, help="Token-bucket rate (msg/s)")
+    parser.add_argument("--fail-every", type=int, default=0, help="Make every Nth send fail")
+    args = parser.parse_args()
+
+    from app.agents.whatsp_agents.mcp_client import direct_api_pool
+    from app.config import settings
+
+    port = free_port()
+    start_stub_server(build_stub_server(args.latency_ms, args.fail_every), port)
+    direct_api_pool._pool = direct_api_pool.DirectApiMCPPool(url=f"http://127.0.0.1:{port}/mcp")
+    settings.DELIVERY_QUEUE_LEASE_SIZE = args.lease_size
+    # The worker notices finished drain threads on its sweep; keep that out of the timings
+    settings.BROADCAST_WORKER_SWEEP_SECONDS = 0.05
+
+    with tempfile.TemporaryDirectory() as tmp:
+        use_sqlite_queue(os.path.join(tmp, "queue.db"))
+        try:
+            rows = run_benchmark(args.messages, args.concurrency, args.rate)
+        finally:
+            direct_api_pool._pool.shutdown()
+
+    print()
+    print(
+        f"messages={args.messages} stub_latency={args.latency_ms:.0f}ms "
+        f"lease_size={args.lease_size} rate={args.rate:.0f}/s"
+    )
+    print(f"{'threads':>8} {'elapsed_s':>10} {'msg/s':>10} {'sent':>8} {'retry':>8} {'dead':>8}")
+    for concurrency, elapsed, totals in rows:
+        attempted = totals["sent"] + totals["retry"] + totals["dead"]
+        print(
+            f"{concurrency:>8} {elapsed:>10.2f} {attempted / elapsed if elapsed else 0:>10.1f} "
+            f"{totals['sent']:>8} {totals['retry']:>8} {totals['dead']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""
+Direct API Load Test
+
+Drives the real broadcast send path end-to-end against the local AiSensy
+simulator (tests/fixtures/aisensy_simulator.py) instead of WhatsApp:
+
+    send_broadcast_messages -> delivery queue -> broadcast worker (drain_once)
+        -> Direct API MCP pool -> mcp_servers/direct_api_server.py
+        -> AiSensy POST client -> simulator
+
+The script starts the simulator, launches direct_api_server.py as a
+subprocess with ``Direct_BASE_URL`` / ``BASE_URL`` pointing at it (the server
+listens on 9002, where the MCP pool connects, so nothing else may hold that
+port), seeds a TempMemory JWT for a dedicated load-test user and then, for
+each ``--concurrency`` level, starts a seeded BroadcastJob with the
+``send_broadcast_messages`` tool (tier lookup and tier windows included) and
+drains it with an in-process broadcast worker running that many drain
+threads, paced by a ``--rate`` token bucket (queue, ledger and progress
+included).
+
+Reports throughput, error codes and the simulator's server-side latency for
+every run. Needs the application database (for the JWT lookup, the
+BroadcastJob, the delivery queue and the delivery ledger).
+
+Usage:
+    python scripts/loadtest_direct_api.py
+    python scripts/loadtest_direct_api.py --messages 2000 --concurrency 4 8 --rate 80 \
+        --latency lognormal:80:0.6 --tier TIER_2 --error 131026=0.02 --error 131053=0.005
+"""
+
+import argparse
+import json
+import logging
+import os
+import socket
+import subprocess
+import sys
+import time
+import uuid
+from collections import Counter
+from typing import Any, Dict, List
+
+# Add project root to path
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from tests.fixtures.aisensy_simulator import (
+    DEFAULT_TIER_MPS,
+    SimulatorConfig,
+    parse_errors,
+    run_simulator,
+)
+
+MCP_PORT = 9002
+TEMPLATE_NAME = "sim_broadcast_promo"
+
+
+# ============================================
+# SETUP
+# ============================================
+
+def start_direct_api_server(simulator_url: str, log_path: str) -> subprocess.Popen:
+    """Launch mcp_servers/direct_api_server.py against the simulator and wait for its port."""
+    with socket.socket() as s:
+        if s.connect_ex(("127.0.0.1", MCP_PORT)) == 0:
+            raise RuntimeError(f"Port {MCP_PORT} is in use; stop the running Direct API MCP server first")
+
+    env = dict(os.environ)
+    env["Direct_BASE_URL"] = simulator_url
+    env["BASE_URL"] = simulator_url
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [PROJECT_ROOT, env.get("PYTHONPATH")]))
+    log = open(log_path, "w")
+    proc = subprocess.Popen(
+        [sys.executable, os.path.join(PROJECT_ROOT, "mcp_servers", "direct_api_server.py")],
+        env=env, stdout=log, stderr=subprocess.STDOUT,
+    )
+    deadline = time.time() + 60
+    while time.time() < deadline:
+        if proc.poll() is not None:
+            raise RuntimeError(f"direct_api_server.py exited with {proc.returncode}, see {log_path}")
+        try:
+            with socket.create_connection(("127.0.0.1", MCP_PORT), timeout=0.5):
+                return proc
+        except OSError:
+            time.sleep(0.2)
+    proc.terminate()
+    raise RuntimeError(f"direct_api_server.py did not start on port {MCP_PORT}, see {log_path}")
+
+
+def seed_user(user_id: str, project_id: str) -> None:
+    """Give the load-test user a TempMemory JWT (send_message looks it up per call)."""
+    from app.database.postgresql.postgresql_connection import get_session
+    from app.database.postgresql.postgresql_repositories import MemoryRepository
+
+    with get_session() as session:
+        MemoryRepository(session=session).create_on_verification_success(
+            user_id=user_id,
+            business_id=f"{project_id}-business",
+            project_id=project_id,
+            jwt_token=f"sim-jwt-{uuid.uuid4().hex}",
+        )
+
+
+def seed_broadcast_job(user_id: str, project_id: str, phones: List[str]) -> str:
+    from app.database.postgresql.postgresql_connection import get_session
+    from app.database.postgresql.postgresql_repositories import BroadcastJobRepository
+
+    job_id = f"loadtest-{uuid.uuid4().hex[:12]}"
+    with get_session() as session:
+        repo = BroadcastJobRepository(session=session)
+        repo.create_broadcast_job(job_id, user_id, project_id, phase="READY_TO_SEND")
+        repo.update_contacts(job_id, json.dumps(phones), total=len(phones), valid=len(phones), invalid=0)
+        repo.update_template(job_id, "sim-template", TEMPLATE_NAME, "en_US", "MARKETING", "APPROVED")
+    return job_id
+
+
+# ============================================
+# RUNS
+# ============================================
+
+def run_tool(user_id: str, project_id: str, phones: List[str], concurrency: int, rate: float) -> Dict[str, Any]:
+    from app.agents.whatsp_agents.tools.supervisor_broadcasting import send_broadcast_messages
+    from app.database.postgresql.postgresql_connection import get_session
+    from app.database.postgresql.postgresql_repositories import DeliveryQueueRepository
+    from app.utils.broadcasting import TokenBucket, delivery_queue
+    from app.utils.broadcasting.worker import run_broadcast_worker
+
+    job_id = seed_broadcast_job(user_id, project_id, phones)
+    t0 = time.perf_counter()
+    result = json.loads(send_broadcast_messages.invoke({"user_id": user_id, "broadcast_job_id": job_id}))
+    if result.get("status") != "started":
+        raise RuntimeError(f"send_broadcast_messages failed: {result}")
+    # Drain in-process what is due now; tier-deferred rows and scheduled retries stay queued.
+    # A fresh bucket per run so one run's debt does not slow the next.
+    delivery_queue._send_bucket = TokenBucket(rate=rate)
+    run_broadcast_worker(f"loadtest-{os.getpid()}", concurrency=concurrency, exit_when_idle=True)
+    elapsed = time.perf_counter() - t0
+
+    with get_session() as session:
+        queue = DeliveryQueueRepository(session=session).get_queue_stats(job_id)
+    sent = queue["by_status"].get("SENT", 0)
+    failed = queue["by_status"].get("DEAD", 0) + queue["retry_scheduled"]
+    attempted = sent + failed
+    return {
+        "label": f"worker threads={concurrency}",
+        "attempted": attempted,
+        "sent": sent,
+        "failed": failed,
+        "deferred": result.get("deferred", 0),
+        "elapsed_s": elapsed,
+        "msg_per_sec": attempted / elapsed if elapsed > 0 else 0.0,
+        "error_codes": Counter(queue["dead_by_code"]),
+    }
+
+
+# ============================================
+# MAIN
+# ============================================
+
+def _fmt_ms(value) -> str:
+    return f"{value:>8.1f}" if value is not None else f"{'-':>8}"
+
+
+def main():
+    from app.config import settings
+
+    parser = argparse.ArgumentParser(description="Load-test the Direct API send path against the AiSensy simulator")
+    parser.add_argument("--messages", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[4, 8], help="Broadcast worker drain threads")
+    parser.add_argument("--rate", type=float, default=settings.BROADCAST_WORKER_RATE_PER_SEC, help="Worker token-bucket rate (msg/s)")
+    parser.add_argument("--latency", default="lognormal:60:0.5", help="Simulator latency spec")
+    parser.add_argument("--tier", default="TIER_2", choices=sorted(DEFAULT_TIER_MPS))
+    parser.add_argument("--error", action="append", default=[], help="Inject an error code, e.g. 131026=0.02")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--user-id", default="loadtest-sim-user")
+    parser.add_argument("--project-id", default="loadtest-sim-project")
+    parser.add_argument("--server-log", default="direct_api_server.loadtest.log")
+    parser.add_argument("--verbose", action="store_true", help="Keep application logging")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+    # The worker notices finished drain threads on its sweep; keep that out of the timings
+    settings.BROADCAST_WORKER_SWEEP_SECONDS = 0.05
+
+    config = SimulatorConfig(
+        latency=args.latency, tier=args.tier, errors=parse_errors(args.error), seed=args.seed,
+    )
+    phones = [f"+9190000{i:05d}" for i in range(args.messages)]
+    rows = []
+
+    with run_simulator(config) as sim:
+        server = start_direct_api_server(sim.url, args.server_log)
+        try:
+            seed_user(args.user_id, args.project_id)
+            for concurrency in args.concurrency:
+                sim.simulator.reset()
+                row = run_tool(args.user_id, args.project_id, phones, concurrency, args.rate)
+                rows.append((row, sim.simulator.stats()))
+        finally:
+            from app.agents.whatsp_agents.mcp_client.direct_api_pool import get_direct_api_pool
+
+            get_direct_api_pool().shutdown()
+            server.terminate()
+            server.wait(timeout=10)
+
+    print()
+    print(
+        f"messages={args.messages} latency={args.latency} tier={config.tier} ({config.mps:.0f} msg/s) "
+        f"errors={config.errors or 'none'} rate={args.rate:.0f}/s"
+    )
+    print(
+        f"{'run':<28} {'elapsed_s':>9} {'msg/s':>8} {'sent':>6} {'failed':>6} {'deferred':>8} "
+        f"{'srv_p50':>8} {'srv_p99':>8}"
+    )
+    for row, stats in rows:
+        server_send = stats["routes"].get("POST /messages", {})
+        print(
+            f"{row['label']:<28} {row['elapsed_s']:>9.2f} {row['msg_per_sec']:>8.1f} "
+            f"{row['sent']:>6} {row['failed']:>6} {row['deferred']:>8} "
+            f"{_fmt_ms(server_send.get('p50_ms'))} {_fmt_ms(server_send.get('p99_ms'))}"
+        )
+        codes = ", ".join(f"{code}={n}" for code, n in sorted(row["error_codes"].items()))
+        if codes:
+            print(f"{'':<28} failures by code: {codes}")
+        print(f"{'':<28} simulator statuses: {stats['statuses']}")
+
+
+if __name__ == "__main__":
+    main()
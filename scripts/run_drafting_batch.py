@@ -0,0 +1,191 @@
+"""
+Drafting Batch Runner
+
+Runs a file of drafting requests through ``run_drafting_batch`` (one compiled
+graph, warm models, bounded concurrency), writes one JSON record per request to
+a JSONL results file and prints throughput plus per-request outcomes.
+
+Request files are JSONL or a JSON list; each item is a request string or an
+object with ``user_request`` and an optional ``id``. ``--scenarios`` uses the
+research multi-scenario set instead.
+
+``--baseline`` compares the run against an earlier results file: wall time,
+LLM tokens, blocking gate issues and whether the draft text changed.
+``--fake-latency-ms`` swaps every drafting LLM for the canned fake model from
+benchmark_drafting_concurrency.py, for offline throughput runs.
+
+Usage:
+    python scripts/run_drafting_batch.py --scenarios --out research/output/batch.jsonl
+    python scripts/run_drafting_batch.py --requests requests.jsonl --concurrency 8 \
+        --out batch_new.jsonl --baseline batch_old.jsonl
+    python scripts/run_drafting_batch.py --scenarios --fake-latency-ms 200 --repeat 10
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from typing import Any, Dict, List
+
+# Add project root to path
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.config import settings
+
+
+# ============================================
+# REQUESTS
+# ============================================
+
+def load_requests(path: str) -> List[Any]:
+    with open(path, encoding="utf-8") as f:
+        raw = f.read()
+    if raw.lstrip().startswith("["):
+        return json.loads(raw)
+    return [json.loads(line) for line in raw.splitlines() if line.strip()]
+
+
+def scenario_requests() -> List[Dict[str, Any]]:
+    from research.run_multi_scenario import SCENARIOS
+
+    return [
+        {"id": f"scenario_{sid}", "user_request": scenario["query"]}
+        for sid, scenario in sorted(SCENARIOS.items())
+    ]
+
+
+def repeat_requests(requests: List[Any], repeat: int) -> List[Dict[str, Any]]:
+    items = []
+    for index, request in enumerate(requests, start=1):
+        if isinstance(request, str):
+            request = {"user_request": request}
+        base_id = str(request.get("id") or index)
+        for copy in range(repeat):
+            item_id = base_id if repeat == 1 else f"{base_id}#{copy + 1}"
+            items.append({**request, "id": item_id})
+    return items
+
+
+# ============================================
+# REPORT
+# ============================================
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered) + 0.5) - 1))
+    return ordered[index]
+
+
+def blocking_total(record: Dict[str, Any]) -> int:
+    return sum(gate.get("blocking", 0) for gate in record.get("gates", {}).values())
+
+
+def print_baseline_diff(records: List[Dict[str, Any]], baseline_path: str) -> None:
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {r["id"]: r for r in map(json.loads, filter(str.strip, f))}
+
+    print()
+    print(f"vs baseline {baseline_path}")
+    print(f"{'id':<24} {'wall_s':>15} {'tokens':>17} {'blocking':>9} {'draft':>8}")
+    for record in sorted(records, key=lambda r: r["id"]):
+        old = baseline.get(record["id"])
+        if old is None:
+            print(f"{record['id']:<24} {'(new request)':>15}")
+            continue
+        draft = "same" if old["draft"]["sha256"] == record["draft"]["sha256"] else "changed"
+        print(
+            f"{record['id']:<24} "
+            f"{old['wall_ms'] / 1000:>6.1f} -> {record['wall_ms'] / 1000:<6.1f} "
+            f"{old['llm']['total_tokens']:>7} -> {record['llm']['total_tokens']:<7} "
+            f"{blocking_total(old):>3} -> {blocking_total(record):<3} {draft:>8}"
+        )
+    missing = sorted(set(baseline) - {r["id"] for r in records})
+    if missing:
+        print(f"not run this time: {', '.join(missing)}")
+
+
+# ============================================
+# MAIN
+# ============================================
+
+async def run(requests: List[Any], concurrency: int, out: str) -> Dict[str, Any]:
+    from app.agents.drafting_agents import run_drafting_batch
+
+    records = []
+    t0 = time.perf_counter()
+    async for record in run_drafting_batch(requests, concurrency=concurrency, results_path=out):
+        records.append(record)
+        print(
+            f"[{len(records)}/{len(requests)}] {record['id']:<24} {record['status']:<5} "
+            f"{record['wall_ms'] / 1000:>6.1f}s tokens={record['llm']['total_tokens']:<7} "
+            f"blocking={blocking_total(record)} draft_chars={record['draft']['chars']}"
+        )
+    return {"records": records, "elapsed_s": time.perf_counter() - t0}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a batch of drafting requests")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--requests", help="JSONL or JSON list of requests")
+    source.add_argument("--scenarios", action="store_true", help="Use research/run_multi_scenario.py scenarios")
+    parser.add_argument("--concurrency", type=int, default=settings.DRAFTING_BATCH_CONCURRENCY)
+    parser.add_argument("--repeat", type=int, default=1, help="Run every request this many times")
+    parser.add_argument("--out", default=None, help="Results JSONL (default research/output/batch_<ts>.jsonl)")
+    parser.add_argument("--baseline", default=None, help="Earlier results JSONL to compare against")
+    parser.add_argument("--fake-latency-ms", type=float, default=None, help="Use the fake LLM with this latency")
+    parser.add_argument("--verbose", action="store_true", help="Keep node logging")
+    args = parser.parse_args()
+
+    if not args.verbose:
+        logging.disable(logging.CRITICAL)
+    if args.fake_latency_ms is not None:
+        from benchmark_drafting_concurrency import patch_models
+
+        patch_models(args.fake_latency_ms / 1000)
+
+    requests = load_requests(args.requests) if args.requests else scenario_requests()
+    requests = repeat_requests(requests, max(1, args.repeat))
+    out = args.out or os.path.join(
+        "research", "output", f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.jsonl",
+    )
+
+    report = asyncio.run(run(requests, args.concurrency, out))
+    records = report["records"]
+    ok = [r for r in records if r["status"] == "ok"]
+    walls = [r["wall_ms"] / 1000 for r in ok]
+
+    print()
+    print(
+        f"requests={len(records)} ok={len(ok)} failed={len(records) - len(ok)} "
+        f"concurrency={args.concurrency} wall={report['elapsed_s']:.1f}s "
+        f"drafts/min={len(ok) / report['elapsed_s'] * 60:.2f}"
+    )
+    print(
+        f"request_p50={percentile(walls, 50):.1f}s request_p95={percentile(walls, 95):.1f}s "
+        f"tokens={sum(r['llm']['total_tokens'] for r in records)} "
+        f"llm_calls={sum(r['llm']['calls'] for r in records)}"
+    )
+
+    node_ms: Dict[str, List[float]] = {}
+    for record in ok:
+        for node, ms in record["node_ms"].items():
+            node_ms.setdefault(node, []).append(ms)
+    print()
+    print(f"{'node':<32} {'runs':>6} {'p50_ms':>10} {'p95_ms':>10}")
+    for node, values in sorted(node_ms.items(), key=lambda kv: -percentile(kv[1], 95)):
+        print(f"{node:<32} {len(values):>6} {percentile(values, 50):>10.1f} {percentile(values, 95):>10.1f}")
+
+    if args.baseline:
+        print_baseline_diff(records, args.baseline)
+    print()
+    print(f"results -> {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Batch drafting runner — concurrency, per-node timing, token counts and JSONL output.
+
+Runs against a two-node stand-in graph and a fake chat model; no network.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import sys
+from typing import List
+
+import pytest
+from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+from langgraph.graph import END, START, StateGraph
+
+sys.path.insert(0, ".")
+
+from app.agents.drafting_agents.batch import DraftingRequest, run_drafting_batch
+from app.agents.drafting_agents.states import DraftingState
+
+
+class _FakeChat(BaseChatModel):
+    @property
+    def _llm_type(self) -> str:
+        return "fake-batch"
+
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        raise NotImplementedError
+
+    async def _agenerate(self, messages, stop=None, run_manager=None, **kwargs) -> ChatResult:
+        await asyncio.sleep(0.05)
+        message = AIMessage(
+            content="PLAINT\n1. The Plaintiff advanced Rs.5,00,000.",
+            usage_metadata={"input_tokens": 120, "output_tokens": 30, "total_tokens": 150},
+        )
+        return ChatResult(generations=[ChatGeneration(message=message)])
+
+
+def _graph(in_flight: List[int]):
+    model = _FakeChat()
+    active = [0]
+
+    async def intake_classify(state):
+        if "fail" in state["user_request"]:
+            raise RuntimeError("intake exploded")
+        return {"errors": []}
+
+    async def draft_freetext(state):
+        active[0] += 1
+        in_flight.append(active[0])
+        try:
+            message = await model.ainvoke(state["user_request"])
+        finally:
+            active[0] -= 1
+        return {
+            "draft": {"draft_artifacts": [{"text": message.content}]},
+            "postprocess_issues": [{"type": "and_or", "count": 1}, {"type": "x", "severity": "blocking"}],
+        }
+
+    graph = StateGraph(DraftingState)
+    graph.add_node("intake_classify", intake_classify)
+    graph.add_node("draft_freetext", draft_freetext)
+    graph.add_edge(START, "intake_classify")
+    graph.add_edge("intake_classify", "draft_freetext")
+    graph.add_edge("draft_freetext", END)
+    return graph.compile()
+
+
+def _collect(requests, **kwargs):
+    async def _run():
+        return [record async for record in run_drafting_batch(requests, warm=False, **kwargs)]
+
+    return asyncio.run(_run())
+
+
+def test_batch_respects_concurrency_and_writes_jsonl(tmp_path):
+    in_flight: List[int] = []
+    out = tmp_path / "batch.jsonl"
+    requests = [{"id": f"r{i}", "user_request": f"Draft plaint {i}"} for i in range(6)]
+
+    records = _collect(requests, concurrency=2, graph=_graph(in_flight), results_path=out)
+
+    assert sorted(r["id"] for r in records) == [f"r{i}" for i in range(6)]
+    assert max(in_flight) == 2
+    lines = [json.loads(line) for line in out.read_text().splitlines()]
+    assert [line["id"] for line in lines] == [r["id"] for r in records]
+
+    record = records[0]
+    assert record["status"] == "ok"
+    assert record["path"] == ["intake_classify", "draft_freetext"]
+    assert record["node_ms"]["draft_freetext"] >= 40
+    assert record["llm"]["by_node"] == {
+        "draft_freetext": {"calls": 1, "input_tokens": 120, "output_tokens": 30},
+    }
+    assert record["llm"]["total_tokens"] == 150
+    assert record["gates"]["postprocess_issues"] == {"issues": 2, "blocking": 1}
+    assert record["draft"]["source"] == "draft"
+    assert record["draft"]["chars"] == len("PLAINT\n1. The Plaintiff advanced Rs.5,00,000.")
+
+
+def test_failed_request_is_reported_without_stopping_the_batch():
+    records = _collect(
+        ["Draft a plaint", DraftingRequest(id="bad", user_request="please fail")],
+        concurrency=2,
+        graph=_graph([]),
+    )
+
+    by_id = {r["id"]: r for r in records}
+    assert by_id["1"]["status"] == "ok"
+    assert by_id["bad"]["status"] == "error"
+    assert "intake exploded" in by_id["bad"]["error"]
+    assert by_id["bad"]["draft"]["source"] == "none"
+
+
+def test_duplicate_ids_are_rejected():
+    with pytest.raises(ValueError):
+        _collect([{"id": "a", "user_request": "x"}, {"id": "a", "user_request": "y"}], graph=_graph([]))
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import sys
+
+sys.path.insert(0, ".")
+
+
+def test_matcher_reports_overlapping_and_nested_keywords():
+    from app.agents.drafting_agents.lkb.keyword_matcher import KeywordMatcher
+
+    matcher = KeywordMatcher(["rent", "rent act", "current", "order xx rule 12", "rule 1"])
+    text = "the rent act and order xx rule 12 apply to current arrears"
+
+    assert matcher.find(text) == {"rent", "rent act", "current", "order xx rule 12", "rule 1"}
+    assert matcher.find("no keywords here") == frozenset()
+
+
+def test_hits_fall_back_to_substring_for_unregistered_keywords():
+    from app.agents.drafting_agents.lkb.keyword_matcher import KeywordMatcher
+
+    hits = KeywordMatcher(["tenant"]).hits("the tenant failed to vacate")
+
+    assert "tenant" in hits
+    assert "vacate" in hits
+    assert "licensee" not in hits
+    assert hits.matching(("licensee", "vacate", "tenant")) == ["vacate", "tenant"]
+
+
+def test_infer_cause_type_reads_the_civil_automaton():
+    from app.agents.drafting_agents.lkb import _KEYWORD_MATCHERS, infer_cause_type
+
+    assert "agreement to sell" in _KEYWORD_MATCHERS["civil"].patterns
+    cause, confidence = infer_cause_type(
+        "plaint", "Suit for specific performance of an agreement to sell a flat",
+    )
+    assert cause == "specific_performance"
+    assert 0 < confidence <= 0.70
+
+
+def test_consistency_gates_share_one_scan_per_draft():
+    from app.agents.drafting_agents.nodes import civil_decision
+
+    civil_decision._draft_hits.cache_clear()
+    text = "SUIT FOR RECOVERY OF POSSESSION WITH INTEREST AND COSTS. Order XX Rule 12 inquiry."
+    issues = civil_decision._possession_consistency_issues(text, "recovery_of_possession_tenant")
+    civil_decision._tenancy_consistency_issues(text, "mesne_profits_post_tenancy")
+
+    assert any("WITH INTEREST AND COSTS" in issue for issue in issues)
+    assert not any("Order XX Rule 12" in issue and "omits" in issue for issue in issues)
+    info = civil_decision._draft_hits.cache_info()
+    assert (info.misses, info.hits) == (1, 1)
@@ -0,0 +1,54 @@
+"""Postprocess rule engine — golden-output tests.
+
+Each fixture under ``fixtures/postprocess/`` is a raw draft paired with the
+text and issues the postprocess node produced before the rule engine was
+introduced; the engine must reproduce them exactly in both modes.
+
+Run:  pytest tests/drafting/test_postprocess_rules.py -v
+"""
+from __future__ import annotations
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, ".")
+
+FIXTURES = Path(__file__).parent / "fixtures" / "postprocess"
+CASES = sorted(p.stem for p in FIXTURES.glob("*.txt"))
+
+
+def _run(text: str, light: bool):
+    from app.agents.drafting_agents.nodes.postprocess import postprocess_node
+
+    result = postprocess_node({
+        "draft": {"draft_artifacts": [{"text": text}]},
+        "postprocess_light": light,
+    })
+    return {
+        "text": result.update["draft"]["draft_artifacts"][0]["text"],
+        "issues": result.update["postprocess_issues"],
+    }
+
+
+@pytest.mark.parametrize("name", CASES)
+@pytest.mark.parametrize("mode", ["full", "light"])
+def test_fixture_output_is_unchanged(name, mode):
+    raw = (FIXTURES / f"{name}.txt").read_text()
+    expected = json.loads((FIXTURES / f"{name}.expected.json").read_text())[mode]
+
+    assert _run(raw, light=mode == "light") == expected
+
+
+def test_rule_stats_cover_every_rule():
+    from app.agents.drafting_agents.nodes import postprocess
+
+    _run((FIXTURES / f"{CASES[0]}.txt").read_text(), light=False)
+    stats = postprocess.get_postprocess_rule_stats()
+
+    names = [rule.name for rule in postprocess._RULES] + [name for name, _ in postprocess._CHECKS]
+    for name in names:
+        assert stats[name]["calls"] >= 1
+        assert stats[name]["total_ms"] >= 0
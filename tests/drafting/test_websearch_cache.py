@@ -0,0 +1,113 @@
+"""Async web search layer — pooled client, query cache and in-flight coalescing.
+
+Runs against a local stub search server; no Brave traffic.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+from app.agents.drafting_agents.tools import websearch
+
+
+class _StubSearch:
+    def __init__(self, latency: float = 0.2):
+        self.latency = latency
+        self.queries = []
+        self.fail = set()
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                query = parse_qs(urlparse(self.path).query)["q"][0]
+                stub.queries.append(query)
+                time.sleep(stub.latency)
+                if query in stub.fail:
+                    self.send_response(500)
+                    self.end_headers()
+                    return
+                body = json.dumps({"web": {"results": [{
+                    "title": f"Result for {query}",
+                    "url": f"https://example.test/{abs(hash(query))}",
+                    "description": "Court fee payable at <b>7.5 per cent</b> ad valorem",
+                }]}}).encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/search"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+
+@pytest.fixture
+def stub(monkeypatch):
+    server = _StubSearch()
+    monkeypatch.setattr(websearch.settings, "BRAVE_SEARCH_URL", server.url)
+    monkeypatch.setattr(websearch.settings, "BRAVE_API_KEY", "test-key")
+    websearch._search_cache.clear()
+    yield server
+    websearch._search_cache.clear()
+    server.server.shutdown()
+
+
+def test_concurrent_identical_queries_share_one_request(stub):
+    async def _run():
+        return await asyncio.gather(
+            websearch._fetch_one("k", "Karnataka court fee"),
+            websearch._fetch_one("k", "  karnataka   COURT fee "),
+            websearch._fetch_one("k", "Karnataka court fee"),
+        )
+
+    first, second, third = asyncio.run(_run())
+
+    assert stub.queries == ["Karnataka court fee"]
+    assert first == second == third
+    stats = websearch.get_websearch_cache_stats()
+    assert (stats["misses"], stats["coalesced"], stats["requests"]) == (1, 2, 1)
+
+
+def test_results_cached_until_ttl_and_failures_not_cached(stub, monkeypatch):
+    clock = {"now": 0.0}
+    monkeypatch.setattr(websearch._search_cache, "_clock", lambda: clock["now"])
+    monkeypatch.setattr(websearch.settings, "DRAFTING_WEBSEARCH_CACHE_TTL_SECONDS", 60)
+    stub.fail.add("broken query")
+
+    asyncio.run(websearch._fetch_one("k", "fee schedule"))
+    asyncio.run(websearch._fetch_one("k", "Fee Schedule"))
+    assert stub.queries == ["fee schedule"]
+
+    clock["now"] = 61
+    asyncio.run(websearch._fetch_one("k", "fee schedule"))
+    assert stub.queries == ["fee schedule", "fee schedule"]
+
+    for _ in range(2):
+        with pytest.raises(Exception):
+            asyncio.run(websearch._fetch_one("k", "broken query"))
+    assert stub.queries.count("broken query") == 2
+
+
+def test_court_fee_tool_runs_queries_concurrently(stub):
+    t0 = time.perf_counter()
+    result = asyncio.run(websearch.CourtFeeWebSearchTool(
+        state="Karnataka", court_type="City Civil Court", doc_type="money_recovery_plaint",
+        suit_value=1_500_000,
+    ))
+    elapsed = time.perf_counter() - t0
+
+    assert result["error"] is None
+    assert len(stub.queries) == 2
+    assert len(result["results"]) == 2
+    assert "7.5 per cent" in result["summary"]
+    # Two 0.2s searches overlap instead of running back to back
+    assert elapsed < 0.38
@@ -0,0 +1,523 @@
+"""
+Local simulator of the AiSensy Direct and Partner HTTP APIs.
+
+A self-contained aiohttp app that answers the endpoints the MCP servers call,
+so the Direct API MCP server, the broadcasting tools and the broadcast worker can
+be exercised end-to-end without WhatsApp traffic. Point the clients at it
+with ``Direct_BASE_URL`` (Direct API) and ``BASE_URL`` (Partner API).
+
+Covered:
+    - Direct API: ``/messages``, ``/marketing_messages``, ``/mark-read``,
+      ``/health-status``, templates (``/get-templates``, ``/get-template/{id}``,
+      ``/wa_template``), media (``/media``, ``/get-media``, ``/media/session``),
+      ``/users/regenrate-token``, ``/get-business-info``
+    - Partner API: ``/partner/{partner_id}/...`` business, project and
+      embedded-signup routes; other partner routes answer ``{"success": true}``
+
+Behaviour is set by ``SimulatorConfig``:
+    - ``latency``: per-request service time, ``fixed:<ms>``,
+      ``uniform:<low_ms>:<high_ms>`` or ``lognormal:<median_ms>:<sigma>``
+    - ``tier``: messaging tier reported by ``/health-status``; sends beyond
+      the tier's messages/sec (``tier_mps``) get a 429 with code 130429
+    - ``errors``: injected WhatsApp error codes and their per-send
+      probability, e.g. ``{131026: 0.02, 131053: 0.01, 130429: 0.005}``
+
+Per-route request counts, status/error-code counts and server-side latency
+percentiles are available from ``stats()`` and ``GET /_sim/stats``;
+``POST /_sim/reset`` clears them.
+
+Usage:
+    python -m tests.fixtures.aisensy_simulator --port 9100 --tier TIER_1 \
+        --latency lognormal:60:0.5 --error 131026=0.02 --error 131053=0.01
+
+    with run_simulator(SimulatorConfig(latency="fixed:20")) as sim:
+        os.environ["Direct_BASE_URL"] = sim.url
+"""
+
+import argparse
+import asyncio
+import contextlib
+import math
+import random
+import threading
+import time
+import uuid
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterator, List, Optional
+
+from aiohttp import web
+
+
+# ============================================
+# CONFIG
+# ============================================
+
+# Simulated messages/sec per messaging tier (keys match delivery.TIER_LIMITS)
+DEFAULT_TIER_MPS = {
+    "UNVERIFIED": 20,
+    "TIER_1": 80,
+    "TIER_2": 80,
+    "TIER_3": 200,
+    "TIER_4": 1000,
+}
+
+# code -> (HTTP status, title, details) as the Graph API reports them
+ERROR_CODES = {
+    130429: (429, "Rate limit hit", "Cloud API message throughput has been reached."),
+    131026: (400, "Message undeliverable", "Unable to deliver message. The recipient may not be on WhatsApp."),
+    131053: (400, "Media upload error", "Unable to upload the media used in the message."),
+}
+
+# Routes that can return injected errors
+_SEND_ROUTES = {"/messages", "/marketing_messages", "/media", "/media/session"}
+
+
+@dataclass
+class LatencyModel:
+    """Service-time distribution; ``sample()`` returns seconds."""
+
+    kind: str = "fixed"
+    a: float = 0.0
+    b: float = 0.0
+
+    @classmethod
+    def parse(cls, spec: str) -> "LatencyModel":
+        """Parse ``fixed:<ms>``, ``uniform:<low>:<high>`` or ``lognormal:<median>:<sigma>``."""
+        kind, _, rest = spec.partition(":")
+        values = [float(v) for v in rest.split(":") if v]
+        if kind == "fixed" and len(values) == 1:
+            return cls(kind, values[0])
+        if kind in ("uniform", "lognormal") and len(values) == 2:
+            return cls(kind, values[0], values[1])
+        raise ValueError(f"Invalid latency spec {spec!r}")
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "uniform":
+            ms = rng.uniform(self.a, self.b)
+        elif self.kind == "lognormal":
+            ms = rng.lognormvariate(math.log(max(self.a, 1e-3)), self.b)
+        else:
+            ms = self.a
+        return max(0.0, ms) / 1000
+
+
+@dataclass
+class SimulatorConfig:
+    """Simulator behaviour; every field can be changed while it runs."""
+
+    latency: Any = "fixed:0"
+    tier: str = "TIER_1"
+    tier_mps: Dict[str, float] = field(default_factory=lambda: dict(DEFAULT_TIER_MPS))
+    errors: Dict[int, float] = field(default_factory=dict)
+    require_auth: bool = True
+    seed: Optional[int] = None
+
+    def __post_init__(self):
+        if isinstance(self.latency, str):
+            self.latency = LatencyModel.parse(self.latency)
+        unknown = set(self.errors) - set(ERROR_CODES)
+        if unknown:
+            raise ValueError(f"Unsupported error codes: {sorted(unknown)}")
+
+    @property
+    def mps(self) -> float:
+        return float(self.tier_mps.get(self.tier, DEFAULT_TIER_MPS["TIER_1"]))
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, max(0, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def _graph_error(code: int) -> web.Response:
+    status, title, details = ERROR_CODES[code]
+    return web.json_response(
+        {
+            "error": {
+                "message": f"(#{code}) {title}",
+                "type": "OAuthException",
+                "code": code,
+                "error_data": {"messaging_product": "whatsapp", "details": details},
+                "fbtrace_id": uuid.uuid4().hex[:24],
+            }
+        },
+        status=status,
+    )
+
+
+# ============================================
+# SIMULATOR
+# ============================================
+
+class AiSensySimulator:
+    """In-memory AiSensy Direct + Partner API (see module docstring)."""
+
+    def __init__(self, config: Optional[SimulatorConfig] = None):
+        self.config = config or SimulatorConfig()
+        self._rng = random.Random(self.config.seed)
+        self._tokens = self.config.mps
+        self._refilled = time.monotonic()
+        self.templates: Dict[str, Dict[str, Any]] = {}
+        self.media: Dict[str, Dict[str, Any]] = {}
+        self.partner: Dict[str, Dict[str, Any]] = {}
+        self.reset()
+        self._add_template("sim_broadcast_promo", "MARKETING", "en_US", "APPROVED")
+
+    def reset(self) -> None:
+        """Clear request statistics (stored templates/media are kept)."""
+        self.requests: Counter = Counter()
+        self.statuses: Counter = Counter()
+        self.error_codes: Counter = Counter()
+        self.latencies_ms: Dict[str, List[float]] = defaultdict(list)
+        self.recipients: Counter = Counter()
+        self.started = time.monotonic()
+
+    # ------------------------------------------------------------------
+    # Behaviour
+    # ------------------------------------------------------------------
+
+    def _take_token(self) -> bool:
+        # The simulator serves from one event loop, so no lock is needed
+        rate = self.config.mps
+        now = time.monotonic()
+        self._tokens = min(rate, self._tokens + (now - self._refilled) * rate)
+        self._refilled = now
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def _injected_error(self) -> Optional[int]:
+        for code, rate in self.config.errors.items():
+            if rate and self._rng.random() < rate:
+                return code
+        return None
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler) -> web.StreamResponse:
+        route = request.match_info.route.resource.canonical if request.match_info.route.resource else request.path
+        if route.startswith("/_sim"):
+            return await handler(request)
+
+        started = time.perf_counter()
+        await asyncio.sleep(self.config.latency.sample(self._rng))
+        code = None
+        if self.config.require_auth and not request.headers.get("Authorization", "").startswith("Bearer "):
+            response = web.json_response({"error": {"message": "Invalid OAuth access token", "code": 190}}, status=401)
+        elif route in _SEND_ROUTES and request.method == "POST":
+            code = self._injected_error()
+            if code is None and route in ("/messages", "/marketing_messages") and not self._take_token():
+                code = 130429
+            response = _graph_error(code) if code is not None else await handler(request)
+        else:
+            response = await handler(request)
+
+        key = f"{request.method} {route}"
+        self.requests[key] += 1
+        self.statuses[response.status] += 1
+        if code is not None:
+            self.error_codes[code] += 1
+        self.latencies_ms[key].append((time.perf_counter() - started) * 1000)
+        return response
+
+    def stats(self) -> Dict[str, Any]:
+        """Request counts, status and error-code counts and latency percentiles per route."""
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        routes = {}
+        for key, values in sorted(self.latencies_ms.items()):
+            routes[key] = {
+                "count": len(values),
+                "p50_ms": round(_percentile(values, 50), 2),
+                "p95_ms": round(_percentile(values, 95), 2),
+                "p99_ms": round(_percentile(values, 99), 2),
+            }
+        total = sum(self.requests.values())
+        return {
+            "total": total,
+            "elapsed_s": round(elapsed, 3),
+            "requests_per_sec": round(total / elapsed, 1),
+            "statuses": {str(k): v for k, v in sorted(self.statuses.items())},
+            "error_codes": {str(k): v for k, v in sorted(self.error_codes.items())},
+            "unique_recipients": len(self.recipients),
+            "tier": self.config.tier,
+            "routes": routes,
+        }
+
+    # ------------------------------------------------------------------
+    # Direct API handlers
+    # ------------------------------------------------------------------
+
+    async def _json(self, request: web.Request) -> Dict[str, Any]:
+        try:
+            body = await request.json()
+        except Exception:
+            return {}
+        return body if isinstance(body, dict) else {}
+
+    async def send_message(self, request: web.Request) -> web.Response:
+        body = await self._json(request)
+        to = str(body.get("to") or "")
+        if not to:
+            return web.json_response({"error": {"message": "(#100) Invalid parameter", "code": 100}}, status=400)
+        self.recipients[to] += 1
+        return web.json_response({
+            "messaging_product": "whatsapp",
+            "contacts": [{"input": to, "wa_id": to.lstrip("+")}],
+            "messages": [{"id": f"wamid.{uuid.uuid4().hex}", "message_status": "accepted"}],
+        })
+
+    async def mark_read(self, request: web.Request) -> web.Response:
+        return web.json_response({"success": True})
+
+    async def health_status(self, request: web.Request) -> web.Response:
+        body = await self._json(request)
+        return web.json_response({
+            "id": body.get("nodeId", ""),
+            "messaging_tier": self.config.tier,
+            "health_status": {
+                "can_send_message": "AVAILABLE",
+                "entities": [{"entity_type": "PHONE_NUMBER", "can_send_message": "AVAILABLE"}],
+            },
+        })
+
+    def _add_template(self, name: str, category: str, language: str, status: str, components=None) -> Dict[str, Any]:
+        template = {
+            "id": str(uuid.uuid4().int)[:15],
+            "name": name,
+            "category": category,
+            "language": language,
+            "status": status,
+            "components": components or [{"type": "BODY", "text": "Hello {{1}}, this is a simulated template."}],
+        }
+        self.templates[template["id"]] = template
+        return template
+
+    async def get_templates(self, request: web.Request) -> web.Response:
+        return web.json_response({"data": list(self.templates.values()), "paging": {}})
+
+    async def get_template(self, request: web.Request) -> web.Response:
+        template = self.templates.get(request.match_info["template_id"])
+        if template is None:
+            return web.json_response({"error": {"message": "Template not found", "code": 100}}, status=404)
+        return web.json_response(template)
+
+    async def create_template(self, request: web.Request) -> web.Response:
+        body = await self._json(request)
+        template = self._add_template(
+            body.get("name", "sim_template"),
+            body.get("category", "MARKETING"),
+            body.get("language", "en_US"),
+            "PENDING",
+            body.get("components"),
+        )
+        return web.json_response({"id": template["id"], "status": template["status"], "category": template["category"]})
+
+    async def delete_template(self, request: web.Request) -> web.Response:
+        name = request.match_info.get("template_name") or request.query.get("name")
+        template_id = request.query.get("hsm_id")
+        removed = [
+            tid for tid, t in self.templates.items()
+            if tid == template_id or (template_id is None and t["name"] == name)
+        ]
+        for tid in removed:
+            del self.templates[tid]
+        if not removed:
+            return web.json_response({"error": {"message": "Template not found", "code": 100}}, status=404)
+        return web.json_response({"success": True})
+
+    async def upload_media(self, request: web.Request) -> web.Response:
+        size = len(await request.read())
+        media_id = str(uuid.uuid4().int)[:16]
+        self.media[media_id] = {"id": media_id, "file_size": size, "mime_type": "application/octet-stream"}
+        return web.json_response({"id": media_id})
+
+    async def get_media(self, request: web.Request) -> web.Response:
+        body = await self._json(request)
+        media = self.media.get(str(body.get("id")))
+        if media is None:
+            return web.json_response({"error": {"message": "Media not found", "code": 100}}, status=404)
+        return web.json_response({**media, "url": f"https://sim.local/media/{media['id']}"})
+
+    async def delete_media(self, request: web.Request) -> web.Response:
+        media_id = request.query.get("id") or (await self._json(request)).get("id")
+        self.media.pop(str(media_id), None)
+        return web.json_response({"success": True})
+
+    async def create_upload_session(self, request: web.Request) -> web.Response:
+        return web.json_response({"id": f"upload:{uuid.uuid4().hex}"})
+
+    async def upload_to_session(self, request: web.Request) -> web.Response:
+        await request.read()
+        return web.json_response({"h": f"4::{uuid.uuid4().hex}"})
+
+    async def regenerate_token(self, request: web.Request) -> web.Response:
+        return web.json_response({"users": [{"token": f"sim-jwt-{uuid.uuid4().hex}"}]})
+
+    async def business_info(self, request: web.Request) -> web.Response:
+        return web.json_response({"id": "sim-business", "name": "Simulated Business", "tier": self.config.tier})
+
+    # ------------------------------------------------------------------
+    # Partner API handlers
+    # ------------------------------------------------------------------
+
+    async def create_partner_record(self, request: web.Request) -> web.Response:
+        body = await self._json(request)
+        record = {**body, "id": uuid.uuid4().hex[:24], "partnerId": request.match_info["partner_id"]}
+        if "business_id" in request.match_info:
+            record["businessId"] = request.match_info["business_id"]
+        self.partner[record["id"]] = record
+        return web.json_response(record)
+
+    async def get_partner_record(self, request: web.Request) -> web.Response:
+        record_id = request.match_info.get("record_id")
+        record = self.partner.get(record_id) if record_id else None
+        if record is None:
+            record = {"id": record_id or request.match_info["partner_id"], "partnerId": request.match_info["partner_id"]}
+        return web.json_response(record)
+
+    async def list_partner_businesses(self, request: web.Request) -> web.Response:
+        return web.json_response([r for r in self.partner.values() if "businessId" not in r])
+
+    async def generate_waba_link(self, request: web.Request) -> web.Response:
+        return web.json_response({"embeddedSignupURL": f"https://sim.local/signup/{uuid.uuid4().hex}"})
+
+    async def partner_fallback(self, request: web.Request) -> web.Response:
+        await request.read()
+        return web.json_response({"success": True, "path": request.path})
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+
+    async def get_stats(self, request: web.Request) -> web.Response:
+        return web.json_response(self.stats())
+
+    async def post_reset(self, request: web.Request) -> web.Response:
+        self.reset()
+        return web.json_response({"success": True})
+
+    def app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware], client_max_size=64 * 1024 * 1024)
+        app.router.add_post("/messages", self.send_message)
+        app.router.add_post("/marketing_messages", self.send_message)
+        app.router.add_post("/mark-read", self.mark_read)
+        app.router.add_post("/health-status", self.health_status)
+        app.router.add_get("/get-templates", self.get_templates)
+        app.router.add_get("/get-template/{template_id}", self.get_template)
+        app.router.add_post("/wa_template", self.create_template)
+        app.router.add_delete("/wa_template", self.delete_template)
+        app.router.add_delete("/wa_template/{template_name}", self.delete_template)
+        app.router.add_post("/media", self.upload_media)
+        app.router.add_delete("/media", self.delete_media)
+        app.router.add_post("/get-media", self.get_media)
+        app.router.add_post("/media/session", self.create_upload_session)
+        app.router.add_post("/media/session/{session_id}", self.upload_to_session)
+        app.router.add_post("/users/regenrate-token", self.regenerate_token)
+        app.router.add_get("/get-business-info", self.business_info)
+
+        app.router.add_get("/partner/{partner_id}/business", self.list_partner_businesses)
+        app.router.add_post("/partner/{partner_id}/business", self.create_partner_record)
+        app.router.add_get("/partner/{partner_id}/business/{record_id}", self.get_partner_record)
+        app.router.add_post("/partner/{partner_id}/business/{business_id}/project", self.create_partner_record)
+        app.router.add_get("/partner/{partner_id}/project/{record_id}", self.get_partner_record)
+        app.router.add_post("/partner/{partner_id}/generate-waba-link", self.generate_waba_link)
+        app.router.add_get("/partner/{partner_id}", self.get_partner_record)
+        app.router.add_route("*", "/partner/{partner_id}/{tail:.*}", self.partner_fallback)
+
+        app.router.add_get("/_sim/stats", self.get_stats)
+        app.router.add_post("/_sim/reset", self.post_reset)
+        return app
+
+
+# ============================================
+# RUNNING
+# ============================================
+
+class SimulatorHandle:
+    """A simulator serving from a background thread; ``stop()`` shuts it down."""
+
+    def __init__(self, simulator: AiSensySimulator, host: str, port: int):
+        self.simulator = simulator
+        self.host = host
+        self.port = port
+        self.url = f"http://{host}:{port}"
+        self._loop = asyncio.new_event_loop()
+        self._runner: Optional[web.AppRunner] = None
+        self._ready = threading.Event()
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._serve, name="aisensy-simulator", daemon=True)
+
+    def _serve(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        try:
+            self._runner = web.AppRunner(self.simulator.app(), access_log=None)
+            self._loop.run_until_complete(self._runner.setup())
+            site = web.TCPSite(self._runner, self.host, self.port)
+            self._loop.run_until_complete(site.start())
+            if not self.port:
+                self.port = self._runner.addresses[0][1]
+                self.url = f"http://{self.host}:{self.port}"
+        except BaseException as e:
+            self._error = e
+            self._ready.set()
+            return
+        self._ready.set()
+        self._loop.run_forever()
+        self._loop.run_until_complete(self._runner.cleanup())
+        self._loop.close()
+
+    def start(self) -> "SimulatorHandle":
+        self._thread.start()
+        self._ready.wait(timeout=15)
+        if self._error is not None:
+            raise RuntimeError(f"AiSensy simulator failed to start: {self._error}")
+        return self
+
+    def stop(self) -> None:
+        if self._thread.is_alive():
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(timeout=10)
+
+
+@contextlib.contextmanager
+def run_simulator(
+    config: Optional[SimulatorConfig] = None, host: str = "127.0.0.1", port: int = 0,
+) -> Iterator[SimulatorHandle]:
+    """Serve a simulator in a background thread (``port=0`` picks a free port)."""
+    handle = SimulatorHandle(AiSensySimulator(config), host, port).start()
+    try:
+        yield handle
+    finally:
+        handle.stop()
+
+
+def parse_errors(specs: List[str]) -> Dict[int, float]:
+    """``["131026=0.02", "130429=0.01"]`` -> ``{131026: 0.02, 130429: 0.01}``."""
+    errors = {}
+    for spec in specs:
+        code, _, rate = spec.partition("=")
+        errors[int(code)] = float(rate)
+    return errors
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the AiSensy Direct/Partner API simulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency", default="fixed:0", help="fixed:<ms> | uniform:<lo>:<hi> | lognormal:<median>:<sigma>")
+    parser.add_argument("--tier", default="TIER_1", choices=sorted(DEFAULT_TIER_MPS))
+    parser.add_argument("--error", action="append", default=[], help="Inject an error code, e.g. 131026=0.02")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+
+    config = SimulatorConfig(latency=args.latency, tier=args.tier, errors=parse_errors(args.error), seed=args.seed)
+    print(f"AiSensy simulator on http://{args.host}:{args.port} (tier={config.tier}, {config.mps:.0f} msg/s)")
+    web.run_app(AiSensySimulator(config).app(), host=args.host, port=args.port, access_log=None)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+"""AiSensy simulator — Direct API responses, tier rate limiting and error injection."""
+import asyncio
+import random
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from app.utils.broadcasting import build_outcome
+from tests.fixtures.aisensy_simulator import AiSensySimulator, LatencyModel, SimulatorConfig
+
+AUTH = {"Authorization": "Bearer sim-jwt"}
+TEMPLATE_MESSAGE = {
+    "to": "+919000000001",
+    "type": "template",
+    "template": {"name": "sim_broadcast_promo", "language": {"code": "en_US"}},
+}
+
+
+def _run(config, scenario):
+    simulator = AiSensySimulator(config)
+
+    async def _main():
+        async with TestClient(TestServer(simulator.app())) as client:
+            return await scenario(client)
+
+    return simulator, asyncio.run(_main())
+
+
+async def _send(client, n=1, headers=AUTH):
+    results = []
+    for _ in range(n):
+        response = await client.post("/messages", json=TEMPLATE_MESSAGE, headers=headers)
+        results.append((response.status, await response.text()))
+    return results
+
+
+def test_send_message_returns_wamid_and_requires_bearer_token():
+    async def scenario(client):
+        ok = await client.post("/messages", json=TEMPLATE_MESSAGE, headers=AUTH)
+        unauthorized = await client.post("/messages", json=TEMPLATE_MESSAGE)
+        return await ok.json(), unauthorized.status
+
+    simulator, (body, unauthorized) = _run(SimulatorConfig(), scenario)
+
+    assert body["messages"][0]["id"].startswith("wamid.")
+    assert unauthorized == 401
+    assert simulator.stats()["unique_recipients"] == 1
+
+
+def test_sends_beyond_tier_throughput_get_130429():
+    config = SimulatorConfig(tier="TIER_1", tier_mps={"TIER_1": 5})
+    simulator, results = _run(config, lambda client: _send(client, 12))
+
+    statuses = [status for status, _ in results]
+    assert statuses.count(200) == 5
+    assert statuses.count(429) == 7
+    # The Direct API client hands the raw body on as ``details``; build_outcome reads the code from it
+    outcome = build_outcome(0, "+919000000001", {"success": False, "error": "Rate limit exceeded", "details": results[-1][1]})
+    assert outcome.error_code == "130429"
+    assert simulator.stats()["error_codes"] == {"130429": 7}
+
+
+@pytest.mark.parametrize("code, status", [(131026, 400), (131053, 400), (130429, 429)])
+def test_injected_error_codes(code, status):
+    simulator, results = _run(SimulatorConfig(errors={code: 1.0}), lambda client: _send(client, 3))
+
+    assert [s for s, _ in results] == [status] * 3
+    assert f'"code": {code}' in results[0][1]
+    assert simulator.stats()["statuses"] == {str(status): 3}
+
+
+def test_health_status_reports_tier_and_templates_round_trip():
+    async def scenario(client):
+        health = await (await client.post("/health-status", json={"nodeId": "n1"}, headers=AUTH)).json()
+        created = await (await client.post(
+            "/wa_template", json={"name": "offer", "category": "MARKETING", "language": "en_US"}, headers=AUTH,
+        )).json()
+        listed = await (await client.get("/get-templates", headers=AUTH)).json()
+        deleted = await client.delete("/wa_template", params={"hsm_id": created["id"], "name": "offer"}, headers=AUTH)
+        return health, created, listed, deleted.status
+
+    simulator, (health, created, listed, deleted) = _run(SimulatorConfig(tier="TIER_3"), scenario)
+
+    assert health["messaging_tier"] == "TIER_3"
+    assert created["status"] == "PENDING"
+    assert {t["name"] for t in listed["data"]} == {"sim_broadcast_promo", "offer"}
+    assert deleted == 200
+    assert [t["name"] for t in simulator.templates.values()] == ["sim_broadcast_promo"]
+
+
+def test_latency_specs():
+    rng = random.Random(1)
+    assert LatencyModel.parse("fixed:40").sample(rng) == pytest.approx(0.04)
+    assert 0.02 <= LatencyModel.parse("uniform:20:30").sample(rng) <= 0.03
+    samples = sorted(LatencyModel.parse("lognormal:50:0.5").sample(rng) for _ in range(2001))
+    assert samples[1000] == pytest.approx(0.05, rel=0.15)
+    with pytest.raises(ValueError):
+        LatencyModel.parse("gamma:1")
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def sqlite_session_factory(tmp_path, monkeypatch):
+    from sqlmodel import Session, SQLModel, create_engine
+
+    from app.database.postgresql import postgresql_connection
+    from app.database.postgresql.models.broadcast_job import BroadcastJob
+    from app.database.postgresql.models.broadcast_message import BroadcastMessage
+    from app.database.postgresql.models.delivery_queue import DeliveryQueueItem
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'ledger.db'}")
+    SQLModel.metadata.create_all(
+        engine, tables=[BroadcastJob.__table__, BroadcastMessage.__table__, DeliveryQueueItem.__table__]
+    )
+
+    @contextmanager
+    def _get_session():
+        session = Session(engine)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr(postgresql_connection, "get_session", _get_session)
+    return _get_session
+
+
+class TestBroadcastMessageRepository:
+    def test_upsert_keeps_one_row_per_job_phone(self, sqlite_session_factory):
+        from app.database.postgresql.postgresql_repositories import BroadcastMessageRepository
+
+        with sqlite_session_factory() as session:
+            repo = BroadcastMessageRepository(session=session)
+            repo.record_outcomes("job-1", "user-1", [
+                {"phone": "+911", "success": True, "message_id": "wamid.1"},
+                {"phone": "+912", "success": False, "error": "Rate limit", "error_code": "130429"},
+                {"phone": "+913", "success": False, "error": "Not on WhatsApp", "error_code": "131026"},
+            ])
+            repo.record_outcomes("job-1", "user-1", [
+                {"phone": "+911", "success": False, "error": "resend", "error_code": "130429"},
+                {"phone": "+912", "success": True, "message_id": "wamid.2"},
+            ])
+
+            assert repo.count_by_status("job-1") == {"SENT": 2, "FAILED": 1}
+            assert repo.count_failures_by_code("job-1") == {"131026": 1}
+            # A later failure never downgrades a sent row
+            assert repo.get_retryable_phones("job-1", max_attempts=5) == ["+913"]
+            assert repo.get_retryable_phones("job-1", max_attempts=5, non_retryable_codes=["131026"]) == []
+
+            assert repo.mark_status(["wamid.1", "wamid.2"], "READ") == 2
+            assert repo.mark_status(["wamid.1"], "DELIVERED") == 0
+            assert repo.get_delivery_counts("job-1") == {"sent": 2, "delivered": 2, "read": 2, "failed": 1}
+
+    def test_recent_send_counts_only_returns_capped_numbers(self, sqlite_session_factory):
+        from app.database.postgresql.postgresql_repositories import BroadcastMessageRepository
+
+        with sqlite_session_factory() as session:
+            repo = BroadcastMessageRepository(session=session)
+            for job in ("job-1", "job-2", "job-3"):
+                repo.record_outcomes(job, "user-1", [
+                    {"phone": "+911", "success": True},
+                    {"phone": "+912", "success": job == "job-1"},
+                ])
+            repo.record_outcomes("job-4", "user-2", [{"phone": "+911", "success": True}])
+
+            since = datetime.utcnow() - timedelta(days=7)
+            assert repo.get_recent_send_counts("user-1", since) == {"+911": 3, "+912": 1}
+            assert repo.get_recent_send_counts("user-1", since, min_count=2) == {"+911": 3}
+            assert repo.get_recent_send_counts("user-1", since, min_count=3, exclude_job_id="job-3") == {}
+
+
+class TestRetryFromLedger:
+    def test_queues_only_retryable_failures(self, sqlite_session_factory):
+        from app.agents.whatsp_agents.tools import delivery
+        from app.database.postgresql.models.broadcast_job import BroadcastJob
+        from app.database.postgresql.postgresql_repositories import BroadcastMessageRepository
+
+        with sqlite_session_factory() as session:
+            session.add(BroadcastJob(
+                id="job-1", user_id="user-1", project_id="p", phase="SENDING",
+                template_name="promo", valid_contacts=3,
+            ))
+            session.commit()
+            BroadcastMessageRepository(session=session).record_outcomes("job-1", "user-1", [
+                {"phone": "+911", "success": False, "error": "Rate limit", "error_code": "130429"},
+                {"phone": "+912", "success": False, "error": "Not on WhatsApp", "error_code": "131026"},
+                {"phone": "+913", "success": True, "message_id": "wamid.3"},
+            ])
+
+        result = delivery._run_retry_failed_sync("user-1", "job-1")
+
+        assert result["queued_for_retry"] == 1
+        assert result["permanent_failures"] == 1
+        assert result["queue"]["by_status"] == {"QUEUED": 1}
+        # Running it again does not queue the number twice
+        assert delivery._run_retry_failed_sync("user-1", "job-1")["queued_for_retry"] == 0
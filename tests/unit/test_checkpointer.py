@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import TypedDict
+
+import pytest
+from langgraph.checkpoint.memory import MemorySaver
+from langgraph.graph import END, START, StateGraph
+
+from app.database.postgresql import checkpointer as cp
+
+
+class _State(TypedDict, total=False):
+    user_request: str
+    rag: dict
+    draft: dict
+
+
+class _RecordingPool:
+    """Stands in for the psycopg pool: records the SQL the checkpointer issues."""
+
+    def __init__(self):
+        self.statements = []
+
+    @asynccontextmanager
+    async def connection(self):
+        pool = self
+
+        class _Conn:
+            async def execute(self, sql, params=None):
+                pool.statements.append((" ".join(sql.split()), params))
+
+        yield _Conn()
+
+
+def _graph(checkpointer):
+    async def retrieve(state):
+        return {"rag": {"chunks": ["Order VII Rule 1 " * 400]}}
+
+    async def draft(state):
+        return {"draft": {"text": "first draft " * 500}}
+
+    async def postprocess(state):
+        return {"draft": {"text": state["draft"]["text"].replace("first", "final")}}
+
+    graph = StateGraph(_State)
+    graph.add_node("retrieve", retrieve)
+    graph.add_node("draft_node", draft)
+    graph.add_node("postprocess", postprocess)
+    graph.add_edge(START, "retrieve")
+    graph.add_edge("retrieve", "draft_node")
+    graph.add_edge("draft_node", "postprocess")
+    graph.add_edge("postprocess", END)
+    return graph.compile(checkpointer=checkpointer)
+
+
+@pytest.fixture
+def pool():
+    return _RecordingPool()
+
+
+@pytest.fixture
+def checkpointer(pool):
+    async def _factory(owner):
+        saver = MemorySaver(serde=owner.serde)
+        saver.conn = pool
+        return saver
+
+    return cp.PostgresCheckpointer(
+        "postgresql://unused", ttl_seconds=0, prune_every=0, compress_min_bytes=1024, saver_factory=_factory,
+    )
+
+
+def test_serializer_compresses_large_values_and_reads_plain_ones():
+    serde = cp.CompressingSerializer(min_bytes=1024)
+    big = {"text": "The Plaintiff submits " * 200}
+
+    type_, data = serde.dumps_typed(big)
+    assert type_.endswith("+zlib")
+    assert len(data) < len(cp.JsonPlusSerializer().dumps_typed(big)[1]) / 5
+    assert serde.loads_typed((type_, data)) == big
+
+    small = {"text": "short"}
+    assert not serde.dumps_typed(small)[0].endswith("+zlib")
+    assert serde.loads_typed(cp.JsonPlusSerializer().dumps_typed(small)) == small
+
+
+def test_state_survives_a_new_graph_instance(checkpointer):
+    config = {"configurable": {"thread_id": "session-1"}}
+
+    async def _run():
+        await _graph(checkpointer).ainvoke({"user_request": "Draft a plaint"}, config)
+        # Fresh compile, same durable checkpointer (as after a worker restart)
+        return await _graph(checkpointer).aget_state(config)
+
+    state = asyncio.run(_run())
+    assert state.values["user_request"] == "Draft a plaint"
+    assert state.values["draft"]["text"].startswith("final draft")
+
+
+def test_superseded_heavy_channel_versions_are_deleted(checkpointer, pool):
+    config = {"configurable": {"thread_id": "session-2"}}
+    asyncio.run(_graph(checkpointer).ainvoke({"user_request": "Draft a plaint"}, config))
+
+    compacted = [params[2] for sql, params in pool.statements if sql.startswith("DELETE FROM checkpoint_blobs")]
+    # rag written once, draft twice (draft_node, postprocess)
+    assert compacted.count("rag") == 1
+    assert compacted.count("draft") == 2
+    assert "user_request" not in compacted
+    assert all(params[0] == "session-2" for _, params in pool.statements)
+
+
+def test_get_checkpointer_backends(monkeypatch):
+    assert isinstance(cp.get_checkpointer("memory"), MemorySaver)
+    with pytest.raises(ValueError):
+        cp.get_checkpointer("redis")
+
+    monkeypatch.setattr(cp, "_postgres_checkpointer", None)
+    first = cp.get_checkpointer("postgres")
+    assert isinstance(first, cp.PostgresCheckpointer)
+    assert cp.get_checkpointer("postgres") is first
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import hashlib
+
+import pytest
+from qdrant_client import AsyncQdrantClient, QdrantClient
+
+from app.database.vectordatabse.qudrant import QdrantDB
+from app.ragIndex import civilIndex
+
+
+class _CountingQdrantDB(QdrantDB):
+    """In-memory Qdrant with deterministic embeddings that records what was embedded."""
+
+    def __init__(self):
+        super().__init__(client=QdrantClient(":memory:"), async_client=AsyncQdrantClient(":memory:"))
+        self.embedded: list[str] = []
+
+    def get_embeddings_batch(self, texts):
+        self.embedded.extend(texts)
+        vectors = []
+        for text in texts:
+            digest = hashlib.sha256(text.encode()).digest()
+            vectors.append([b / 255 + 0.01 for b in digest[:8]])
+        return vectors
+
+
+@pytest.fixture
+def index_env(tmp_path, monkeypatch):
+    db = _CountingQdrantDB()
+    monkeypatch.setattr(civilIndex, "qdrant_db", db)
+    books = tmp_path / "books"
+    books.mkdir()
+
+    def build(**kwargs):
+        return civilIndex.build_civil_index(
+            books_dir=books,
+            collection_name="civil_test",
+            manifest_path=tmp_path / "manifest.json",
+            chunk_size=200,
+            chunk_overlap=0,
+            extract_workers=1,
+            **kwargs,
+        )
+
+    return db, books, build
+
+
+def _paragraphs(prefix: str, count: int) -> str:
+    return "\n\n".join(f"{prefix} paragraph {i}. " + "Order VII Rule 1 text. " * 6 for i in range(count))
+
+
+def test_second_run_skips_unchanged_books(index_env):
+    db, books, build = index_env
+    (books / "cpc.txt").write_text(_paragraphs("CPC", 6))
+    (books / "limitation.md").write_text(_paragraphs("Limitation", 4))
+
+    first = build()
+    assert first["books_processed"] == 2
+    embedded = len(db.embedded)
+    assert embedded == first["chunks_upserted"] == first["final_point_count"]
+
+    second = build()
+    assert (second["books_processed"], second["books_unchanged"]) == (0, 2)
+    assert second["status"] == "success"
+    assert len(db.embedded) == embedded
+
+    forced = build(force=True)
+    assert forced["books_processed"] == 2
+    assert forced["chunks_reused"] == 0
+    assert len(db.embedded) == 2 * embedded
+    assert forced["final_point_count"] == first["final_point_count"]
+
+
+def test_changed_book_embeds_only_new_chunks_and_prunes_stale(index_env):
+    db, books, build = index_env
+    book = books / "cpc.txt"
+    book.write_text(_paragraphs("CPC", 6))
+    first = build()
+    before = first["final_point_count"]
+    db.embedded.clear()
+
+    # Replace the last paragraph only
+    paragraphs = _paragraphs("CPC", 6).split("\n\n")
+    paragraphs[-1] = "Amended paragraph on Order XXXVII summary suits."
+    book.write_text("\n\n".join(paragraphs))
+
+    second = build()
+    assert second["books_processed"] == 1
+    assert second["chunks_reused"] > 0
+    assert len(db.embedded) == second["chunks_upserted"] < before
+    assert any("Amended paragraph" in text for text in db.embedded)
+    # Stale chunk of the old last paragraph is gone
+    assert second["final_point_count"] == second["chunks_discovered"]
+
+
+def test_removed_book_points_are_deleted(index_env):
+    db, books, build = index_env
+    (books / "cpc.txt").write_text(_paragraphs("CPC", 3))
+    (books / "old_act.txt").write_text(_paragraphs("Old act", 3))
+    first = build()
+
+    (books / "old_act.txt").unlink()
+    second = build()
+
+    assert second["books_removed"] == 1
+    assert second["books_unchanged"] == 1
+    assert second["final_point_count"] < first["final_point_count"]
+    remaining = db.client.scroll("civil_test", limit=100, with_payload=True)[0]
+    assert {point.payload["source"] for point in remaining} == {"cpc.txt"}
+
+
+def test_points_carry_bm25_sparse_vectors(index_env):
+    db, books, build = index_env
+    (books / "cpc.txt").write_text(_paragraphs("CPC", 3))
+    build()
+
+    points = db.client.scroll("civil_test", limit=100, with_vectors=True)[0]
+    assert points
+    for point in points:
+        assert civilIndex.SPARSE_VECTOR_NAME in point.vector
+        assert point.vector[civilIndex.SPARSE_VECTOR_NAME].indices
@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def engine(tmp_path):
+    from sqlmodel import SQLModel, create_engine
+
+    from app.database.postgresql.models import ConsentLog, ProcessedContact, SuppressionList
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'compliance.db'}")
+    SQLModel.metadata.create_all(
+        engine, tables=[ProcessedContact.__table__, ConsentLog.__table__, SuppressionList.__table__]
+    )
+    return engine
+
+
+def _add_contacts(session, phones, job_id="job-1"):
+    from app.database.postgresql.models import ProcessedContact
+
+    session.add_all(
+        ProcessedContact(broadcast_job_id=job_id, user_id="user-1", phone_e164=p, source_row=i)
+        for i, p in enumerate(phones)
+    )
+    session.add(ProcessedContact(broadcast_job_id=job_id, user_id="user-1", phone_e164=phones[0], is_duplicate=True))
+    session.commit()
+
+
+class TestCheckOptIn:
+    def test_uses_latest_consent_action_and_logs_exclusions(self, engine):
+        from sqlmodel import Session, select
+
+        from app.database.postgresql.models import ConsentLog
+        from app.database.postgresql.postgresql_repositories import ComplianceRepository
+
+        now = datetime.utcnow()
+        with Session(engine) as session:
+            _add_contacts(session, ["+911", "+912", "+913", "+914"])
+            session.add_all([
+                ConsentLog(user_id="user-1", phone_e164="+911", action="OPT_OUT", created_at=now - timedelta(hours=2)),
+                ConsentLog(user_id="user-1", phone_e164="+912", action="OPT_OUT", created_at=now - timedelta(hours=2)),
+                ConsentLog(user_id="user-1", phone_e164="+912", action="RESUME", created_at=now - timedelta(hours=1)),
+                ConsentLog(user_id="other", phone_e164="+913", action="OPT_OUT", created_at=now),
+            ])
+            session.commit()
+
+            repo = ComplianceRepository(session=session)
+            first = repo.check_opt_in("user-1", "job-1")
+            # EXCLUDED audit rows must not mask the opt-out on the next check
+            second = repo.check_opt_in("user-1", "job-1")
+
+            assert first == {"total": 4, "excluded_count": 1, "excluded_sample": ["+911"]}
+            assert second == first
+            excluded = session.exec(select(ConsentLog.phone_e164).where(ConsentLog.action == "EXCLUDED")).all()
+            assert excluded == ["+911", "+911"]
+
+    def test_round_trips_do_not_grow_with_audience(self, engine):
+        from sqlalchemy import event
+        from sqlmodel import Session
+
+        from app.database.postgresql.models import ConsentLog
+        from app.database.postgresql.postgresql_repositories import ComplianceRepository
+
+        def _statements(size, job_id):
+            phones = [f"+91{job_id[-1]}{i:05d}" for i in range(size)]
+            with Session(engine) as session:
+                _add_contacts(session, phones, job_id)
+                session.add_all(ConsentLog(user_id="user-1", phone_e164=p, action="OPT_OUT") for p in phones[::2])
+                session.commit()
+
+                statements = []
+                listener = lambda *args: statements.append(args[2])
+                event.listen(engine, "before_cursor_execute", listener)
+                try:
+                    result = ComplianceRepository(session=session).check_opt_in("user-1", job_id)
+                finally:
+                    event.remove(engine, "before_cursor_execute", listener)
+            assert result["excluded_count"] == size // 2
+            assert len(result["excluded_sample"]) == min(10, size // 2)
+            return len(statements)
+
+        assert _statements(20, "job-2") == _statements(2000, "job-3")
+
+
+class TestFilterSuppressed:
+    def test_applies_active_global_and_own_campaign_suppressions(self, engine):
+        from sqlmodel import Session, select
+
+        from app.database.postgresql.models import SuppressionList
+        from app.database.postgresql.postgresql_repositories import ComplianceRepository
+
+        now = datetime.utcnow()
+        with Session(engine) as session:
+            _add_contacts(session, ["+911", "+912", "+913", "+914", "+915"])
+            session.add_all([
+                SuppressionList(user_id="user-1", phone_e164="+911", suppression_type="global"),
+                SuppressionList(user_id="user-1", phone_e164="+911", suppression_type="bounce"),
+                SuppressionList(user_id="user-1", phone_e164="+912", suppression_type="campaign", broadcast_job_id="job-1"),
+                SuppressionList(user_id="user-1", phone_e164="+913", suppression_type="campaign", broadcast_job_id="job-9"),
+                SuppressionList(user_id="user-1", phone_e164="+914", suppression_type="temporary",
+                                expires_at=now - timedelta(days=1)),
+                SuppressionList(user_id="user-1", phone_e164="+915", suppression_type="global", is_active=False),
+            ])
+            session.commit()
+
+            result = ComplianceRepository(session=session).filter_suppressed("user-1", "job-1")
+
+            assert result == {
+                "total": 5,
+                "filtered_count": 2,
+                "filtered_by_type": {"global": 1, "bounce": 1, "campaign": 1},
+                "filtered_sample": ["+911", "+912"],
+            }
+            expired = session.exec(
+                select(SuppressionList.is_active).where(SuppressionList.phone_e164 == "+914")
+            ).one()
+            assert expired is False
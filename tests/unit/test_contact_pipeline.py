@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import csv
+
+
+def _write_csv(path, rows):
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Name", "Phone", "Email", "City"])
+        writer.writerows(rows)
+
+
+ROWS = [
+    ["Asha", "+919876543210", "asha@example.com", "Pune"],
+    ["Ravi", "9876543210", "NA", ""],          # normalized duplicate, NA email
+    [],                                         # blank line
+    ["", "+919876543211", "", "Delhi"],         # fuzzy duplicate of row 1
+    ["Bad", "12345", "", ""],                   # invalid
+    ["Asha", "+919876543210", "", ""],          # exact duplicate
+    ["Meena", "+919812345678", "m@example.com", "Goa"],
+]
+
+
+class TestIterCsv:
+    def test_streams_rows_like_parse_csv(self, tmp_path):
+        from app.utils.data_processing import iter_csv, parse_csv
+
+        path = tmp_path / "contacts.csv"
+        _write_csv(path, ROWS)
+
+        contacts = list(iter_csv(str(path)))
+
+        assert contacts == parse_csv(str(path))
+        assert [c["source_row"] for c in contacts] == [2, 3, 4, 5, 6, 7]
+        assert contacts[1]["email"] is None
+        assert contacts[1]["custom_fields"] == {}
+        assert contacts[0]["custom_fields"] == {"City": "Pune"}
+
+
+class TestProcessContactStream:
+    def test_chunking_does_not_change_results(self, tmp_path):
+        from app.utils.data_processing import iter_csv, process_contact_stream
+
+        path = tmp_path / "contacts.csv"
+        _write_csv(path, ROWS)
+
+        results = {}
+        for chunk_size in (1, 2, 100):
+            stored = []
+            stats = process_contact_stream(
+                iter_csv(str(path)),
+                sink=lambda records: stored.extend(records) or len(records),
+                chunk_size=chunk_size,
+            )
+            results[chunk_size] = (
+                sorted((r["source_row"], r["is_duplicate"], r.get("dedup_stage")) for r in stored),
+                stats.valid_phones,
+                stats.duplicate_breakdown,
+                stats.records_stored,
+            )
+
+        assert results[1] == results[2] == results[100]
+        rows, valid_phones, breakdown, stored_count = results[1]
+        assert valid_phones == ["+919876543210", "+919812345678"]
+        assert breakdown == {"normalized": 1, "fuzzy": 1, "exact": 1}
+        assert stored_count == 6
+
+    def test_progress_reported_per_chunk(self, tmp_path):
+        from app.utils.data_processing import iter_csv, process_contact_stream
+
+        path = tmp_path / "contacts.csv"
+        _write_csv(path, ROWS)
+
+        seen = []
+        process_contact_stream(
+            iter_csv(str(path)),
+            sink=len,
+            chunk_size=2,
+            on_progress=lambda stats: seen.append((stats.chunks, stats.total_parsed)),
+        )
+
+        assert seen == [(1, 2), (2, 4), (3, 6)]
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import random
+
+
+def _linear_fuzzy_find(phone: str, seen: list):
+    """Reference O(n) scan: first seen number within distance 1, in insertion order."""
+    from Levenshtein import distance
+
+    for existing in seen:
+        if abs(len(existing) - len(phone)) <= 1 and distance(phone, existing) <= 1:
+            return existing
+    return None
+
+
+def _mutate(rng: random.Random, phone: str, alphabet: str) -> str:
+    pos = rng.randrange(len(phone) + 1)
+    op = rng.choice(("sub", "ins", "del", "swap"))
+    if op == "sub" and pos < len(phone):
+        return phone[:pos] + rng.choice(alphabet) + phone[pos + 1:]
+    if op == "del" and pos < len(phone):
+        return phone[:pos] + phone[pos + 1:]
+    if op == "swap" and pos < len(phone) - 1:
+        return phone[:pos] + phone[pos + 1] + phone[pos] + phone[pos + 2:]
+    return phone[:pos] + rng.choice(alphabet) + phone[pos:]
+
+
+class TestFuzzyPhoneIndex:
+    def test_matches_linear_scan(self):
+        from Levenshtein import distance
+        from app.utils.data_processing.deduplicator import FuzzyPhoneIndex
+
+        rng = random.Random(7)
+        # Short alphabet and short strings force dense neighbourhoods and edge lengths
+        for alphabet, lengths in (("0123456789", (12, 13, 14)), ("01", (1, 2, 3, 4, 5))):
+            index, seen = FuzzyPhoneIndex(), []
+            pool = ["".join(rng.choice(alphabet) for _ in range(rng.choice(lengths))) for _ in range(300)]
+            for _ in range(3000):
+                phone = rng.choice(pool)
+                if rng.random() < 0.7:
+                    phone = _mutate(rng, phone, alphabet)
+                if not phone or phone in index:
+                    continue
+                assert index.find(phone, distance) == _linear_fuzzy_find(phone, seen)
+                if rng.random() < 0.5:
+                    index.add(phone)
+                    seen.append(phone)
+
+    def test_deduplicate_contacts_labels(self):
+        from app.utils.data_processing import deduplicate_contacts
+
+        contacts = [
+            {"phone": "+919876543210"},
+            {"phone": "+919876543210"},   # exact
+            {"phone": "09876543210"},     # normalized
+            {"phone": "+919876543211"},   # fuzzy (substitution)
+            {"phone": "+919812345678"},
+        ]
+        unique, duplicates = deduplicate_contacts(contacts, cross_campaign_phones={"+919812345678"})
+
+        assert [c["phone"] for c in unique] == ["+919876543210"]
+        assert [d["dedup_stage"] for d in duplicates] == ["exact", "normalized", "fuzzy", "cross_campaign"]
+        assert duplicates[2]["duplicate_of"] == "+919876543210"
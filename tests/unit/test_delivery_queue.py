@@ -0,0 +1,417 @@
+"""Durable delivery queue — priority leasing, retry ladder, dead-lettering, broadcast workers."""
+from __future__ import annotations
+
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+
+import pytest
+
+
+@pytest.fixture
+def sqlite_session_factory(tmp_path, monkeypatch):
+    from sqlmodel import Session, SQLModel, create_engine
+
+    from app.database.postgresql import postgresql_connection
+    from app.database.postgresql.models.broadcast_job import BroadcastJob
+    from app.database.postgresql.models.broadcast_message import BroadcastMessage
+    from app.database.postgresql.models.delivery_queue import DeliveryQueueItem
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'queue.db'}")
+    SQLModel.metadata.create_all(
+        engine, tables=[BroadcastJob.__table__, BroadcastMessage.__table__, DeliveryQueueItem.__table__]
+    )
+
+    @contextmanager
+    def _get_session():
+        session = Session(engine)
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr(postgresql_connection, "get_session", _get_session)
+    return _get_session
+
+
+def _add_job(session, job_id="job-1", phase="SENDING"):
+    from app.database.postgresql.models.broadcast_job import BroadcastJob
+
+    session.add(BroadcastJob(
+        id=job_id, user_id="user-1", project_id="p", phase=phase, template_name="promo", valid_contacts=3,
+    ))
+    session.commit()
+
+
+def _make_due(session, **where):
+    """Pull scheduled retries forward so the next lease picks them up."""
+    from sqlalchemy import update
+
+    from app.database.postgresql.models.delivery_queue import DeliveryQueueItem
+
+    stmt = update(DeliveryQueueItem).values(next_attempt_at=datetime.utcnow() - timedelta(seconds=1))
+    for column, value in where.items():
+        stmt = stmt.where(getattr(DeliveryQueueItem, column) == value)
+    session.execute(stmt)
+    session.commit()
+
+
+class TestDeliveryQueueRepository:
+    def test_lease_takes_lanes_in_order_and_skips_leased_rows(self, sqlite_session_factory):
+        from app.database.postgresql.postgresql_repositories import DeliveryQueueRepository
+
+        with sqlite_session_factory() as session:
+            _add_job(session)
+            repo = DeliveryQueueRepository(session=session)
+            assert repo.enqueue("job-1", "user-1", [
+                {"phone": "+915", "priority": 5},
+                {"phone": "+913", "priority": 3},
+                {"phone": "+914", "priority": 4},
+            ], method="template", payload={"template_name": "promo"}) == 3
+            # Re-enqueueing the job leaves existing rows alone
+            assert repo.enqueue("job-1", "user-1", [{"phone": "+913", "priority": 1}], "template", {}) == 0
+
+            first = repo.lease("worker-a", limit=2, lease_seconds=60, max_attempts=5)
+            second = repo.lease("worker-b", limit=2, lease_seconds=60, max_attempts=5)
+
+            assert [r["phone_e164"] for r in first] == ["+913", "+914"]
+            assert [r["phone_e164"] for r in second] == ["+915"]
+            assert repo.lease("worker-c", limit=2, lease_seconds=60, max_attempts=5) == []
+            assert repo.get_queue_stats("job-1")["by_priority"] == {3: {"LEASED": 1}, 4: {"LEASED": 1}, 5: {"LEASED": 1}}
+
+    def test_expired_leases_return_to_the_queue(self, sqlite_session_factory):
+        from app.database.postgresql.postgresql_repositories import DeliveryQueueRepository
+
+        with sqlite_session_factory() as session:
+            _add_job(session)
+            repo = DeliveryQueueRepository(session=session)
+            repo.enqueue("job-1", "user-1", [{"phone": "+911"}], "template", {})
+            [row] = repo.lease("worker-dead", limit=10, lease_seconds=-1, max_attempts=5)
+
+            [retaken] = repo.lease("worker-b", limit=10, lease_seconds=60, max_attempts=5)
+            assert retaken["id"] == row["id"]
+            assert retaken["leased_by"] == "worker-b"
+            assert retaken["attempts"] == 1
+            # The dead worker's late results no longer apply
+            assert repo.settle("worker-dead", [{"id": row["id"], "attempts": 0, "success": True}], [0], 5) == {
+                "sent": 0, "retry": 0, "dead": 0, "settled_ids": [],
+            }
+            assert repo.get_queue_stats("job-1")["by_status"] == {"LEASED": 1}
+
+    def test_a_batch_that_keeps_losing_its_lease_is_dead_lettered(self, sqlite_session_factory):
+        from sqlmodel import select
+
+        from app.database.postgresql.models.delivery_queue import DeliveryQueueItem
+        from app.database.postgresql.postgresql_repositories import DeliveryQueueRepository
+        from app.database.postgresql.postgresql_repositories.delivery_queue_repo import LEASE_EXPIRED_ERROR
+
+        with sqlite_session_factory() as session:
+            _add_job(session)
+            repo = DeliveryQueueRepository(session=session)
+            repo.enqueue("job-1", "user-1", [{"phone": "+911"}], "template", {})
+
+            leases = 0
+            while repo.lease(f"worker-{leases}", limit=10, lease_seconds=-1, max_attempts=3):
+                leases += 1
+            assert leases == 3
+
+            stats = repo.get_queue_stats("job-1")
+            assert stats["by_status"] == {"DEAD": 1}
+            assert repo.lease("w", limit=10, lease_seconds=60, max_attempts=3) == []
+            row = session.exec(select(DeliveryQueueItem)).one()
+            assert (row.attempts, row.error_message) == (3, LEASE_EXPIRED_ERROR)
+
+    def test_settle_walks_the_backoff_ladder_then_dead_letters(self, sqlite_session_factory):
+        from app.database.postgresql.models.delivery_queue import DeliveryQueueItem
+        from app.database.postgresql.postgresql_repositories import DeliveryQueueRepository
+        from app.utils.broadcasting import MAX_RETRIES, NON_RETRYABLE_ERRORS, RETRY_DELAYS
+
+        def _settle(repo, rows, success_phones=(), codes=None):
+            codes = codes or {}
+            return repo.settle("w", [
+                {
+                    "id": r["id"], "attempts": r["attempts"], "success": r["phone_e164"] in success_phones,
+                    "message_id": f"wamid.{r['phone_e164']}", "error": "failed",
+                    "error_code": codes.get(r["phone_e164"], "130429"),
+                }
+                for r in rows
+            ], RETRY_DELAYS, MAX_RETRIES, NON_RETRYABLE_ERRORS)
+
+        with sqlite_session_factory() as session:
+            _add_job(session)
+            repo = DeliveryQueueRepository(session=session)
+            repo.enqueue("job-1", "user-1", [{"phone": p} for p in ("+911", "+912", "+913")], "template", {})
+
+            rows = repo.lease("w", limit=10, lease_seconds=60, max_attempts=5)
+            assert _settle(repo, rows, success_phones={"+911"}, codes={"+912": "131026"}) == {
+                "sent": 1, "retry": 1, "dead": 1, "settled_ids": [1, 2, 3],
+            }
+
+            delays = []
+            for _ in range(MAX_RETRIES - 1):
+                row = session.get(DeliveryQueueItem, 3)
+                session.refresh(row)
+                delays.append(round((row.next_attempt_at - row.updated_at).total_seconds()))
+                assert repo.lease("w", limit=10, lease_seconds=60, max_attempts=5) == []  # not due yet
+                _make_due(session, phone_e164="+913")
+                _settle(repo, repo.lease("w", limit=10, lease_seconds=60, max_attempts=5))
+
+            assert delays == RETRY_DELAYS[1:]
+            stats = repo.get_queue_stats("job-1")
+            assert stats["by_status"] == {"SENT": 1, "DEAD": 2}
+            assert stats["dead_by_code"] == {"131026": 1, "130429": 1}
+            assert stats["pending"] == 0
+
+    def test_lease_skips_jobs_that_are_not_sending_and_rows_not_yet_due(self, sqlite_session_factory):
+        from app.database.postgresql.postgresql_repositories import DeliveryQueueRepository
+        from app.utils.broadcasting import schedule_by_tier
+
+        with sqlite_session_factory() as session:
+            _add_job(session, "job-paused", phase="PAUSED")
+            _add_job(session, "job-live")
+            repo = DeliveryQueueRepository(session=session)
+            repo.enqueue("job-paused", "user-1", [{"phone": "+911", "priority": 1}], "template", {})
+            repo.enqueue("job-live", "user-1", schedule_by_tier(["+912", "+913", "+914"], tier_limit=2), "template", {})
+
+            assert [r["phone_e164"] for r in repo.lease("w", limit=10, lease_seconds=60, max_attempts=5)] == ["+912", "+913"]
+            assert repo.count_pending_by_job(["job-paused", "job-live", "job-never"]) == {
+                "job-paused": {"total": 1, "pending": 1},
+                "job-live": {"total": 3, "pending": 3},
+            }
+
+
+def test_schedule_by_tier_spreads_recipients_over_24h_windows():
+    from app.utils.broadcasting import schedule_by_tier
+
+    rows = schedule_by_tier([f"+91{i}" for i in range(5)], tier_limit=2)
+    offsets = [round((r["not_before"] - rows[0]["not_before"]).total_seconds() / 3600) for r in rows]
+    assert offsets == [0, 0, 24, 24, 48]
+    assert len({r["not_before"] for r in schedule_by_tier(["+911", "+912", "+913"], float("inf"))}) == 1
+    assert len({r["not_before"] for r in schedule_by_tier(["+911", "+912", "+913"], None)}) == 1
+
+
+class TestDeliveryWorker:
+    def test_drain_sends_records_and_schedules_retries(self, sqlite_session_factory, monkeypatch):
+        from app.database.postgresql.models.broadcast_job import BroadcastJob
+        from app.database.postgresql.postgresql_repositories import (
+            BroadcastMessageRepository,
+            DeliveryQueueRepository,
+        )
+        from app.utils.broadcasting import delivery_queue
+
+        with sqlite_session_factory() as session:
+            _add_job(session)
+            DeliveryQueueRepository(session=session).enqueue(
+                "job-1", "user-1",
+                [{"phone": "+911", "priority": 3}, {"phone": "+912", "priority": 3}, {"phone": "+913", "priority": 5}],
+                method="template",
+                payload={"user_id": "user-1", "message_type": "template", "template_name": "promo"},
+            )
+
+        calls = []
+        codes = {"+912": 130429, "+913": 131026}
+
+        def _fake_mcp(tool_name, params, timeout=None):
+            calls.append((tool_name, params["template_name"], [r["to"] for r in params["recipients"]]))
+            return {"success": True, "results": [
+                {"to": r["to"], "ok": r["to"] not in codes, "id": f"wamid.{r['to']}", "code": codes.get(r["to"])}
+                for r in params["recipients"]
+            ]}
+
+        monkeypatch.setattr(delivery_queue, "_call_direct_api_mcp", _fake_mcp)
+        totals = delivery_queue.run_worker("w", exit_when_idle=True)
+
+        assert calls == [("send_message_batch", "promo", ["+911", "+912", "+913"])]
+        assert totals == {"leased": 3, "sent": 1, "retry": 1, "dead": 1}
+
+        with sqlite_session_factory() as session:
+            stats = DeliveryQueueRepository(session=session).get_queue_stats("job-1")
+            assert stats["retry_scheduled"] == 1
+            assert stats["dead_by_code"] == {"131026": 1}
+            assert BroadcastMessageRepository(session=session).count_by_status("job-1") == {"SENT": 1, "FAILED": 2}
+            job = session.get(BroadcastJob, "job-1")
+            assert (job.sent_count, job.failed_count) == (1, 2)
+
+            # The retry goes out once it is due
+            _make_due(session, phone_e164="+912")
+        codes.pop("+912")
+        assert delivery_queue.drain_once("w")["sent"] == 1
+        assert calls[-1][2] == ["+912"]
+        with sqlite_session_factory() as session:
+            assert BroadcastMessageRepository(session=session).count_by_status("job-1") == {"SENT": 2, "FAILED": 1}
+
+    def test_results_of_rows_whose_lease_was_lost_are_discarded(self, sqlite_session_factory, monkeypatch):
+        from sqlalchemy import update
+
+        from app.database.postgresql.models.delivery_queue import DeliveryQueueItem
+        from app.database.postgresql.postgresql_repositories import (
+            BroadcastMessageRepository,
+            DeliveryQueueRepository,
+        )
+        from app.utils.broadcasting import delivery_queue
+
+        with sqlite_session_factory() as session:
+            _add_job(session)
+            DeliveryQueueRepository(session=session).enqueue(
+                "job-1", "user-1", [{"phone": "+911"}, {"phone": "+912"}], "template", {"template_name": "promo"},
+            )
+
+        def _slow_mcp(tool_name, params, timeout=None):
+            # The lease on +912 expires mid-call and another worker takes it over
+            with sqlite_session_factory() as session:
+                session.execute(
+                    update(DeliveryQueueItem)
+                    .where(DeliveryQueueItem.phone_e164 == "+912")
+                    .values(leased_by="worker-b")
+                )
+                session.commit()
+            return {"success": True, "results": [{"to": r["to"], "ok": True, "id": "wamid"} for r in params["recipients"]]}
+
+        monkeypatch.setattr(delivery_queue, "_call_direct_api_mcp", _slow_mcp)
+
+        assert delivery_queue.drain_once("w") == {"leased": 2, "sent": 1, "retry": 0, "dead": 0}
+        with sqlite_session_factory() as session:
+            assert BroadcastMessageRepository(session=session).count_by_status("job-1") == {"SENT": 1}
+            assert DeliveryQueueRepository(session=session).get_queue_stats("job-1")["by_status"] == {
+                "SENT": 1, "LEASED": 1,
+            }
+
+    def test_batch_calls_time_out_before_the_lease_and_late_groups_are_released(
+        self, sqlite_session_factory, monkeypatch,
+    ):
+        from app.config import settings
+        from app.database.postgresql.postgresql_repositories import DeliveryQueueRepository
+        from app.utils.broadcasting import delivery_queue
+
+        monkeypatch.setattr(settings, "DELIVERY_QUEUE_LEASE_SECONDS", 60)
+        monkeypatch.setattr(settings, "DELIVERY_QUEUE_SETTLE_MARGIN_SECONDS", 20)
+        with sqlite_session_factory() as session:
+            _add_job(session, "job-1")
+            _add_job(session, "job-2")
+            repo = DeliveryQueueRepository(session=session)
+            repo.enqueue("job-1", "user-1", [{"phone": "+911", "priority": 1}], "template", {"template_name": "a"})
+            repo.enqueue("job-2", "user-1", [{"phone": "+912", "priority": 2}], "template", {"template_name": "b"})
+
+        clock = {"now": 1000.0}
+        timeouts = []
+
+        def _hanging_mcp(tool_name, params, timeout=None):
+            timeouts.append(timeout)
+            clock["now"] += timeout
+            raise TimeoutError()
+
+        class _Unpaced:
+            def take(self, tokens=1.0):
+                pass
+
+        monkeypatch.setattr(delivery_queue.time, "monotonic", lambda: clock["now"])
+        monkeypatch.setattr(delivery_queue, "_call_direct_api_mcp", _hanging_mcp)
+
+        assert delivery_queue.drain_once("w", bucket=_Unpaced()) == {"leased": 2, "sent": 0, "retry": 1, "dead": 0}
+        assert timeouts == [40]
+        with sqlite_session_factory() as session:
+            stats = DeliveryQueueRepository(session=session)
+            first, second = stats.get_queue_stats("job-1"), stats.get_queue_stats("job-2")
+            assert (first["retry_scheduled"], first["by_status"]) == (1, {"QUEUED": 1})
+            # Released unsent: due again at once, no attempt used
+            assert (second["retry_scheduled"], second["by_status"]) == (0, {"QUEUED": 1})
+
+    def test_start_delivery_and_broadcast_worker_complete_the_job(self, sqlite_session_factory, monkeypatch):
+        from app.database.postgresql.models.broadcast_job import BroadcastJob
+        from app.utils.broadcasting import delivery_queue, start_delivery
+        from app.utils.broadcasting.worker import run_broadcast_worker
+
+        with sqlite_session_factory() as session:
+            _add_job(session, phase="READY_TO_SEND")
+
+        def _fake_mcp(tool_name, params, timeout=None):
+            return {"success": True, "results": [
+                {"to": r["to"], "ok": True, "id": f"wamid.{r['to']}"} for r in params["recipients"]
+            ]}
+
+        monkeypatch.setattr(delivery_queue, "_call_direct_api_mcp", _fake_mcp)
+        payload = {"user_id": "user-1", "message_type": "template", "template_name": "promo"}
+        started = start_delivery("user-1", "job-1", [{"phone": f"+91{i}"} for i in range(5)], "template", payload)
+        assert (started["queued"], started["phase"], started["queue"]["pending"]) == (5, "SENDING", 5)
+        # Starting again queues nothing new
+        assert start_delivery("user-1", "job-1", [{"phone": "+910"}], "template", payload)["queued"] == 0
+
+        totals = run_broadcast_worker("w", concurrency=3, exit_when_idle=True)
+
+        assert totals == {"leased": 5, "sent": 5, "retry": 0, "dead": 0}
+        with sqlite_session_factory() as session:
+            job = session.get(BroadcastJob, "job-1")
+            assert (job.phase, job.sent_count, job.failed_count) == ("COMPLETED", 5, 0)
+        assert delivery_queue.finalize_jobs() == []
+
+    def test_worker_threads_pace_batches_through_one_bucket(self, sqlite_session_factory, monkeypatch):
+        from app.config import settings
+        from app.database.postgresql.postgresql_repositories import DeliveryQueueRepository
+        from app.utils.broadcasting import delivery_queue, worker
+
+        with sqlite_session_factory() as session:
+            _add_job(session, "job-1")
+            _add_job(session, "job-2")
+            repo = DeliveryQueueRepository(session=session)
+            repo.enqueue("job-1", "user-1", [{"phone": f"+911{i}"} for i in range(3)], "template", {"template_name": "a"})
+            repo.enqueue("job-2", "user-1", [{"phone": f"+912{i}"} for i in range(2)], "template", {"template_name": "b"})
+
+        buckets = []
+
+        class _Bucket:
+            def __init__(self, rate):
+                self.rate, self.taken = rate, []
+                buckets.append(self)
+
+            def take(self, tokens=1.0):
+                self.taken.append(tokens)
+
+        monkeypatch.setattr(delivery_queue, "_send_bucket", None)
+
+        def _fake_mcp(tool_name, params, timeout=None):
+            return {"success": True, "results": [{"to": r["to"], "ok": True} for r in params["recipients"]]}
+
+        monkeypatch.setattr(settings, "BROADCAST_WORKER_RATE_PER_SEC", 50)
+        monkeypatch.setattr(delivery_queue, "TokenBucket", _Bucket)
+        monkeypatch.setattr(delivery_queue, "_call_direct_api_mcp", _fake_mcp)
+
+        assert worker.run_broadcast_worker("w", concurrency=2, exit_when_idle=True)["sent"] == 5
+        assert len(buckets) == 1
+        assert (buckets[0].rate, sorted(buckets[0].taken)) == (50, [2, 3])
+
+    def test_template_fallback_requeues_dead_lite_rows(self, sqlite_session_factory):
+        from sqlalchemy import update
+        from sqlmodel import select
+
+        from app.database.postgresql.models.delivery_queue import DeliveryQueueItem
+        from app.utils.broadcasting import start_delivery
+
+        with sqlite_session_factory() as session:
+            _add_job(session, "job-1")
+            _add_job(session, "job-2", phase="COMPLETED")
+
+        lite = {"user_id": "user-1", "text": "hi"}
+        template = {"user_id": "user-1", "message_type": "template", "template_name": "promo"}
+        recipients = [{"phone": p} for p in ("+911", "+912", "+913")]
+        assert start_delivery("user-1", "job-1", recipients, "lite", lite)["queued"] == 3
+        with sqlite_session_factory() as session:
+            for phone, status, code in (("+911", "DEAD", "131047"), ("+912", "DEAD", "131026"), ("+913", "SENT", None)):
+                session.execute(
+                    update(DeliveryQueueItem).where(DeliveryQueueItem.phone_e164 == phone)
+                    .values(status=status, attempts=1, error_code=code)
+                )
+            session.commit()
+
+        started = start_delivery("user-1", "job-1", recipients, "template", template, fallback_from="lite")
+
+        assert (started["queued"], started["requeued"]) == (0, 1)
+        with sqlite_session_factory() as session:
+            rows = {r.phone_e164: r for r in session.exec(select(DeliveryQueueItem)).all()}
+        assert (rows["+911"].method, rows["+911"].status, rows["+911"].attempts) == ("template", "QUEUED", 0)
+        assert (rows["+911"].payload, rows["+911"].error_code) == (template, None)
+        # Not on WhatsApp: a template cannot reach it either
+        assert (rows["+912"].method, rows["+912"].status) == ("lite", "DEAD")
+        assert rows["+913"].status == "SENT"
+
+        # A finished job never sends again
+        finished = start_delivery("user-1", "job-2", recipients, "template", template, fallback_from="lite")
+        assert (finished["queued"], finished["requeued"], finished["queue"]["total"]) == (0, 0, 0)
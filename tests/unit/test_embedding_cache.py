@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+
+import numpy as np
+import pytest
+
+from app.database.vectordatabse import embedding_cache as ec
+from app.database.vectordatabse import qudrant
+
+
+class _FakeEmbeddings:
+    model = "fake-embed-3"
+
+    def __init__(self):
+        self.calls: list[list[str]] = []
+
+    def _vector(self, text: str) -> list[float]:
+        return [float(len(text)), float(sum(map(ord, text)) % 97), 0.5]
+
+    def embed_documents(self, texts):
+        self.calls.append(list(texts))
+        return [self._vector(t) for t in texts]
+
+    async def aembed_documents(self, texts):
+        return self.embed_documents(texts)
+
+
+@pytest.fixture
+def fake_embeddings(tmp_path, monkeypatch):
+    fake = _FakeEmbeddings()
+    monkeypatch.setattr(qudrant, "embeddings_model", fake)
+    monkeypatch.setattr(ec.settings, "EMBEDDING_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(ec.settings, "EMBEDDING_CACHE_ENABLED", True)
+    monkeypatch.setattr(ec, "_caches", {})
+    return fake
+
+
+def test_only_misses_reach_the_provider(fake_embeddings):
+    db = qudrant.QdrantDB.__new__(qudrant.QdrantDB)
+
+    first = db.get_embeddings_batch(["order vii rule 1", "section 9 cpc"])
+    second = db.get_embeddings_batch(["section 9 cpc", "order xxxvii"])
+    third = asyncio.run(db.aget_embeddings_batch(["order xxxvii", "order vii rule 1"]))
+
+    assert fake_embeddings.calls == [["order vii rule 1", "section 9 cpc"], ["order xxxvii"]]
+    assert second[0] == first[1]
+    assert third == [second[1], first[0]]
+    stats = ec.get_embedding_cache_stats()["fake-embed-3"]
+    assert (stats["hits"], stats["misses"], stats["rows"]) == (3, 3, 3)
+
+
+def test_store_reloads_from_disk_memory_mapped(tmp_path):
+    cache = ec.EmbeddingCache(tmp_path, "model-a")
+    cache.put_many(["a", "b"], [[1.0, 2.0], [3.0, 4.0]])
+
+    reopened = ec.EmbeddingCache(tmp_path, "model-a")
+    found, missing = reopened.get_many(["b", "c", "a"])
+
+    assert isinstance(reopened._matrix, np.memmap)
+    assert found == [[3.0, 4.0], None, [1.0, 2.0]]
+    assert missing == [1]
+    # Keys are per model
+    assert ec.EmbeddingCache(tmp_path, "model-b").get_many(["a"])[1] == [0]
+
+
+def test_compact_drops_duplicate_rows_written_by_other_processes(tmp_path):
+    writer_a = ec.EmbeddingCache(tmp_path, "model-a")
+    writer_b = ec.EmbeddingCache(tmp_path, "model-a")
+    writer_a.put_many(["a", "b"], [[1.0, 1.0], [2.0, 2.0]])
+    # writer_b has not seen writer_a's rows yet and embeds "b" again
+    writer_b._index.clear()
+    writer_b.put_many(["b", "c"], [[2.5, 2.5], [3.0, 3.0]])
+
+    assert writer_b.stats()["duplicate_rows"] == 1
+    assert writer_b.compact() == {"rows_before": 4, "rows_after": 3}
+
+    # writer_a notices the shrunken store on its next miss
+    found, missing = writer_a.get_many(["a", "b", "c", "z"])
+    assert found[:3] == [[1.0, 1.0], [2.5, 2.5], [3.0, 3.0]]
+    assert missing == [3]
@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TypedDict
+
+import pytest
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def cache(tmp_path):
+    from sqlalchemy import create_engine
+
+    from app.services.llm_cache import DraftingLLMCache
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'llm_cache.db'}")
+    return DraftingLLMCache(engine, ttl_seconds=60, max_entries=2, skip_nodes=["review"], clock=_Clock())
+
+
+def _model(cache, *responses):
+    from langchain_core.language_models.fake_chat_models import FakeListChatModel
+
+    return FakeListChatModel(responses=list(responses)).model_copy(update={"cache": cache})
+
+
+def _graph(model, retry: bool = False):
+    from langgraph.graph import END, START, StateGraph
+
+    from app.services import ainvoke_llm
+
+    class State(TypedDict):
+        prompt: str
+        answer: str
+
+    async def draft(state):
+        response = await ainvoke_llm(model, state["prompt"], cache=not retry)
+        return {"answer": response.content}
+
+    async def review(state):
+        response = await ainvoke_llm(model, state["prompt"] + " (review)")
+        return {"answer": state["answer"] + "|" + response.content}
+
+    graph = StateGraph(State)
+    graph.add_node("draft", draft)
+    graph.add_node("review", review)
+    graph.add_edge(START, "draft")
+    graph.add_edge("draft", "review")
+    graph.add_edge("review", END)
+    return graph.compile()
+
+
+class TestDraftingLLMCache:
+    def test_repeat_run_is_served_from_cache_per_node(self, cache):
+        graph = _graph(_model(cache, "first", "second", "third", "fourth"))
+
+        first = asyncio.run(graph.ainvoke({"prompt": "Draft a plaint"}))
+        # Trailing whitespace does not change the content address
+        second = asyncio.run(graph.ainvoke({"prompt": "Draft a plaint  "}))
+
+        assert first["answer"] == "first|second"
+        # draft hits the cache; review opted out and calls the model again
+        assert second["answer"] == "first|third"
+        stats = cache.stats()
+        assert stats["draft"] == {"hits": 1, "misses": 1, "writes": 1, "bypassed": 0, "skipped": 0}
+        assert stats["review"]["skipped"] == 2
+
+    def test_retry_bypasses_lookup_and_overwrites_entry(self, cache):
+        model = _model(cache, "bad", "x", "good", "y")
+
+        asyncio.run(_graph(model).ainvoke({"prompt": "p"}))
+        retried = asyncio.run(_graph(model, retry=True).ainvoke({"prompt": "p"}))
+        again = asyncio.run(_graph(model).ainvoke({"prompt": "p"}))
+
+        assert retried["answer"].startswith("good|")
+        assert again["answer"].startswith("good|")
+        assert cache.stats()["draft"]["bypassed"] == 1
+
+    def test_ttl_and_lru_eviction(self, cache):
+        from langchain_core.messages import AIMessage
+        from langchain_core.outputs import ChatGeneration
+
+        def _store(prompt):
+            cache.update(prompt, "llm", [ChatGeneration(message=AIMessage(content=prompt))])
+
+        _store("a")
+        cache._clock.now += 10
+        _store("b")
+        cache._clock.now += 10
+        assert cache.lookup("a", "llm")[0].message.content == "a"
+        _store("c")
+
+        # "b" is least recently used once "a" was read
+        assert cache.evict() == 1
+        assert cache.lookup("b", "llm") is None
+        assert cache.lookup("a", "llm") is not None
+
+        cache._clock.now += 70
+        assert cache.lookup("a", "llm") is None
+        assert cache.evict() == 2
@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+
+class _SlowModel:
+    def __init__(self, name: str, latency: float):
+        self.model_name = name
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+
+    async def ainvoke(self, messages, **kwargs):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency)
+            return f"{self.model_name}:{messages}"
+        finally:
+            self.in_flight -= 1
+
+    def invoke(self, messages, **kwargs):
+        raise AssertionError("sync invoke must not be used")
+
+
+class TestAinvokeLlm:
+    def test_caps_in_flight_calls_per_model(self):
+        from app.services.llm_limiter import ainvoke_llm
+
+        fast = _SlowModel("limiter-test-a", 0.02)
+        other = _SlowModel("limiter-test-b", 0.02)
+
+        async def _run():
+            return await asyncio.gather(
+                *(ainvoke_llm(fast, i, max_concurrency=3) for i in range(12)),
+                *(ainvoke_llm(other, i, max_concurrency=3) for i in range(3)),
+            )
+
+        results = asyncio.run(_run())
+
+        assert results[:2] == ["limiter-test-a:0", "limiter-test-a:1"]
+        assert fast.peak == 3
+        # A separate model has its own limit
+        assert other.peak == 3
+
+    def test_timeout_raises_and_releases_slot(self):
+        from app.services.llm_limiter import ainvoke_llm, get_llm_limiter_stats
+
+        slow = _SlowModel("limiter-test-slow", 1.0)
+        quick = _SlowModel("limiter-test-slow", 0.0)
+
+        async def _run():
+            with pytest.raises(TimeoutError, match="limiter-test-slow"):
+                await ainvoke_llm(slow, "x", timeout=0.05, max_concurrency=1)
+            # The single slot was released by the timed-out call
+            return await ainvoke_llm(quick, "y", timeout=0.5, max_concurrency=1)
+
+        assert asyncio.run(_run()) == "limiter-test-slow:y"
+        stats = get_llm_limiter_stats()["_SlowModel:limiter-test-slow"]
+        assert stats["timeouts"] == 1
+        assert stats["in_flight"] == 0
+
+    def test_structured_output_wrappers_share_the_model_key(self):
+        from langchain_core.language_models.fake_chat_models import FakeListChatModel
+        from langchain_core.runnables import RunnableLambda
+
+        from app.services.llm_limiter import limiter_key
+
+        model = FakeListChatModel(responses=["ok"])
+        wrapped = model.bind(stop=["\n"]) | RunnableLambda(lambda m: m)
+
+        assert limiter_key(wrapped) == limiter_key(model) == "FakeListChatModel"
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+
+
+class TestMessageBatchFanOut:
+    def test_results_are_compact_and_ordered(self):
+        from mcp_servers.direct_api_mcp.tools.messages._batch import fan_out
+
+        async def _send(recipient: dict) -> dict:
+            if recipient["to"] == "919000000002":
+                return {
+                    "success": False,
+                    "error": "Bad request",
+                    "status_code": 400,
+                    "details": '{"error": {"code": 131026}}',
+                }
+            return {"success": True, "data": {"messages": [{"id": f"wamid.{recipient['to']}"}]}}
+
+        recipients = [{"to": f"91900000000{i}"} for i in range(5)]
+        response = asyncio.run(fan_out(recipients, _send, max_concurrency=2))
+
+        assert response["sent"] == 4
+        assert response["failed"] == 1
+        assert [r["to"] for r in response["results"]] == [r["to"] for r in recipients]
+        assert response["results"][0] == {"to": "919000000000", "ok": True, "id": "wamid.919000000000"}
+        assert response["results"][2] == {
+            "to": "919000000002", "ok": False, "error": "Bad request", "status_code": 400, "code": "131026",
+        }
+
+    def test_concurrency_is_bounded(self):
+        from mcp_servers.direct_api_mcp.tools.messages._batch import fan_out
+
+        state = {"active": 0, "peak": 0}
+
+        async def _send(recipient: dict) -> dict:
+            state["active"] += 1
+            state["peak"] = max(state["peak"], state["active"])
+            await asyncio.sleep(0.01)
+            state["active"] -= 1
+            return {"success": True, "data": {}}
+
+        asyncio.run(fan_out([{"to": str(i)} for i in range(20)], _send, max_concurrency=4))
+
+        assert state["peak"] == 4
+
+    def test_validation_errors_fail_only_that_recipient(self):
+        from mcp_servers.direct_api_mcp.tools.messages._batch import fan_out
+
+        async def _send(recipient: dict) -> dict:
+            if recipient["to"] == "bad":
+                raise ValueError("to too short")
+            return {"success": True, "data": {}}
+
+        response = asyncio.run(fan_out([{"to": "bad"}, {"to": "919000000001"}], _send, max_concurrency=2))
+
+        assert response["failed"] == 1
+        assert response["results"][0]["error"] == "Validation error: to too short"
+
+    def test_check_batch_rejects_bad_input(self):
+        from mcp_servers.direct_api_mcp.tools.messages._batch import MAX_BATCH_SIZE, check_batch
+
+        assert check_batch([]) != ""
+        assert check_batch([{"phone": "1"}]) != ""
+        assert check_batch([{"to": "1"}] * (MAX_BATCH_SIZE + 1)) != ""
+        assert check_batch([{"to": "919000000001"}]) == ""
@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+
+CONTACTS = [
+    {
+        "phone_e164": "+919876543210", "name": "Asha", "email": "asha@example.com",
+        "country_code": "IN", "quality_score": 80, "custom_fields": {"city": "Pune", "note": "tab\there"},
+        "source_row": 2, "validation_errors": [], "is_duplicate": False, "duplicate_of": None,
+    },
+    {"phone_e164": "", "source_row": 3, "validation_errors": ["Invalid phone: 123"], "custom_fields": None},
+]
+
+
+class TestCopyRow:
+    def test_row_matches_copy_columns_and_orm_defaults(self):
+        from app.database.postgresql.postgresql_repositories.processed_contact_repo import (
+            COPY_COLUMNS,
+            COPY_SQL,
+            _copy_row,
+        )
+
+        now = datetime(2026, 1, 1)
+        full = dict(zip(COPY_COLUMNS, _copy_row(CONTACTS[0], "job-1", "user-1", now)))
+        sparse = dict(zip(COPY_COLUMNS, _copy_row(CONTACTS[1], "job-1", "user-1", now)))
+
+        assert len(_copy_row(CONTACTS[0], "job-1", "user-1", now)) == len(COPY_COLUMNS)
+        assert COPY_SQL.startswith("COPY processed_contacts (broadcast_job_id, user_id, phone_e164")
+        assert full["broadcast_job_id"] == "job-1" and full["created_at"] == now
+        assert json.loads(full["custom_fields"]) == CONTACTS[0]["custom_fields"]
+        assert full["validation_errors"] == "[]"
+        # None is stored as JSON null, like the ORM path
+        assert sparse["custom_fields"] == "null"
+        assert sparse["quality_score"] == 0 and sparse["is_duplicate"] is False
+        assert json.loads(sparse["validation_errors"]) == ["Invalid phone: 123"]
+
+
+class TestBulkCreateFallback:
+    def test_sqlite_uses_orm_path(self, tmp_path):
+        from sqlmodel import Session, SQLModel, create_engine
+
+        from app.database.postgresql.models.processed_contact import ProcessedContact
+        from app.database.postgresql.postgresql_repositories.processed_contact_repo import (
+            ProcessedContactRepository,
+        )
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'contacts.db'}")
+        SQLModel.metadata.create_all(engine, tables=[ProcessedContact.__table__])
+
+        with Session(engine) as session:
+            repo = ProcessedContactRepository(session=session)
+            assert repo.supports_copy() is False
+
+            assert repo.bulk_create(CONTACTS, "job-1", "user-1") == 2
+            stored = repo.get_by_broadcast_job("job-1")
+
+        assert [r["source_row"] for r in stored] == [2, 3]
+        assert stored[0]["custom_fields"] == {"city": "Pune", "note": "tab\there"}
+        assert stored[1]["validation_errors"] == ["Invalid phone: 123"]
+
+
+class TestLifecycleStages:
+    def test_stages_are_assigned_in_one_statement_and_persisted(self, tmp_path):
+        from datetime import timedelta
+
+        from sqlalchemy import event
+        from sqlmodel import Session, SQLModel, create_engine
+
+        from app.database.postgresql.models import ConsentLog, ProcessedContact
+        from app.database.postgresql.postgresql_repositories.processed_contact_repo import (
+            ProcessedContactRepository,
+        )
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'contacts.db'}")
+        SQLModel.metadata.create_all(engine, tables=[ProcessedContact.__table__, ConsentLog.__table__])
+        now = datetime(2026, 6, 1, 12)
+        ages = {"+911": None, "+912": 3, "+913": 8, "+914": 45, "+915": 75, "+916": 120}
+
+        with Session(engine) as session:
+            session.add_all(
+                ProcessedContact(broadcast_job_id="job-1", user_id="user-1", phone_e164=p) for p in ages
+            )
+            session.add(ProcessedContact(broadcast_job_id="job-1", user_id="user-1", phone_e164="+916", is_duplicate=True))
+            session.add_all(
+                ConsentLog(user_id="user-1", phone_e164=p, action="OPT_IN", created_at=now - timedelta(days=d))
+                for p, d in ages.items() if d is not None
+            )
+            # Audit rows and other users' events do not count as interactions
+            session.add(ConsentLog(user_id="user-1", phone_e164="+916", action="EXCLUDED", created_at=now))
+            session.add(ConsentLog(user_id="user-2", phone_e164="+915", action="OPT_IN", created_at=now))
+            session.commit()
+
+            repo = ProcessedContactRepository(session=session)
+            statements = []
+            listener = lambda *args: statements.append(args[2])
+            event.listen(engine, "before_cursor_execute", listener)
+            try:
+                updated = repo.assign_lifecycle_stages(
+                    "job-1", "user-1",
+                    (("new", 7), ("engaged", 30), ("active", 60), ("at_risk", 90)),
+                    fallback_stage="churned", now=now,
+                )
+            finally:
+                event.remove(engine, "before_cursor_execute", listener)
+
+            assert updated == 7
+            assert len(statements) == 1
+            stages = {c["phone_e164"]: c["lifecycle_stage"] for c in repo.get_by_broadcast_job("job-1")}
+            assert stages == {
+                "+911": "new", "+912": "new", "+913": "engaged",
+                "+914": "active", "+915": "at_risk", "+916": "churned",
+            }
+            assert repo.count_by_lifecycle_stage("job-1") == {
+                "new": 2, "engaged": 1, "active": 1, "at_risk": 1, "churned": 1,
+            }
@@ -0,0 +1,188 @@
+"""AiSensy client limiter — AIMD concurrency, Retry-After pauses, circuit breaking, metrics."""
+import asyncio
+import time
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from app.config import settings
+from app.core import rate_limiter as rl
+from tests.fixtures.aisensy_simulator import AiSensySimulator, SimulatorConfig
+
+AUTH = {"Authorization": "Bearer account-a"}
+
+
+@pytest.fixture(autouse=True)
+def _fresh_limiters(monkeypatch):
+    monkeypatch.setattr(settings, "AISENSY_LIMITER_ENABLED", True)
+    monkeypatch.setattr(settings, "AISENSY_LIMITER_THROTTLE_PAUSE_SECONDS", 0.05)
+    rl.reset_rate_limiters()
+    yield
+    rl.reset_rate_limiters()
+
+
+def _serve(app, scenario):
+    async def _main():
+        async with TestServer(app) as server:
+            async with rl.RateLimitedSession() as session:
+                return await scenario(session, server)
+
+    return asyncio.run(_main())
+
+
+def test_aimd_increase_and_decrease():
+    limiter = rl.AdaptiveLimiter("k", initial=4, min_limit=1, max_limit=8, decrease_factor=0.5, cooldown_s=10)
+
+    async def _cycle(outcome):
+        await limiter.acquire()
+        limiter.release(outcome)
+
+    async def _run():
+        for _ in range(4):
+            await _cycle("ok")
+        grown = limiter.limit
+        await _cycle("throttled")
+        await _cycle("throttled")  # within cooldown: counted, not applied again
+        return grown
+
+    grown = asyncio.run(_run())
+    # +1/limit per success: about one extra slot per window of four
+    assert 4.8 < grown < 5.0
+    assert limiter.limit == pytest.approx(grown / 2)
+    assert limiter.snapshot()["throttled"] == 2
+    assert limiter.snapshot()["decreases"] == 1
+
+
+def test_waiters_are_served_fifo_within_the_limit():
+    limiter = rl.AdaptiveLimiter("k", initial=2, max_limit=2)
+    order, peak = [], [0]
+
+    async def _request(i):
+        await limiter.acquire()
+        peak[0] = max(peak[0], limiter.in_flight)
+        order.append(i)
+        await asyncio.sleep(0.01)
+        limiter.release(None)
+
+    async def _run():
+        await asyncio.gather(*(_request(i) for i in range(10)))
+
+    asyncio.run(_run())
+    assert peak[0] == 2
+    assert order == list(range(10))
+    assert limiter.snapshot()["in_flight"] == 0
+
+
+def test_simulator_429s_shrink_the_account_limit():
+    simulator = AiSensySimulator(SimulatorConfig(tier="TIER_1", tier_mps={"TIER_1": 5}))
+    body = {"to": "+919000000001", "type": "text", "text": {"body": "hi"}}
+
+    async def scenario(session, server):
+        async def _send():
+            async with session.post(server.make_url("/messages"), json=body, headers=AUTH) as response:
+                return response.status
+
+        return await asyncio.gather(*(_send() for _ in range(30)))
+
+    statuses = _serve(simulator.app(), scenario)
+    account = rl.get_rate_limiter_stats()["accounts"][rl.account_key_for_token("account-a")]
+    assert 429 in statuses
+    assert account["throttled"] == statuses.count(429)
+    assert account["limit"] < settings.AISENSY_LIMITER_INITIAL_CONCURRENCY
+    assert account["pauses"] >= 1
+    assert account["in_flight"] == 0
+
+
+def test_retry_after_pauses_the_account():
+    calls = []
+
+    async def handler(request):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            return web.json_response({"error": {"code": 130429}}, status=429, headers={"Retry-After": "0.3"})
+        return web.json_response({"ok": True})
+
+    app = web.Application()
+    app.router.add_post("/messages", handler)
+
+    async def scenario(session, server):
+        for _ in range(2):
+            async with session.post(server.make_url("/messages"), json={}, headers=AUTH) as response:
+                await response.read()
+
+    _serve(app, scenario)
+    assert calls[1] - calls[0] >= 0.28
+
+
+def test_slot_is_held_until_the_body_is_read():
+    in_flight = []
+
+    async def handler(request):
+        limiter = rl.get_account_limiter(rl.account_key_for_token("account-a"))
+        response = web.StreamResponse()
+        await response.prepare(request)
+        await response.write(b'{"ok": ')
+        await asyncio.sleep(0.05)
+        # Headers are out but the body is not: the slot must still be taken
+        in_flight.append(limiter.in_flight)
+        await response.write(b"true}")
+        await response.write_eof()
+        return response
+
+    app = web.Application()
+    app.router.add_post("/messages", handler)
+
+    async def scenario(session, server):
+        async with session.post(server.make_url("/messages"), json={}, headers=AUTH) as response:
+            return await response.json(content_type=None)
+
+    assert _serve(app, scenario) == {"ok": True}
+    assert in_flight == [1]
+    assert rl.get_account_limiter(rl.account_key_for_token("account-a")).in_flight == 0
+
+
+def test_error_burst_opens_the_endpoint_circuit(monkeypatch):
+    monkeypatch.setattr(settings, "AISENSY_CIRCUIT_FAILURE_THRESHOLD", 3)
+    monkeypatch.setattr(settings, "AISENSY_CIRCUIT_OPEN_SECONDS", 0.2)
+    healthy = {"value": False}
+
+    async def handler(request):
+        if healthy["value"]:
+            return web.json_response({"ok": True})
+        return web.Response(status=502, text="bad gateway")
+
+    app = web.Application()
+    app.router.add_get("/get-templates", handler)
+    app.router.add_get("/get-business-info", handler)
+
+    async def scenario(session, server):
+        statuses = []
+        for _ in range(3):
+            async with session.get(server.make_url("/get-templates"), headers=AUTH) as response:
+                statuses.append(response.status)
+        with pytest.raises(rl.CircuitOpenError):
+            await session.get(server.make_url("/get-templates"), headers=AUTH)
+        # Other endpoints are unaffected
+        async with session.get(server.make_url("/get-business-info"), headers=AUTH) as response:
+            statuses.append(response.status)
+
+        await asyncio.sleep(0.25)
+        healthy["value"] = True
+        async with session.get(server.make_url("/get-templates"), headers=AUTH) as response:
+            statuses.append(response.status)
+        return statuses
+
+    statuses = _serve(app, scenario)
+    circuits = rl.get_rate_limiter_stats()["circuits"]
+    assert statuses == [502, 502, 502, 502, 200]
+    assert circuits["GET /get-templates"] == {"state": "closed", "consecutive_failures": 0, "opened": 1, "rejected": 1}
+
+
+def test_keys_and_header_parsing():
+    assert rl.endpoint_key("post", "http://x/partner/p1/business/b1/project") == "POST /business"
+    assert rl.endpoint_key("GET", "http://x/get-template/123") == "GET /get-template"
+    assert rl.pause_from_headers({"Retry-After": "2"}, throttled=True) == 2
+    assert rl.pause_from_headers({"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": "1.5"}, throttled=False) == 1.5
+    assert rl.pause_from_headers({"X-RateLimit-Remaining": "10"}, throttled=False) is None
+    assert rl.pause_from_headers({}, throttled=True) == settings.AISENSY_LIMITER_THROTTLE_PAUSE_SECONDS
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+
+class TestBuildOutcome:
+    def test_success_carries_the_wamid(self):
+        from app.utils.broadcasting import build_outcome
+
+        outcome = build_outcome(0, "+919000000001", {"success": True, "data": {"messages": [{"id": "wamid.1"}]}})
+
+        assert (outcome.success, outcome.message_id, outcome.error_code) == (True, "wamid.1", None)
+
+    def test_failure_reads_the_error_code_from_the_raw_body(self):
+        from app.utils.broadcasting import build_outcome
+
+        outcome = build_outcome(3, "+919000000001", {
+            "success": False,
+            "error": "Bad request",
+            "status_code": 400,
+            "details": '{"error": {"message": "undeliverable", "code": 131026}}',
+        })
+
+        assert (outcome.index, outcome.success, outcome.error, outcome.error_code) == (3, False, "Bad request", "131026")
+        assert outcome.to_dict() == {
+            "phone": "+919000000001", "success": False, "message_id": None,
+            "error": "Bad request", "error_code": "131026",
+        }
+
+    def test_non_dict_results_are_failures(self):
+        from app.utils.broadcasting import build_outcome
+
+        outcome = build_outcome(0, "+919000000001", "session dropped")
+
+        assert (outcome.success, outcome.error) == (False, "session dropped")
+
+
+class TestTokenBucket:
+    def test_bucket_limits_rate(self):
+        from app.utils.broadcasting import TokenBucket
+
+        bucket = TokenBucket(rate=100, capacity=10)
+
+        async def _run():
+            await asyncio.gather(*(bucket.acquire() for _ in range(30)))
+
+        started = time.perf_counter()
+        asyncio.run(_run())
+        # 10 burst tokens, then 20 more at 100/s -> ~0.2s
+        assert time.perf_counter() - started >= 0.15
+
+    def test_threads_share_the_bucket(self):
+        import threading
+
+        from app.utils.broadcasting import TokenBucket
+
+        bucket = TokenBucket(rate=100, capacity=10)
+        threads = [threading.Thread(target=bucket.take, args=(10,)) for _ in range(3)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        # 10 burst tokens, then 20 more at 100/s -> ~0.2s
+        assert time.perf_counter() - started >= 0.15
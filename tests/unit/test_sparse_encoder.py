@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+from qdrant_client import QdrantClient, models
+
+from app.database.vectordatabse import sparse_encoder as se
+
+
+def test_roman_numerals_after_headings_match_digits():
+    assert se.tokenize("Order XXXVII Rule 2") == se.tokenize("order 37 rule 2")
+    assert se.encode_query("Order XXXVII Rule 2").indices == se.encode_query("Order 37 Rule 2").indices
+
+
+def test_roman_lookalikes_outside_headings_are_kept():
+    assert se.tokenize("civil suits") == ["civil", "suit"]
+    assert "mix" in se.tokenize("a mix of claims")
+
+
+def test_document_weights_saturate_with_term_frequency():
+    once = se.encode_document("injunction")
+    thrice = se.encode_document("injunction injunction injunction")
+    term_id = se._term_id("injunction")
+    weight_once = once.values[once.indices.index(term_id)]
+    weight_thrice = thrice.values[thrice.indices.index(term_id)]
+    assert weight_once < weight_thrice < 3 * weight_once
+
+
+def test_empty_text_encodes_to_empty_vector():
+    assert se.encode_document("the of and").indices == []
+    assert se.encode_query("").indices == []
+
+
+def test_sparse_search_ranks_exact_statutory_phrase_first():
+    client = QdrantClient(":memory:")
+    client.create_collection(
+        collection_name="sparse_test",
+        vectors_config={},
+        sparse_vectors_config={se.SPARSE_VECTOR_NAME: se.sparse_vector_params()},
+    )
+    documents = [
+        "Order XXXVII Rule 2. Institution of summary suits upon bills of exchange.",
+        "Order VII Rule 11. Rejection of plaint where it does not disclose a cause of action.",
+        "Article 54. For specific performance of a contract, three years.",
+    ]
+    client.upsert(
+        collection_name="sparse_test",
+        points=[
+            models.PointStruct(id=i, vector={se.SPARSE_VECTOR_NAME: se.encode_document(text)}, payload={"text": text})
+            for i, text in enumerate(documents)
+        ],
+    )
+
+    result = client.query_points(
+        collection_name="sparse_test",
+        query=se.encode_query("Order 37 Rule 2 summary suit"),
+        using=se.SPARSE_VECTOR_NAME,
+        limit=3,
+    ).points
+
+    assert result[0].id == 0
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def stub_api(monkeypatch):
+    """Stub get_templates and the DB sync; statuses are set per template ID."""
+    from app.agents.whatsp_agents import proactive_template_monitor as monitor
+
+    state = {"statuses": {}, "calls": [], "synced": []}
+
+    def _fake_mcp(tool_name, params):
+        state["calls"].append((tool_name, params["user_id"]))
+        return {"success": True, "data": {"data": [
+            {"id": tid, "status": status, "rejected_reason": "NONE"}
+            for tid, status in state["statuses"].items()
+        ]}}
+
+    monkeypatch.setattr(monitor, "_call_direct_api_mcp", _fake_mcp)
+    monkeypatch.setattr(
+        monitor, "_sync_status_to_db",
+        lambda tid, status, reason=None: state["synced"].append((tid, status)) or True,
+    )
+    return state
+
+
+class TestTemplateApprovalWatcher:
+    def test_one_get_templates_call_per_user_per_tick(self, stub_api):
+        from app.agents.whatsp_agents.proactive_template_monitor import TemplateApprovalWatcher
+
+        clock = _Clock()
+        watcher = TemplateApprovalWatcher(clock=clock)
+        stub_api["statuses"] = {"t1": "PENDING", "t2": "PENDING", "t3": "PENDING"}
+        for tid in ("t1", "t2"):
+            watcher.add("user-1", tid)
+        watcher.add("user-2", "t3")
+
+        assert watcher.tick() == 2
+        assert sorted(stub_api["calls"]) == [("get_templates", "user-1"), ("get_templates", "user-2")]
+        # Nothing is due again before the poll interval elapses
+        assert watcher.tick() == 0
+
+        stub_api["statuses"]["t1"] = "APPROVED"
+        clock.now += 15
+        watcher.tick()
+
+        assert watcher.channel.latest("t1").status == "APPROVED"
+        assert not watcher.is_tracking("t1")
+        assert watcher.is_tracking("t2")
+        # DB is only written on status changes
+        assert stub_api["synced"] == [("t1", "PENDING"), ("t2", "PENDING"), ("t3", "PENDING"), ("t1", "APPROVED")]
+
+    def test_poll_follows_paging_until_tracked_templates_are_seen(self, monkeypatch, stub_api):
+        from app.agents.whatsp_agents import proactive_template_monitor as monitor
+
+        pages = {
+            None: ([{"id": "t1", "status": "PENDING"}], "c1"),
+            "c1": ([{"id": "t2", "status": "APPROVED"}], "c2"),
+            "c2": ([{"id": "t3", "status": "PENDING"}], None),
+        }
+        cursors = []
+
+        def _paged_mcp(tool_name, params):
+            cursors.append(params.get("after"))
+            templates, after = pages[params.get("after")]
+            paging = {"cursors": {"after": after}, "next": f"https://graph/next?after={after}"} if after else {}
+            return {"success": True, "data": {"data": templates, "paging": paging}}
+
+        monkeypatch.setattr(monitor, "_call_direct_api_mcp", _paged_mcp)
+        watcher = monitor.TemplateApprovalWatcher(clock=_Clock())
+        watcher.add("user-1", "t1")
+        watcher.add("user-1", "t2")
+
+        assert watcher.poll_user("user-1")
+        # t3's page is never fetched: both tracked templates were on the first two
+        assert cursors == [None, "c1"]
+        assert watcher.channel.latest("t2").status == "APPROVED"
+        assert watcher.snapshot()["t1"]["consecutive_errors"] == 0
+
+    def test_long_pending_templates_back_off(self, stub_api):
+        from app.agents.whatsp_agents.proactive_template_monitor import TemplateApprovalWatcher
+
+        clock = _Clock()
+        watcher = TemplateApprovalWatcher(clock=clock, poll_interval=15, backoff_after=60, max_interval=100)
+        stub_api["statuses"] = {"t1": "PENDING"}
+        watcher.add("user-1", "t1")
+
+        intervals = []
+        for _ in range(8):
+            clock.now = watcher.snapshot()["t1"]["next_poll_in"] + clock.now
+            watcher.tick()
+            intervals.append(watcher.snapshot()["t1"]["poll_interval"])
+
+        assert intervals == [15, 15, 15, 15, 30, 60, 100, 100]
+        assert len(stub_api["calls"]) == 8
+
+    def test_webhook_event_wakes_waiter_and_stops_monitor(self, stub_api):
+        from app.agents.whatsp_agents import proactive_template_monitor as monitor
+
+        watcher = monitor.TemplateApprovalWatcher()
+        monitor._watcher, previous = watcher, monitor._watcher
+        try:
+            watcher.add("user-1", "123")
+            results = []
+            waiter = threading.Thread(
+                target=lambda: results.append(monitor.wait_for_template_status("123", timeout=5)),
+            )
+            waiter.start()
+
+            applied = monitor.handle_template_status_webhook({"entry": [{"changes": [
+                {"field": "messages", "value": {}},
+                {"field": "message_template_status_update", "value": {
+                    "event": "REJECTED", "message_template_id": 123, "reason": "INVALID_FORMAT",
+                }},
+            ]}]})
+            waiter.join(timeout=5)
+
+            assert [r.status for r in applied] == ["REJECTED"]
+            assert results[0].status == "REJECTED"
+            assert results[0].rejected_reason == "INVALID_FORMAT"
+            assert results[0].source == "webhook"
+            assert not watcher.is_tracking("123")
+            assert stub_api["calls"] == []
+            assert stub_api["synced"] == [("123", "REJECTED")]
+        finally:
+            monitor._watcher = previous
+
+
+class TestTemplateStatusChannel:
+    def test_async_waiter_is_woken_from_the_publishing_thread(self):
+        import asyncio
+
+        from app.agents.whatsp_agents.proactive_template_monitor import TemplateStatusChannel, _build_result
+
+        channel = TemplateStatusChannel()
+
+        async def _run():
+            waiting = asyncio.ensure_future(channel.await_for_final("t1", timeout=5))
+            await asyncio.sleep(0)
+            # Non-final updates do not wake the waiter
+            channel.publish(_build_result("t1", "PENDING"))
+            publisher = threading.Thread(target=channel.publish, args=(_build_result("t1", "APPROVED"),))
+            publisher.start()
+            result = await waiting
+            publisher.join()
+            return result
+
+        result = asyncio.run(_run())
+
+        assert result.status == "APPROVED"
+        assert channel._async_waiters == {}
+
+    def test_async_wait_times_out_with_the_latest_status(self):
+        import asyncio
+
+        from app.agents.whatsp_agents.proactive_template_monitor import TemplateStatusChannel, _build_result
+
+        channel = TemplateStatusChannel()
+        channel.publish(_build_result("t1", "PENDING"))
+
+        result = asyncio.run(channel.await_for_final("t1", timeout=0.05))
+
+        assert result.status == "PENDING"
+        assert channel._async_waiters == {}
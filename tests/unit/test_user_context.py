@@ -0,0 +1,176 @@
+"""Direct API user context cache — TTL, LRU, coalesced loads, invalidation on JWT writes."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _make_cache(contexts, calls, delay=0.0):
+    from app.database.postgresql.user_context import UserContext, UserContextCache
+
+    async def _loader(user_id):
+        calls.append(user_id)
+        await asyncio.sleep(delay)
+        jwt = contexts.get(user_id)
+        return UserContext(user_id=user_id, jwt_token=jwt, project_id="p", business_id="b") if jwt else None
+
+    clock = _Clock()
+    return UserContextCache(loader=_loader, clock=clock), clock
+
+
+class TestUserContextCache:
+    def test_hits_skip_the_loader_until_the_ttl_expires(self, monkeypatch):
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "USER_CONTEXT_CACHE_TTL_SECONDS", 60)
+        calls = []
+        cache, clock = _make_cache({"u1": "jwt-1"}, calls)
+
+        async def _run():
+            first = await cache.get("u1")
+            clock.now = 59
+            second = await cache.get("u1")
+            clock.now = 121
+            third = await cache.get("u1")
+            return first, second, third
+
+        first, second, third = asyncio.run(_run())
+
+        assert first.jwt_token == second.jwt_token == third.jwt_token == "jwt-1"
+        assert calls == ["u1", "u1"]
+        assert cache.get_stats() == {
+            "hits": 1, "misses": 2, "loads": 2, "coalesced": 0, "invalidations": 0, "entries": 1,
+        }
+
+    def test_concurrent_misses_share_one_load_and_unknown_users_are_not_cached(self):
+        calls = []
+        cache, _ = _make_cache({"u1": "jwt-1"}, calls, delay=0.01)
+
+        async def _run():
+            results = await asyncio.gather(*(cache.get("u1") for _ in range(10)))
+            assert await cache.get("nobody") is None
+            assert await cache.get("nobody") is None
+            return results
+
+        results = asyncio.run(_run())
+
+        assert {r.jwt_token for r in results} == {"jwt-1"}
+        assert calls == ["u1", "nobody", "nobody"]
+        assert cache.stats["coalesced"] == 9
+
+    def test_invalidation_drops_entries_and_discards_loads_in_flight(self):
+        contexts = {"u1": "jwt-old"}
+        calls = []
+        cache, _ = _make_cache(contexts, calls, delay=0.01)
+
+        async def _run():
+            assert (await cache.get("u1")).jwt_token == "jwt-old"
+            contexts["u1"] = "jwt-new"
+            cache.invalidate("u1")
+            assert (await cache.get("u1")).jwt_token == "jwt-new"
+
+            # A load racing an invalidation returns its result but does not cache it
+            contexts["u1"] = "jwt-newer"
+            load = asyncio.ensure_future(cache.get("u2"))
+            await asyncio.sleep(0)
+            cache.invalidate("u1")
+            await load
+            assert cache.peek("u2") is None
+            assert (await cache.get("u1")).jwt_token == "jwt-newer"
+
+        asyncio.run(_run())
+        assert calls == ["u1", "u1", "u2", "u1"]
+
+    def test_lru_bound_and_tier(self, monkeypatch):
+        from app.config import settings
+
+        monkeypatch.setattr(settings, "USER_CONTEXT_CACHE_MAX_ENTRIES", 2)
+        calls = []
+        cache, _ = _make_cache({"u1": "a", "u2": "b", "u3": "c"}, calls)
+
+        async def _run():
+            for user_id in ("u1", "u2", "u1", "u3"):
+                await cache.get(user_id)
+
+        asyncio.run(_run())
+        cache.set_tier("u1", "TIER_1K")
+        cache.set_tier("u2", "TIER_1K")
+
+        assert cache.peek("u2") is None
+        assert cache.peek("u1").tier == "TIER_1K"
+        assert cache.peek("u3").tier is None
+
+
+def test_memory_repository_writes_invalidate_the_cached_context(tmp_path, monkeypatch):
+    from sqlmodel import Session, SQLModel, create_engine
+
+    from app.database.postgresql import user_context
+    from app.database.postgresql.models import TempMemory
+    from app.database.postgresql.postgresql_repositories import MemoryRepository
+    from app.database.postgresql.user_context import UserContext, UserContextCache
+
+    cache = UserContextCache(loader=None)
+    monkeypatch.setattr(user_context, "_user_context_cache", cache)
+    engine = create_engine(f"sqlite:///{tmp_path / 'memory.db'}")
+    SQLModel.metadata.create_all(engine, tables=[TempMemory.__table__])
+
+    with Session(engine) as session:
+        repo = MemoryRepository(session=session)
+        for _ in range(2):
+            with cache._lock:
+                cache._store(UserContext(user_id="u1", jwt_token="cached"))
+            repo.create_on_verification_success("u1", "b", "p", jwt_token="fresh")
+            assert cache.peek("u1") is None
+
+        with cache._lock:
+            cache._store(UserContext(user_id="u1", jwt_token="fresh"))
+        assert repo.deactivate("u1", "p") is True
+        assert cache.peek("u1") is None
+    assert cache.stats["invalidations"] == 3
+
+
+@pytest.mark.parametrize("status_code, invalidated", [(401, True), (400, False)])
+def test_send_message_batch_drops_a_rejected_jwt(monkeypatch, status_code, invalidated):
+    import importlib
+
+    from app.database.postgresql.user_context import UserContext
+
+    # The messages package re-exports the tool under the module's name
+    module = importlib.import_module("mcp_servers.direct_api_mcp.tools.messages.send_message_batch")
+
+    dropped = []
+
+    async def _context(user_id):
+        return UserContext(user_id=user_id, jwt_token="jwt")
+
+    class _Client:
+        async def send_message(self, **kwargs):
+            return {"success": False, "error": "rejected", "status_code": status_code}
+
+    class _ClientContext:
+        async def __aenter__(self):
+            return _Client()
+
+        async def __aexit__(self, *exc):
+            return False
+
+    monkeypatch.setattr(module, "get_user_context", _context)
+    monkeypatch.setattr(module, "invalidate_user_context", dropped.append)
+    monkeypatch.setattr(module, "get_direct_api_post_client", _ClientContext)
+
+    tool = getattr(module.send_message_batch, "fn", module.send_message_batch)  # FastMCP wraps the function
+    response = asyncio.run(tool(
+        user_id="u1", recipients=[{"to": "919000000001"}], message_type="text", text_body="hi",
+    ))
+
+    assert response["failed"] == 1
+    assert dropped == (["u1"] if invalidated else [])